@@ -0,0 +1,230 @@
+"""Local stand-in for the Siren API used by the benchmark scripts.
+
+The server runs an asyncio event loop in a background thread and answers every
+request with a canned Siren envelope, optionally after an artificial delay that
+mimics API latency and a transfer delay that mimics a bandwidth-limited link. It speaks HTTP/1.1 and – when the ``h2`` package is
+installed – plain-text HTTP/2 with prior knowledge, and keeps simple counters
+(connections, requests, request body bytes) so scripts can report socket usage
+and bytes on the wire.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from siren.http.memory import canned_response
+
+try:
+    import h2.config  # type: ignore
+    import h2.connection  # type: ignore
+    import h2.events  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+_H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+@dataclass
+class ServerStats:
+    """Counters collected by :class:`StandInServer`."""
+
+    connections: int = 0
+    requests: int = 0
+    body_bytes: int = 0
+    decoded_body_bytes: int = 0
+
+
+def _decode_body(body: bytes, encoding: str | None) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd":
+        import zstandard  # type: ignore
+
+        return zstandard.ZstdDecompressor().decompress(body)
+    return body
+
+
+class StandInServer:
+    """Threaded asyncio server answering Siren API calls with canned data."""
+
+    def __init__(self, delay: float = 0.0, bandwidth: float | None = None) -> None:
+        """Create the server.
+
+        Args:
+            delay: Seconds to wait before answering each request.
+            bandwidth: Simulated uplink in bytes per second; each request is
+                held for ``len(body) / bandwidth`` seconds. ``None`` disables
+                it (loopback speed).
+        """
+        self.delay = delay
+        self.bandwidth = bandwidth
+        self.stats = ServerStats()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server: asyncio.AbstractServer | None = None
+        self.base_url = ""
+
+    def start(self) -> StandInServer:
+        """Start listening on a free localhost port."""
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle, "127.0.0.1", 0), self._loop
+        )
+        self._server = future.result()
+        port = self._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    def stop(self) -> None:
+        """Stop the server, drop open connections and end the event loop."""
+
+        async def shutdown() -> None:
+            if self._server is not None:
+                self._server.close()
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+    def reset_stats(self) -> None:
+        """Zero all counters."""
+        self.stats = ServerStats()
+
+    def __enter__(self) -> StandInServer:
+        """Start the server on context entry."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Stop the server on context exit."""
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        try:
+            head = await reader.readexactly(len(_H2_PREFACE))
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+        try:
+            if head == _H2_PREFACE and h2 is not None:
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_http1(head, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, path: str, body: bytes, encoding):
+        self.stats.requests += 1
+        self.stats.body_bytes += len(body)
+        decoded = _decode_body(body, encoding)
+        self.stats.decoded_body_bytes += len(decoded)
+        wait = self.delay + (len(body) / self.bandwidth if self.bandwidth else 0.0)
+        if wait:
+            await asyncio.sleep(wait)
+        return canned_response(method, path, decoded)
+
+    async def _serve_http1(self, buffered: bytes, reader, writer) -> None:
+        reader_buffer = bytearray(buffered)
+        while True:
+            while b"\r\n\r\n" not in reader_buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                reader_buffer += chunk
+            head, _, rest = bytes(reader_buffer).partition(b"\r\n\r\n")
+            lines = head.decode("latin-1").split("\r\n")
+            method, path, _ = lines[0].split(" ", 2)
+            headers = {
+                key.strip().lower(): value.strip()
+                for key, value in (line.split(":", 1) for line in lines[1:])
+            }
+            length = int(headers.get("content-length", 0))
+            body = bytearray(rest)
+            while len(body) < length:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                body += chunk
+            reader_buffer = bytearray(body[length:])
+            status, payload = await self._respond(
+                method, path, bytes(body[:length]), headers.get("content-encoding")
+            )
+            keep_alive = headers.get("connection", "").lower() != "close"
+            writer.write(
+                f"HTTP/1.1 {status} X\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                + payload
+            )
+            await writer.drain()
+            if not keep_alive:
+                return
+
+    async def _serve_h2(self, preface: bytes, reader, writer) -> None:
+        config = h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        conn = h2.connection.H2Connection(config=config)
+        conn.initiate_connection()
+        conn.increment_flow_control_window(2**24)
+        writer.write(conn.data_to_send())
+        streams: dict[int, dict[str, Any]] = {}
+
+        async def answer(stream_id: int, stream: dict[str, Any]) -> None:
+            headers = stream["headers"]
+            status, payload = await self._respond(
+                headers[":method"],
+                headers[":path"],
+                bytes(stream["body"]),
+                headers.get("content-encoding"),
+            )
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", str(status)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(payload))),
+                ],
+            )
+            conn.send_data(stream_id, payload, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        data = preface
+        while True:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    streams[event.stream_id] = {
+                        "headers": dict(event.headers),
+                        "body": bytearray(),
+                    }
+                elif isinstance(event, h2.events.DataReceived):
+                    streams[event.stream_id]["body"] += event.data
+                    conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    stream = streams.pop(event.stream_id)
+                    asyncio.ensure_future(answer(event.stream_id, stream))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+            if not data:
+                return
@@ -0,0 +1,79 @@
+"""Measure cold-start cost: ``import siren``, client creation and the first call.
+
+Every sample runs in a fresh interpreter, as a serverless function would, and
+reports the best of ``--runs``. ``--eager`` first imports every module the SDK
+used to load from ``import siren`` (both client stacks, httpx, all domain
+clients and models), which reproduces the old start-up cost for comparison.
+The first call is a ``message.get_status`` against a local stand-in server.
+
+Usage::
+
+    python benchmarks/cold_start.py --runs 10
+    python benchmarks/cold_start.py --runs 10 --eager
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+
+from _stand_in_server import StandInServer
+
+EAGER_IMPORTS = """
+import httpx, siren.async_client, siren.clients
+for name in ("channel_templates", "messaging", "templates", "users",
+             "webhooks", "workflows"):
+    __import__(f"siren.clients.{name}")
+    __import__(f"siren.clients.{name}_async")
+"""
+
+CHILD = """
+import json, time
+start = time.perf_counter()
+{eager}
+import siren
+imported = time.perf_counter()
+siren.SirenClient.API_URLS["dev"] = {base_url!r}
+client = siren.SirenClient(api_key="benchmark", env="dev")
+created = time.perf_counter()
+client.message.get_status("msg_1")
+called = time.perf_counter()
+client.close()
+print(json.dumps({{
+    "import": imported - start,
+    "client": created - imported,
+    "first call": called - created,
+    "total": called - start,
+}}))
+"""
+
+
+def _sample(base_url: str, eager: bool) -> dict[str, float]:
+    code = CHILD.format(eager=EAGER_IMPORTS if eager else "", base_url=base_url)
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    """Print the best cold-start timings over several fresh interpreters."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--eager", action="store_true")
+    args = parser.parse_args()
+
+    with StandInServer() as server:
+        samples = [_sample(server.base_url, args.eager) for _ in range(args.runs)]
+
+    label = "eager imports" if args.eager else "lazy imports"
+    print(f"{label} (best of {args.runs}, ms)")
+    for phase in samples[0]:
+        best = min(sample[phase] for sample in samples)
+        print(f"  {phase:<12} {best * 1e3:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
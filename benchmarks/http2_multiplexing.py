@@ -0,0 +1,112 @@
+"""Benchmark HTTP/2 multiplexing against the HTTP/1.1 connection pool.
+
+Fans out many concurrent ``send`` calls against a local stand-in server (with
+artificial latency) and reports requests/sec together with the number of TCP
+connections the server accepted.
+
+Usage::
+
+    pip install trysiren[http2]
+    python benchmarks/http2_multiplexing.py --requests 2000 --delay 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _stand_in_server import StandInServer
+
+from siren.clients.messaging import MessageClient
+from siren.clients.messaging_async import AsyncMessageClient
+from siren.http.transport import AsyncTransport, HttpxTransport, SyncTransport
+
+API_KEY = "benchmark"
+
+
+async def _run_async(server: StandInServer, transport, total: int) -> float:
+    client = AsyncMessageClient(
+        api_key=API_KEY, base_url=server.base_url, transport=transport
+    )
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client.send(
+                template_name="bench",
+                channel="EMAIL",
+                recipient_value=f"user{i}@example.com",
+            )
+            for i in range(total)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    await transport.aclose()
+    return elapsed
+
+
+def _run_sync(server: StandInServer, transport, total: int, threads: int) -> float:
+    client = MessageClient(
+        api_key=API_KEY, base_url=server.base_url, transport=transport
+    )
+
+    def send(i: int) -> str:
+        return client.send(
+            recipient_value=f"user{i}@example.com", channel="EMAIL", body="bench"
+        )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(send, range(total)))
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return elapsed
+
+
+def _report(label: str, server: StandInServer, total: int, elapsed: float) -> None:
+    print(
+        f"{label:<28} {total / elapsed:>10.0f} req/s"
+        f" {server.stats.connections:>8} sockets"
+    )
+    server.reset_stats()
+
+
+def main() -> None:
+    """Run the benchmark and print a small comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--delay", type=float, default=0.02)
+    parser.add_argument("--threads", type=int, default=64)
+    args = parser.parse_args()
+
+    with StandInServer(delay=args.delay) as server:
+        print(f"{'transport':<28} {'throughput':>14} {'sockets':>8}")
+        elapsed = asyncio.run(
+            _run_async(server, AsyncTransport(max_connections=None), args.requests)
+        )
+        _report("async HTTP/1.1", server, args.requests, elapsed)
+        elapsed = asyncio.run(
+            _run_async(
+                server,
+                AsyncTransport(http2=True, http1=False, max_connections=None),
+                args.requests,
+            )
+        )
+        _report("async HTTP/2", server, args.requests, elapsed)
+
+        elapsed = _run_sync(
+            server,
+            SyncTransport(pool_maxsize=args.threads),
+            args.requests,
+            args.threads,
+        )
+        _report("sync HTTP/1.1 (requests)", server, args.requests, elapsed)
+        elapsed = _run_sync(
+            server, HttpxTransport(http2=True, http1=False), args.requests, args.threads
+        )
+        _report("sync HTTP/2 (httpx)", server, args.requests, elapsed)
+
+
+if __name__ == "__main__":
+    main()
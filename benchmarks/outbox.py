@@ -0,0 +1,139 @@
+"""Measure outbox enqueue throughput and dispatcher drain rate.
+
+Enqueueing is timed from the first call until :meth:`Outbox.flush` returns
+(so everything is committed), from one thread and from several, next to a
+naive outbox that commits every row on its own, for each SQLite
+``synchronous`` level in ``--synchronous``. Draining runs an
+:class:`OutboxDispatcher` against the local stand-in server, which answers
+after ``--delay`` seconds like a remote API would.
+
+Usage::
+
+    python benchmarks/outbox.py --entries 5000 --threads 8 --delay 0.01 \
+        --synchronous NORMAL FULL
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+import types
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from _stand_in_server import StandInServer
+
+from siren import Outbox, OutboxDispatcher
+from siren.clients.messaging import MessageClient
+from siren.clients.outbox import _SCHEMA
+from siren.clients.workflows import WorkflowClient
+from siren.http.transport import SyncTransport
+
+API_KEY = "benchmark"
+
+
+def _enqueue(outbox: Outbox, i: int) -> str:
+    return outbox.enqueue_send(f"user{i}@example.com", "EMAIL", template_name="bench")
+
+
+def _group_commit(path: Path, entries: int, threads: int, synchronous: str) -> float:
+    with Outbox(path, synchronous=synchronous) as outbox:
+        start = time.perf_counter()
+        if threads == 1:
+            for i in range(entries):
+                _enqueue(outbox, i)
+        else:
+            with ThreadPoolExecutor(threads) as pool:
+                list(pool.map(lambda i: _enqueue(outbox, i), range(entries)))
+        outbox.flush()
+        return time.perf_counter() - start
+
+
+def _commit_per_row(path: Path, entries: int, synchronous: str) -> float:
+    """Same table and row contents, one transaction per entry."""
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(f"PRAGMA synchronous={synchronous}")
+    db.executescript(_SCHEMA)
+    start = time.perf_counter()
+    for i in range(entries):
+        payload = {
+            "recipient_value": f"user{i}@example.com",
+            "channel": "EMAIL",
+            "template_name": "bench",
+        }
+        now = time.time()
+        db.execute(
+            "INSERT INTO outbox (id, kind, payload, created, updated)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (uuid.uuid4().hex, "send", json.dumps(payload), now, now),
+        )
+        db.commit()
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed
+
+
+def _drain(path: Path, server: StandInServer, entries: int, concurrency: int) -> float:
+    transport = SyncTransport(pool_maxsize=concurrency)
+    kwargs = {"api_key": API_KEY, "base_url": server.base_url, "transport": transport}
+    client = types.SimpleNamespace(
+        message=MessageClient(**kwargs), workflow=WorkflowClient(**kwargs)
+    )
+    with Outbox(path) as outbox:
+        for i in range(entries):
+            _enqueue(outbox, i)
+        outbox.flush()
+        start = time.perf_counter()
+        OutboxDispatcher(client, outbox, concurrency=concurrency).start().stop()
+        elapsed = time.perf_counter() - start
+        assert outbox.stats().done == entries
+    transport.close()
+    return elapsed
+
+
+def main() -> None:
+    """Print entries/sec for enqueueing and draining."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--delay", type=float, default=0.01)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--synchronous", nargs="+", default=["NORMAL", "FULL"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = iter(range(1_000_000))
+
+        def fresh() -> Path:
+            return Path(tmp) / f"outbox{next(runs)}.db"
+
+        n = args.entries
+        print(f"{'enqueue':<34} {'entries/s':>12}")
+        for sync in args.synchronous:
+            rows = [
+                ("commit per row", _commit_per_row(fresh(), n, sync)),
+                ("group commit, 1 thread", _group_commit(fresh(), n, 1, sync)),
+                (
+                    f"group commit, {args.threads} threads",
+                    _group_commit(fresh(), n, args.threads, sync),
+                ),
+            ]
+            for label, elapsed in rows:
+                print(f"{label + ' (' + sync + ')':<34} {n / elapsed:>12.0f}")
+
+        print(
+            f"\n{'drain (' + str(args.delay * 1000) + ' ms API)':<34} {'entries/s':>12}"
+        )
+        with StandInServer(delay=args.delay) as server:
+            for concurrency in args.concurrency:
+                elapsed = _drain(fresh(), server, n, concurrency)
+                print(f"{'concurrency ' + str(concurrency):<34} {n / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
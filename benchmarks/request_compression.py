@@ -0,0 +1,133 @@
+"""Benchmark request-body compression for large ``trigger_bulk`` payloads.
+
+Sends ``workflow.trigger_bulk`` calls with growing ``notify`` lists to a local
+stand-in server, uncompressed and with gzip/zstd ``RequestCompression``, and
+reports the request bytes on the wire and end-to-end latency. Loopback is far
+faster than a real uplink, so ``--bandwidth`` makes the server hold each
+request for as long as its body would take over a link of that speed.
+
+Usage::
+
+    pip install trysiren[zstd]
+    python benchmarks/request_compression.py --sizes 1000 10000 50000 --bandwidth 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from _stand_in_server import StandInServer
+
+from siren import RequestCompression
+from siren.clients.workflows import WorkflowClient
+from siren.clients.workflows_async import AsyncWorkflowClient
+from siren.http.transport import AsyncTransport, SyncTransport
+
+API_KEY = "benchmark"
+
+
+def _notify(size: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "email": f"user{i}@example.com",
+            "name": f"User {i}",
+            "plan": "pro" if i % 3 else "free",
+            "locale": "en-US",
+        }
+        for i in range(size)
+    ]
+
+
+def _modes() -> dict[str, RequestCompression | None]:
+    modes: dict[str, RequestCompression | None] = {
+        "none": None,
+        "gzip": RequestCompression("gzip"),
+    }
+    try:
+        modes["zstd"] = RequestCompression("zstd")
+    except ImportError:
+        print("zstandard not installed; skipping zstd")
+    return modes
+
+
+def _run_sync(server, compression, notify, iterations: int) -> float:
+    transport = SyncTransport(timeout=120)
+    client = WorkflowClient(
+        api_key=API_KEY,
+        base_url=server.base_url,
+        transport=transport,
+        compression=compression,
+    )
+    client.trigger_bulk("bench", notify=notify[:1])  # open the connection
+    server.reset_stats()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client.trigger_bulk("bench", notify=notify)
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return elapsed
+
+
+async def _run_async(server, compression, notify, iterations: int) -> float:
+    transport = AsyncTransport(timeout=120)
+    client = AsyncWorkflowClient(
+        api_key=API_KEY,
+        base_url=server.base_url,
+        transport=transport,
+        compression=compression,
+    )
+    await client.trigger_bulk("bench", notify=notify[:1])
+    server.reset_stats()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await client.trigger_bulk("bench", notify=notify)
+    elapsed = time.perf_counter() - start
+    await transport.aclose()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print bytes on the wire and latency per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=None,
+        help="simulated uplink in Mbit/s (default: loopback speed)",
+    )
+    args = parser.parse_args()
+    bandwidth = args.bandwidth * 125_000 if args.bandwidth else None
+
+    print(
+        f"{'recipients':>10} {'client':<6} {'encoding':<8} {'wire KiB':>10}"
+        f" {'ratio':>6} {'ms/call':>9}"
+    )
+    with StandInServer(bandwidth=bandwidth) as server:
+        for size in args.sizes:
+            notify = _notify(size)
+            for name, compression in _modes().items():
+                for label in ("sync", "async"):
+                    if label == "sync":
+                        elapsed = _run_sync(
+                            server, compression, notify, args.iterations
+                        )
+                    else:
+                        elapsed = asyncio.run(
+                            _run_async(server, compression, notify, args.iterations)
+                        )
+                    stats = server.stats
+                    wire = stats.body_bytes / stats.requests
+                    ratio = stats.decoded_body_bytes / stats.body_bytes
+                    print(
+                        f"{size:>10} {label:<6} {name:<8} {wire / 1024:>10.1f}"
+                        f" {ratio:>6.1f} {elapsed / args.iterations * 1e3:>9.1f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
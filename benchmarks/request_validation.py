@@ -0,0 +1,130 @@
+"""Measure the per-call saving of ``validate_requests=False``.
+
+Runs the calls whose payloads the SDK builds itself (message sends and
+workflow triggers) through ``InMemoryTransport``, with request validation on
+(the default) and off, and reports µs per call for the whole call and for the
+validate + serialize step alone.
+
+Usage::
+
+    python benchmarks/request_validation.py --iterations 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable
+
+from siren import AsyncSirenClient, SirenClient
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+
+API_KEY = "benchmark"
+BULK_NOTIFY = [
+    {"email": f"user{i}@example.com", "name": f"User {i}"} for i in range(100)
+]
+
+OPERATIONS: dict[str, Callable[[Any], Any]] = {
+    "message.send": lambda c: c.message.send(
+        recipient_value="alice@example.com",
+        channel="EMAIL",
+        template_name="welcome",
+        template_variables={"user_name": "Alice", "plan": "pro"},
+    ),
+    "workflow.trigger": lambda c: c.workflow.trigger(
+        "onboarding", data={"plan": "pro"}, notify={"email": "alice@example.com"}
+    ),
+    "workflow.trigger_bulk": lambda c: c.workflow.trigger_bulk(
+        "onboarding", notify=BULK_NOTIFY, data={"plan": "pro"}
+    ),
+}
+
+
+def _per_call(func: Callable[[], Any], iterations: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def _serialize_cost(client: SirenClient, operation, iterations: int) -> float:
+    spent = 0.0
+    domains = (client.message, client.workflow)
+    originals = [d._serialize_request for d in domains]
+
+    def timed(original):
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal spent
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                spent += time.perf_counter() - start
+
+        return wrapper
+
+    for domain, original in zip(domains, originals):
+        domain._serialize_request = timed(original)  # type: ignore[method-assign]
+    operation(client)
+    spent = 0.0
+    for _ in range(iterations):
+        operation(client)
+    return spent / iterations * 1e6
+
+
+async def _async_per_call(operation, validate: bool, iterations: int) -> float:
+    async with AsyncSirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=AsyncInMemoryTransport(),
+        validate_requests=validate,
+    ) as client:
+        await operation(client)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await operation(client)
+        return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    """Print per-call timings with validation on and off."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=3000)
+    args = parser.parse_args()
+
+    print(
+        f"{'operation':<22} {'client':<6} {'validated':>10} {'trusted':>9}"
+        f" {'saved':>7} {'serialize':>18}   (µs/call)"
+    )
+    for name, operation in OPERATIONS.items():
+        sync: dict[bool, float] = {}
+        serialize: dict[bool, float] = {}
+        for validate in (True, False):
+            client = SirenClient(
+                api_key=API_KEY,
+                env="dev",
+                transport=InMemoryTransport(),
+                validate_requests=validate,
+            )
+            sync[validate] = _per_call(lambda: operation(client), args.iterations)
+            serialize[validate] = _serialize_cost(client, operation, args.iterations)
+        async_ = {
+            validate: asyncio.run(_async_per_call(operation, validate, args.iterations))
+            for validate in (True, False)
+        }
+        for label, totals in (("sync", sync), ("async", async_)):
+            phase = (
+                f"{serialize[True]:.1f} -> {serialize[False]:.1f}"
+                if label == "sync"
+                else ""
+            )
+            print(
+                f"{name:<22} {label:<6} {totals[True]:>10.1f} {totals[False]:>9.1f}"
+                f" {totals[True] - totals[False]:>7.1f} {phase:>18}"
+            )
+
+
+if __name__ == "__main__":
+    main()
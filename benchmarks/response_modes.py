@@ -0,0 +1,81 @@
+"""Compare the ``model``, ``raw`` and ``lazy`` response modes on read calls.
+
+Each call runs end to end through ``InMemoryTransport``, so the numbers are the
+SDK's own cost of turning a list response into return values. ``touch`` reads
+one field of every item afterwards, which is where lazy views pay for
+validation.
+
+Usage::
+
+    python benchmarks/response_modes.py --sizes 10 100 1000 --iterations 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import time
+from typing import Any, Callable
+
+from siren import SirenClient
+from siren.http.memory import InMemoryTransport, canned_response
+
+MODES = ("model", "raw", "lazy")
+
+OPERATIONS: dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    # name -> (call, read one field of an item in the result)
+    "template.get": (
+        lambda c: c.template.get(),
+        lambda t: t["name"] if isinstance(t, dict) else t.name,
+    ),
+    "message.get_replies": (
+        lambda c: c.message.get_replies("msg_1"),
+        lambda r: r["text"] if isinstance(r, dict) else r.text,
+    ),
+}
+
+
+def _time(func: Callable[[], Any], iterations: int, repeats: int = 5) -> float:
+    """Best-of-*repeats* µs per call, which is less noisy than the mean."""
+    func()
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e6
+
+
+def main() -> None:
+    """Print µs per call for every mode, with and without field access."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    header = "".join(f" {mode:>9} {mode + '+touch':>12}" for mode in MODES)
+    print(f"{'operation':<22} {'items':>6}{header}   (µs/call)")
+    for name, (call, read) in OPERATIONS.items():
+        for size in args.sizes:
+            handler = functools.partial(canned_response, list_size=size)
+            row = ""
+            for mode in MODES:
+                client = SirenClient(
+                    api_key="benchmark",
+                    env="dev",
+                    transport=InMemoryTransport(handler),
+                    response_mode=mode,
+                )
+
+                def touched(client: Any = client) -> None:
+                    for item in call(client):
+                        read(item)
+
+                bare = _time(functools.partial(call, client), args.iterations)
+                row += f" {bare:>9.1f} {_time(touched, args.iterations):>12.1f}"
+            print(f"{name:<22} {size:>6}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Microbenchmark response parsing: dict round trip vs. validating raw bytes.
+
+Compares the previous parse path (``response.json()`` followed by
+``model_validate`` on the resulting dict) with validating the body bytes
+directly via ``model_validate_json`` on large ``TemplateListResponse`` and
+``MessageRepliesResponse`` payloads.
+
+Usage::
+
+    python benchmarks/response_parsing.py --sizes 10 100 1000 --iterations 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+import httpx  # type: ignore
+
+from siren.http.memory import canned_response
+from siren.models.messaging import MessageRepliesResponse
+from siren.models.templates import TemplateListResponse
+
+PAYLOADS: dict[str, tuple[str, Any]] = {
+    "TemplateListResponse": ("/api/v1/public/template", TemplateListResponse),
+    "MessageRepliesResponse": (
+        "/api/v1/public/get-reply/msg_1",
+        MessageRepliesResponse,
+    ),
+}
+
+
+def _time(func: Callable[[], Any], iterations: int, repeats: int = 5) -> float:
+    """Best-of-*repeats* µs per call, which is less noisy than the mean."""
+    func()
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e6
+
+
+def main() -> None:
+    """Print µs per parse for both strategies."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'model':<24} {'items':>6} {'KiB':>8} {'json()+validate':>16}"
+        f" {'validate_json':>14} {'speed-up':>9}   (µs/parse)"
+    )
+    for name, (path, model) in PAYLOADS.items():
+        for size in args.sizes:
+            _, body = canned_response("GET", path, None, list_size=size)
+
+            response = httpx.Response(200, content=body)
+
+            def via_dict(response: Any = response, model: Any = model) -> Any:
+                return model.model_validate(response.json())
+
+            def via_bytes(response: Any = response, model: Any = model) -> Any:
+                return model.model_validate_json(response.content)
+
+            old = _time(via_dict, args.iterations)
+            new = _time(via_bytes, args.iterations)
+            print(
+                f"{name:<24} {size:>6} {len(body) / 1024:>8.1f} {old:>16.1f}"
+                f" {new:>14.1f} {old / new:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
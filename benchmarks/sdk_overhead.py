@@ -0,0 +1,151 @@
+"""Measure the SDK's own per-call overhead with no network involved.
+
+Every call goes through ``InMemoryTransport``, which answers instantly with a
+canned Siren envelope, so the numbers are pure SDK cost. Sync calls are split
+into request validation + serialization, the (stand-in) transport, response
+parsing and the remaining client plumbing; async calls report the total.
+
+Usage::
+
+    python benchmarks/sdk_overhead.py --iterations 5000
+    python benchmarks/sdk_overhead.py --profile send   # cProfile one operation
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+from siren import AsyncSirenClient, SirenClient
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+
+API_KEY = "benchmark"
+BULK_NOTIFY = [
+    {"email": f"user{i}@example.com", "name": f"User {i}"} for i in range(100)
+]
+
+OPERATIONS: dict[str, Callable[[Any], Any]] = {
+    "send": lambda c: c.message.send(
+        recipient_value="alice@example.com",
+        channel="EMAIL",
+        template_name="welcome",
+        template_variables={"user_name": "Alice", "plan": "pro"},
+    ),
+    "get_status": lambda c: c.message.get_status("msg_1"),
+    "get_replies": lambda c: c.message.get_replies("msg_1"),
+    "template.get": lambda c: c.template.get(page=0, size=10),
+    "workflow.trigger": lambda c: c.workflow.trigger(
+        "onboarding", data={"plan": "pro"}, notify={"email": "alice@example.com"}
+    ),
+    "workflow.trigger_bulk": lambda c: c.workflow.trigger_bulk(
+        "onboarding", notify=BULK_NOTIFY, data={"plan": "pro"}
+    ),
+}
+
+
+class PhaseTimer:
+    """Accumulates time spent in wrapped callables, keyed by phase name."""
+
+    def __init__(self) -> None:
+        """Start with empty totals."""
+        self.totals: dict[str, float] = defaultdict(float)
+
+    def wrap(self, phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return *func* instrumented to add its run time to *phase*."""
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.totals[phase] += time.perf_counter() - start
+
+        return timed
+
+
+def _instrumented_client() -> tuple[SirenClient, PhaseTimer]:
+    timer = PhaseTimer()
+    transport = InMemoryTransport()
+    transport.request = timer.wrap("transport", transport.request)  # type: ignore[method-assign]
+    client = SirenClient(api_key=API_KEY, env="dev", transport=transport)
+    for domain in (client.message, client.template, client.workflow):
+        domain._serialize_request = timer.wrap(  # type: ignore[method-assign]
+            "serialize", domain._serialize_request
+        )
+        domain._handle_response = timer.wrap(  # type: ignore[method-assign]
+            "parse", domain._handle_response
+        )
+    return client, timer
+
+
+def run_sync(iterations: int) -> None:
+    """Print the per-call cost of each operation on the sync client."""
+    print(
+        f"{'sync operation':<24} {'total':>9} {'serialize':>10} {'parse':>9}"
+        f" {'transport':>10} {'other':>9}   (µs/call)"
+    )
+    for name, operation in OPERATIONS.items():
+        client, timer = _instrumented_client()
+        operation(client)  # warm caches outside the measurement
+        timer.totals.clear()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            operation(client)
+        total = time.perf_counter() - start
+        phases = {k: v / iterations * 1e6 for k, v in timer.totals.items()}
+        per_call = total / iterations * 1e6
+        other = per_call - sum(phases.values())
+        print(
+            f"{name:<24} {per_call:>9.1f} {phases.get('serialize', 0):>10.1f}"
+            f" {phases.get('parse', 0):>9.1f} {phases.get('transport', 0):>10.1f}"
+            f" {other:>9.1f}"
+        )
+
+
+async def _run_async(iterations: int) -> None:
+    print(f"\n{'async operation':<24} {'total':>9}   (µs/call)")
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport()
+    ) as client:
+        for name, operation in OPERATIONS.items():
+            await operation(client)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                await operation(client)
+            per_call = (time.perf_counter() - start) / iterations * 1e6
+            print(f"{name:<24} {per_call:>9.1f}")
+
+
+def profile(name: str, iterations: int) -> None:
+    """Run one sync operation under cProfile and print the hottest functions."""
+    client = SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport())
+    operation = OPERATIONS[name]
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(iterations):
+        operation(client)
+    profiler.disable()
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+def main() -> None:
+    """Run the benchmark and print per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--profile", choices=sorted(OPERATIONS), default=None)
+    args = parser.parse_args()
+
+    if args.profile:
+        profile(args.profile, args.iterations)
+        return
+    run_sync(args.iterations)
+    asyncio.run(_run_async(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
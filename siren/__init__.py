@@ -8,11 +8,96 @@ Both clients expose the same domain‐specific namespaces (``.message``,
 ``.template``, etc.). Choose the async variant whenever your application is
 already running inside an asyncio event-loop or needs to issue many concurrent
 requests.
+
+Names are imported on first access, so ``import siren`` stays cheap and only
+the client stack that is actually used (and its HTTP library) gets loaded.
 """
 
-from .async_client import AsyncSirenClient
-from .client import SirenClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncSirenClient
+    from .client import SirenClient
+    from .clients.bulk_chunks import BulkChunk, ChunkedBulkExecution
+    from .clients.outbox import Outbox, OutboxDispatcher
+    from .clients.outbox_async import AsyncOutboxDispatcher
+    from .clients.status_cache import StatusCache
+    from .clients.status_polling import PollBackoff, StatusTransition
+    from .http.circuit_breaker import CircuitBreaker, CircuitState
+    from .http.compression import RequestCompression
+    from .http.hedging import Hedger
+    from .http.idempotency import IdempotencyWindow
+    from .http.options import RequestOptions, ResponseMode
+    from .http.rate_limit import RateLimiter, TokenBucket
+    from .http.retry import RetryPolicy
+    from .models.lazy import LazyModel
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "AsyncOutboxDispatcher": ".clients.outbox_async",
+    "AsyncSirenClient": ".async_client",
+    "BulkChunk": ".clients.bulk_chunks",
+    "ChunkedBulkExecution": ".clients.bulk_chunks",
+    "CircuitBreaker": ".http.circuit_breaker",
+    "CircuitState": ".http.circuit_breaker",
+    "Hedger": ".http.hedging",
+    "IdempotencyWindow": ".http.idempotency",
+    "LazyModel": ".models.lazy",
+    "Outbox": ".clients.outbox",
+    "OutboxDispatcher": ".clients.outbox",
+    "PollBackoff": ".clients.status_polling",
+    "RateLimiter": ".http.rate_limit",
+    "RequestCompression": ".http.compression",
+    "RequestOptions": ".http.options",
+    "ResponseMode": ".http.options",
+    "RetryPolicy": ".http.retry",
+    "SirenClient": ".client",
+    "StatusCache": ".clients.status_cache",
+    "StatusTransition": ".clients.status_polling",
+    "TokenBucket": ".http.rate_limit",
+}
 
-__all__ = ["AsyncSirenClient", "SirenClient"]
+__all__ = [
+    "AsyncOutboxDispatcher",
+    "AsyncSirenClient",
+    "BulkChunk",
+    "ChunkedBulkExecution",
+    "CircuitBreaker",
+    "CircuitState",
+    "Hedger",
+    "IdempotencyWindow",
+    "LazyModel",
+    "Outbox",
+    "OutboxDispatcher",
+    "PollBackoff",
+    "RateLimiter",
+    "RequestCompression",
+    "RequestOptions",
+    "ResponseMode",
+    "RetryPolicy",
+    "SirenClient",
+    "StatusCache",
+    "StatusTransition",
+    "TokenBucket",
+]
 
 __version__ = "0.2.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names alongside the module's own."""
+    return sorted(set(globals()) | set(_EXPORTS))
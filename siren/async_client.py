@@ -10,15 +10,32 @@ using the async client.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, TypeVar
 
-from .clients.channel_templates_async import AsyncChannelTemplateClient
-from .clients.messaging_async import AsyncMessageClient
-from .clients.templates_async import AsyncTemplateClient
-from .clients.users_async import AsyncUserClient
-from .clients.webhooks_async import AsyncWebhookClient
-from .clients.workflows_async import AsyncWorkflowClient
+from .exceptions import SirenSDKError
+from .http.circuit_breaker import CircuitBreaker
+from .http.compression import RequestCompression
+from .http.hedging import Hedger
+from .http.idempotency import IdempotencyWindow
+from .http.options import RESPONSE_MODES, ResponseMode
+from .http.rate_limit import RateLimiter
+from .http.retry import RetryPolicy
+from .http.transport import AsyncTransport, AsyncTransportProtocol
+
+if TYPE_CHECKING:
+    from .clients.async_base import AsyncBaseClient
+    from .clients.channel_templates_async import AsyncChannelTemplateClient
+    from .clients.messaging_async import AsyncMessageClient
+    from .clients.status_cache import StatusCache
+    from .clients.templates_async import AsyncTemplateClient
+    from .clients.users_async import AsyncUserClient
+    from .clients.webhooks_async import AsyncWebhookClient
+    from .clients.workflows_async import AsyncWorkflowClient
+
+    _C = TypeVar("_C", bound=AsyncBaseClient)
 
 
 class AsyncSirenClient:  # noqa: D101
@@ -32,12 +49,54 @@ class AsyncSirenClient:  # noqa: D101
         *,
         api_key: str | None = None,
         env: Literal["dev", "prod"] | None = None,
+        timeout: float = 10,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        transport: AsyncTransportProtocol | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
+        compression: RequestCompression | None = None,
+        validate_requests: bool = True,
+        response_mode: ResponseMode = "model",
+        status_cache: StatusCache | None = None,
+        idempotency_window: IdempotencyWindow | None = None,
+        auto_idempotency_keys: bool = False,
     ):
         """Create a new *asynchronous* Siren client.
 
+        All domain clients share a single :class:`~siren.http.transport.AsyncTransport`
+        (one ``httpx.AsyncClient`` connection pool). Each domain client is
+        created on first access to its property.
+
         Args:
             api_key: Siren API key. If ``None``, falls back to the ``SIREN_API_KEY`` env-var.
             env: Deployment environment – ``"dev"`` or ``"prod"``. If ``None``, uses ``SIREN_ENV`` or defaults to ``"prod"``.
+            timeout: Default timeout in seconds for every request phase.
+            connect_timeout: Connection-establishment timeout; defaults to ``timeout``.
+            read_timeout: Response read timeout; defaults to ``timeout``.
+            pool_timeout: Wait for a free pooled connection; defaults to ``timeout``.
+            max_connections: Maximum number of concurrently open connections.
+            max_keepalive_connections: Maximum number of idle connections kept for reuse.
+            keepalive_expiry: Seconds an idle connection stays open before being closed.
+            http2: Multiplex concurrent requests over HTTP/2 connections. Requires the ``h2`` package (``pip install trysiren[http2]``).
+            transport: Custom :class:`~siren.http.transport.AsyncTransportProtocol` (e.g. ``AsyncInMemoryTransport``). Overrides the pool and timeout options; the caller keeps ownership and must close it.
+            retry_policy: Retry transient failures (network errors, 429/5xx) with backoff. ``None`` (default) disables retries.
+            rate_limiter: Paces requests, globally or per endpoint group, by awaiting a free token. Can be the same instance passed to a ``SirenClient``. ``None`` (default) disables pacing.
+            circuit_breaker: Fails fast with ``SirenCircuitOpenError`` on endpoints whose recent calls keep failing. Can be the same instance passed to a ``SirenClient``. ``None`` (default) disables it.
+            hedger: Races a second request against slow read-only calls and cancels the loser. Can be the same instance passed to a ``SirenClient``. ``None`` (default) disables hedging.
+            compression: Gzip- or zstd-encode request bodies above a size threshold (e.g. large ``workflow.trigger_bulk`` payloads) and set ``Content-Encoding``. ``None`` (default) sends bodies uncompressed.
+            validate_requests: Re-validate the payloads the SDK builds itself (message sends, workflow triggers) against their request models before sending. ``False`` skips that pass for lower per-call overhead; the API still rejects malformed requests. Override per call with ``RequestOptions(validate_request=...)``.
+            response_mode: How read calls (message status and replies, template and channel-template listings) return data: ``"model"`` (pydantic models, the default), ``"raw"`` (plain dicts and lists as decoded from JSON) or ``"lazy"`` (views that validate each field on first access). Override per call with ``RequestOptions(response_mode=...)``.
+            status_cache: A :class:`~siren.clients.status_cache.StatusCache` answering repeated ``message.get_status`` calls: non-terminal statuses for a short TTL, terminal ones until evicted. The same cache may be shared with other (sync or async) clients. ``None`` (default) disables caching.
+            idempotency_window: An :class:`~siren.http.idempotency.IdempotencyWindow` remembering the idempotency keys of recent calls: a repeated key returns the first call's result without contacting the API, and one still in flight raises ``SirenDuplicateRequestError``. May be shared with other clients. ``None`` (default) disables local deduplication.
+            auto_idempotency_keys: Give every message send and workflow trigger a random idempotency key unless the call passes ``idempotency_key=``, so the retry policy may safely repeat them.
         """
         if api_key is None:
             api_key = os.getenv("SIREN_API_KEY")
@@ -46,6 +105,9 @@ class AsyncSirenClient:  # noqa: D101
                 "The api_key must be set either by passing api_key to the client or by setting the SIREN_API_KEY environment variable"
             )
         self.api_key = api_key
+        # Domain clients are built lazily, so check their settings up front.
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {RESPONSE_MODES}")
 
         if env is None:
             env = os.getenv("SIREN_ENV", "prod")
@@ -58,66 +120,168 @@ class AsyncSirenClient:  # noqa: D101
         self.env: Literal["dev", "prod"] = env  # concrete
         self.base_url = self.API_URLS[env]
 
-        # Domain clients
-        self._webhook_client = AsyncWebhookClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._message_client = AsyncMessageClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._template_client = AsyncTemplateClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._channel_template_client = AsyncChannelTemplateClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._user_client = AsyncUserClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._workflow_client = AsyncWorkflowClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
+        self._keepalive_task: asyncio.Task[None] | None = None
+        self._owns_transport = transport is None
+        self._transport: AsyncTransportProtocol
+        if transport is not None:
+            self._transport = transport
+        else:
+            self._transport = AsyncTransport(
+                timeout=timeout,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                pool_timeout=pool_timeout,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
+        self._client_kwargs: dict[str, Any] = {
+            "api_key": self.api_key,
+            "base_url": self.base_url,
+            "transport": self._transport,
+            "retry_policy": retry_policy,
+            "rate_limiter": rate_limiter,
+            "circuit_breaker": circuit_breaker,
+            "hedger": hedger,
+            "compression": compression,
+            "validate_requests": validate_requests,
+            "response_mode": response_mode,
+            "idempotency_window": idempotency_window,
+            "auto_idempotency_keys": auto_idempotency_keys,
+        }
+        self._status_cache = status_cache
+
+    def _domain_client(self, attr: str, factory: Callable[..., _C]) -> _C:
+        """Return the domain client stored in *attr*, creating it once."""
+        client = self.__dict__.get(attr)
+        if client is None:
+            client = factory(**self._client_kwargs)
+            setattr(self, attr, client)
+        return client
 
     # ---- Domain accessors ----
     @property
     def webhook(self) -> AsyncWebhookClient:
         """Non-blocking webhook operations."""
-        return self._webhook_client
+        from .clients.webhooks_async import AsyncWebhookClient
+
+        return self._domain_client("_webhook_client", AsyncWebhookClient)
 
     @property
     def message(self) -> AsyncMessageClient:
         """Non-blocking message operations."""
-        return self._message_client
+        from .clients.messaging_async import AsyncMessageClient
+
+        return self._domain_client(
+            "_message_client",
+            functools.partial(AsyncMessageClient, status_cache=self._status_cache),
+        )
 
     @property
     def template(self) -> AsyncTemplateClient:
         """Asynchronous template operations."""
-        return self._template_client
+        from .clients.templates_async import AsyncTemplateClient
+
+        return self._domain_client("_template_client", AsyncTemplateClient)
 
     @property
     def channel_template(self) -> AsyncChannelTemplateClient:
         """Asynchronous channel-template operations."""
-        return self._channel_template_client
+        from .clients.channel_templates_async import AsyncChannelTemplateClient
+
+        return self._domain_client(
+            "_channel_template_client", AsyncChannelTemplateClient
+        )
 
     @property
     def user(self) -> AsyncUserClient:
         """Asynchronous user operations."""
-        return self._user_client
+        from .clients.users_async import AsyncUserClient
+
+        return self._domain_client("_user_client", AsyncUserClient)
 
     @property
     def workflow(self) -> AsyncWorkflowClient:
         """Asynchronous workflow operations."""
-        return self._workflow_client
+        from .clients.workflows_async import AsyncWorkflowClient
+
+        return self._domain_client("_workflow_client", AsyncWorkflowClient)
+
+    # ---- Connection warm-up ----
+    async def warmup(
+        self, connections: int = 1, *, keepalive_interval: float | None = None
+    ) -> int:
+        """Open keep-alive connections to the API before the first real call.
+
+        With ``keepalive_interval`` a background task repeats the warm-up on
+        that schedule so idle connections survive between bursts; it is
+        cancelled by :meth:`aclose` or the next ``warmup`` call.
+
+        Args:
+            connections: Number of connections to open, capped by
+                ``max_connections`` and ``max_keepalive_connections``.
+            keepalive_interval: Seconds between background keep-alive pings.
+                ``None`` (default) warms up once.
+
+        Returns:
+            The number of connections warmed up. ``0`` when the transport
+            does not support warm-up (e.g. ``AsyncInMemoryTransport``).
+
+        Raises:
+            SirenSDKError: If the API cannot be reached.
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        if keepalive_interval is not None and keepalive_interval <= 0:
+            raise ValueError("keepalive_interval must be positive")
+        await self._stop_keepalive()
+        warm: Callable[[str, int], Awaitable[int]] | None = getattr(
+            self._transport, "warmup", None
+        )
+        if warm is None:
+            return 0
+        try:
+            opened = await warm(self.base_url, connections)
+        except self._transport.network_errors as e:
+            raise SirenSDKError(
+                f"Network or connection error: {e}", original_exception=e
+            )
+        if keepalive_interval is not None:
+            self._keepalive_task = asyncio.create_task(
+                self._keepalive_loop(warm, connections, keepalive_interval)
+            )
+        return opened
+
+    async def _keepalive_loop(
+        self,
+        warm: Callable[[str, int], Awaitable[int]],
+        connections: int,
+        interval: float,
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await warm(self.base_url, connections)
+            except self._transport.network_errors:
+                # A missed ping only costs a reconnect later; try again next tick.
+                continue
+
+    async def _stop_keepalive(self) -> None:
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
     # ---- Context management ----
     async def aclose(self) -> None:
-        """Release underlying HTTP resources."""
-        await self._webhook_client.aclose()
-        await self._message_client.aclose()
-        await self._template_client.aclose()
-        await self._channel_template_client.aclose()
-        await self._user_client.aclose()
-        await self._workflow_client.aclose()
+        """Release underlying HTTP resources (unless the transport was passed in)."""
+        await self._stop_keepalive()
+        if self._owns_transport:
+            await self._transport.aclose()
 
     async def __aenter__(self) -> AsyncSirenClient:
         """Enter async context manager returning *self*."""
@@ -1,14 +1,33 @@
 """Siren API client implementation."""
 
+import functools
 import os
-from typing import Literal, Optional
+import threading
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Tuple, TypeVar
 
-from .clients.channel_templates import ChannelTemplateClient
-from .clients.messaging import MessageClient
-from .clients.templates import TemplateClient
-from .clients.users import UserClient
-from .clients.webhooks import WebhookClient
-from .clients.workflows import WorkflowClient
+from .exceptions import SirenSDKError
+from .http.circuit_breaker import CircuitBreaker
+from .http.compression import RequestCompression
+from .http.hedging import Hedger
+from .http.idempotency import IdempotencyWindow
+from .http.options import RESPONSE_MODES, ResponseMode
+from .http.rate_limit import RateLimiter
+from .http.retry import RetryPolicy
+from .http.transport import HttpxTransport, SyncTransport, Transport
+
+if TYPE_CHECKING:
+    from .clients.base import BaseClient
+    from .clients.channel_templates import ChannelTemplateClient
+    from .clients.messaging import MessageClient
+    from .clients.status_cache import StatusCache
+    from .clients.submit import SubmitNamespace
+    from .clients.templates import TemplateClient
+    from .clients.users import UserClient
+    from .clients.webhooks import WebhookClient
+    from .clients.workflows import WorkflowClient
+
+    _C = TypeVar("_C", bound=BaseClient)
 
 
 class SirenClient:
@@ -25,12 +44,53 @@ class SirenClient:
         *,
         api_key: Optional[str] = None,
         env: Optional[Literal["dev", "prod"]] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        http2: bool = False,
+        transport: Optional[Transport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+        compression: Optional[RequestCompression] = None,
+        validate_requests: bool = True,
+        response_mode: ResponseMode = "model",
+        status_cache: Optional["StatusCache"] = None,
+        idempotency_window: Optional[IdempotencyWindow] = None,
+        auto_idempotency_keys: bool = False,
+        executor: Optional[Executor] = None,
+        shutdown_timeout: Optional[float] = 30.0,
     ):
         """Initialize the SirenClient.
 
+        All domain clients share one pooled HTTP session, so connections are
+        reused across calls. Each domain client (and its models) is created on
+        first access to its property, which keeps start-up cheap. Call
+        :meth:`close` (or use the client as a context manager) to release them.
+
         Args:
             api_key: The API key for authentication. If not provided, will be read from SIREN_API_KEY environment variable.
             env: Environment to use ('dev' or 'prod'). If not provided, defaults to 'prod' or uses SIREN_ENV environment variable.
+            pool_connections: Number of per-host connection pools to cache (default 10). Not supported with ``http2=True``, whose ``httpx`` pool is not split per host.
+            pool_maxsize: Maximum number of keep-alive connections per host.
+            pool_block: Block when all pooled connections are busy instead of opening extra, non-pooled ones.
+            keep_alive: Reuse connections between requests. Set to ``False`` to close each connection after use.
+            http2: Use an ``httpx.Client`` that multiplexes concurrent requests over HTTP/2 instead of the ``requests`` session. Requires the ``h2`` package (``pip install trysiren[http2]``). ``pool_maxsize``, ``pool_block`` and ``keep_alive`` keep their meaning; ``pool_connections`` raises ``ValueError``.
+            transport: Custom :class:`~siren.http.transport.Transport` (e.g. ``InMemoryTransport`` for tests and benchmarks). Overrides the pooling and ``http2`` options; the caller keeps ownership and must close it.
+            retry_policy: Retry transient failures (network errors, 429/5xx) with backoff. ``None`` (default) disables retries.
+            rate_limiter: Paces requests, globally or per endpoint group, by blocking the calling thread until a token is free. ``None`` (default) disables pacing.
+            circuit_breaker: Fails fast with ``SirenCircuitOpenError`` on endpoints whose recent calls keep failing, probing them again after a cool-down. ``None`` (default) disables it.
+            hedger: Races a second request against slow read-only calls (message status/replies, template listings) and keeps the first answer. ``None`` (default) disables hedging.
+            compression: Gzip- or zstd-encode request bodies above a size threshold (e.g. large ``workflow.trigger_bulk`` payloads) and set ``Content-Encoding``. ``None`` (default) sends bodies uncompressed.
+            validate_requests: Re-validate the payloads the SDK builds itself (message sends, workflow triggers) against their request models before sending. ``False`` skips that pass for lower per-call overhead; the API still rejects malformed requests. Override per call with ``RequestOptions(validate_request=...)``.
+            response_mode: How read calls (message status and replies, template and channel-template listings) return data: ``"model"`` (pydantic models, the default), ``"raw"`` (plain dicts and lists as decoded from JSON) or ``"lazy"`` (views that validate each field on first access). Override per call with ``RequestOptions(response_mode=...)``.
+            status_cache: A :class:`~siren.clients.status_cache.StatusCache` answering repeated ``message.get_status`` calls: non-terminal statuses for a short TTL, terminal ones until evicted. The same cache may be shared with other (sync or async) clients. ``None`` (default) disables caching.
+            idempotency_window: An :class:`~siren.http.idempotency.IdempotencyWindow` remembering the idempotency keys of recent calls: a repeated key returns the first call's result without contacting the API, and one still in flight raises ``SirenDuplicateRequestError``. May be shared with other clients. ``None`` (default) disables local deduplication.
+            auto_idempotency_keys: Give every message send and workflow trigger a random idempotency key unless the call passes ``idempotency_key=``, so the retry policy may safely repeat them.
+            executor: Thread-based executor running the calls made through :attr:`submit`. It stays owned by the caller. ``None`` (default) creates a thread pool of ``pool_maxsize`` threads on first use, so every worker can hold a pooled connection.
+            shutdown_timeout: Seconds :meth:`close` waits for calls made through :attr:`submit` to finish before cancelling the ones that have not started. ``None`` waits for all of them.
         """
         # Get API key from environment if not provided
         if api_key is None:
@@ -40,6 +100,11 @@ class SirenClient:
                 "The api_key must be set either by passing api_key to the client or by setting the SIREN_API_KEY environment variable"
             )
         self.api_key = api_key
+        # Domain clients are built lazily, so check their settings up front.
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {RESPONSE_MODES}")
+        if shutdown_timeout is not None and shutdown_timeout < 0:
+            raise ValueError("shutdown_timeout must not be negative")
 
         # Determine environment and base URL
         if env is None:
@@ -53,50 +118,213 @@ class SirenClient:
         self.env = env
         self.base_url = self.API_URLS[env]
 
-        # Initialize API clients
-        self._template_client = TemplateClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._channel_template_client = ChannelTemplateClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._workflow_client = WorkflowClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._message_client = MessageClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
-        self._user_client = UserClient(api_key=self.api_key, base_url=self.base_url)
-        self._webhook_client = WebhookClient(
-            api_key=self.api_key, base_url=self.base_url
-        )
+        self._keepalive: Optional[Tuple[threading.Thread, threading.Event]] = None
+        self._owns_transport = transport is None
+        self._transport: Transport
+        if transport is not None:
+            self._transport = transport
+        elif http2:
+            if pool_connections is not None:
+                raise ValueError("pool_connections is not supported with http2=True")
+            # requests semantics on httpx limits: pool_maxsize connections are
+            # kept alive; with pool_block they are also the hard cap, without
+            # it extra connections are opened (and dropped) on demand.
+            self._transport = HttpxTransport(
+                http2=True,
+                max_connections=pool_maxsize if pool_block else None,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            )
+        else:
+            self._transport = SyncTransport(
+                pool_connections=10 if pool_connections is None else pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+            )
+        self._client_kwargs: dict[str, Any] = {
+            "api_key": self.api_key,
+            "base_url": self.base_url,
+            "transport": self._transport,
+            "retry_policy": retry_policy,
+            "rate_limiter": rate_limiter,
+            "circuit_breaker": circuit_breaker,
+            "hedger": hedger,
+            "compression": compression,
+            "validate_requests": validate_requests,
+            "response_mode": response_mode,
+            "idempotency_window": idempotency_window,
+            "auto_idempotency_keys": auto_idempotency_keys,
+        }
+        self._status_cache = status_cache
+        self._executor = executor
+        self._submit_workers = pool_maxsize
+        self.shutdown_timeout = shutdown_timeout
+        self._domain_lock = threading.Lock()
+
+    def _domain_client(self, attr: str, factory: Callable[..., "_C"]) -> "_C":
+        """Return the domain client stored in *attr*, creating it once."""
+        client = self.__dict__.get(attr)
+        if client is None:
+            with self._domain_lock:  # one instance even if threads race here
+                client = self.__dict__.get(attr)
+                if client is None:
+                    client = factory(**self._client_kwargs)
+                    setattr(self, attr, client)
+        return client
 
     @property
-    def template(self) -> TemplateClient:
+    def template(self) -> "TemplateClient":
         """Access to template operations."""
-        return self._template_client
+        from .clients.templates import TemplateClient
+
+        return self._domain_client("_template_client", TemplateClient)
 
     @property
-    def channel_template(self) -> ChannelTemplateClient:
+    def channel_template(self) -> "ChannelTemplateClient":
         """Access to channel template operations."""
-        return self._channel_template_client
+        from .clients.channel_templates import ChannelTemplateClient
+
+        return self._domain_client("_channel_template_client", ChannelTemplateClient)
 
     @property
-    def workflow(self) -> WorkflowClient:
+    def workflow(self) -> "WorkflowClient":
         """Access to workflow operations."""
-        return self._workflow_client
+        from .clients.workflows import WorkflowClient
+
+        return self._domain_client("_workflow_client", WorkflowClient)
 
     @property
-    def message(self) -> MessageClient:
+    def message(self) -> "MessageClient":
         """Access to message operations."""
-        return self._message_client
+        from .clients.messaging import MessageClient
+
+        return self._domain_client(
+            "_message_client",
+            functools.partial(MessageClient, status_cache=self._status_cache),
+        )
 
     @property
-    def user(self) -> UserClient:
+    def user(self) -> "UserClient":
         """Access to user operations."""
-        return self._user_client
+        from .clients.users import UserClient
+
+        return self._domain_client("_user_client", UserClient)
 
     @property
-    def webhook(self) -> WebhookClient:
+    def webhook(self) -> "WebhookClient":
         """Access to webhook operations."""
-        return self._webhook_client
+        from .clients.webhooks import WebhookClient
+
+        return self._domain_client("_webhook_client", WebhookClient)
+
+    @property
+    def submit(self) -> "SubmitNamespace":
+        """Non-blocking access to every domain operation.
+
+        ``client.submit.message.send(...)``, ``client.submit.workflow.trigger(...)``
+        and so on take the same arguments as the blocking methods and return a
+        :class:`concurrent.futures.Future` for their result.
+        """
+        from .clients.submit import SubmitNamespace
+
+        with self._domain_lock:
+            submit = self.__dict__.get("_submit_namespace")
+            if submit is None:
+                submit = self._submit_namespace = SubmitNamespace(
+                    self, executor=self._executor, max_workers=self._submit_workers
+                )
+        return submit
+
+    def warmup(
+        self, connections: int = 1, *, keepalive_interval: Optional[float] = None
+    ) -> int:
+        """Open keep-alive connections to the API before the first real call.
+
+        DNS lookup, TCP and TLS setup then happen here instead of on the
+        first requests after start-up. With ``keepalive_interval`` a daemon
+        thread repeats the warm-up on that schedule, so idle connections are
+        not dropped by the server or the pool between bursts of traffic; it
+        stops when the client is closed or ``warmup`` is called again.
+
+        Args:
+            connections: Number of connections to open, capped by the pool
+                size (``pool_maxsize``).
+            keepalive_interval: Seconds between background keep-alive pings.
+                ``None`` (default) warms up once.
+
+        Returns:
+            The number of connections warmed up. ``0`` when the transport
+            does not support warm-up (e.g. ``InMemoryTransport``).
+
+        Raises:
+            SirenSDKError: If the API cannot be reached.
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        if keepalive_interval is not None and keepalive_interval <= 0:
+            raise ValueError("keepalive_interval must be positive")
+        self._stop_keepalive()
+        warm: Optional[Callable[[str, int], int]] = getattr(
+            self._transport, "warmup", None
+        )
+        if warm is None:
+            return 0
+        try:
+            opened = warm(self.base_url, connections)
+        except self._transport.network_errors as e:
+            raise SirenSDKError(
+                f"Network or connection error: {e}", original_exception=e
+            )
+        if keepalive_interval is not None:
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=self._keepalive_loop,
+                args=(warm, connections, keepalive_interval, stop),
+                name="siren-keepalive",
+                daemon=True,
+            )
+            self._keepalive = (thread, stop)
+            thread.start()
+        return opened
+
+    def _keepalive_loop(
+        self,
+        warm: Callable[[str, int], int],
+        connections: int,
+        interval: float,
+        stop: threading.Event,
+    ) -> None:
+        while not stop.wait(interval):
+            try:
+                warm(self.base_url, connections)
+            except self._transport.network_errors:
+                # A missed ping only costs a reconnect later; try again next tick.
+                continue
+
+    def _stop_keepalive(self) -> None:
+        if self._keepalive is not None:
+            thread, stop = self._keepalive
+            self._keepalive = None
+            stop.set()
+            thread.join()
+
+    def close(self) -> None:
+        """Release pooled HTTP connections (unless the transport was passed in).
+
+        Calls made through :attr:`submit` are drained first, for up to
+        ``shutdown_timeout`` seconds.
+        """
+        submit: Optional[SubmitNamespace] = self.__dict__.get("_submit_namespace")
+        if submit is not None:
+            submit.shutdown(self.shutdown_timeout)
+        self._stop_keepalive()
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> "SirenClient":
+        """Enter context manager returning *self*."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Exit context manager, closing the shared transport."""
+        self.close()
@@ -1,12 +1,32 @@
-"""Client classes for the Siren SDK."""
+"""Client classes for the Siren SDK.
 
-from .base import BaseClient
-from .channel_templates import ChannelTemplateClient
-from .messaging import MessageClient
-from .templates import TemplateClient
-from .users import UserClient
-from .webhooks import WebhookClient
-from .workflows import WorkflowClient
+Each class is imported on first access, so loading one domain client (or the
+base client) does not pull in the others and their models.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseClient
+    from .channel_templates import ChannelTemplateClient
+    from .messaging import MessageClient
+    from .templates import TemplateClient
+    from .users import UserClient
+    from .webhooks import WebhookClient
+    from .workflows import WorkflowClient
+
+_EXPORTS = {
+    "BaseClient": ".base",
+    "ChannelTemplateClient": ".channel_templates",
+    "TemplateClient": ".templates",
+    "UserClient": ".users",
+    "MessageClient": ".messaging",
+    "WebhookClient": ".webhooks",
+    "WorkflowClient": ".workflows",
+}
 
 __all__ = [
     "BaseClient",
@@ -17,3 +37,14 @@ __all__ = [
     "WebhookClient",
     "WorkflowClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import client classes on first access (PEP 562)."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
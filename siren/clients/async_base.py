@@ -6,29 +6,93 @@ Mirrors the synchronous ``BaseClient`` behaviour but utilises
 
 from __future__ import annotations
 
+import asyncio
+import functools
 from typing import Any
 
-import httpx  # type: ignore
 from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticSerializationError, from_json, to_json
 
 from ..exceptions import SirenAPIError, SirenSDKError
-from ..http.transport import AsyncTransport
+from ..http.circuit_breaker import CircuitBreaker
+from ..http.compression import RequestCompression
+from ..http.hedging import Hedger
+from ..http.idempotency import IdempotencyWindow, Scope, with_idempotency_key
+from ..http.options import RESPONSE_MODES, RequestOptions, ResponseMode
+from ..http.rate_limit import RateLimiter
+from ..http.retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy
+from ..http.transport import AsyncTransport, AsyncTransportProtocol, Response
+from ..models.lazy import lazy_data
 
 
 class AsyncBaseClient:  # noqa: D101 – docstring provided at module level
-    def __init__(self, api_key: str, base_url: str, timeout: int = 10):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: int = 10,
+        transport: AsyncTransportProtocol | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
+        compression: RequestCompression | None = None,
+        validate_requests: bool = True,
+        response_mode: ResponseMode = "model",
+        idempotency_window: IdempotencyWindow | None = None,
+        auto_idempotency_keys: bool = False,
+    ):
         """Construct the asynchronous base client.
 
         Args:
             api_key: Bearer token for Siren API.
             base_url: Fully-qualified API root (e.g. ``https://api.trysiren.io``).
-            timeout: Request timeout in seconds.
+            timeout: Request timeout in seconds (only used for a private transport).
+            transport: Any :class:`~siren.http.transport.AsyncTransportProtocol`,
+                usually shared with sibling clients. If omitted, the client
+                creates (and owns) a private ``httpx``-based one.
+            retry_policy: Default retry policy for every request. ``None``
+                disables retries.
+            rate_limiter: Paces requests before they are sent. Share one
+                instance between clients to enforce a common budget.
+            circuit_breaker: Fails fast on endpoints that keep erroring. Share
+                one instance between clients to pool endpoint health.
+            hedger: Re-sends slow read-only requests and keeps the fastest
+                answer. Only calls made with ``hedge=True`` are hedged.
+            compression: Compresses request bodies above a size threshold.
+                ``None`` sends every body uncompressed.
+            validate_requests: Validate payloads the SDK builds itself
+                against their request model. ``False`` serializes them
+                directly; caller-supplied payloads are always validated.
+            response_mode: How read calls return data: ``"model"`` (pydantic
+                models), ``"raw"`` (decoded JSON) or ``"lazy"`` (views that
+                validate each field on first access).
+            idempotency_window: Remembers the idempotency keys of recent
+                calls, answering a repeated key from its first result and
+                rejecting one that is still in flight.
+            auto_idempotency_keys: Give message sends and workflow triggers a
+                random idempotency key when the caller passes none, so the
+                retry policy may repeat them.
         """
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {RESPONSE_MODES}")
         self.api_key = api_key
         self.base_url = base_url
-        self._transport = AsyncTransport(timeout=timeout)
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+        self.compression = compression
+        self.validate_requests = validate_requests
+        self.response_mode: ResponseMode = response_mode
+        self.idempotency_window = idempotency_window
+        self.auto_idempotency_keys = auto_idempotency_keys
+        self._owns_transport = transport is None
+        self._transport: AsyncTransportProtocol = (
+            transport if transport is not None else AsyncTransport(timeout=timeout)
+        )
 
-    async def _parse_json_response(self, response: httpx.Response) -> dict:  # noqa: D401
+    def _parse_json_response(self, response: Response) -> dict:  # noqa: D401
         try:
             return response.json()
         except ValueError as e:
@@ -48,64 +112,68 @@ class AsyncBaseClient:  # noqa: D101 – docstring provided at module level
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         expected_status: int = 200,
+        options: RequestOptions | None = None,
+        path_params: dict[str, Any] | None = None,
+        hedge: bool = False,
+        trusted_payload: bool = False,
+        supports_response_mode: bool = False,
     ) -> BaseModel | bool:
-        url = f"{self.base_url}{endpoint}"
-        headers: dict[str, str] = {"Authorization": f"Bearer {self.api_key}"}
+        path = endpoint.format(**path_params) if path_params else endpoint
+        url = f"{self.base_url}{path}"
+        options = options or RequestOptions()
+        headers: dict[str, str] = {
+            **options.extra_headers,
+            "Authorization": f"Bearer {self.api_key}",
+        }
+        if options.idempotency_key:
+            headers[IDEMPOTENCY_KEY_HEADER] = options.idempotency_key
 
-        json_data = None
-        if data and request_model:
-            try:
-                validated_request = request_model.model_validate(data)
-                json_data = validated_request.model_dump(
-                    by_alias=True, exclude_none=True
-                )
-            except ValidationError as e:
-                raise SirenSDKError(f"Invalid parameters: {e}", original_exception=e)
-
-        if json_data is not None:
+        validate = not trusted_payload or (
+            self.validate_requests
+            if options.validate_request is None
+            else options.validate_request
+        )
+        body = self._serialize_request(request_model, data, validate=validate)
+        if body is not None:
             headers["Content-Type"] = "application/json"
+            if self.compression is not None:
+                body, encoding = self.compression.compress(body)
+                if encoding is not None:
+                    headers["Content-Encoding"] = encoding
 
+        key = options.idempotency_key
+        window = self.idempotency_window if key else None
+        scope: Scope = (method, path, key or "")  # only used with a window
+        if window is not None:
+            seen, result = window.claim(scope)
+            if seen:
+                return result
         try:
-            response = await self._transport.request(
+            response = await self._send_with_retries(
                 method=method,
+                endpoint=endpoint,
                 url=url,
                 headers=headers,
-                json=json_data,
+                body=body,
                 params=params,
+                retry_policy=options.retry_policy or self.retry_policy,
+                timeout=options.timeout,
+                hedge=hedge,
             )
-
-            # Success
-            if response.status_code == expected_status:
-                if expected_status == 204:
-                    return True
-
-                if response_model is not None:
-                    response_json = await self._parse_json_response(response)
-                    parsed = response_model.model_validate(response_json)
-                    if hasattr(parsed, "data") and parsed.data is not None:
-                        return parsed.data
-
-            # Error handling
-            response_json = await self._parse_json_response(response)
-            if response_model is not None:
-                try:
-                    parsed = response_model.model_validate(response_json)
-                    if getattr(parsed, "error_detail", None):
-                        raise SirenAPIError(
-                            error_detail=parsed.error_detail,
-                            status_code=response.status_code,
-                            raw_response=response_json,
-                        )
-                except ValidationError:
-                    pass
-
-            raise SirenSDKError(
-                message=f"Unexpected API response. Status: {response.status_code}",
-                status_code=response.status_code,
-                raw_response=response_json,
+            result = self._handle_response(
+                response,
+                response_model,
+                expected_status,
+                (options.response_mode or self.response_mode)
+                if supports_response_mode
+                else "model",
             )
+            if window is not None:
+                window.complete(scope, result)
+                window = None
+            return result
 
-        except httpx.RequestError as e:
+        except self._transport.network_errors as e:
             raise SirenSDKError(
                 f"Network or connection error: {e}", original_exception=e
             )
@@ -113,10 +181,259 @@ class AsyncBaseClient:  # noqa: D101 – docstring provided at module level
             raise
         except Exception as e:  # noqa: BLE001
             raise SirenSDKError(f"Unexpected error: {e}", original_exception=e)
+        finally:
+            if window is not None:  # failed or cancelled: free the key
+                window.release(scope)
+
+    def _with_idempotency_key(
+        self, options: RequestOptions | None, key: str | None
+    ) -> RequestOptions | None:
+        """Attach the idempotency key a send or trigger should carry."""
+        return with_idempotency_key(options, key, self.auto_idempotency_keys)
+
+    def _serialize_request(
+        self,
+        request_model: type[BaseModel] | None,
+        data: dict[str, Any] | None,
+        validate: bool = True,
+    ) -> bytes | None:
+        """Validate *data* against *request_model* and encode it as JSON bytes.
+
+        With ``validate=False`` the (wire-format) dict is encoded as-is, minus
+        top-level ``None`` values.
+
+        Raises:
+            SirenSDKError: If the data fails validation or cannot be encoded.
+        """
+        if not (data and request_model):
+            return None
+        try:
+            if not validate:
+                return to_json({k: v for k, v in data.items() if v is not None})
+            validated_request = request_model.model_validate(data)
+            # model_dump_json() minus its bytes -> str decode.
+            return request_model.__pydantic_serializer__.to_json(
+                validated_request, by_alias=True, exclude_none=True
+            )
+        except (ValidationError, PydanticSerializationError) as e:
+            raise SirenSDKError(f"Invalid parameters: {e}", original_exception=e)
+
+    async def _send_with_retries(  # noqa: C901
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        params: dict[str, Any] | None,
+        retry_policy: RetryPolicy | None,
+        timeout: float | None = None,
+        hedge: bool = False,
+    ) -> Response:
+        """Send the request, repeating it as long as *retry_policy* allows.
+
+        Each attempt first passes the circuit breaker and waits for the rate
+        limiter, if configured. Network errors from the final attempt are
+        re-raised unchanged.
+
+        Raises:
+            SirenCircuitOpenError: If the endpoint's circuit is open.
+        """
+        breaker = self.circuit_breaker
+        hedger = self.hedger if hedge else None
+        attempt = 1
+        while True:
+            if breaker is not None:
+                breaker.before_request(endpoint)
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(endpoint)
+                send = functools.partial(
+                    self._transport.request,
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    content=body,
+                    params=params,
+                    timeout=timeout,
+                )
+                if hedger is not None:
+                    response = await hedger.call_async(endpoint, send)
+                else:
+                    response = await send()
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure(endpoint)
+                delay = (
+                    retry_policy.delay_after_exception(
+                        attempt, method, headers, e, self._transport.network_errors
+                    )
+                    if retry_policy is not None
+                    else None
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, but a
+                # half-open probe slot must not stay taken.
+                if breaker is not None:
+                    breaker.release_probe(endpoint)
+                raise
+            else:
+                if breaker is not None:
+                    if breaker.is_failure_status(response.status_code):
+                        breaker.record_failure(endpoint)
+                    else:
+                        breaker.record_success(endpoint)
+                delay = (
+                    retry_policy.delay_after_response(
+                        attempt,
+                        method,
+                        headers,
+                        response.status_code,
+                        response.headers,
+                    )
+                    if retry_policy is not None
+                    else None
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _handle_response(
+        self,
+        response: Any,
+        response_model: type[BaseModel] | None,
+        expected_status: int,
+        response_mode: ResponseMode = "model",
+    ) -> BaseModel | bool:
+        """Turn an HTTP response into parsed data or a structured exception.
+
+        The body is decoded once. Responses with the expected status are
+        validated straight from bytes (``"model"``) or decoded without
+        validation (``"raw"``, ``"lazy"``); error responses are decoded to a
+        dict, kept as ``raw_response``, and validated from that.
+
+        Raises:
+            SirenAPIError: If the API returns an error response.
+            SirenSDKError: If the response is unexpected or unparsable.
+        """
+        # Handle success cases
+        if response.status_code == expected_status:
+            if expected_status == 204:  # No Content
+                return True
+
+            if response_model and response_mode != "model":
+                return self._shape_response(response, response_model, response_mode)
+            if response_model:
+                parsed_response = self._validate_json_body(response, response_model)
+                data = getattr(parsed_response, "data", None)
+                if data is not None:
+                    return data
+                # Expected status but no data: report it with the body as
+                # sent, decoded again only on this rare path.
+                self._raise_for_error_detail(
+                    parsed_response, response.status_code, from_json(response.content)
+                )
+
+        # Handle error cases
+        response_json = self._parse_json_response(response)
+        # Try to parse as structured error response
+        if response_model:
+            try:
+                parsed_response = response_model.model_validate(response_json)
+            except ValidationError:
+                pass  # Fall through to generic error
+            else:
+                self._raise_for_error_detail(
+                    parsed_response, response.status_code, response_json
+                )
+
+        # Generic error for unexpected responses
+        raise SirenSDKError(
+            message=f"Unexpected API response. Status: {response.status_code}",
+            status_code=response.status_code,
+            raw_response=response_json,
+        )
+
+    def _shape_response(
+        self,
+        response: Response,
+        response_model: type[BaseModel],
+        response_mode: ResponseMode,
+    ) -> Any:
+        """Return the envelope's ``data`` as decoded JSON or lazy models.
+
+        Raises:
+            SirenAPIError: If the envelope carries an error instead of data.
+            SirenSDKError: If the body is not valid JSON or has no data.
+        """
+        try:
+            envelope = from_json(response.content)
+        except ValueError as e:
+            raise SirenSDKError(
+                f"API response was not valid JSON. Status: {response.status_code}. Content: {response.text}",
+                original_exception=e,
+                status_code=response.status_code,
+            )
+        data = envelope.get("data") if isinstance(envelope, dict) else None
+        if data is not None:
+            return data if response_mode == "raw" else lazy_data(response_model, data)
+        try:
+            parsed_response = response_model.model_validate(envelope)
+        except ValidationError:
+            raise SirenSDKError(
+                message=f"Unexpected API response. Status: {response.status_code}",
+                status_code=response.status_code,
+                raw_response=envelope,
+            )
+        self._raise_for_error_detail(parsed_response, response.status_code, envelope)
+
+    def _validate_json_body(
+        self, response: Response, response_model: type[BaseModel]
+    ) -> BaseModel:
+        """Validate the raw response bytes against *response_model*.
+
+        Raises:
+            SirenSDKError: If the body is not valid JSON.
+            ValidationError: If the JSON does not match *response_model*.
+        """
+        try:
+            return response_model.model_validate_json(response.content)
+        except ValidationError as e:
+            if e.errors()[0]["type"] != "json_invalid":
+                raise
+            raise SirenSDKError(
+                f"API response was not valid JSON. Status: {response.status_code}. Content: {response.text}",
+                original_exception=e,
+                status_code=response.status_code,
+            )
+
+    def _raise_for_error_detail(
+        self, parsed_response: BaseModel, status_code: int, raw_response: dict
+    ) -> None:
+        """Raise ``SirenAPIError`` if *parsed_response* carries an API error.
+
+        Without an error detail, raise a generic ``SirenSDKError``.
+        """
+        error_detail = getattr(parsed_response, "error_detail", None)
+        if error_detail:
+            raise SirenAPIError(
+                error_detail=error_detail,
+                status_code=status_code,
+                raw_response=raw_response,
+            )
+        raise SirenSDKError(
+            message=f"Unexpected API response. Status: {status_code}",
+            status_code=status_code,
+            raw_response=raw_response,
+        )
 
     async def aclose(self) -> None:
-        """Close underlying transport."""
-        await self._transport.aclose()
+        """Close underlying transport if this client created it."""
+        if self._owns_transport:
+            await self._transport.aclose()
 
     async def __aenter__(self) -> AsyncBaseClient:
         """Enter async context manager and return *self*."""
@@ -1,29 +1,95 @@
 """Base client class for all Siren API clients."""
 
+import functools
+import time
 from typing import Any, Dict, Optional, Type, Union
 
-import requests
 from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticSerializationError, from_json, to_json
 
 from ..exceptions import SirenAPIError, SirenSDKError
+from ..http.circuit_breaker import CircuitBreaker
+from ..http.compression import RequestCompression
+from ..http.hedging import Hedger
+from ..http.idempotency import IdempotencyWindow, Scope, with_idempotency_key
+from ..http.options import RESPONSE_MODES, RequestOptions, ResponseMode
+from ..http.rate_limit import RateLimiter
+from ..http.retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy
+from ..http.transport import Response, SyncTransport, Transport
+from ..models.lazy import lazy_data
 
 
 class BaseClient:
     """Base class for all API clients with common HTTP handling."""
 
-    def __init__(self, api_key: str, base_url: str, timeout: int = 10):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: int = 10,
+        transport: Optional[Transport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+        compression: Optional[RequestCompression] = None,
+        validate_requests: bool = True,
+        response_mode: ResponseMode = "model",
+        idempotency_window: Optional[IdempotencyWindow] = None,
+        auto_idempotency_keys: bool = False,
+    ):
         """Initialize the BaseClient.
 
         Args:
             api_key: The API key for authentication.
             base_url: The base URL for the Siren API.
             timeout: Request timeout in seconds.
+            transport: Any :class:`~siren.http.transport.Transport`, usually
+                shared with sibling clients. If omitted, the client creates
+                (and owns) a private ``requests``-based one.
+            retry_policy: Default retry policy for every request. ``None``
+                disables retries.
+            rate_limiter: Paces requests before they are sent. Share one
+                instance between clients to enforce a common budget.
+            circuit_breaker: Fails fast on endpoints that keep erroring. Share
+                one instance between clients to pool endpoint health.
+            hedger: Re-sends slow read-only requests and keeps the fastest
+                answer. Only calls made with ``hedge=True`` are hedged.
+            compression: Compresses request bodies above a size threshold.
+                ``None`` sends every body uncompressed.
+            validate_requests: Validate payloads the SDK builds itself
+                against their request model. ``False`` serializes them
+                directly; caller-supplied payloads are always validated.
+            response_mode: How read calls return data: ``"model"`` (pydantic
+                models), ``"raw"`` (decoded JSON) or ``"lazy"`` (views that
+                validate each field on first access).
+            idempotency_window: Remembers the idempotency keys of recent
+                calls, answering a repeated key from its first result and
+                rejecting one that is still in flight.
+            auto_idempotency_keys: Give message sends and workflow triggers a
+                random idempotency key when the caller passes none, so the
+                retry policy may repeat them.
         """
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {RESPONSE_MODES}")
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+        self.compression = compression
+        self.validate_requests = validate_requests
+        self.response_mode: ResponseMode = response_mode
+        self.idempotency_window = idempotency_window
+        self.auto_idempotency_keys = auto_idempotency_keys
+        self._owns_transport = transport is None
+        self._transport: Transport = (
+            transport if transport is not None else SyncTransport()
+        )
 
-    def _parse_json_response(self, response: requests.Response) -> dict:
+    def _parse_json_response(self, response: Response) -> dict:
         """Parse JSON response and handle parsing errors.
 
         Args:
@@ -37,7 +103,8 @@ class BaseClient:
         """
         try:
             return response.json()
-        except requests.exceptions.JSONDecodeError as e:
+        except ValueError as e:
+            # requests and httpx both raise ValueError subclasses for invalid JSON
             raise SirenSDKError(
                 f"API response was not valid JSON. Status: {response.status_code}. Content: {response.text}",
                 original_exception=e,
@@ -53,17 +120,37 @@ class BaseClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         expected_status: int = 200,
+        options: Optional[RequestOptions] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        hedge: bool = False,
+        trusted_payload: bool = False,
+        supports_response_mode: bool = False,
     ) -> Union[BaseModel, bool]:
         """Make HTTP request with complete error handling.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE).
-            endpoint: API endpoint (e.g., "/api/v1/public/users").
+            endpoint: API endpoint template (e.g.,
+                "/api/v1/public/users/{unique_id}"). The template, not the
+                formatted path, keys rate-limit groups and circuit breakers.
             request_model: Pydantic model for request validation.
             response_model: Pydantic model for response parsing.
             data: Raw data to validate and send.
             params: Query parameters for GET requests.
             expected_status: Expected HTTP status code.
+            options: Per-call timeout, retry policy, idempotency key and
+                extra headers. Never stored on the client, so concurrent calls
+                cannot leak settings into each other.
+            path_params: Values substituted into *endpoint*.
+            hedge: The call is safe to repeat, so the client's hedger (if
+                any) may race a second request against a slow first one.
+            trusted_payload: *data* was built by the SDK in the API's wire
+                format (aliased keys, no ``None`` values in nested objects),
+                so validation may be skipped when ``validate_requests`` or
+                ``options.validate_request`` is ``False``.
+            supports_response_mode: The caller can handle ``"raw"`` and
+                ``"lazy"`` data, so the client's or call's ``response_mode``
+                applies.
 
         Returns:
             Parsed response data or True for successful operations.
@@ -72,75 +159,62 @@ class BaseClient:
             SirenAPIError: If the API returns an error response.
             SirenSDKError: If there's an SDK-level issue.
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        path = endpoint.format(**path_params) if path_params else endpoint
+        url = f"{self.base_url}{path}"
+        options = options or RequestOptions()
+        headers = {**options.extra_headers, "Authorization": f"Bearer {self.api_key}"}
+        if options.idempotency_key:
+            headers[IDEMPOTENCY_KEY_HEADER] = options.idempotency_key
 
-        # Validate request data first (outside main try block)
-        json_data = None
-        if data and request_model:
-            try:
-                validated_request = request_model.model_validate(data)
-                json_data = validated_request.model_dump(
-                    by_alias=True, exclude_none=True
-                )
-            except ValidationError as e:
-                raise SirenSDKError(f"Invalid parameters: {e}", original_exception=e)
+        # Validate, serialize and compress request data once (outside main try
+        # block); every retry attempt resends the same bytes.
+        validate = not trusted_payload or (
+            self.validate_requests
+            if options.validate_request is None
+            else options.validate_request
+        )
+        body = self._serialize_request(request_model, data, validate=validate)
 
-        try:
-            # Prepare headers
-            if json_data:
-                headers["Content-Type"] = "application/json"
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+            if self.compression is not None:
+                body, encoding = self.compression.compress(body)
+                if encoding is not None:
+                    headers["Content-Encoding"] = encoding
 
-            # Make HTTP request
-            response = requests.request(
+        key = options.idempotency_key
+        window = self.idempotency_window if key else None
+        scope: Scope = (method, path, key or "")  # only used with a window
+        if window is not None:
+            seen, result = window.claim(scope)
+            if seen:
+                return result
+        try:
+            response = self._send_with_retries(
                 method=method,
+                endpoint=endpoint,
                 url=url,
                 headers=headers,
-                json=json_data,
+                body=body,
                 params=params,
-                timeout=self.timeout,
+                retry_policy=options.retry_policy or self.retry_policy,
+                timeout=self.timeout if options.timeout is None else options.timeout,
+                hedge=hedge,
             )
-
-            # Handle success cases
-            if response.status_code == expected_status:
-                if expected_status == 204:  # No Content
-                    return True
-
-                if response_model:
-                    response_json = self._parse_json_response(response)
-                    parsed_response = response_model.model_validate(response_json)
-                    if (
-                        hasattr(parsed_response, "data")
-                        and parsed_response.data is not None
-                    ):
-                        return parsed_response.data
-
-            # Handle error cases
-            response_json = self._parse_json_response(response)
-            # Try to parse as structured error response
-            if response_model:
-                try:
-                    parsed_response = response_model.model_validate(response_json)
-                    if (
-                        hasattr(parsed_response, "error_detail")
-                        and parsed_response.error_detail
-                    ):
-                        raise SirenAPIError(
-                            error_detail=parsed_response.error_detail,
-                            status_code=response.status_code,
-                            raw_response=response_json,
-                        )
-                except ValidationError:
-                    pass  # Fall through to generic error
-
-            # Generic error for unexpected responses
-            raise SirenSDKError(
-                message=f"Unexpected API response. Status: {response.status_code}",
-                status_code=response.status_code,
-                raw_response=response_json,
+            result = self._handle_response(
+                response,
+                response_model,
+                expected_status,
+                (options.response_mode or self.response_mode)
+                if supports_response_mode
+                else "model",
             )
+            if window is not None:
+                window.complete(scope, result)
+                window = None
+            return result
 
-        except requests.exceptions.RequestException as e:
+        except self._transport.network_errors as e:
             raise SirenSDKError(
                 f"Network or connection error: {e}", original_exception=e
             )
@@ -150,3 +224,263 @@ class BaseClient:
         except Exception as e:
             # Catch any other exceptions (e.g., JSON parsing errors)
             raise SirenSDKError(f"Unexpected error: {e}", original_exception=e)
+        finally:
+            if window is not None:  # the call failed: free the key
+                window.release(scope)
+
+    def _with_idempotency_key(
+        self, options: Optional[RequestOptions], key: Optional[str]
+    ) -> Optional[RequestOptions]:
+        """Attach the idempotency key a send or trigger should carry."""
+        return with_idempotency_key(options, key, self.auto_idempotency_keys)
+
+    def _serialize_request(
+        self,
+        request_model: Optional[Type[BaseModel]],
+        data: Optional[Dict[str, Any]],
+        validate: bool = True,
+    ) -> Optional[bytes]:
+        """Validate *data* against *request_model* and encode it as JSON bytes.
+
+        The validated model is serialized straight to UTF-8 JSON by
+        pydantic-core, skipping the intermediate dict and stdlib ``json`` pass.
+        With ``validate=False`` the (wire-format) dict is encoded as-is, minus
+        top-level ``None`` values.
+
+        Raises:
+            SirenSDKError: If the data fails validation or cannot be encoded.
+        """
+        if not (data and request_model):
+            return None
+        try:
+            if not validate:
+                return to_json({k: v for k, v in data.items() if v is not None})
+            validated_request = request_model.model_validate(data)
+            # model_dump_json() minus its bytes -> str decode.
+            return request_model.__pydantic_serializer__.to_json(
+                validated_request, by_alias=True, exclude_none=True
+            )
+        except (ValidationError, PydanticSerializationError) as e:
+            raise SirenSDKError(f"Invalid parameters: {e}", original_exception=e)
+
+    def _send_with_retries(  # noqa: C901
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        retry_policy: Optional[RetryPolicy],
+        timeout: float,
+        hedge: bool = False,
+    ) -> Any:
+        """Send the request, repeating it as long as *retry_policy* allows.
+
+        Each attempt first passes the circuit breaker and waits for the rate
+        limiter, if configured. Network errors from the final attempt are
+        re-raised unchanged.
+
+        Raises:
+            SirenCircuitOpenError: If the endpoint's circuit is open.
+        """
+        breaker = self.circuit_breaker
+        hedger = self.hedger if hedge else None
+        attempt = 1
+        while True:
+            if breaker is not None:
+                breaker.before_request(endpoint)
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(endpoint)
+                send = functools.partial(
+                    self._transport.request,
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    content=body,
+                    params=params,
+                    timeout=timeout,
+                )
+                response = hedger.call(endpoint, send) if hedger else send()
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure(endpoint)
+                delay = (
+                    retry_policy.delay_after_exception(
+                        attempt, method, headers, e, self._transport.network_errors
+                    )
+                    if retry_policy is not None
+                    else None
+                )
+                if delay is None:
+                    raise
+            except BaseException:
+                # Cancelled or interrupted: no outcome to record, but a
+                # half-open probe slot must not stay taken.
+                if breaker is not None:
+                    breaker.release_probe(endpoint)
+                raise
+            else:
+                if breaker is not None:
+                    if breaker.is_failure_status(response.status_code):
+                        breaker.record_failure(endpoint)
+                    else:
+                        breaker.record_success(endpoint)
+                delay = (
+                    retry_policy.delay_after_response(
+                        attempt,
+                        method,
+                        headers,
+                        response.status_code,
+                        response.headers,
+                    )
+                    if retry_policy is not None
+                    else None
+                )
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    def _handle_response(
+        self,
+        response: Any,
+        response_model: Optional[Type[BaseModel]],
+        expected_status: int,
+        response_mode: ResponseMode = "model",
+    ) -> Union[BaseModel, bool]:
+        """Turn an HTTP response into parsed data or a structured exception.
+
+        The body is decoded once. Responses with the expected status are
+        validated straight from bytes (``"model"``) or decoded without
+        validation (``"raw"``, ``"lazy"``); error responses are decoded to a
+        dict, kept as ``raw_response``, and validated from that.
+
+        Raises:
+            SirenAPIError: If the API returns an error response.
+            SirenSDKError: If the response is unexpected or unparsable.
+        """
+        # Handle success cases
+        if response.status_code == expected_status:
+            if expected_status == 204:  # No Content
+                return True
+
+            if response_model and response_mode != "model":
+                return self._shape_response(response, response_model, response_mode)
+            if response_model:
+                parsed_response = self._validate_json_body(response, response_model)
+                data = getattr(parsed_response, "data", None)
+                if data is not None:
+                    return data
+                # Expected status but no data: report it with the body as
+                # sent, decoded again only on this rare path.
+                self._raise_for_error_detail(
+                    parsed_response, response.status_code, from_json(response.content)
+                )
+
+        # Handle error cases
+        response_json = self._parse_json_response(response)
+        # Try to parse as structured error response
+        if response_model:
+            try:
+                parsed_response = response_model.model_validate(response_json)
+            except ValidationError:
+                pass  # Fall through to generic error
+            else:
+                self._raise_for_error_detail(
+                    parsed_response, response.status_code, response_json
+                )
+
+        # Generic error for unexpected responses
+        raise SirenSDKError(
+            message=f"Unexpected API response. Status: {response.status_code}",
+            status_code=response.status_code,
+            raw_response=response_json,
+        )
+
+    def _shape_response(
+        self,
+        response: Response,
+        response_model: Type[BaseModel],
+        response_mode: ResponseMode,
+    ) -> Any:
+        """Return the envelope's ``data`` as decoded JSON or lazy models.
+
+        Raises:
+            SirenAPIError: If the envelope carries an error instead of data.
+            SirenSDKError: If the body is not valid JSON or has no data.
+        """
+        try:
+            envelope = from_json(response.content)
+        except ValueError as e:
+            raise SirenSDKError(
+                f"API response was not valid JSON. Status: {response.status_code}. Content: {response.text}",
+                original_exception=e,
+                status_code=response.status_code,
+            )
+        data = envelope.get("data") if isinstance(envelope, dict) else None
+        if data is not None:
+            return data if response_mode == "raw" else lazy_data(response_model, data)
+        try:
+            parsed_response = response_model.model_validate(envelope)
+        except ValidationError:
+            raise SirenSDKError(
+                message=f"Unexpected API response. Status: {response.status_code}",
+                status_code=response.status_code,
+                raw_response=envelope,
+            )
+        self._raise_for_error_detail(parsed_response, response.status_code, envelope)
+
+    def _validate_json_body(
+        self, response: Response, response_model: Type[BaseModel]
+    ) -> BaseModel:
+        """Validate the raw response bytes against *response_model*.
+
+        Raises:
+            SirenSDKError: If the body is not valid JSON.
+            ValidationError: If the JSON does not match *response_model*.
+        """
+        try:
+            return response_model.model_validate_json(response.content)
+        except ValidationError as e:
+            if e.errors()[0]["type"] != "json_invalid":
+                raise
+            raise SirenSDKError(
+                f"API response was not valid JSON. Status: {response.status_code}. Content: {response.text}",
+                original_exception=e,
+                status_code=response.status_code,
+            )
+
+    def _raise_for_error_detail(
+        self, parsed_response: BaseModel, status_code: int, raw_response: dict
+    ) -> None:
+        """Raise ``SirenAPIError`` if *parsed_response* carries an API error.
+
+        Without an error detail, raise a generic ``SirenSDKError``.
+        """
+        error_detail = getattr(parsed_response, "error_detail", None)
+        if error_detail:
+            raise SirenAPIError(
+                error_detail=error_detail,
+                status_code=status_code,
+                raw_response=raw_response,
+            )
+        raise SirenSDKError(
+            message=f"Unexpected API response. Status: {status_code}",
+            status_code=status_code,
+            raw_response=raw_response,
+        )
+
+    def close(self) -> None:
+        """Close the underlying transport if this client created it."""
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> "BaseClient":
+        """Enter context manager and return *self*."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Exit context manager, closing the underlying transport."""
+        self.close()
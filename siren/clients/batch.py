@@ -0,0 +1,79 @@
+"""Run many blocking SDK calls with a bound on how many are in flight.
+
+Used by the batch helpers of the domain clients (e.g.
+:meth:`siren.clients.messaging.MessageClient.send_many`). Items are pulled from
+the input lazily, so arbitrarily long iterables never queue more than
+``concurrency`` calls at a time, and results are reported as
+``(index, value_or_exception)`` pairs in completion order.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+__all__ = ["iter_bounded", "ordered_results"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def iter_bounded(
+    call: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+    fail_fast: bool = False,
+    thread_name_prefix: str = "siren-batch",
+) -> Iterator[tuple[int, R | Exception]]:
+    """Apply *call* to every item on worker threads, yielding as calls finish.
+
+    Args:
+        call: Function run once per item.
+        items: Inputs, consumed lazily.
+        concurrency: Maximum number of calls in flight.
+        fail_fast: Re-raise the first exception instead of yielding it, and
+            drop every call that has not started yet. Calls already running
+            cannot be interrupted and finish in the background.
+        thread_name_prefix: Name prefix of the worker threads.
+
+    Yields:
+        ``(index, result)`` pairs, where *result* is the call's return value
+        or the exception it raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    source = enumerate(items)
+    executor = ThreadPoolExecutor(concurrency, thread_name_prefix=thread_name_prefix)
+    pending: dict[Future[R], int] = {}
+    finished = False
+    try:
+        for index, item in islice(source, concurrency):
+            pending[executor.submit(call, item)] = index
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                error = future.exception()
+                if error is not None and fail_fast:
+                    raise error
+                # Refill before yielding so workers stay busy while the
+                # caller handles this result.
+                for next_index, item in islice(source, 1):
+                    pending[executor.submit(call, item)] = next_index
+                yield index, future.result() if error is None else error  # type: ignore[misc]
+        finished = True
+    finally:
+        # On errors or an abandoned iterator, queued calls are cancelled
+        # rather than waited for. (By hand: shutdown(cancel_futures=True)
+        # needs Python 3.9.)
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=finished)
+
+
+def ordered_results(results: Iterable[tuple[int, Any]]) -> list[Any]:
+    """Collect ``(index, result)`` pairs into a list in index order."""
+    by_index = dict(results)
+    return [by_index[i] for i in range(len(by_index))]
@@ -0,0 +1,65 @@
+"""Run many SDK coroutines with a bound on how many are in flight.
+
+Non-blocking counterpart of :mod:`siren.clients.batch`, used by the async
+clients' batch helpers (e.g.
+:meth:`siren.clients.messaging_async.AsyncMessageClient.send_many`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+__all__ = ["iter_bounded_async"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def iter_bounded_async(
+    call: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+    fail_fast: bool = False,
+) -> AsyncIterator[tuple[int, R | Exception]]:
+    """Await *call* for every item as tasks, yielding results as they finish.
+
+    Args:
+        call: Coroutine function run once per item.
+        items: Inputs, consumed lazily.
+        concurrency: Maximum number of tasks in flight.
+        fail_fast: Re-raise the first exception instead of yielding it, and
+            cancel every task still in flight.
+
+    Yields:
+        ``(index, result)`` pairs, where *result* is the call's return value
+        or the exception it raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    source = enumerate(items)
+    pending: dict[asyncio.Task[R], int] = {}
+
+    def start(batch: int) -> None:
+        for index, item in islice(source, batch):
+            pending[asyncio.ensure_future(call(item))] = index
+
+    try:
+        start(concurrency)
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                error = task.exception()
+                if error is not None and fail_fast:
+                    raise error
+                start(1)
+                yield index, task.result() if error is None else error  # type: ignore[misc]
+    finally:
+        # Errors, cancellation or an abandoned iterator: stop what is running.
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
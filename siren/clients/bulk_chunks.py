@@ -0,0 +1,152 @@
+"""Split huge ``trigger_bulk`` notify lists into bounded requests.
+
+:meth:`~siren.clients.workflows.WorkflowClient.trigger_bulk_chunked` cuts
+``notify`` into consecutive chunks of at most ``max_items`` elements whose
+request body stays under ``max_bytes`` (measured with the same compact JSON
+encoder the client sends), triggers them with bounded parallelism, and
+returns a :class:`ChunkedBulkExecution` that maps every chunk's execution
+IDs back to the positions of its ``notify`` elements and keeps the error of
+each chunk that failed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_core import to_json
+
+from ..exceptions import SirenSDKError
+from ..http.options import RequestOptions
+from ..models.workflows import BulkWorkflowExecutionData
+
+__all__ = ["BulkChunk", "ChunkedBulkExecution", "chunk_notify", "chunk_options"]
+
+DEFAULT_MAX_ITEMS = 1000
+DEFAULT_MAX_BYTES = 1_000_000
+
+
+def chunk_notify(
+    workflow_name: str,
+    notify: list[dict[str, Any]],
+    data: dict[str, Any] | None = None,
+    *,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> list[tuple[int, int]]:
+    """Return ``(start, stop)`` bounds of the chunks *notify* is sent in.
+
+    Every chunk holds at most *max_items* elements, and its request body
+    (including ``workflowName`` and ``data``) at most *max_bytes* bytes. An
+    element too large to fit on its own still gets a chunk of its own; the
+    API decides whether to accept it.
+    """
+    if max_items < 1:
+        raise ValueError("max_items must be at least 1")
+    if max_bytes < 1:
+        raise ValueError("max_bytes must be at least 1")
+    envelope: dict[str, Any] = {"workflowName": workflow_name, "notify": []}
+    if data is not None:
+        envelope["data"] = data
+    base = len(to_json(envelope))
+    bounds = []
+    start, size = 0, base
+    for i, item in enumerate(notify):
+        item_size = len(to_json(item)) + (i > start)  # "," between elements
+        if i > start and (i - start >= max_items or size + item_size > max_bytes):
+            bounds.append((start, i))
+            start, size = i, base
+            item_size -= 1
+        size += item_size
+    if start < len(notify):
+        bounds.append((start, len(notify)))
+    return bounds
+
+
+def chunk_options(
+    request_options: RequestOptions | None, start: int
+) -> RequestOptions | None:
+    """Return the options for the chunk starting at position *start*.
+
+    An idempotency key becomes ``"{key}:{start}"``, so every chunk is
+    deduplicated on its own: repeating the whole chunked trigger with the
+    same key and limits resends no chunk twice, and no chunk is mistaken for
+    another.
+    """
+    if request_options is None or not request_options.idempotency_key:
+        return request_options
+    key = f"{request_options.idempotency_key}:{start}"
+    return request_options.merge(RequestOptions(idempotency_key=key))
+
+
+@dataclass(frozen=True)
+class BulkChunk:
+    """One ``trigger_bulk`` request of a chunked bulk trigger.
+
+    Attributes:
+        start: Position in ``notify`` of the chunk's first element.
+        stop: Position after the chunk's last element.
+        result: The API's answer, ``None`` if the chunk failed.
+        error: Why the chunk failed, ``None`` if it succeeded.
+    """
+
+    start: int
+    stop: int
+    result: BulkWorkflowExecutionData | None = None
+    error: Exception | None = None
+
+    @classmethod
+    def of(cls, start: int, stop: int, outcome: Any) -> BulkChunk:
+        """Build the chunk from its ``trigger_bulk`` return value or error."""
+        if isinstance(outcome, Exception):
+            return cls(start, stop, error=outcome)
+        count = len(outcome.workflow_execution_ids)
+        if count != stop - start:
+            error = SirenSDKError(
+                f"trigger_bulk returned {count} execution IDs for "
+                f"{stop - start} notify elements"
+            )
+            return cls(start, stop, error=error)
+        return cls(start, stop, result=outcome)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the chunk was triggered."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class ChunkedBulkExecution:
+    """Aggregated outcome of a chunked bulk trigger.
+
+    Attributes:
+        chunks: Every chunk, in ``notify`` order.
+    """
+
+    chunks: list[BulkChunk]
+
+    @property
+    def workflow_execution_ids(self) -> list[str | None]:
+        """Execution ID per ``notify`` element, ``None`` where its chunk failed."""
+        ids: list[str | None] = []
+        for chunk in self.chunks:
+            if chunk.result is None:
+                ids.extend([None] * (chunk.stop - chunk.start))
+            else:
+                ids.extend(chunk.result.workflow_execution_ids)
+        return ids
+
+    @property
+    def request_ids(self) -> list[str]:
+        """Request IDs of the chunks that succeeded."""
+        return [c.result.request_id for c in self.chunks if c.result is not None]
+
+    @property
+    def failed(self) -> list[BulkChunk]:
+        """Chunks that failed; retry them with ``notify[chunk.start:chunk.stop]``."""
+        return [c for c in self.chunks if not c.ok]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every chunk was triggered."""
+        return all(c.ok for c in self.chunks)
@@ -2,6 +2,7 @@
 
 from typing import List, Optional
 
+from ..http.options import RequestOptions
 from ..models.templates import (
     ChannelTemplate,
     CreateChannelTemplatesRequest,
@@ -15,7 +16,11 @@ class ChannelTemplateClient(BaseClient):
     """Client for channel template operations."""
 
     def create(
-        self, template_id: str, **channel_templates_data
+        self,
+        template_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
+        **channel_templates_data,
     ) -> List[ChannelTemplate]:
         """Create or update channel templates for a specific template.
 
@@ -24,6 +29,8 @@ class ChannelTemplateClient(BaseClient):
             **channel_templates_data: Channel templates configuration where keys are
                                     channel names (e.g., "EMAIL", "SMS") and values
                                     are the channel-specific template objects.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             List[ChannelTemplate]: List of created channel template objects.
@@ -34,10 +41,12 @@ class ChannelTemplateClient(BaseClient):
         """
         response = self._make_request(
             method="POST",
-            endpoint=f"/api/v1/public/template/{template_id}/channel-templates",
+            endpoint="/api/v1/public/template/{template_id}/channel-templates",
+            path_params={"template_id": template_id},
             request_model=CreateChannelTemplatesRequest,
             response_model=CreateChannelTemplatesResponse,
             data=channel_templates_data,
+            options=request_options,
         )
         return response
 
@@ -49,6 +58,8 @@ class ChannelTemplateClient(BaseClient):
         sort: Optional[str] = None,
         page: Optional[int] = None,
         size: Optional[int] = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> List[ChannelTemplate]:
         """Fetch channel templates for a specific template version.
 
@@ -59,6 +70,8 @@ class ChannelTemplateClient(BaseClient):
             sort: Sort by field.
             page: Page number.
             size: Page size.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             List[ChannelTemplate]: List of channel template objects.
@@ -81,8 +94,12 @@ class ChannelTemplateClient(BaseClient):
 
         response = self._make_request(
             method="GET",
-            endpoint=f"/api/v1/public/template/versions/{version_id}/channel-templates",
+            hedge=True,
+            supports_response_mode=True,
+            endpoint="/api/v1/public/template/versions/{version_id}/channel-templates",
+            path_params={"version_id": version_id},
             response_model=GetChannelTemplatesResponse,
             params=params,
+            options=request_options,
         )
         return response
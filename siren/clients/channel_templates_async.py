@@ -1,7 +1,8 @@
 """Asynchronous channel-template operations for Siren SDK."""
 
-from typing import Any
+from typing import Any, Optional
 
+from ..http.options import RequestOptions
 from ..models.templates import (
     ChannelTemplate,
     CreateChannelTemplatesRequest,
@@ -15,25 +16,41 @@ class AsyncChannelTemplateClient(AsyncBaseClient):
     """Non-blocking channel-template actions."""
 
     async def create(
-        self, template_id: str, **channel_payloads: Any
+        self,
+        template_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
+        **channel_payloads: Any,
     ) -> list[ChannelTemplate]:
         """Create channel templates for the given template ID."""
         payload: dict[str, Any] = {k: v for k, v in channel_payloads.items() if v}
         response = await self._make_request(
             method="POST",
-            endpoint=f"/api/v1/public/template/{template_id}/channel-templates",
+            endpoint="/api/v1/public/template/{template_id}/channel-templates",
+            path_params={"template_id": template_id},
             request_model=CreateChannelTemplatesRequest,
             response_model=CreateChannelTemplatesResponse,
             data=payload,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
 
-    async def get(self, version_id: str, **params: Any) -> list[ChannelTemplate]:
+    async def get(
+        self,
+        version_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
+        **params: Any,
+    ) -> list[ChannelTemplate]:
         """Get channel templates for a specific template version."""
         response = await self._make_request(
             method="GET",
-            endpoint=f"/api/v1/public/template/versions/{version_id}/channel-templates",
+            hedge=True,
+            supports_response_mode=True,
+            endpoint="/api/v1/public/template/versions/{version_id}/channel-templates",
+            path_params={"version_id": version_id},
             response_model=GetChannelTemplatesResponse,
             params=params or None,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
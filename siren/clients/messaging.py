@@ -1,7 +1,21 @@
 """Messaging client for the Siren SDK."""
 
-from typing import Any, Dict, List, Optional
+import time
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from ..exceptions import SirenSDKError
+from ..http.options import RequestOptions
 from ..models.messaging import (
     MessageRepliesResponse,
     MessageStatusResponse,
@@ -12,11 +26,36 @@ from ..models.messaging import (
     SendMessageResponse,
 )
 from .base import BaseClient
+from .batch import iter_bounded, ordered_results
+from .replies import RAW_OPTIONS, ReplyCursors, newer_replies, shape_replies
+from .status_cache import StatusCache
+from .status_polling import (
+    TERMINAL_STATUSES,
+    PollBackoff,
+    StatusTransition,
+    is_transient,
+    iter_status_transitions,
+)
 
 
 class MessageClient(BaseClient):
     """Client for direct message operations."""
 
+    def __init__(
+        self, *args: Any, status_cache: Optional[StatusCache] = None, **kwargs: Any
+    ):
+        """Initialize MessageClient.
+
+        Args:
+            status_cache: Serve repeated :meth:`get_status` calls from this
+                cache. ``None`` (default) always asks the API.
+            *args: :class:`BaseClient` arguments.
+            **kwargs: :class:`BaseClient` options.
+        """
+        super().__init__(*args, **kwargs)
+        self.status_cache = status_cache
+        self.reply_cursors = ReplyCursors()
+
     def send(
         self,
         recipient_value: str,
@@ -28,6 +67,8 @@ class MessageClient(BaseClient):
         template_variables: Optional[Dict[str, Any]] = None,
         provider_name: Optional[str] = None,
         provider_code: Optional[ProviderCode] = None,
+        idempotency_key: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> str:
         """Send a message either using a template or directly.
 
@@ -40,6 +81,11 @@ class MessageClient(BaseClient):
             template_variables: Optional template variables for template-based messages
             provider_name: Optional provider name (must be provided with provider_code)
             provider_code: Optional provider code from ProviderCode enum (must be provided with provider_name)
+            idempotency_key: Sent as the ``Idempotency-Key`` header, which
+                lets the retry policy repeat the call. Generated when the
+                client has ``auto_idempotency_keys`` set and none is given.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             The message ID of the sent message.
@@ -57,7 +103,7 @@ class MessageClient(BaseClient):
         
         recipient = self._create_recipient(channel, recipient_value)
         payload = {
-            "recipient": recipient.model_dump(),
+            "recipient": recipient.model_dump(exclude_none=True),
             "channel": channel,
         }
 
@@ -84,6 +130,8 @@ class MessageClient(BaseClient):
             request_model=SendMessageRequest,
             response_model=SendMessageResponse,
             data=payload,
+            options=self._with_idempotency_key(request_options, idempotency_key),
+            trusted_payload=True,
         )
         return response.message_id
 
@@ -96,6 +144,8 @@ class MessageClient(BaseClient):
         template_variables: Optional[Dict[str, Any]] = None,
         provider_name: Optional[str] = None,
         provider_code: Optional[ProviderCode] = None,
+        idempotency_key: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> str:
         """Send a message using a template path.
 
@@ -106,6 +156,11 @@ class MessageClient(BaseClient):
             template_variables: Optional template variables for template-based messages
             provider_name: Optional provider name (must be provided with provider_code)
             provider_code: Optional provider code from ProviderCode enum (must be provided with provider_name)
+            idempotency_key: Sent as the ``Idempotency-Key`` header, which
+                lets the retry policy repeat the call. Generated when the
+                client has ``auto_idempotency_keys`` set and none is given.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             The message ID of the sent message.
@@ -143,49 +198,275 @@ class MessageClient(BaseClient):
             request_model=SendMessageRequest,
             response_model=SendMessageResponse,
             data=payload,
+            options=self._with_idempotency_key(request_options, idempotency_key),
+            trusted_payload=True,
         )
         return response.message_id
 
-    def get_status(self, message_id: str) -> str:
+    def get_status(
+        self, message_id: str, *, request_options: Optional[RequestOptions] = None
+    ) -> str:
         """Retrieve the status of a specific message.
 
         Args:
             message_id: The ID of the message for which to retrieve the status.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
-            The status of the message (e.g., "DELIVERED", "PENDING").
+            The status of the message (e.g., "DELIVERED", "PENDING"). With a
+            ``status_cache`` it may come from the cache.
 
         Raises:
             SirenAPIError: If the API returns an error response.
             SirenSDKError: If there's an SDK-level issue (network, parsing, etc).
         """
+        if self.status_cache is not None:
+            status = self.status_cache.get(message_id)
+            if status is not None:
+                return status
+        return self._fetch_status(message_id, request_options)
+
+    def _fetch_status(
+        self, message_id: str, request_options: Optional[RequestOptions] = None
+    ) -> str:
+        """Ask the API for a message's status and refresh the cache with it."""
         response = self._make_request(
             method="GET",
-            endpoint=f"/api/v1/public/message-status/{message_id}",
+            hedge=True,
+            supports_response_mode=True,
+            endpoint="/api/v1/public/message-status/{message_id}",
+            path_params={"message_id": message_id},
             response_model=MessageStatusResponse,
+            options=request_options,
         )
-        return response.status
+        status = response["status"] if isinstance(response, dict) else response.status
+        if self.status_cache is not None:
+            self.status_cache.put(message_id, status)
+        return status
 
-    def get_replies(self, message_id: str) -> List[ReplyData]:
+    def get_replies(
+        self,
+        message_id: str,
+        *,
+        since: Optional[str] = None,
+        incremental: bool = False,
+        request_options: Optional[RequestOptions] = None,
+    ) -> List[ReplyData]:
         """Retrieve replies for a specific message.
 
         Args:
             message_id: The ID of the message for which to retrieve replies.
+            since: Only return replies with a ``ts`` after this one.
+            incremental: Only return replies newer than the newest one an
+                earlier incremental call returned for this message (tracked
+                in :attr:`reply_cursors`). The first call returns them all.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
-            A list of reply objects containing message details.
+            A list of reply objects containing message details. With ``since``
+            or ``incremental``, only the new replies, oldest first; only they
+            are validated.
 
         Raises:
             SirenAPIError: If the API returns an error response.
             SirenSDKError: If there's an SDK-level issue (network, parsing, etc).
         """
-        response = self._make_request(
+        if since is None and not incremental:
+            response = self._make_request(
+                method="GET",
+                hedge=True,
+                supports_response_mode=True,
+                endpoint="/api/v1/public/get-reply/{message_id}",
+                path_params={"message_id": message_id},
+                response_model=MessageRepliesResponse,
+                options=request_options,
+            )
+            return response
+        if since is None:
+            since = self.reply_cursors.get(message_id)
+        replies, newest = self._fetch_new_replies(message_id, since, request_options)
+        if incremental and newest is not None:
+            self.reply_cursors.advance(message_id, newest)
+        return replies
+
+    def iter_replies(
+        self,
+        message_id: str,
+        *,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        since: Optional[str] = None,
+        timeout: Optional[float] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[ReplyData]:
+        """Yield the replies to a message as they arrive.
+
+        The thread is polled every ``poll_interval`` seconds while replies
+        keep coming; each empty poll stretches the interval (up to
+        ``max_interval``) and a new reply resets it. Transient failures
+        (network errors, 429/5xx) only delay the next poll.
+
+        Args:
+            message_id: The message whose replies to watch.
+            poll_interval: Seconds between polls while the thread is active.
+            max_interval: Upper bound for the interval of a quiet thread.
+            since: Only yield replies with a ``ts`` after this one. ``None``
+                starts with the replies already in the thread.
+            timeout: Stop iterating after this many seconds. ``None`` polls
+                until the caller stops iterating.
+            request_options: Per-call overrides for every poll.
+
+        Yields:
+            Each new reply once, in ``ts`` order within a poll.
+
+        Raises:
+            SirenSDKError: If a poll fails with an error retrying cannot fix,
+                such as a 4xx answer or a reply that does not validate.
+        """
+        backoff = PollBackoff(
+            initial=poll_interval, max_interval=max(max_interval, poll_interval)
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval: Optional[float] = None
+        while True:
+            try:
+                replies, since = self._fetch_new_replies(
+                    message_id, since, request_options
+                )
+            except SirenSDKError as e:
+                if not is_transient(e):
+                    raise
+                replies = []
+            yield from replies
+            interval = backoff.next_interval(None if replies else interval)
+            delay = backoff.delay(interval)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                return
+            time.sleep(delay)
+
+    def _fetch_new_replies(
+        self,
+        message_id: str,
+        since: Optional[str],
+        request_options: Optional[RequestOptions],
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Return the replies after *since*, validated, and the newest ``ts``."""
+        options = (request_options or RequestOptions()).merge(RAW_OPTIONS)
+        items: Any = self._make_request(
             method="GET",
-            endpoint=f"/api/v1/public/get-reply/{message_id}",
+            hedge=True,
+            supports_response_mode=True,
+            endpoint="/api/v1/public/get-reply/{message_id}",
+            path_params={"message_id": message_id},
             response_model=MessageRepliesResponse,
+            options=options,
         )
-        return response
-    
+        fresh, newest = newer_replies(items, since)
+        mode = (request_options and request_options.response_mode) or self.response_mode
+        return shape_replies(fresh, mode), newest
+
+    def send_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 10,
+        fail_fast: bool = False,
+    ) -> List[Union[str, Exception]]:
+        """Send many messages with at most ``concurrency`` requests in flight.
+
+        Args:
+            items: Message specs, each a mapping of :meth:`send` keyword
+                arguments (``recipient_value``, ``channel``, ``template_name``,
+                ...). Consumed lazily, so generators of any length work.
+            concurrency: Maximum number of sends in flight. Keep it at or below
+                the client's ``pool_maxsize`` so every send reuses a pooled
+                connection.
+            fail_fast: Raise the first error instead of returning it, and
+                skip every send that has not started yet.
+
+        Returns:
+            One entry per item, in input order: the message ID, or the
+            exception that send raised.
+
+        Raises:
+            SirenAPIError: With ``fail_fast``, the first API error.
+            SirenSDKError: With ``fail_fast``, the first SDK-level error.
+            ValueError: If ``concurrency`` is below 1 (or, with ``fail_fast``,
+                the first invalid item).
+        """
+        return ordered_results(
+            self.iter_send_many(items, concurrency=concurrency, fail_fast=fail_fast)
+        )
+
+    def iter_send_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 10,
+        fail_fast: bool = False,
+    ) -> Iterator[Tuple[int, Union[str, Exception]]]:
+        """Like :meth:`send_many`, but yield results as sends complete.
+
+        Closing the iterator early cancels the sends that have not started.
+
+        Yields:
+            ``(index, result)`` pairs in completion order, where *index* is
+            the item's position in *items* and *result* its message ID or
+            exception.
+        """
+        return iter_bounded(
+            lambda item: self.send(**item),
+            items,
+            concurrency=concurrency,
+            fail_fast=fail_fast,
+            thread_name_prefix="siren-send",
+        )
+
+    def wait_for_statuses(
+        self,
+        message_ids: Iterable[str],
+        *,
+        terminal: AbstractSet[str] = TERMINAL_STATUSES,
+        timeout: Optional[float] = None,
+        concurrency: int = 10,
+        backoff: Optional[PollBackoff] = None,
+    ) -> Iterator[StatusTransition]:
+        """Poll message statuses until each one is terminal.
+
+        Every ID is polled right away, then on its own schedule: the interval
+        grows while the status stays the same and resets when it changes. IDs
+        with a terminal status are no longer polled. Transient failures (network
+        errors, 429/5xx) only delay the affected ID. Polls always ask the API
+        but refresh the ``status_cache``, if there is one.
+
+        Args:
+            message_ids: IDs of the messages to watch. Duplicates are ignored.
+            terminal: Statuses after which an ID is no longer polled.
+            timeout: Seconds to wait overall. ``None`` waits indefinitely.
+            concurrency: Maximum number of status requests in flight.
+            backoff: Per-message polling schedule. Defaults to
+                :class:`PollBackoff` (1s, growing 1.5x up to 30s).
+
+        Yields:
+            A :class:`StatusTransition` for every ID's first observed status and
+            every change after that, as they happen.
+
+        Raises:
+            SirenTimeoutError: If IDs are still not terminal after ``timeout``;
+                its ``pending`` attribute lists them.
+            SirenAPIError: If a status request fails with a non-transient error.
+        """
+        return iter_status_transitions(
+            self._fetch_status,
+            message_ids,
+            terminal=terminal,
+            timeout=timeout,
+            concurrency=concurrency,
+            backoff=backoff or PollBackoff(),
+        )
+
     def _create_recipient(self, channel: str, recipient_value: str) -> Recipient:
             """Create a Recipient object based on the channel and recipient value.
             
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import time
+from typing import AbstractSet, Any, AsyncIterator, Iterable, Mapping
 
+from ..exceptions import SirenSDKError
+from ..http.options import RequestOptions
 from ..models.messaging import (
     MessageRepliesResponse,
     MessageStatusResponse,
@@ -13,11 +17,30 @@ from ..models.messaging import (
     SendMessageResponse,
 )
 from .async_base import AsyncBaseClient
+from .batch import ordered_results
+from .batch_async import iter_bounded_async
+from .replies import RAW_OPTIONS, ReplyCursors, newer_replies, shape_replies
+from .status_cache import StatusCache
+from .status_polling import (
+    TERMINAL_STATUSES,
+    PollBackoff,
+    StatusTransition,
+    is_transient,
+)
+from .status_polling_async import iter_status_transitions_async
 
 
 class AsyncMessageClient(AsyncBaseClient):
     """Non-blocking client for message operations."""
 
+    def __init__(
+        self, *args: Any, status_cache: StatusCache | None = None, **kwargs: Any
+    ):
+        """Initialize the client; *status_cache* serves repeated ``get_status`` calls."""
+        super().__init__(*args, **kwargs)
+        self.status_cache = status_cache
+        self.reply_cursors = ReplyCursors()
+
     async def send(
         self,
         template_name: str,
@@ -26,6 +49,9 @@ class AsyncMessageClient(AsyncBaseClient):
         template_variables: dict[str, Any] | None = None,
         provider_name: str | None = None,
         provider_code: str | None = None,
+        *,
+        idempotency_key: str | None = None,
+        request_options: RequestOptions | None = None,
     ) -> str:
         """Send a message and return the notification ID.
 
@@ -36,12 +62,17 @@ class AsyncMessageClient(AsyncBaseClient):
             template_variables: The variables to use in the template.
             provider_name: The name of the provider to use.
             provider_code: The code of the provider to use.
+            idempotency_key: Sent as the ``Idempotency-Key`` header, which
+                lets the retry policy repeat the call. Generated when the
+                client has ``auto_idempotency_keys`` set and none is given.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
         """
         recipient = self._create_recipient(channel, recipient_value)
         
         payload: dict[str, Any] = {
             "template": {"name": template_name},
-            "recipient": recipient.model_dump(),
+            "recipient": recipient.model_dump(exclude_none=True),
             "channel": channel,
         }
         if template_variables is not None:
@@ -58,26 +89,199 @@ class AsyncMessageClient(AsyncBaseClient):
             request_model=SendMessageRequest,
             response_model=SendMessageResponse,
             data=payload,
+            options=self._with_idempotency_key(request_options, idempotency_key),
+            trusted_payload=True,
         )
         return response.message_id  # type: ignore[return-value]
 
-    async def get_status(self, message_id: str) -> str:
-        """Return delivery status for a given message ID."""
+    async def get_status(
+        self, message_id: str, *, request_options: RequestOptions | None = None
+    ) -> str:
+        """Return delivery status for a given message ID (from the cache, if set)."""
+        if self.status_cache is not None:
+            status = self.status_cache.get(message_id)
+            if status is not None:
+                return status
+        return await self._fetch_status(message_id, request_options)
+
+    async def _fetch_status(
+        self, message_id: str, request_options: RequestOptions | None = None
+    ) -> str:
+        """Ask the API for a message's status and refresh the cache with it."""
         response = await self._make_request(
             method="GET",
-            endpoint=f"/api/v1/public/message-status/{message_id}",
+            hedge=True,
+            supports_response_mode=True,
+            endpoint="/api/v1/public/message-status/{message_id}",
+            path_params={"message_id": message_id},
             response_model=MessageStatusResponse,
+            options=request_options,
         )
-        return response.status  # type: ignore[return-value]
+        status = response["status"] if isinstance(response, dict) else response.status  # type: ignore[union-attr]
+        if self.status_cache is not None:
+            self.status_cache.put(message_id, status)
+        return status
 
-    async def get_replies(self, message_id: str) -> list[ReplyData]:
-        """Return list of replies for a given message ID."""
-        response = await self._make_request(
+    async def get_replies(
+        self,
+        message_id: str,
+        *,
+        since: str | None = None,
+        incremental: bool = False,
+        request_options: RequestOptions | None = None,
+    ) -> list[ReplyData]:
+        """Return list of replies for a given message ID.
+
+        ``since`` and ``incremental`` behave as in
+        :meth:`siren.clients.messaging.MessageClient.get_replies`.
+        """
+        if since is None and not incremental:
+            response = await self._make_request(
+                method="GET",
+                hedge=True,
+                supports_response_mode=True,
+                endpoint="/api/v1/public/get-reply/{message_id}",
+                path_params={"message_id": message_id},
+                response_model=MessageRepliesResponse,
+                options=request_options,
+            )
+            return response  # type: ignore[return-value]
+        if since is None:
+            since = self.reply_cursors.get(message_id)
+        replies, newest = await self._fetch_new_replies(
+            message_id, since, request_options
+        )
+        if incremental and newest is not None:
+            self.reply_cursors.advance(message_id, newest)
+        return replies
+
+    async def iter_replies(
+        self,
+        message_id: str,
+        *,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        since: str | None = None,
+        timeout: float | None = None,
+        request_options: RequestOptions | None = None,
+    ) -> AsyncIterator[ReplyData]:
+        """Yield the replies to a message as they arrive.
+
+        See :meth:`siren.clients.messaging.MessageClient.iter_replies`.
+        """
+        backoff = PollBackoff(
+            initial=poll_interval, max_interval=max(max_interval, poll_interval)
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval: float | None = None
+        while True:
+            try:
+                replies, since = await self._fetch_new_replies(
+                    message_id, since, request_options
+                )
+            except SirenSDKError as e:
+                if not is_transient(e):
+                    raise
+                replies = []
+            for reply in replies:
+                yield reply
+            interval = backoff.next_interval(None if replies else interval)
+            delay = backoff.delay(interval)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                return
+            await asyncio.sleep(delay)
+
+    async def _fetch_new_replies(
+        self,
+        message_id: str,
+        since: str | None,
+        request_options: RequestOptions | None,
+    ) -> tuple[list[Any], str | None]:
+        """Return the replies after *since*, validated, and the newest ``ts``."""
+        options = (request_options or RequestOptions()).merge(RAW_OPTIONS)
+        items = await self._make_request(
             method="GET",
-            endpoint=f"/api/v1/public/get-reply/{message_id}",
+            hedge=True,
+            supports_response_mode=True,
+            endpoint="/api/v1/public/get-reply/{message_id}",
+            path_params={"message_id": message_id},
             response_model=MessageRepliesResponse,
+            options=options,
+        )
+        fresh, newest = newer_replies(items, since)  # type: ignore[arg-type]
+        mode = (request_options and request_options.response_mode) or self.response_mode
+        return shape_replies(fresh, mode), newest
+
+    async def send_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 10,
+        fail_fast: bool = False,
+    ) -> list[str | Exception]:
+        """Send many messages with at most ``concurrency`` requests in flight.
+
+        Args:
+            items: Message specs, each a mapping of :meth:`send` keyword
+                arguments. Consumed lazily.
+            concurrency: Maximum number of sends in flight.
+            fail_fast: Raise the first error instead of returning it, and
+                cancel every send still in flight.
+
+        Returns:
+            One entry per item, in input order: the message ID, or the
+            exception that send raised.
+        """
+        return ordered_results(
+            [
+                result
+                async for result in self.iter_send_many(
+                    items, concurrency=concurrency, fail_fast=fail_fast
+                )
+            ]
+        )
+
+    def iter_send_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 10,
+        fail_fast: bool = False,
+    ) -> AsyncIterator[tuple[int, str | Exception]]:
+        """Like :meth:`send_many`, but yield ``(index, result)`` as sends complete.
+
+        Closing the iterator early cancels the sends still in flight.
+        """
+        return iter_bounded_async(
+            lambda item: self.send(**item),
+            items,
+            concurrency=concurrency,
+            fail_fast=fail_fast,
+        )
+
+    def wait_for_statuses(
+        self,
+        message_ids: Iterable[str],
+        *,
+        terminal: AbstractSet[str] = TERMINAL_STATUSES,
+        timeout: float | None = None,
+        concurrency: int = 10,
+        backoff: PollBackoff | None = None,
+    ) -> AsyncIterator[StatusTransition]:
+        """Poll message statuses until each one is terminal, yielding changes.
+
+        Non-blocking counterpart of
+        :meth:`siren.clients.messaging.MessageClient.wait_for_statuses`; status
+        requests run as tasks, cancelled if the iterator is closed early.
+        """
+        return iter_status_transitions_async(
+            self._fetch_status,
+            message_ids,
+            terminal=terminal,
+            timeout=timeout,
+            concurrency=concurrency,
+            backoff=backoff or PollBackoff(),
         )
-        return response  # type: ignore[return-value]
 
     def _create_recipient(self, channel: str, recipient_value: str) -> Recipient:
             """Create a Recipient object based on the channel and recipient value.
@@ -0,0 +1,606 @@
+"""Durable local outbox for message sends and workflow triggers.
+
+:meth:`Outbox.enqueue_send` and :meth:`Outbox.enqueue_trigger` append the call
+to an in-memory buffer and return its ID straight away. A writer thread
+commits the buffer to a SQLite file, taking everything that accumulated
+during the previous commit in one transaction (group commit), so enqueueing
+costs a list append rather than a disk sync. :meth:`Outbox.flush` waits until
+everything enqueued so far is on disk; :meth:`Outbox.close` flushes too.
+
+An :class:`OutboxDispatcher` drains the file in a background thread with a
+bounded number of calls in flight, marking rows ``done`` or ``failed`` and
+retrying transient failures with backoff. Rows still pending after a crash
+or restart are dispatched by the next dispatcher that opens the same file.
+Dispatchers lease the rows they take, so several of them (in one process or
+in several) can share a file without sending a row twice; a dispatcher that
+dies leaves its rows to the others once their lease expires.
+Delivery is at-least-once: each call carries its row ID as the
+``Idempotency-Key`` so the API can drop repeats.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from ..exceptions import SirenSDKError
+from .status_polling import PollBackoff, is_transient
+
+if TYPE_CHECKING:
+    from ..client import SirenClient
+    from ..models.messaging import ProviderCode
+
+__all__ = [
+    "Outbox",
+    "OutboxDispatcher",
+    "OutboxEntry",
+    "OutboxOutcome",
+    "OutboxStats",
+]
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    lease_until REAL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (state, next_attempt);
+"""
+
+_SYNCHRONOUS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# kind -> (domain client attribute, method name)
+_TARGETS = {"send": ("message", "send"), "trigger": ("workflow", "trigger")}
+
+DEFAULT_RETRY_BACKOFF = PollBackoff(initial=1.0, multiplier=2.0, max_interval=60.0)
+DEFAULT_LEASE = 300.0
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """A pending outbox row handed to a dispatcher."""
+
+    id: str
+    kind: str
+    payload: dict[str, Any]
+    attempts: int
+
+    def call(self, client: Any) -> Any:
+        """Make the queued call through *client* (a coroutine for async ones).
+
+        The row ID is sent as the idempotency key.
+        """
+        namespace, method = _TARGETS[self.kind]
+        kwargs = dict(self.payload)
+        if "provider_code" in kwargs:
+            from ..models.messaging import ProviderCode
+
+            kwargs["provider_code"] = ProviderCode(kwargs["provider_code"])
+        return getattr(getattr(client, namespace), method)(
+            **kwargs, idempotency_key=self.id
+        )
+
+
+@dataclass(frozen=True)
+class OutboxOutcome:
+    """What happened to one dispatched entry."""
+
+    entry_id: str
+    state: str
+    result: str | None = None
+    error: str | None = None
+    retry_at: float = 0.0
+
+    @classmethod
+    def of(
+        cls,
+        entry: OutboxEntry,
+        result: Any,
+        error: BaseException | None,
+        *,
+        max_attempts: int,
+        backoff: PollBackoff,
+    ) -> OutboxOutcome:
+        """Classify a finished call as done, failed, or pending a retry."""
+        if error is None:
+            if hasattr(result, "model_dump"):
+                result = result.model_dump(by_alias=True)
+            return cls(entry.id, "done", result=json.dumps(result))
+        attempts = entry.attempts + 1
+        if is_transient(error) and attempts < max_attempts:
+            interval = backoff.initial
+            for _ in range(attempts - 1):
+                interval = backoff.next_interval(interval)
+            retry_at = time.time() + backoff.delay(interval)
+            return cls(entry.id, "pending", error=str(error), retry_at=retry_at)
+        return cls(entry.id, "failed", error=str(error))
+
+
+@dataclass(frozen=True)
+class OutboxStats:
+    """Row counts by state; ``pending`` includes entries not yet committed."""
+
+    pending: int
+    done: int
+    failed: int
+
+
+class Outbox:
+    """SQLite-backed queue of sends and triggers with group-commit writes."""
+
+    def __init__(
+        self, path: str | os.PathLike[str], *, synchronous: str = "NORMAL"
+    ) -> None:
+        """Open (or create) the outbox file at *path*.
+
+        Args:
+            path: SQLite file; ``":memory:"`` gives a non-durable outbox for
+                tests.
+            synchronous: SQLite ``synchronous`` level of the write-ahead log.
+                With ``"NORMAL"`` a committed entry survives the process
+                being killed, but a power loss can drop the latest commits;
+                ``"FULL"`` syncs every commit to disk, which is where group
+                commit saves the most.
+        """
+        if synchronous not in _SYNCHRONOUS:
+            raise ValueError(f"synchronous must be one of {_SYNCHRONOUS}")
+        self._db = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={synchronous}")
+        self._db.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._buffer: list[tuple[str, str, str, float, float]] = []
+        self._enqueued = 0
+        self._committed = 0
+        self._closed = False
+        self._failure: BaseException | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self._writer = threading.Thread(
+            target=self._run_writer, name="siren-outbox-writer", daemon=True
+        )
+        self._writer.start()
+
+    def enqueue_send(
+        self,
+        recipient_value: str,
+        channel: str,
+        *,
+        body: str | None = None,
+        subject: str | None = None,
+        template_name: str | None = None,
+        template_variables: dict[str, Any] | None = None,
+        provider_name: str | None = None,
+        provider_code: ProviderCode | str | None = None,
+    ) -> str:
+        """Queue a ``message.send`` call and return the outbox entry ID.
+
+        Arguments are those of
+        :meth:`siren.clients.messaging.MessageClient.send`; template
+        variables must be JSON-serialisable.
+
+        Raises:
+            ValueError: If only one of the provider fields is given.
+            SirenSDKError: If the outbox is closed or its writer failed.
+        """
+        if (provider_name is None) != (provider_code is None):
+            raise ValueError(
+                "Both provider_name and provider_code must be provided together"
+            )
+        payload = {
+            "recipient_value": recipient_value,
+            "channel": channel,
+            "body": body,
+            "subject": subject,
+            "template_name": template_name,
+            "template_variables": template_variables,
+            "provider_name": provider_name,
+            "provider_code": getattr(provider_code, "value", provider_code),
+        }
+        return self._enqueue(
+            "send", {k: v for k, v in payload.items() if v is not None}
+        )
+
+    def enqueue_trigger(
+        self,
+        workflow_name: str,
+        data: dict[str, Any] | None = None,
+        notify: dict[str, Any] | None = None,
+    ) -> str:
+        """Queue a ``workflow.trigger`` call and return the outbox entry ID.
+
+        Raises:
+            SirenSDKError: If the outbox is closed or its writer failed.
+        """
+        return self._enqueue(
+            "trigger", {"workflow_name": workflow_name, "data": data, "notify": notify}
+        )
+
+    def _enqueue(self, kind: str, payload: dict[str, Any]) -> str:
+        entry_id = uuid.uuid4().hex
+        now = time.time()
+        row = (entry_id, kind, json.dumps(payload, separators=(",", ":")), now, now)
+        with self._cond:
+            self._check_open()
+            self._buffer.append(row)
+            self._enqueued += 1
+            if len(self._buffer) == 1:
+                self._cond.notify_all()
+        return entry_id
+
+    def _check_open(self) -> None:
+        if self._failure is not None:
+            raise SirenSDKError(
+                f"Outbox writer failed: {self._failure}",
+                original_exception=self._failure,  # type: ignore[arg-type]
+            )
+        if self._closed:
+            raise SirenSDKError("Outbox is closed")
+
+    def _run_writer(self) -> None:
+        """Commit whatever accumulated while the previous commit ran."""
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closed:
+                    self._cond.wait()
+                if not self._buffer:
+                    return
+                batch, self._buffer = self._buffer, []
+                target = self._enqueued
+            try:
+                with self._db_lock:
+                    self._db.executemany(
+                        "INSERT INTO outbox (id, kind, payload, created, updated)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        batch,
+                    )
+                    self._db.commit()
+            except sqlite3.Error as e:
+                with self._cond:
+                    self._failure = e
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._committed = target
+                self._cond.notify_all()
+                listeners = list(self._listeners)
+            for listener in listeners:
+                listener()
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every entry enqueued so far is committed.
+
+        Raises:
+            SirenSDKError: If the writer failed, or *timeout* seconds passed.
+        """
+        with self._cond:
+            target = self._enqueued
+            done = self._cond.wait_for(
+                lambda: self._committed >= target or self._failure is not None,
+                timeout,
+            )
+            if self._failure is not None:
+                self._check_open()
+            if not done:
+                raise SirenSDKError(f"Outbox flush timed out after {timeout}s")
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Call *callback* (from the writer thread) after every commit."""
+        with self._cond:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        """Stop calling *callback* after commits."""
+        with self._cond:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def due(
+        self, limit: int, exclude: Iterable[str] = (), *, lease: float = DEFAULT_LEASE
+    ) -> list[OutboxEntry]:
+        """Claim up to *limit* committed pending entries whose retry time passed.
+
+        Each entry returned is leased for *lease* seconds: other callers,
+        through this or another connection to the file, skip it until it is
+        settled or the lease runs out. Entries in *exclude* are skipped too.
+        Oldest entries come first.
+        """
+        exclude = set(exclude)
+        now = time.time()
+        claimed = []
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT id, kind, payload, attempts FROM outbox"
+                " WHERE state = 'pending' AND next_attempt <= ?"
+                " AND (lease_until IS NULL OR lease_until <= ?)"
+                " ORDER BY rowid LIMIT ?",
+                (now, now, limit + len(exclude)),
+            ).fetchall()
+            for row in rows:
+                if len(claimed) == limit:
+                    break
+                if row[0] in exclude:
+                    continue
+                # Conditional update: only one connection wins each row.
+                won = self._db.execute(
+                    "UPDATE outbox SET lease_until = ? WHERE id = ?"
+                    " AND state = 'pending'"
+                    " AND (lease_until IS NULL OR lease_until <= ?)",
+                    (now + lease, row[0], now),
+                ).rowcount
+                if won:
+                    claimed.append(row)
+            self._db.commit()
+        return [OutboxEntry(r[0], r[1], json.loads(r[2]), r[3]) for r in claimed]
+
+    def settle(self, outcomes: Iterable[OutboxOutcome]) -> None:
+        """Record the outcomes of dispatched entries in one transaction."""
+        now = time.time()
+        rows = [
+            (o.state, o.retry_at, o.result, o.error, now, o.entry_id) for o in outcomes
+        ]
+        if not rows:
+            return
+        with self._db_lock:
+            self._db.executemany(
+                "UPDATE outbox SET state = ?, attempts = attempts + 1,"
+                " next_attempt = ?, lease_until = NULL, result = ?, error = ?,"
+                " updated = ?"
+                " WHERE id = ?",
+                rows,
+            )
+            self._db.commit()
+
+    def get(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the committed row for *entry_id* as a dict, or ``None``."""
+        with self._db_lock:
+            cursor = self._db.execute(
+                "SELECT id, kind, payload, state, attempts, result, error"
+                " FROM outbox WHERE id = ?",
+                (entry_id,),
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        entry = dict(zip([c[0] for c in cursor.description], row))
+        entry["payload"] = json.loads(entry["payload"])
+        if entry["result"] is not None:
+            entry["result"] = json.loads(entry["result"])
+        return entry
+
+    def stats(self) -> OutboxStats:
+        """Return how many entries are pending, done and failed."""
+        with self._db_lock:
+            counts = dict(
+                self._db.execute(
+                    "SELECT state, COUNT(*) FROM outbox GROUP BY state"
+                ).fetchall()
+            )
+        with self._cond:
+            buffered = len(self._buffer)
+        return OutboxStats(
+            pending=counts.get("pending", 0) + buffered,
+            done=counts.get("done", 0),
+            failed=counts.get("failed", 0),
+        )
+
+    def purge(self, state: str = "done") -> int:
+        """Delete the rows in *state* and return how many were removed."""
+        with self._db_lock:
+            removed = self._db.execute(
+                "DELETE FROM outbox WHERE state = ?", (state,)
+            ).rowcount
+            self._db.commit()
+        return removed
+
+    def close(self) -> None:
+        """Commit buffered entries, stop the writer and close the file."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        with self._db_lock:
+            self._db.close()
+
+    def __enter__(self) -> Outbox:
+        """Enter context manager returning *self*."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Exit context manager, closing the outbox."""
+        self.close()
+
+
+class OutboxDispatcher:
+    """Background thread draining an :class:`Outbox` through a client."""
+
+    def __init__(
+        self,
+        client: SirenClient,
+        outbox: Outbox,
+        *,
+        concurrency: int = 8,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        backoff: PollBackoff = DEFAULT_RETRY_BACKOFF,
+        lease: float = DEFAULT_LEASE,
+    ) -> None:
+        """Create the dispatcher; call :meth:`start` (or use ``with``) to run it.
+
+        Args:
+            client: Client whose ``message.send`` and ``workflow.trigger``
+                perform the queued calls (any object with ``message`` and
+                ``workflow`` domain clients will do).
+            outbox: The outbox to drain.
+            concurrency: Maximum number of calls in flight.
+            poll_interval: Seconds between checks for entries whose retry
+                time has come; new entries wake the dispatcher immediately.
+            max_attempts: Attempts before a transiently failing entry is
+                marked ``failed``. Other errors fail it at once.
+            backoff: Delay before each retry, growing per attempt.
+            lease: Seconds a taken entry is reserved for this dispatcher.
+                Other dispatchers on the same file only send it once the
+                lease runs out, so keep it above the longest call, retries
+                included.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if lease <= 0:
+            raise ValueError("lease must be positive")
+        self.client = client
+        self.outbox = outbox
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self._refill_at = max(1, concurrency // 4)
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._drain = True
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> OutboxDispatcher:
+        """Start the dispatcher thread."""
+        if self._thread is not None:
+            raise RuntimeError("dispatcher already started")
+        self.outbox.add_listener(self._wake.set)
+        self._thread = threading.Thread(
+            target=self._run, name="siren-outbox-dispatcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, *, drain: bool = True, timeout: float | None = None) -> bool:
+        """Stop the dispatcher.
+
+        Args:
+            drain: Dispatch every entry that is due before stopping.
+                ``False`` only waits for the calls already in flight.
+            timeout: Seconds to wait for the thread; unfinished entries stay
+                pending and are dispatched after the next start.
+
+        Returns:
+            Whether the thread stopped within *timeout*. ``False`` too when
+            entries enqueued before the call could not be committed in time
+            to be drained.
+        """
+        if self._thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = True
+        if drain:
+            try:
+                self.outbox.flush(timeout)
+            except SirenSDKError:
+                flushed = False  # stop anyway; what is committed is drained
+        self._drain = drain
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join(
+            None if deadline is None else max(0.0, deadline - time.monotonic())
+        )
+        self.outbox.remove_listener(self._wake.set)
+        return flushed and not self._thread.is_alive()
+
+    def __enter__(self) -> OutboxDispatcher:
+        """Start the dispatcher and return it."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Drain and stop the dispatcher."""
+        self.stop()
+
+    def _run(self) -> None:
+        in_flight: dict[Future[Any], OutboxEntry] = {}
+        unsettled: list[OutboxOutcome] = []
+        retry: float | None = None
+        errors = 0
+        with ThreadPoolExecutor(
+            self.concurrency, thread_name_prefix="siren-outbox"
+        ) as pool:
+            while True:
+                stopping = self._stopping.is_set()
+                free = self.concurrency - len(in_flight)
+                # Top up in chunks rather than querying after every call.
+                refill = free >= self._refill_at or (free and not in_flight)
+                if not refill or (stopping and not self._drain):
+                    free = 0
+                try:
+                    self._exchange(pool, in_flight, unsettled, free)
+                except Exception:
+                    # E.g. "database is locked": log, back off and retry,
+                    # keeping unrecorded outcomes. A stopping dispatcher gives
+                    # up after max_attempts errors in a row.
+                    errors += 1
+                    if stopping and errors >= self.max_attempts:
+                        logger.exception("Outbox dispatcher stopped on an error")
+                        return
+                    retry = self.backoff.next_interval(retry)
+                    logger.exception(
+                        "Outbox dispatcher failed; retrying in %.1fs", retry
+                    )
+                    if stopping:
+                        time.sleep(self.backoff.delay(retry))
+                    else:
+                        self._stopping.wait(self.backoff.delay(retry))
+                    continue
+                retry, errors = None, 0
+                if not in_flight:
+                    if stopping:
+                        return
+                    self._wake.wait(self.poll_interval)
+                    continue
+                done, _ = wait(
+                    in_flight, timeout=self.poll_interval, return_when=FIRST_COMPLETED
+                )
+                unsettled.extend(self._outcome(in_flight.pop(f), f) for f in done)
+
+    def _exchange(
+        self,
+        pool: ThreadPoolExecutor,
+        in_flight: dict[Future[Any], OutboxEntry],
+        unsettled: list[OutboxOutcome],
+        free: int,
+    ) -> None:
+        """Record finished outcomes, then start up to *free* due entries."""
+        if unsettled:
+            self.outbox.settle(unsettled)
+            unsettled.clear()
+        if free:
+            self._wake.clear()
+            busy = [entry.id for entry in in_flight.values()]
+            for entry in self.outbox.due(free, busy, lease=self.lease):
+                in_flight[pool.submit(entry.call, self.client)] = entry
+
+    def _outcome(self, entry: OutboxEntry, future: Future[Any]) -> OutboxOutcome:
+        error = future.exception()
+        return OutboxOutcome.of(
+            entry,
+            None if error is not None else future.result(),
+            error,
+            max_attempts=self.max_attempts,
+            backoff=self.backoff,
+        )
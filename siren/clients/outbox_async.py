@@ -0,0 +1,217 @@
+"""Asyncio task draining a :class:`~siren.clients.outbox.Outbox`."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from ..exceptions import SirenSDKError
+from .outbox import (
+    DEFAULT_LEASE,
+    DEFAULT_RETRY_BACKOFF,
+    Outbox,
+    OutboxEntry,
+    OutboxOutcome,
+)
+from .status_polling import PollBackoff
+
+if TYPE_CHECKING:
+    from ..async_client import AsyncSirenClient
+
+__all__ = ["AsyncOutboxDispatcher"]
+
+logger = logging.getLogger("siren.clients.outbox")
+
+
+class AsyncOutboxDispatcher:
+    """Counterpart of :class:`~siren.clients.outbox.OutboxDispatcher` for asyncio.
+
+    Calls run as tasks on the client's event loop; the blocking SQLite reads
+    and writes run in the loop's default executor. The async
+    ``message.send`` only sends templates, so entries queued with ``body`` or
+    ``subject`` are marked failed here.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSirenClient,
+        outbox: Outbox,
+        *,
+        concurrency: int = 8,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        backoff: PollBackoff = DEFAULT_RETRY_BACKOFF,
+        lease: float = DEFAULT_LEASE,
+    ) -> None:
+        """Create the dispatcher; see ``OutboxDispatcher`` for the arguments."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if lease <= 0:
+            raise ValueError("lease must be positive")
+        self.client = client
+        self.outbox = outbox
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+        self._refill_at = max(1, concurrency // 4)
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping = False
+        self._drain = True
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> AsyncOutboxDispatcher:
+        """Start the dispatcher task on the running event loop."""
+        if self._task is not None:
+            raise RuntimeError("dispatcher already started")
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self.outbox.add_listener(self._notify)
+        self._task = self._loop.create_task(self._run())
+        return self
+
+    async def stop(self, *, drain: bool = True, timeout: float | None = None) -> bool:
+        """Stop the dispatcher; see ``OutboxDispatcher.stop``."""
+        if self._task is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = True
+        if drain:
+            try:
+                await self._in_executor(self.outbox.flush, timeout)
+            except SirenSDKError:
+                flushed = False  # stop anyway; what is committed is drained
+        self._drain = drain
+        self._stopping = True
+        self._wake.set()  # type: ignore[union-attr]
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), remaining)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.outbox.remove_listener(self._notify)
+        return flushed
+
+    async def __aenter__(self) -> AsyncOutboxDispatcher:
+        """Start the dispatcher and return it."""
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Drain and stop the dispatcher."""
+        await self.stop()
+
+    def _notify(self) -> None:
+        # Called from the outbox writer thread after each commit.
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake.set)  # type: ignore[union-attr]
+
+    def _in_executor(self, func: Any, *args: Any) -> asyncio.Future[Any]:
+        return self._loop.run_in_executor(  # type: ignore[union-attr]
+            None, functools.partial(func, *args)
+        )
+
+    async def _run(self) -> None:
+        wake = self._wake
+        assert wake is not None
+        in_flight: dict[asyncio.Task[Any], OutboxEntry] = {}
+        unsettled: list[OutboxOutcome] = []
+        retry: float | None = None
+        errors = 0
+        try:
+            while True:
+                stopping = self._stopping
+                free = self.concurrency - len(in_flight)
+                # Top up in chunks rather than querying after every call.
+                refill = free >= self._refill_at or (free and not in_flight)
+                if not refill or (stopping and not self._drain):
+                    free = 0
+                try:
+                    await self._exchange(in_flight, unsettled, free)
+                except Exception:
+                    # See OutboxDispatcher._run: log, back off, keep going.
+                    errors += 1
+                    if stopping and errors >= self.max_attempts:
+                        logger.exception("Outbox dispatcher stopped on an error")
+                        return
+                    retry = self.backoff.next_interval(retry)
+                    logger.exception(
+                        "Outbox dispatcher failed; retrying in %.1fs", retry
+                    )
+                    await self._pause(self.backoff.delay(retry))
+                    continue
+                retry, errors = None, 0
+                if not in_flight:
+                    if stopping:
+                        return
+                    try:
+                        await asyncio.wait_for(wake.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                done, _ = await asyncio.wait(
+                    in_flight,
+                    timeout=self.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                unsettled.extend(self._outcome(in_flight.pop(t), t) for t in done)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _exchange(
+        self,
+        in_flight: dict[asyncio.Task[Any], OutboxEntry],
+        unsettled: list[OutboxOutcome],
+        free: int,
+    ) -> None:
+        """Record finished outcomes, then start up to *free* due entries."""
+        if unsettled:
+            await self._in_executor(self.outbox.settle, unsettled)
+            unsettled.clear()
+        if free:
+            self._wake.clear()  # type: ignore[union-attr]
+            busy = [entry.id for entry in in_flight.values()]
+            due = functools.partial(self.outbox.due, lease=self.lease)
+            for entry in await self._in_executor(due, free, busy):
+                in_flight[asyncio.ensure_future(self._call(entry))] = entry
+
+    async def _pause(self, delay: float) -> None:
+        """Sleep *delay* seconds; a call to :meth:`stop` cuts the sleep short."""
+        if self._stopping:
+            await asyncio.sleep(delay)
+            return
+        end = time.monotonic() + delay
+        while not self._stopping and time.monotonic() < end:
+            self._wake.clear()  # type: ignore[union-attr]
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(),  # type: ignore[union-attr]
+                    end - time.monotonic(),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _call(self, entry: OutboxEntry) -> Any:
+        # Awaiting inside a task turns argument errors into task failures.
+        return await entry.call(self.client)
+
+    def _outcome(self, entry: OutboxEntry, task: asyncio.Task[Any]) -> OutboxOutcome:
+        error = task.exception()
+        return OutboxOutcome.of(
+            entry,
+            None if error is not None else task.result(),
+            error,
+            max_attempts=self.max_attempts,
+            backoff=self.backoff,
+        )
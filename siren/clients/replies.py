@@ -0,0 +1,89 @@
+"""Fetch only the replies of a message that are newer than a known ``ts``.
+
+The replies endpoint always returns the whole thread. Incremental reads decode
+it without validation (``response_mode="raw"``), drop every reply whose ``ts``
+is not after the cursor and validate only what is left, oldest first, so
+watching a long thread costs little more than its new replies.
+"""
+
+from __future__ import annotations
+
+import threading
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from pydantic import ValidationError
+
+from ..exceptions import SirenSDKError
+from ..http.options import RequestOptions, ResponseMode
+from ..models.lazy import lazy_data
+from ..models.messaging import MessageRepliesResponse, ReplyData
+
+__all__ = ["RAW_OPTIONS", "ReplyCursors", "newer_replies", "shape_replies"]
+
+RAW_OPTIONS = RequestOptions(response_mode="raw")
+"""Merged into the caller's options so replies come back as plain dicts."""
+
+
+def _ts_key(ts: Any) -> tuple[int, Any]:
+    # Slack-style "1700000000.000123" timestamps compare numerically; anything
+    # else falls back to string order (and sorts after numeric ones).
+    try:
+        return 0, Decimal(ts)
+    except (InvalidOperation, TypeError, ValueError):
+        return 1, str(ts)
+
+
+def newer_replies(
+    items: list[dict[str, Any]], since: str | None
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Return the replies after *since*, oldest first, and the newest ``ts``.
+
+    The API's order is not relied on; replies are sorted by ``ts``.
+    """
+    if since is None:
+        fresh = list(items)
+    else:
+        floor = _ts_key(since)
+        fresh = [item for item in items if _ts_key(item.get("ts")) > floor]
+    fresh.sort(key=lambda item: _ts_key(item.get("ts")))
+    return fresh, fresh[-1].get("ts") if fresh else since
+
+
+def shape_replies(items: list[dict[str, Any]], response_mode: ResponseMode) -> Any:
+    """Return raw replies as the client's response mode would have."""
+    if response_mode == "raw":
+        return items
+    if response_mode == "lazy":
+        return lazy_data(MessageRepliesResponse, items)
+    try:
+        return [ReplyData.model_validate(item) for item in items]
+    except ValidationError as e:
+        raise SirenSDKError(
+            f"Invalid reply in API response: {e}", original_exception=e
+        ) from e
+
+
+class ReplyCursors:
+    """Thread-safe ``message_id -> newest reply ts`` map for incremental reads."""
+
+    def __init__(self) -> None:
+        """Start with no cursors."""
+        self._lock = threading.Lock()
+        self._cursors: dict[str, str] = {}
+
+    def get(self, message_id: str) -> str | None:
+        """Return the newest ``ts`` already returned for *message_id*."""
+        return self._cursors.get(message_id)
+
+    def advance(self, message_id: str, ts: str) -> None:
+        """Move the cursor of *message_id* forward to *ts* (never backwards)."""
+        with self._lock:
+            current = self._cursors.get(message_id)
+            if current is None or _ts_key(ts) > _ts_key(current):
+                self._cursors[message_id] = ts
+
+    def reset(self, message_id: str) -> None:
+        """Forget the cursor, so the next incremental read returns everything."""
+        with self._lock:
+            self._cursors.pop(message_id, None)
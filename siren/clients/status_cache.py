@@ -0,0 +1,112 @@
+"""Bounded LRU cache of message delivery statuses.
+
+Passed to a client as ``status_cache=``, a :class:`StatusCache` answers
+repeated ``message.get_status`` calls without contacting the API. Statuses
+that can still change are kept for ``ttl`` seconds; terminal ones (delivered,
+failed) never change again and stay until they are evicted as the least
+recently used entry. The cache is thread-safe and holds no event-loop state,
+so one instance can back a sync and an async client at the same time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import AbstractSet, Callable
+
+from .status_polling import TERMINAL_STATUSES
+
+__all__ = ["StatusCache", "StatusCacheStats"]
+
+
+@dataclass(frozen=True)
+class StatusCacheStats:
+    """Counters describing how well the cache is doing."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class StatusCache:
+    """Thread-safe LRU + TTL cache of ``message_id -> status``."""
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        *,
+        ttl: float = 5.0,
+        terminal: AbstractSet[str] = TERMINAL_STATUSES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            maxsize: Maximum number of message IDs kept; the least recently
+                used entry is evicted beyond that.
+            ttl: Seconds a non-terminal status is served from the cache.
+            terminal: Statuses that never change again and are cached until
+                evicted.
+            clock: Monotonic time source, for tests.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.terminal = terminal
+        self._clock = clock
+        self._lock = threading.Lock()
+        # message_id -> (status, expiry or None for terminal statuses)
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, message_id: str) -> str | None:
+        """Return the cached status of *message_id*, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(message_id)
+            if entry is not None and (entry[1] is None or entry[1] > self._clock()):
+                self._entries.move_to_end(message_id)
+                self._hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[message_id]  # expired
+            self._misses += 1
+            return None
+
+    def put(self, message_id: str, status: str) -> None:
+        """Store *status*, with a TTL unless it is terminal."""
+        expiry = None if status in self.terminal else self._clock() + self.ttl
+        with self._lock:
+            self._entries[message_id] = (status, expiry)
+            self._entries.move_to_end(message_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, message_id: str) -> None:
+        """Forget the cached status of *message_id*, if any."""
+        with self._lock:
+            self._entries.pop(message_id, None)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> StatusCacheStats:
+        """Return hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return StatusCacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries)
+            )
+
+    def __len__(self) -> int:
+        """Number of cached entries, including expired ones not yet dropped."""
+        return len(self._entries)
@@ -0,0 +1,255 @@
+"""Wait for many messages to reach a terminal delivery status.
+
+:meth:`siren.clients.messaging.MessageClient.wait_for_statuses` polls
+``get_status`` for a set of message IDs. Each ID has its own polling interval
+that starts at :attr:`PollBackoff.initial`, grows while the status stays the
+same and snaps back when it changes, so busy messages are watched closely and
+stalled ones cheaply. IDs leave the schedule once their status is terminal,
+and at most ``concurrency`` status requests are in flight at any time.
+
+Transient failures (network errors, open circuits, 429 and 5xx responses) only
+push the affected ID back; other API errors are raised, and
+:class:`~siren.exceptions.SirenTimeoutError` is raised if IDs are still pending
+when the timeout expires.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Iterable, Iterator
+
+import requests
+
+from ..exceptions import SirenCircuitOpenError, SirenSDKError, SirenTimeoutError
+
+__all__ = [
+    "TERMINAL_STATUSES",
+    "PollBackoff",
+    "StatusTransition",
+    "iter_status_transitions",
+]
+
+TERMINAL_STATUSES: frozenset[str] = frozenset({"DELIVERED", "FAILED"})
+"""Statuses after which a message's status no longer changes by default."""
+
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+_REQUESTS_NETWORK_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+@dataclass(frozen=True)
+class PollBackoff:
+    """Per-message polling schedule.
+
+    Attributes:
+        initial: Seconds between polls right after a message is first seen or
+            its status changes.
+        multiplier: Factor applied to the interval after every poll that
+            returned the same status (or failed transiently).
+        max_interval: Upper bound for the interval.
+        jitter: Fraction of each interval that is randomised, so messages sent
+            together are not polled in lock-step.
+    """
+
+    initial: float = 1.0
+    multiplier: float = 1.5
+    max_interval: float = 30.0
+    jitter: float = 0.1
+
+    def __post_init__(self) -> None:
+        """Validate the settings."""
+        if self.initial <= 0 or self.max_interval < self.initial:
+            raise ValueError("need 0 < initial <= max_interval")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 <= self.jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+
+    def next_interval(self, interval: float | None) -> float:
+        """Return the interval following *interval* (``None``: start over)."""
+        if interval is None:
+            return self.initial
+        return min(interval * self.multiplier, self.max_interval)
+
+    def delay(self, interval: float) -> float:
+        """Return *interval* with jitter applied."""
+        return interval * (1 - self.jitter * random.random())
+
+
+@dataclass(frozen=True)
+class StatusTransition:
+    """A message's status as first observed, or after it changed.
+
+    Attributes:
+        message_id: The message.
+        status: The status just observed.
+        previous: The status observed before, ``None`` on the first poll.
+        terminal: Whether *status* is terminal, i.e. the message is no longer
+            polled.
+    """
+
+    message_id: str
+    status: str
+    previous: str | None
+    terminal: bool
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a failed status poll is worth repeating later.
+
+    That is a 429 or 5xx answer (with or without a Siren error body), an open
+    circuit, or a network failure; anything else will fail again.
+    """
+    if isinstance(error, SirenCircuitOpenError):
+        return True
+    if not isinstance(error, SirenSDKError):
+        return False
+    if error.status_code is not None:
+        return error.status_code in _TRANSIENT_STATUSES
+    return _is_network_error(error.original_exception)
+
+
+def _is_network_error(error: BaseException | None) -> bool:
+    """Whether *error* is a connection failure or timeout of the HTTP stack."""
+    if isinstance(error, (ConnectionError, TimeoutError, *_REQUESTS_NETWORK_ERRORS)):
+        return True
+    # httpx is only loaded by the httpx transports; no need to import it here.
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(
+        error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+    )
+
+
+class PollSchedule:
+    """Bookkeeping shared by the sync and async polling loops."""
+
+    def __init__(
+        self,
+        message_ids: Iterable[str],
+        terminal: AbstractSet[str],
+        backoff: PollBackoff,
+        now: float,
+    ) -> None:
+        """Schedule every distinct ID for an immediate first poll."""
+        self.terminal = terminal
+        self.backoff = backoff
+        self._seq = itertools.count()
+        self._last: dict[str, str | None] = {}
+        self._interval: dict[str, float] = {}
+        self._due: list[tuple[float, int, str]] = []
+        for message_id in dict.fromkeys(message_ids):
+            self._last[message_id] = None
+            self._due.append((now, next(self._seq), message_id))
+        self.remaining = len(self._last)
+
+    def pop_due(self, now: float, limit: int) -> list[str]:
+        """Remove and return up to *limit* IDs whose next poll is due."""
+        ready = []
+        while self._due and len(ready) < limit and self._due[0][0] <= now:
+            ready.append(heapq.heappop(self._due)[2])
+        return ready
+
+    def wait_time(
+        self, now: float, deadline: float | None, can_start: bool
+    ) -> float | None:
+        """Seconds until the next poll is due (if *can_start*) or the deadline."""
+        wake = [deadline] if deadline is not None else []
+        if can_start and self._due:
+            wake.append(self._due[0][0])
+        return max(min(wake) - now, 0) if wake else None
+
+    def settle(
+        self, message_id: str, result: str | BaseException, now: float
+    ) -> StatusTransition | None:
+        """Apply a poll's status or error; re-raise errors that are not transient."""
+        if isinstance(result, BaseException):
+            if not is_transient(result):
+                raise result
+            self._reschedule(message_id, now, reset=False)
+            return None
+        return self.record(message_id, result, now)
+
+    def record(
+        self, message_id: str, status: str, now: float
+    ) -> StatusTransition | None:
+        """Store a poll result and reschedule the ID unless it is terminal."""
+        previous = self._last[message_id]
+        changed = status != previous
+        self._last[message_id] = status
+        terminal = status in self.terminal
+        if terminal:
+            self.remaining -= 1
+        else:
+            self._reschedule(message_id, now, reset=changed)
+        if not changed:
+            return None
+        return StatusTransition(message_id, status, previous, terminal)
+
+    def pending(self) -> list[str]:
+        """IDs that have not reached a terminal status."""
+        return [m for m, s in self._last.items() if s not in self.terminal]
+
+    def _reschedule(self, message_id: str, now: float, *, reset: bool) -> None:
+        interval = self.backoff.next_interval(
+            None if reset else self._interval.get(message_id)
+        )
+        self._interval[message_id] = interval
+        due = now + self.backoff.delay(interval)
+        heapq.heappush(self._due, (due, next(self._seq), message_id))
+
+
+def iter_status_transitions(
+    fetch: Callable[[str], str],
+    message_ids: Iterable[str],
+    *,
+    terminal: AbstractSet[str],
+    timeout: float | None,
+    concurrency: int,
+    backoff: PollBackoff,
+) -> Iterator[StatusTransition]:
+    """Poll *fetch* on worker threads and yield status transitions.
+
+    See :meth:`siren.clients.messaging.MessageClient.wait_for_statuses`.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    start = time.monotonic()
+    deadline = None if timeout is None else start + timeout
+    schedule = PollSchedule(message_ids, terminal, backoff, start)
+    executor = ThreadPoolExecutor(concurrency, thread_name_prefix="siren-status")
+    in_flight: dict[Future[str], str] = {}
+    try:
+        while schedule.remaining:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                raise SirenTimeoutError(schedule.pending(), timeout)  # type: ignore[arg-type]
+            for message_id in schedule.pop_due(now, concurrency - len(in_flight)):
+                in_flight[executor.submit(fetch, message_id)] = message_id
+            # Sleep until a poll finishes, the next one is due (if a slot is
+            # free to start it) or the deadline passes.
+            delay = schedule.wait_time(now, deadline, len(in_flight) < concurrency)
+            if not in_flight:
+                time.sleep(delay or 0)
+                continue
+            done, _ = wait(in_flight, timeout=delay, return_when=FIRST_COMPLETED)
+            for future in done:
+                message_id = in_flight.pop(future)
+                result = future.exception() or future.result()
+                transition = schedule.settle(message_id, result, time.monotonic())
+                if transition is not None:
+                    yield transition
+    finally:
+        # Polls not yet started are dropped (by hand: shutdown's
+        # cancel_futures needs Python 3.9); running ones finish unobserved.
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,58 @@
+"""Non-blocking counterpart of :mod:`siren.clients.status_polling`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import AbstractSet, AsyncIterator, Awaitable, Callable, Iterable
+
+from ..exceptions import SirenTimeoutError
+from .status_polling import PollBackoff, PollSchedule, StatusTransition
+
+__all__ = ["iter_status_transitions_async"]
+
+
+async def iter_status_transitions_async(
+    fetch: Callable[[str], Awaitable[str]],
+    message_ids: Iterable[str],
+    *,
+    terminal: AbstractSet[str],
+    timeout: float | None,
+    concurrency: int,
+    backoff: PollBackoff,
+) -> AsyncIterator[StatusTransition]:
+    """Poll *fetch* as tasks and yield status transitions.
+
+    See :meth:`siren.clients.messaging_async.AsyncMessageClient.wait_for_statuses`.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    start = time.monotonic()
+    deadline = None if timeout is None else start + timeout
+    schedule = PollSchedule(message_ids, terminal, backoff, start)
+    in_flight: dict[asyncio.Task[str], str] = {}
+    try:
+        while schedule.remaining:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                raise SirenTimeoutError(schedule.pending(), timeout)  # type: ignore[arg-type]
+            for message_id in schedule.pop_due(now, concurrency - len(in_flight)):
+                in_flight[asyncio.ensure_future(fetch(message_id))] = message_id
+            delay = schedule.wait_time(now, deadline, len(in_flight) < concurrency)
+            if not in_flight:
+                await asyncio.sleep(delay or 0)
+                continue
+            done, _ = await asyncio.wait(
+                in_flight, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                message_id = in_flight.pop(task)
+                result = task.exception() or task.result()
+                transition = schedule.settle(message_id, result, time.monotonic())
+                if transition is not None:
+                    yield transition
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
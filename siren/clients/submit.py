@@ -0,0 +1,165 @@
+"""Non-blocking, future-returning view of the synchronous client.
+
+``client.submit`` mirrors the client's domain namespaces: every public
+method of ``client.submit.message``, ``client.submit.workflow``,
+``client.submit.user`` and so on takes the same arguments as its blocking
+counterpart and returns a :class:`concurrent.futures.Future` for its result.
+Calls run on a thread pool sized to the HTTP connection pool (or on the
+``executor`` given to :class:`~siren.client.SirenClient`) and use the
+client's domain clients, so they share its pooled connections, retry policy,
+rate limiter and so on.
+
+Closing the client drains the submitted calls: it waits up to its
+``shutdown_timeout`` for them, then cancels the ones that have not started.
+Calls still running after that are not interrupted, but the client's
+connections are closed under them, so they usually fail.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..exceptions import SirenSDKError
+
+if TYPE_CHECKING:
+    from ..client import SirenClient
+
+__all__ = ["SubmitNamespace"]
+
+
+class _DomainSubmitter:
+    """Future-returning proxy for one domain client."""
+
+    def __init__(self, namespace: SubmitNamespace, domain: Any) -> None:
+        self._namespace = namespace
+        self._domain = domain
+
+    def __getattr__(self, name: str) -> Callable[..., Future[Any]]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self._domain, name)
+        if not callable(method):
+            raise AttributeError(f"{name!r} is not a method and cannot be submitted")
+
+        @functools.wraps(method)
+        def submit(*args: Any, **kwargs: Any) -> Future[Any]:
+            return self._namespace.run(method, *args, **kwargs)
+
+        return submit
+
+    def __dir__(self) -> list[str]:
+        return [name for name in dir(self._domain) if not name.startswith("_")]
+
+
+class SubmitNamespace:
+    """Domain namespaces of a :class:`~siren.client.SirenClient` returning futures."""
+
+    def __init__(
+        self,
+        client: SirenClient,
+        *,
+        executor: Executor | None = None,
+        max_workers: int = 10,
+    ) -> None:
+        """Create the namespace; prefer ``client.submit``.
+
+        Args:
+            client: Client whose domain clients run the calls.
+            executor: Executor to run the calls on, owned by the caller.
+                ``None`` creates a thread pool of *max_workers* on first use.
+            max_workers: Size of the managed thread pool.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._client = client
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pending: set[Future[Any]] = set()
+        self._closed = False
+
+    @property
+    def template(self) -> Any:
+        """Future-returning template operations."""
+        return _DomainSubmitter(self, self._client.template)
+
+    @property
+    def channel_template(self) -> Any:
+        """Future-returning channel template operations."""
+        return _DomainSubmitter(self, self._client.channel_template)
+
+    @property
+    def workflow(self) -> Any:
+        """Future-returning workflow operations."""
+        return _DomainSubmitter(self, self._client.workflow)
+
+    @property
+    def message(self) -> Any:
+        """Future-returning message operations."""
+        return _DomainSubmitter(self, self._client.message)
+
+    @property
+    def user(self) -> Any:
+        """Future-returning user operations."""
+        return _DomainSubmitter(self, self._client.user)
+
+    @property
+    def webhook(self) -> Any:
+        """Future-returning webhook operations."""
+        return _DomainSubmitter(self, self._client.webhook)
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """Run ``fn(*args, **kwargs)`` on the pool and return its future.
+
+        Raises:
+            SirenSDKError: If the client has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise SirenSDKError("Cannot submit calls after the client is closed")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="siren-submit"
+                )
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted calls that have not finished."""
+        with self._lock:
+            return len(self._pending)
+
+    def shutdown(self, timeout: float | None = None, *, cancel: bool = True) -> bool:
+        """Refuse new calls and drain the submitted ones.
+
+        Args:
+            timeout: Seconds to wait for submitted calls; ``None`` waits for
+                all of them.
+            cancel: Cancel the calls that have not started when the timeout
+                expires. Calls already running cannot be interrupted and
+                finish in the background.
+
+        Returns:
+            ``True`` if every submitted call finished in time.
+        """
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending)
+        _, not_done = wait(pending, timeout=timeout)
+        if cancel:
+            for future in not_done:
+                future.cancel()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=not not_done)
+        return not not_done
+
+    def _discard(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._pending.discard(future)
@@ -1,7 +1,8 @@
 """New templates client using BaseClient architecture."""
 
-from typing import List, Optional
+from typing import Any, List, Optional
 
+from ..http.options import RequestOptions
 from ..models.base import DeleteResponse
 from ..models.templates import (
     ChannelTemplate,
@@ -21,19 +22,35 @@ from .channel_templates import ChannelTemplateClient
 class TemplateClient(BaseClient):
     """Client for template operations."""
 
-    def __init__(self, api_key: str, base_url: str, timeout: int = 10):
+    def __init__(self, api_key: str, base_url: str, timeout: int = 10, **kwargs: Any):
         """Initialize TemplateClient with an internal ChannelTemplateClient.
 
         Args:
             api_key: Bearer token for Siren API.
             base_url: API root.
             timeout: Request timeout in seconds.
+            **kwargs: Extra :class:`BaseClient` options (e.g. ``transport``).
         """
-        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout)
-        # Re-use specialised client instead of duplicating logic
-        self._channel_template_client = ChannelTemplateClient(
-            api_key=api_key, base_url=base_url, timeout=timeout
-        )
+        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout, **kwargs)
+        self._channel_template_kwargs = {
+            **kwargs,
+            "api_key": api_key,
+            "base_url": base_url,
+            "timeout": timeout,
+            "transport": self._transport,
+        }
+        self._channel_templates: Optional[ChannelTemplateClient] = None
+
+    @property
+    def _channel_template_client(self) -> ChannelTemplateClient:
+        # Re-use specialised client instead of duplicating logic; it shares our
+        # transport so both talk over the same connection pool. Built on first
+        # use, since most callers never touch channel templates through here.
+        if self._channel_templates is None:
+            self._channel_templates = ChannelTemplateClient(
+                **self._channel_template_kwargs
+            )
+        return self._channel_templates
 
     def get(
         self,
@@ -42,6 +59,8 @@ class TemplateClient(BaseClient):
         sort: Optional[str] = None,
         page: Optional[int] = None,
         size: Optional[int] = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> List[Template]:
         """Fetch templates.
 
@@ -51,6 +70,8 @@ class TemplateClient(BaseClient):
             sort: Sort by field.
             page: Page number.
             size: Page size.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             List[Template]: A list of Template models.
@@ -73,17 +94,24 @@ class TemplateClient(BaseClient):
 
         response = self._make_request(
             method="GET",
+            hedge=True,
+            supports_response_mode=True,
             endpoint="/api/v1/public/template",
             response_model=TemplateListResponse,
             params=params,
+            options=request_options,
         )
         return response
 
-    def create(self, **template_data) -> CreatedTemplate:
+    def create(
+        self, *, request_options: Optional[RequestOptions] = None, **template_data
+    ) -> CreatedTemplate:
         """Create a new template.
 
         Args:
             **template_data: Template attributes matching the CreateTemplateRequest model fields.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             CreatedTemplate: A CreatedTemplate model representing the created template.
@@ -98,15 +126,24 @@ class TemplateClient(BaseClient):
             request_model=CreateTemplateRequest,
             response_model=CreateTemplateResponse,
             data=template_data,
+            options=request_options,
         )
         return response
 
-    def update(self, template_id: str, **template_data) -> Template:
+    def update(
+        self,
+        template_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
+        **template_data,
+    ) -> Template:
         """Update an existing template.
 
         Args:
             template_id: The ID of the template to update.
             **template_data: Template attributes matching the UpdateTemplateRequest model fields.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             Template: A Template model representing the updated template.
@@ -117,18 +154,24 @@ class TemplateClient(BaseClient):
         """
         response = self._make_request(
             method="PUT",
-            endpoint=f"/api/v1/public/template/{template_id}",
+            endpoint="/api/v1/public/template/{template_id}",
+            path_params={"template_id": template_id},
             request_model=UpdateTemplateRequest,
             response_model=UpdateTemplateResponse,
             data=template_data,
+            options=request_options,
         )
         return response
 
-    def delete(self, template_id: str) -> bool:
+    def delete(
+        self, template_id: str, *, request_options: Optional[RequestOptions] = None
+    ) -> bool:
         """Delete a template.
 
         Args:
             template_id: The ID of the template to delete.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             bool: True if deletion was successful.
@@ -139,16 +182,22 @@ class TemplateClient(BaseClient):
         """
         return self._make_request(
             method="DELETE",
-            endpoint=f"/api/v1/public/template/{template_id}",
+            endpoint="/api/v1/public/template/{template_id}",
+            path_params={"template_id": template_id},
             response_model=DeleteResponse,
             expected_status=204,
+            options=request_options,
         )
 
-    def publish(self, template_id: str) -> Template:
+    def publish(
+        self, template_id: str, *, request_options: Optional[RequestOptions] = None
+    ) -> Template:
         """Publish a template.
 
         Args:
             template_id: The ID of the template to publish.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             Template: A Template model representing the published template.
@@ -159,8 +208,10 @@ class TemplateClient(BaseClient):
         """
         response = self._make_request(
             method="PATCH",
-            endpoint=f"/api/v1/public/template/{template_id}/publish",
+            endpoint="/api/v1/public/template/{template_id}/publish",
+            path_params={"template_id": template_id},
             response_model=PublishTemplateResponse,
+            options=request_options,
         )
         return response
 
@@ -169,7 +220,11 @@ class TemplateClient(BaseClient):
     # ---------------------------------------------------------------------
 
     def create_channel_templates(
-        self, template_id: str, **channel_templates_data
+        self,
+        template_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
+        **channel_templates_data,
     ) -> list[ChannelTemplate]:
         """DEPRECATED – use :pyattr:`siren.SirenClient.channel_template.create`.
 
@@ -177,7 +232,7 @@ class TemplateClient(BaseClient):
         preserve backwards-compatibility while avoiding code duplication.
         """
         return self._channel_template_client.create(
-            template_id, **channel_templates_data
+            template_id, request_options=request_options, **channel_templates_data
         )
 
     def get_channel_templates(
@@ -188,6 +243,8 @@ class TemplateClient(BaseClient):
         sort: str | None = None,
         page: int | None = None,
         size: int | None = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> list[ChannelTemplate]:
         """DEPRECATED – use ``ChannelTemplateClient.get`` instead."""
         return self._channel_template_client.get(
@@ -197,4 +254,5 @@ class TemplateClient(BaseClient):
             sort=sort,
             page=page,
             size=size,
+            request_options=request_options,
         )
@@ -1,7 +1,8 @@
 """Asynchronous template operations for Siren SDK."""
 
-from typing import Any
+from typing import Any, Optional
 
+from ..http.options import RequestOptions
 from ..models.templates import (
     CreatedTemplate,
     CreateTemplateRequest,
@@ -19,7 +20,11 @@ class AsyncTemplateClient(AsyncBaseClient):
     """Non-blocking template operations."""
 
     async def get(
-        self, page: int | None = None, size: int | None = None
+        self,
+        page: int | None = None,
+        size: int | None = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> list[Template]:
         """Return paginated list of templates."""
         params: dict[str, Any] | None = None
@@ -27,9 +32,12 @@ class AsyncTemplateClient(AsyncBaseClient):
             params = {"page": page or 0, "size": size or 10}
         response = await self._make_request(
             method="GET",
+            hedge=True,
+            supports_response_mode=True,
             endpoint="/api/v1/public/template",
             response_model=TemplateListResponse,
             params=params,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
 
@@ -39,6 +47,8 @@ class AsyncTemplateClient(AsyncBaseClient):
         description: str | None = None,
         tag_names: list[str] | None = None,
         variables: list[dict[str, Any]] | None = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> CreatedTemplate:
         """Create a new template and return summary data."""
         payload: dict[str, Any] = {"name": name}
@@ -55,38 +65,51 @@ class AsyncTemplateClient(AsyncBaseClient):
             request_model=CreateTemplateRequest,
             response_model=CreateTemplateResponse,
             data=payload,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
 
     async def update(
         self,
         template_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
         **updates: Any,
     ) -> Template:
         """Update a template's metadata fields."""
         response = await self._make_request(
             method="PUT",
-            endpoint=f"/api/v1/public/template/{template_id}",
+            endpoint="/api/v1/public/template/{template_id}",
+            path_params={"template_id": template_id},
             request_model=UpdateTemplateRequest,
             response_model=UpdateTemplateResponse,
             data=updates,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
 
-    async def delete(self, template_id: str) -> bool:
+    async def delete(
+        self, template_id: str, *, request_options: Optional[RequestOptions] = None
+    ) -> bool:
         """Delete template by ID."""
         await self._make_request(
             method="DELETE",
-            endpoint=f"/api/v1/public/template/{template_id}",
+            endpoint="/api/v1/public/template/{template_id}",
+            path_params={"template_id": template_id},
             expected_status=204,
+            options=request_options,
         )
         return True
 
-    async def publish(self, template_id: str) -> Template:
+    async def publish(
+        self, template_id: str, *, request_options: Optional[RequestOptions] = None
+    ) -> Template:
         """Publish draft template returning published entity."""
         response = await self._make_request(
             method="PATCH",
-            endpoint=f"/api/v1/public/template/{template_id}/publish",
+            endpoint="/api/v1/public/template/{template_id}/publish",
+            path_params={"template_id": template_id},
             response_model=PublishTemplateResponse,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
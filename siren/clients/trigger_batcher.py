@@ -0,0 +1,244 @@
+"""Coalesce individual workflow triggers into ``trigger_bulk`` calls.
+
+A :class:`TriggerBatcher` (from ``client.workflow.batcher()``) queues each
+``submit(workflow_name, data, notify)`` under the key ``(workflow_name,
+data)`` and sends the queue as one ``trigger_bulk`` request once it holds
+``max_batch`` triggers or its oldest trigger has waited ``max_delay_ms``.
+Every caller gets a :class:`concurrent.futures.Future` that resolves to the
+execution ID at its position in ``workflow_execution_ids``, or to the error
+of the bulk call.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Tuple
+
+from ..exceptions import SirenSDKError
+
+if TYPE_CHECKING:
+    from ..http.options import RequestOptions
+    from .workflows import WorkflowClient
+
+__all__ = ["TriggerBatcher", "batch_key", "check_request_options", "resolve_batch"]
+
+BatchKey = Tuple[str, str]
+
+
+def batch_key(workflow_name: str, data: dict[str, Any] | None) -> BatchKey:
+    """Return the key under which triggers can share one bulk call.
+
+    ``data`` is compared by its canonical JSON, so equal dicts built in a
+    different order still coalesce; values JSON cannot encode (datetimes,
+    say) are compared by ``repr``. Data that cannot be made canonical at all
+    (mixed key types, cycles) only coalesces with the very same object.
+    """
+    try:
+        canonical = json.dumps(
+            data, sort_keys=True, separators=(",", ":"), default=repr
+        )
+    except (TypeError, ValueError):
+        canonical = f"id:{id(data)}"  # the queued batch keeps *data* alive
+    return workflow_name, canonical
+
+
+def check_request_options(request_options: RequestOptions | None) -> None:
+    """Reject options a batcher cannot apply to every bulk request it sends.
+
+    Raises:
+        ValueError: If *request_options* carries an idempotency key; one key
+            on every batch would make the API (or an ``IdempotencyWindow``)
+            drop all batches after the first.
+    """
+    if request_options is not None and request_options.idempotency_key:
+        raise ValueError(
+            "A trigger batcher cannot send an idempotency key: every batch "
+            "would reuse it"
+        )
+
+
+def resolve_batch(futures: list[Any], result: Any, error: BaseException | None) -> None:
+    """Settle each future with its execution ID, or all of them with *error*.
+
+    Works for :class:`concurrent.futures.Future` and :class:`asyncio.Future`
+    alike; futures already done (cancelled by their caller) are skipped.
+    Concurrent futures must have been marked running before the call, so
+    they can no longer be cancelled while they are settled.
+    """
+    ids: list[str] = []
+    if error is None:
+        ids = result.workflow_execution_ids
+        if len(ids) != len(futures):
+            error = SirenSDKError(
+                f"trigger_bulk returned {len(ids)} execution IDs for "
+                f"{len(futures)} triggers"
+            )
+    for i, future in enumerate(futures):
+        if future.done():
+            continue
+        if error is None:
+            future.set_result(ids[i])
+        else:
+            future.set_exception(error)
+
+
+@dataclass
+class _Batch:
+    workflow_name: str
+    data: dict[str, Any] | None
+    deadline: float
+    notify: list[dict[str, Any]] = field(default_factory=list)
+    futures: list[Future[str]] = field(default_factory=list)
+
+
+class TriggerBatcher:
+    """Thread-safe micro-batcher in front of ``WorkflowClient.trigger_bulk``."""
+
+    def __init__(
+        self,
+        client: WorkflowClient,
+        *,
+        max_batch: int = 100,
+        max_delay_ms: float = 10.0,
+        concurrency: int = 4,
+        request_options: RequestOptions | None = None,
+    ) -> None:
+        """Create the batcher; prefer ``client.workflow.batcher()``.
+
+        Args:
+            client: Workflow client whose ``trigger_bulk`` sends each batch.
+            max_batch: Triggers per bulk request; a full batch is sent at once.
+            max_delay_ms: Longest a trigger waits for others to join its batch.
+            concurrency: Bulk requests in flight at the same time.
+            request_options: Per-call overrides for every bulk request,
+                without an idempotency key.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if max_delay_ms < 0:
+            raise ValueError("max_delay_ms must not be negative")
+        check_request_options(request_options)
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.request_options = request_options
+        self._cond = threading.Condition()
+        self._batches: dict[BatchKey, _Batch] = {}
+        self._in_flight: set[Future[Any]] = set()
+        self._closed = False
+        self._pool = ThreadPoolExecutor(concurrency, thread_name_prefix="siren-batch")
+        self._timer = threading.Thread(
+            target=self._run_timer, name="siren-batch-timer", daemon=True
+        )
+        self._timer.start()
+
+    def submit(
+        self,
+        workflow_name: str,
+        data: dict[str, Any] | None = None,
+        notify: dict[str, Any] | None = None,
+    ) -> Future[str]:
+        """Queue a trigger and return a future for its execution ID.
+
+        Arguments are those of
+        :meth:`siren.clients.workflows.WorkflowClient.trigger`; triggers with
+        the same ``workflow_name`` and ``data`` share a bulk request, in
+        which ``notify`` (``{}`` when omitted) is this trigger's element.
+
+        Raises:
+            SirenSDKError: If the batcher is closed.
+        """
+        key = batch_key(workflow_name, data)
+        future: Future[str] = Future()
+        with self._cond:
+            if self._closed:
+                raise SirenSDKError("Trigger batcher is closed")
+            batch = self._batches.get(key)
+            if batch is None:
+                deadline = time.monotonic() + self.max_delay
+                batch = self._batches[key] = _Batch(workflow_name, data, deadline)
+                self._cond.notify()
+            batch.notify.append(notify or {})
+            batch.futures.append(future)
+            if len(batch.notify) >= self.max_batch:
+                del self._batches[key]
+                self._send(batch)
+        return future
+
+    def trigger(
+        self,
+        workflow_name: str,
+        data: dict[str, Any] | None = None,
+        notify: dict[str, Any] | None = None,
+    ) -> str:
+        """Queue a trigger and block until its execution ID is known."""
+        return self.submit(workflow_name, data, notify).result()
+
+    def flush(self) -> None:
+        """Send every queued trigger now and wait for all bulk requests."""
+        with self._cond:
+            for batch in self._batches.values():
+                self._send(batch)
+            self._batches.clear()
+            in_flight = list(self._in_flight)
+        for request in in_flight:
+            request.exception()  # wait; errors are reported through futures
+
+    def close(self) -> None:
+        """Flush, then stop the timer thread and the request pool."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self.flush()
+        self._timer.join()
+        self._pool.shutdown()
+
+    def __enter__(self) -> TriggerBatcher:
+        """Enter context manager returning *self*."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Exit context manager, flushing and closing the batcher."""
+        self.close()
+
+    def _send(self, batch: _Batch) -> None:
+        """Hand *batch* to the pool (caller holds the lock)."""
+        # From here on callers can no longer cancel; those who already did
+        # keep their place in the request but are not settled.
+        for future in batch.futures:
+            future.set_running_or_notify_cancel()
+        request = self._pool.submit(
+            self.client.trigger_bulk,
+            batch.workflow_name,
+            batch.notify,
+            batch.data,
+            request_options=self.request_options,
+        )
+        self._in_flight.add(request)
+        request.add_done_callback(lambda r: self._settle(r, batch))
+
+    def _settle(self, request: Future[Any], batch: _Batch) -> None:
+        error = request.exception()
+        resolve_batch(batch.futures, None if error else request.result(), error)
+        with self._cond:
+            self._in_flight.discard(request)
+
+    def _run_timer(self) -> None:
+        """Send batches whose oldest trigger has waited ``max_delay``."""
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                due = [k for k, b in self._batches.items() if b.deadline <= now]
+                for key in due:
+                    self._send(self._batches.pop(key))
+                if self._batches:
+                    next_deadline = min(b.deadline for b in self._batches.values())
+                    self._cond.wait(next_deadline - now)
+                else:
+                    self._cond.wait()
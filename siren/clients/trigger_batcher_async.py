@@ -0,0 +1,153 @@
+"""Asyncio counterpart of :mod:`siren.clients.trigger_batcher`."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from ..exceptions import SirenSDKError
+from .trigger_batcher import (
+    BatchKey,
+    batch_key,
+    check_request_options,
+    resolve_batch,
+)
+
+if TYPE_CHECKING:
+    from ..http.options import RequestOptions
+    from .workflows_async import AsyncWorkflowClient
+
+__all__ = ["AsyncTriggerBatcher"]
+
+
+class _Batch:
+    __slots__ = ("workflow_name", "data", "notify", "futures", "timer")
+
+    def __init__(self, workflow_name: str, data: dict[str, Any] | None) -> None:
+        self.workflow_name = workflow_name
+        self.data = data
+        self.notify: list[dict[str, Any]] = []
+        self.futures: list[asyncio.Future[str]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class AsyncTriggerBatcher:
+    """Micro-batcher in front of ``AsyncWorkflowClient.trigger_bulk``.
+
+    Bound to the event loop it is first used on; see
+    :class:`~siren.clients.trigger_batcher.TriggerBatcher` for the behaviour.
+    """
+
+    def __init__(
+        self,
+        client: AsyncWorkflowClient,
+        *,
+        max_batch: int = 100,
+        max_delay_ms: float = 10.0,
+        concurrency: int = 4,
+        request_options: RequestOptions | None = None,
+    ) -> None:
+        """Create the batcher; prefer ``client.workflow.batcher()``."""
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if max_delay_ms < 0:
+            raise ValueError("max_delay_ms must not be negative")
+        check_request_options(request_options)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.concurrency = concurrency
+        self.request_options = request_options
+        self._batches: dict[BatchKey, _Batch] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._closed = False
+
+    def submit(
+        self,
+        workflow_name: str,
+        data: dict[str, Any] | None = None,
+        notify: dict[str, Any] | None = None,
+    ) -> asyncio.Future[str]:
+        """Queue a trigger and return a future for its execution ID.
+
+        Must be called from a running event loop.
+
+        Raises:
+            SirenSDKError: If the batcher is closed.
+        """
+        if self._closed:
+            raise SirenSDKError("Trigger batcher is closed")
+        loop = asyncio.get_running_loop()
+        key = batch_key(workflow_name, data)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(workflow_name, data)
+            batch.timer = loop.call_later(self.max_delay, self._send, key)
+        future: asyncio.Future[str] = loop.create_future()
+        batch.notify.append(notify or {})
+        batch.futures.append(future)
+        if len(batch.notify) >= self.max_batch:
+            self._send(key)
+        return future
+
+    async def trigger(
+        self,
+        workflow_name: str,
+        data: dict[str, Any] | None = None,
+        notify: dict[str, Any] | None = None,
+    ) -> str:
+        """Queue a trigger and wait for its execution ID."""
+        return await self.submit(workflow_name, data, notify)
+
+    async def flush(self) -> None:
+        """Send every queued trigger now and wait for all bulk requests."""
+        for key in list(self._batches):
+            self._send(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Flush and refuse further triggers."""
+        self._closed = True
+        await self.flush()
+
+    async def __aenter__(self) -> AsyncTriggerBatcher:
+        """Enter async context manager returning *self*."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Exit async context manager, flushing and closing the batcher."""
+        await self.aclose()
+
+    def _send(self, key: BatchKey) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._request(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _request(self, batch: _Batch) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            async with self._semaphore:
+                result = await self.client.trigger_bulk(
+                    batch.workflow_name,
+                    batch.notify,
+                    batch.data,
+                    request_options=self.request_options,
+                )
+        except Exception as e:
+            resolve_batch(batch.futures, None, e)
+        else:
+            resolve_batch(batch.futures, result, None)
+        finally:
+            for future in batch.futures:  # cancelled before an answer
+                if not future.done():
+                    future.cancel()
@@ -1,5 +1,8 @@
 """User client for the Siren API."""
 
+from typing import Optional
+
+from ..http.options import RequestOptions
 from ..models.base import DeleteResponse
 from ..models.user import User, UserAPIResponse, UserRequest
 from .base import BaseClient
@@ -8,11 +11,15 @@ from .base import BaseClient
 class UserClient(BaseClient):
     """Client for user-related operations."""
 
-    def add(self, **user_data) -> User:
+    def add(
+        self, *, request_options: Optional[RequestOptions] = None, **user_data
+    ) -> User:
         """Create a user.
 
         Args:
             **user_data: User attributes matching the UserRequest model fields.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             User: A User model representing the created user.
@@ -27,14 +34,23 @@ class UserClient(BaseClient):
             request_model=UserRequest,
             response_model=UserAPIResponse,
             data=user_data,
+            options=request_options,
         )
 
-    def update(self, unique_id: str, **user_data) -> User:
+    def update(
+        self,
+        unique_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
+        **user_data,
+    ) -> User:
         """Update a user.
 
         Args:
             unique_id: The unique ID of the user to update.
             **user_data: User attributes matching the UserRequest model fields.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             User: A User model representing the updated user.
@@ -46,17 +62,23 @@ class UserClient(BaseClient):
         user_data["unique_id"] = unique_id
         return self._make_request(
             method="PUT",
-            endpoint=f"/api/v1/public/users/{unique_id}",
+            endpoint="/api/v1/public/users/{unique_id}",
+            path_params={"unique_id": unique_id},
             request_model=UserRequest,
             response_model=UserAPIResponse,
             data=user_data,
+            options=request_options,
         )
 
-    def delete(self, unique_id: str) -> bool:
+    def delete(
+        self, unique_id: str, *, request_options: Optional[RequestOptions] = None
+    ) -> bool:
         """Delete a user.
 
         Args:
             unique_id: The unique ID of the user to delete.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             bool: True if the user was successfully deleted.
@@ -67,7 +89,9 @@ class UserClient(BaseClient):
         """
         return self._make_request(
             method="DELETE",
-            endpoint=f"/api/v1/public/users/{unique_id}",
+            endpoint="/api/v1/public/users/{unique_id}",
+            path_params={"unique_id": unique_id},
             response_model=DeleteResponse,
             expected_status=204,
+            options=request_options,
         )
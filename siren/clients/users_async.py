@@ -1,7 +1,8 @@
 """Asynchronous User client for Siren SDK."""
 
-from typing import Any
+from typing import Any, Optional
 
+from ..http.options import RequestOptions
 from ..models.base import DeleteResponse
 from ..models.user import User, UserAPIResponse, UserRequest
 from .async_base import AsyncBaseClient
@@ -10,7 +11,9 @@ from .async_base import AsyncBaseClient
 class AsyncUserClient(AsyncBaseClient):
     """Non-blocking user operations (add, update, delete)."""
 
-    async def add(self, **user_data: Any) -> User:
+    async def add(
+        self, *, request_options: Optional[RequestOptions] = None, **user_data: Any
+    ) -> User:
         """Create a user and return the resulting object."""
         response = await self._make_request(
             method="POST",
@@ -18,27 +21,40 @@ class AsyncUserClient(AsyncBaseClient):
             request_model=UserRequest,
             response_model=UserAPIResponse,
             data=user_data,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
 
-    async def update(self, unique_id: str, **user_data: Any) -> User:
+    async def update(
+        self,
+        unique_id: str,
+        *,
+        request_options: Optional[RequestOptions] = None,
+        **user_data: Any,
+    ) -> User:
         """Update user identified by unique_id."""
         user_data["unique_id"] = unique_id
         response = await self._make_request(
             method="PUT",
-            endpoint=f"/api/v1/public/users/{unique_id}",
+            endpoint="/api/v1/public/users/{unique_id}",
+            path_params={"unique_id": unique_id},
             request_model=UserRequest,
             response_model=UserAPIResponse,
             data=user_data,
+            options=request_options,
         )
         return response  # type: ignore[return-value]
 
-    async def delete(self, unique_id: str) -> bool:
+    async def delete(
+        self, unique_id: str, *, request_options: Optional[RequestOptions] = None
+    ) -> bool:
         """Delete user and return True on success."""
         await self._make_request(
             method="DELETE",
-            endpoint=f"/api/v1/public/users/{unique_id}",
+            endpoint="/api/v1/public/users/{unique_id}",
+            path_params={"unique_id": unique_id},
             response_model=DeleteResponse,
             expected_status=204,
+            options=request_options,
         )
         return True
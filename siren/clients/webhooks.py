@@ -1,5 +1,8 @@
 """Webhook client for the Siren API."""
 
+from typing import Optional
+
+from ..http.options import RequestOptions
 from ..models.webhooks import (
     InboundWebhookRequest,
     NotificationsWebhookRequest,
@@ -12,11 +15,15 @@ from .base import BaseClient
 class WebhookClient(BaseClient):
     """Client for webhook configuration operations."""
 
-    def configure_notifications(self, url: str) -> WebhookConfig:
+    def configure_notifications(
+        self, url: str, *, request_options: Optional[RequestOptions] = None
+    ) -> WebhookConfig:
         """Configure the webhook for notifications.
 
         Args:
             url: The URL to be configured for the notifications webhook.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             The webhook configuration object.
@@ -33,14 +40,19 @@ class WebhookClient(BaseClient):
             request_model=NotificationsWebhookRequest,
             response_model=WebhookResponse,
             data=payload,
+            options=request_options,
         )
         return response.webhook_config
 
-    def configure_inbound(self, url: str) -> WebhookConfig:
+    def configure_inbound(
+        self, url: str, *, request_options: Optional[RequestOptions] = None
+    ) -> WebhookConfig:
         """Configure the webhook for inbound messages.
 
         Args:
             url: The URL to be configured for the inbound message webhook.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             The webhook configuration object.
@@ -57,5 +69,6 @@ class WebhookClient(BaseClient):
             request_model=InboundWebhookRequest,
             response_model=WebhookResponse,
             data=payload,
+            options=request_options,
         )
         return response.inbound_webhook_config
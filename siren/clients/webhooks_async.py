@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from ..http.options import RequestOptions
 from ..models.webhooks import (
     InboundWebhookRequest,
     NotificationsWebhookRequest,
@@ -12,7 +13,9 @@ from .async_base import AsyncBaseClient
 
 
 class AsyncWebhookClient(AsyncBaseClient):  # noqa: D101 – simple wrapper
-    async def configure_notifications(self, url: str) -> WebhookConfig:
+    async def configure_notifications(
+        self, url: str, *, request_options: RequestOptions | None = None
+    ) -> WebhookConfig:
         """Configure the notifications webhook (async)."""
         payload = {"webhook_config": {"url": url}}
 
@@ -22,11 +25,14 @@ class AsyncWebhookClient(AsyncBaseClient):  # noqa: D101 – simple wrapper
             request_model=NotificationsWebhookRequest,
             response_model=WebhookResponse,
             data=payload,
+            options=request_options,
         )
         # ``response`` is WebhookData; return nested config.
         return response.webhook_config  # type: ignore[return-value]
 
-    async def configure_inbound(self, url: str) -> WebhookConfig:
+    async def configure_inbound(
+        self, url: str, *, request_options: RequestOptions | None = None
+    ) -> WebhookConfig:
         """Configure the inbound message webhook (async)."""
         payload = {"inbound_webhook_config": {"url": url}}
 
@@ -36,5 +42,6 @@ class AsyncWebhookClient(AsyncBaseClient):  # noqa: D101 – simple wrapper
             request_model=InboundWebhookRequest,
             response_model=WebhookResponse,
             data=payload,
+            options=request_options,
         )
         return response.inbound_webhook_config  # type: ignore[return-value]
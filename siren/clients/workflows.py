@@ -1,7 +1,8 @@
 """Workflows client using BaseClient architecture."""
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from ..http.options import RequestOptions
 from ..models.workflows import (
     BulkWorkflowExecutionData,
     ScheduleData,
@@ -14,6 +15,23 @@ from ..models.workflows import (
     WorkflowExecutionData,
 )
 from .base import BaseClient
+from .batch import iter_bounded
+from .bulk_chunks import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ITEMS,
+    BulkChunk,
+    ChunkedBulkExecution,
+    chunk_notify,
+    chunk_options,
+)
+
+if TYPE_CHECKING:
+    from .trigger_batcher import TriggerBatcher
+
+# Default timeouts for triggers; bulk triggers get more time. Passed per call
+# so concurrent calls on a shared client never race on ``self.timeout``.
+_TRIGGER_OPTIONS = RequestOptions(timeout=10)
+_TRIGGER_BULK_OPTIONS = RequestOptions(timeout=20)
 
 
 class WorkflowClient(BaseClient):
@@ -24,6 +42,9 @@ class WorkflowClient(BaseClient):
         workflow_name: str,
         data: Optional[Dict[str, Any]] = None,
         notify: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> WorkflowExecutionData:
         """Trigger a workflow with the given name and payload.
 
@@ -31,6 +52,11 @@ class WorkflowClient(BaseClient):
             workflow_name: The name of the workflow to execute.
             data: Common data for all workflow executions.
             notify: Specific data for this workflow execution.
+            idempotency_key: Sent as the ``Idempotency-Key`` header, which
+                lets the retry policy repeat the call. Generated when the
+                client has ``auto_idempotency_keys`` set and none is given.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             WorkflowExecutionData: Workflow execution details.
@@ -39,25 +65,21 @@ class WorkflowClient(BaseClient):
             SirenAPIError: If the API returns an error response.
             SirenSDKError: If there's an SDK-level issue (network, parsing, etc).
         """
-        # Store original timeout for custom timeout handling
-        original_timeout = self.timeout
-        self.timeout = 10
-
-        try:
-            response = self._make_request(
-                method="POST",
-                endpoint="/api/v2/workflows/trigger",
-                request_model=TriggerWorkflowRequest,
-                response_model=TriggerWorkflowResponse,
-                data={
-                    "workflow_name": workflow_name,
-                    "data": data,
-                    "notify": notify,
-                },
-            )
-        finally:
-            # Restore original timeout
-            self.timeout = original_timeout
+        response = self._make_request(
+            method="POST",
+            endpoint="/api/v2/workflows/trigger",
+            request_model=TriggerWorkflowRequest,
+            response_model=TriggerWorkflowResponse,
+            data={
+                "workflowName": workflow_name,
+                "data": data,
+                "notify": notify,
+            },
+            options=_TRIGGER_OPTIONS.merge(
+                self._with_idempotency_key(request_options, idempotency_key)
+            ),
+            trusted_payload=True,
+        )
         return response
 
     def trigger_bulk(
@@ -65,6 +87,8 @@ class WorkflowClient(BaseClient):
         workflow_name: str,
         notify: List[Dict[str, Any]],
         data: Optional[Dict[str, Any]] = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> BulkWorkflowExecutionData:
         """Trigger a workflow in bulk for multiple recipients/notifications.
 
@@ -74,6 +98,8 @@ class WorkflowClient(BaseClient):
                    for a workflow execution. The workflow will be executed for
                    each element in this list.
             data: Common data that will be used across all workflow executions.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             BulkWorkflowExecutionData: Bulk workflow execution details.
@@ -82,27 +108,114 @@ class WorkflowClient(BaseClient):
             SirenAPIError: If the API returns an error response.
             SirenSDKError: If there's an SDK-level issue (network, parsing, etc).
         """
-        # Store original timeout for custom timeout handling
-        original_timeout = self.timeout
-        self.timeout = 20  # Increased timeout for bulk
-
-        try:
-            response = self._make_request(
-                method="POST",
-                endpoint="/api/v2/workflows/trigger/bulk",
-                request_model=TriggerBulkWorkflowRequest,
-                response_model=TriggerBulkWorkflowResponse,
-                data={
-                    "workflow_name": workflow_name,
-                    "notify": notify,
-                    "data": data,
-                },
-            )
-        finally:
-            # Restore original timeout
-            self.timeout = original_timeout
+        response = self._make_request(
+            method="POST",
+            endpoint="/api/v2/workflows/trigger/bulk",
+            request_model=TriggerBulkWorkflowRequest,
+            response_model=TriggerBulkWorkflowResponse,
+            data={
+                "workflowName": workflow_name,
+                "notify": notify,
+                "data": data,
+            },
+            options=_TRIGGER_BULK_OPTIONS.merge(request_options),
+            trusted_payload=True,
+        )
         return response
 
+    def trigger_bulk_chunked(
+        self,
+        workflow_name: str,
+        notify: List[Dict[str, Any]],
+        data: Optional[Dict[str, Any]] = None,
+        *,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        concurrency: int = 4,
+        request_options: Optional[RequestOptions] = None,
+    ) -> ChunkedBulkExecution:
+        """Trigger a workflow in bulk, split over as many requests as needed.
+
+        ``notify`` is cut into consecutive chunks of at most ``max_items``
+        elements whose request body stays under ``max_bytes``; each chunk is
+        sent with :meth:`trigger_bulk`, at most ``concurrency`` at a time.
+        A failed chunk does not stop the others.
+
+        Args:
+            workflow_name: The name of the workflow to execute.
+            notify: One element per workflow execution, as for
+                :meth:`trigger_bulk`.
+            data: Common data sent with every chunk.
+            max_items: Maximum ``notify`` elements per request.
+            max_bytes: Maximum serialized request body per request.
+            concurrency: Maximum number of requests in flight. Keep it at or
+                below the client's ``pool_maxsize``.
+            request_options: Per-call overrides applied to every request. An
+                idempotency key is suffixed with ``":{start}"``, the position
+                of each chunk's first element, so chunks do not share it.
+
+        Returns:
+            ChunkedBulkExecution: Execution IDs by ``notify`` position and
+            the outcome of every chunk.
+        """
+        bounds = chunk_notify(
+            workflow_name, notify, data, max_items=max_items, max_bytes=max_bytes
+        )
+        outcomes = dict(
+            iter_bounded(
+                lambda b: self.trigger_bulk(
+                    workflow_name,
+                    notify[b[0] : b[1]],
+                    data,
+                    request_options=chunk_options(request_options, b[0]),
+                ),
+                bounds,
+                concurrency=concurrency,
+                thread_name_prefix="siren-bulk",
+            )
+        )
+        return ChunkedBulkExecution(
+            [BulkChunk.of(*b, outcomes[i]) for i, b in enumerate(bounds)]
+        )
+
+    def batcher(
+        self,
+        *,
+        max_batch: int = 100,
+        max_delay_ms: float = 10.0,
+        concurrency: int = 4,
+        request_options: Optional[RequestOptions] = None,
+    ) -> "TriggerBatcher":
+        """Return a batcher that coalesces single triggers into bulk calls.
+
+        Triggers submitted to it with the same ``workflow_name`` and ``data``
+        are sent together through :meth:`trigger_bulk`; each caller gets a
+        future resolving to its own execution ID. Close the batcher (or use
+        it as a context manager) to send what is still queued.
+
+        Args:
+            max_batch: Triggers per bulk request; a full batch is sent at once.
+            max_delay_ms: Longest a trigger waits for others to join its batch.
+            concurrency: Bulk requests in flight at the same time.
+            request_options: Per-call overrides for every bulk request.
+                An idempotency key is rejected, as every batch would share it.
+
+        Returns:
+            TriggerBatcher: The batcher, ready for ``submit()``.
+
+        Raises:
+            ValueError: If ``request_options`` carries an idempotency key.
+        """
+        from .trigger_batcher import TriggerBatcher
+
+        return TriggerBatcher(
+            self,
+            max_batch=max_batch,
+            max_delay_ms=max_delay_ms,
+            concurrency=concurrency,
+            request_options=request_options,
+        )
+
     def schedule(
         self,
         name: str,
@@ -113,6 +226,8 @@ class WorkflowClient(BaseClient):
         workflow_id: str,
         input_data: Dict[str, Any],
         end_date: Optional[str] = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> ScheduleData:
         """Schedule a workflow execution.
 
@@ -125,6 +240,8 @@ class WorkflowClient(BaseClient):
             workflow_id: ID of the workflow to schedule.
             input_data: Input data for the workflow.
             end_date: Optional end date for the schedule in "YYYY-MM-DD" format.
+            request_options: Per-call overrides (timeout, retry policy,
+                idempotency key, extra headers).
 
         Returns:
             ScheduleData: Schedule details.
@@ -152,5 +269,6 @@ class WorkflowClient(BaseClient):
                 "input_data": input_data,
                 "end_date": end_date,
             },
+            options=request_options,
         )
         return response
@@ -1,7 +1,8 @@
 """Asynchronous Workflow client for Siren SDK."""
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from ..http.options import RequestOptions
 from ..models.workflows import (
     BulkWorkflowExecutionData,
     ScheduleData,
@@ -14,6 +15,18 @@ from ..models.workflows import (
     WorkflowExecutionData,
 )
 from .async_base import AsyncBaseClient
+from .batch_async import iter_bounded_async
+from .bulk_chunks import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ITEMS,
+    BulkChunk,
+    ChunkedBulkExecution,
+    chunk_notify,
+    chunk_options,
+)
+
+if TYPE_CHECKING:
+    from .trigger_batcher_async import AsyncTriggerBatcher
 
 
 class AsyncWorkflowClient(AsyncBaseClient):
@@ -24,18 +37,27 @@ class AsyncWorkflowClient(AsyncBaseClient):
         workflow_name: str,
         data: Optional[Dict[str, Any]] = None,
         notify: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> WorkflowExecutionData:
-        """Trigger a workflow execution and return execution data."""
+        """Trigger a workflow execution and return execution data.
+
+        ``idempotency_key`` is sent as the ``Idempotency-Key`` header (see
+        :meth:`siren.clients.workflows.WorkflowClient.trigger`).
+        """
         response = await self._make_request(
             method="POST",
             endpoint="/api/v2/workflows/trigger",
             request_model=TriggerWorkflowRequest,
             response_model=TriggerWorkflowResponse,
             data={
-                "workflow_name": workflow_name,
+                "workflowName": workflow_name,
                 "data": data,
                 "notify": notify,
             },
+            options=self._with_idempotency_key(request_options, idempotency_key),
+            trusted_payload=True,
         )
         return response  # type: ignore[return-value]
 
@@ -44,6 +66,8 @@ class AsyncWorkflowClient(AsyncBaseClient):
         workflow_name: str,
         notify: List[Dict[str, Any]],
         data: Optional[Dict[str, Any]] = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> BulkWorkflowExecutionData:
         """Trigger workflow for multiple recipients in bulk."""
         response = await self._make_request(
@@ -52,13 +76,75 @@ class AsyncWorkflowClient(AsyncBaseClient):
             request_model=TriggerBulkWorkflowRequest,
             response_model=TriggerBulkWorkflowResponse,
             data={
-                "workflow_name": workflow_name,
+                "workflowName": workflow_name,
                 "notify": notify,
                 "data": data,
             },
+            options=request_options,
+            trusted_payload=True,
         )
         return response  # type: ignore[return-value]
 
+    async def trigger_bulk_chunked(
+        self,
+        workflow_name: str,
+        notify: List[Dict[str, Any]],
+        data: Optional[Dict[str, Any]] = None,
+        *,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        concurrency: int = 4,
+        request_options: Optional[RequestOptions] = None,
+    ) -> ChunkedBulkExecution:
+        """Trigger a workflow in bulk, split over as many requests as needed.
+
+        See :meth:`siren.clients.workflows.WorkflowClient.trigger_bulk_chunked`;
+        here the chunks are sent as concurrent tasks.
+        """
+        bounds = chunk_notify(
+            workflow_name, notify, data, max_items=max_items, max_bytes=max_bytes
+        )
+        outcomes = {
+            index: outcome
+            async for index, outcome in iter_bounded_async(
+                lambda b: self.trigger_bulk(
+                    workflow_name,
+                    notify[b[0] : b[1]],
+                    data,
+                    request_options=chunk_options(request_options, b[0]),
+                ),
+                bounds,
+                concurrency=concurrency,
+            )
+        }
+        return ChunkedBulkExecution(
+            [BulkChunk.of(*b, outcomes[i]) for i, b in enumerate(bounds)]
+        )
+
+    def batcher(
+        self,
+        *,
+        max_batch: int = 100,
+        max_delay_ms: float = 10.0,
+        concurrency: int = 4,
+        request_options: Optional[RequestOptions] = None,
+    ) -> "AsyncTriggerBatcher":
+        """Return a batcher that coalesces single triggers into bulk calls.
+
+        See :meth:`siren.clients.workflows.WorkflowClient.batcher`; here
+        ``submit()`` returns an :class:`asyncio.Future` and ``aclose()``
+        sends what is still queued.
+        """
+        from .trigger_batcher_async import AsyncTriggerBatcher
+
+        return AsyncTriggerBatcher(
+            self,
+            max_batch=max_batch,
+            max_delay_ms=max_delay_ms,
+            concurrency=concurrency,
+            request_options=request_options,
+        )
+
     async def schedule(
         self,
         name: str,
@@ -69,6 +155,8 @@ class AsyncWorkflowClient(AsyncBaseClient):
         workflow_id: str,
         input_data: Dict[str, Any],
         end_date: Optional[str] = None,
+        *,
+        request_options: Optional[RequestOptions] = None,
     ) -> ScheduleData:
         """Schedule a workflow as per provided recurrence params."""
         if workflow_type == "ONCE" and end_date is None:
@@ -88,5 +176,6 @@ class AsyncWorkflowClient(AsyncBaseClient):
                 "input_data": input_data,
                 "end_date": end_date,
             },
+            options=request_options,
         )
         return response  # type: ignore[return-value]
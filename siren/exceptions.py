@@ -1,6 +1,6 @@
 """Custom exceptions for the Siren SDK."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .models.base import APIErrorDetail
 
@@ -52,3 +52,55 @@ class SirenAPIError(SirenSDKError):
     def __str__(self) -> str:
         """Return string representation of the error."""
         return f"{self.__class__.__name__} (Status: {self.status_code}, Code: {self.error_code}): {self.api_message}"
+
+
+class SirenCircuitOpenError(SirenSDKError):
+    """Raised without contacting the API while an endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        """Initialize the circuit-open error.
+
+        Args:
+            endpoint: Endpoint template whose circuit is open.
+            retry_after: Seconds until the circuit lets a probe request through.
+        """
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            message=f"Circuit open for {endpoint}; retry in {retry_after:.1f}s"
+        )
+
+
+class SirenTimeoutError(SirenSDKError, TimeoutError):
+    """Raised when waited-for messages are not terminal before the deadline."""
+
+    def __init__(self, pending: List[str], timeout: float):
+        """Initialize the timeout error.
+
+        Args:
+            pending: IDs that had not reached a terminal status.
+            timeout: The timeout, in seconds, that expired.
+        """
+        self.pending = pending
+        self.timeout = timeout
+        super().__init__(
+            message=(
+                f"{len(pending)} message(s) did not reach a terminal status "
+                f"within {timeout}s"
+            )
+        )
+
+
+class SirenDuplicateRequestError(SirenSDKError):
+    """Raised when a call reuses the idempotency key of a call still in flight."""
+
+    def __init__(self, idempotency_key: str):
+        """Initialize the duplicate-request error.
+
+        Args:
+            idempotency_key: The key that is already in use.
+        """
+        self.idempotency_key = idempotency_key
+        super().__init__(
+            message=f"A request with idempotency key {idempotency_key!r} is in flight"
+        )
@@ -0,0 +1,239 @@
+"""Per-endpoint circuit breaker for Siren API requests.
+
+Each endpoint template (e.g. ``/api/v1/public/template/{template_id}``) gets
+its own circuit that tracks the outcome of the most recent calls:
+
+* **closed** – requests flow normally. Once at least ``minimum_calls`` outcomes
+  are recorded and the failure rate reaches ``failure_rate_threshold`` the
+  circuit opens.
+* **open** – requests fail immediately with
+  :class:`~siren.exceptions.SirenCircuitOpenError` for ``recovery_timeout``
+  seconds.
+* **half-open** – up to ``half_open_max_calls`` probe requests are let through.
+  If they all succeed the circuit closes; any failure re-opens it.
+
+Network errors, timeouts and 5xx responses count as failures. One breaker can
+be shared by sync and async clients.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ..exceptions import SirenCircuitOpenError
+
+__all__ = ["CircuitBreaker", "CircuitSnapshot", "CircuitState"]
+
+
+class CircuitState(str, Enum):
+    """State of a single circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitSnapshot:
+    """Point-in-time view of one circuit, suitable for exporting as metrics."""
+
+    state: CircuitState
+    calls: int
+    failures: int
+    failure_rate: float
+    retry_after: float
+
+
+@dataclass
+class _Circuit:
+    outcomes: deque
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    probes_in_flight: int = 0
+    probe_successes: int = 0
+    failures: int = field(default=0)
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker keyed by endpoint template."""
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_statuses: frozenset[int] = frozenset({500, 502, 503, 504}),
+    ) -> None:
+        """Create a breaker.
+
+        Args:
+            failure_rate_threshold: Failure ratio (0-1) over the window that
+                opens the circuit.
+            minimum_calls: Outcomes required before the rate is evaluated.
+            window_size: Number of most recent outcomes kept per endpoint.
+            recovery_timeout: Seconds a circuit stays open before probing.
+            half_open_max_calls: Probe requests allowed while half-open; all of
+                them must succeed to close the circuit.
+            failure_statuses: Response statuses counted as failures.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        if minimum_calls < 1 or window_size < minimum_calls:
+            raise ValueError("window_size must be >= minimum_calls >= 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_size = window_size
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_statuses = failure_statuses
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Request hooks used by the base clients
+    # ------------------------------------------------------------------
+
+    def before_request(self, endpoint: str) -> None:
+        """Admit a request to *endpoint* or raise if its circuit is open.
+
+        Raises:
+            SirenCircuitOpenError: If the circuit is open, or half-open with
+                all probe slots taken.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            now = time.monotonic()
+            if circuit.state is CircuitState.OPEN:
+                remaining = circuit.opened_at + self.recovery_timeout - now
+                if remaining > 0:
+                    raise SirenCircuitOpenError(endpoint, remaining)
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probes_in_flight = 0
+                circuit.probe_successes = 0
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.probes_in_flight >= self.half_open_max_calls:
+                    raise SirenCircuitOpenError(endpoint, 0.0)
+                circuit.probes_in_flight += 1
+
+    def record_success(self, endpoint: str) -> None:
+        """Record a successful (or non-failure) outcome for *endpoint*."""
+        self._record(endpoint, failed=False)
+
+    def record_failure(self, endpoint: str) -> None:
+        """Record a failed outcome (network error, timeout, 5xx) for *endpoint*."""
+        self._record(endpoint, failed=True)
+
+    def release_probe(self, endpoint: str) -> None:
+        """Free the slot of a request admitted without recording an outcome.
+
+        Used when a request is cancelled or interrupted after
+        :meth:`before_request`; its half-open probe slot would otherwise stay
+        taken and keep the circuit rejecting calls.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+
+    def is_failure_status(self, status_code: int) -> bool:
+        """Return whether a response with *status_code* counts as a failure."""
+        return status_code in self.failure_statuses
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Return the current state of the circuit for *endpoint*."""
+        return self.snapshot().get(endpoint, _CLOSED_SNAPSHOT).state
+
+    def snapshot(self) -> dict[str, CircuitSnapshot]:
+        """Return the state of every known circuit keyed by endpoint template."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                endpoint: CircuitSnapshot(
+                    state=circuit.state,
+                    calls=len(circuit.outcomes),
+                    failures=circuit.failures,
+                    failure_rate=(
+                        circuit.failures / len(circuit.outcomes)
+                        if circuit.outcomes
+                        else 0.0
+                    ),
+                    retry_after=(
+                        max(0.0, circuit.opened_at + self.recovery_timeout - now)
+                        if circuit.state is CircuitState.OPEN
+                        else 0.0
+                    ),
+                )
+                for endpoint, circuit in self._circuits.items()
+            }
+
+    def reset(self, endpoint: str | None = None) -> None:
+        """Close and clear one circuit, or all of them when *endpoint* is ``None``."""
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = _Circuit(outcomes=deque(maxlen=self.window_size))
+            self._circuits[endpoint] = circuit
+        return circuit
+
+    def _record(self, endpoint: str, failed: bool) -> None:
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+                if failed:
+                    self._open(circuit)
+                    return
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= self.half_open_max_calls:
+                    circuit.state = CircuitState.CLOSED
+                    circuit.outcomes.clear()
+                    circuit.failures = 0
+                return
+            if circuit.state is CircuitState.OPEN:
+                # Late result of a request admitted before the circuit opened.
+                return
+
+            if len(circuit.outcomes) == circuit.outcomes.maxlen:
+                circuit.failures -= circuit.outcomes[0]
+            circuit.outcomes.append(failed)
+            circuit.failures += failed
+            if (
+                len(circuit.outcomes) >= self.minimum_calls
+                and circuit.failures / len(circuit.outcomes)
+                >= self.failure_rate_threshold
+            ):
+                self._open(circuit)
+
+    @staticmethod
+    def _open(circuit: _Circuit) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.probes_in_flight = 0
+        circuit.probe_successes = 0
+
+
+_CLOSED_SNAPSHOT = CircuitSnapshot(
+    state=CircuitState.CLOSED, calls=0, failures=0, failure_rate=0.0, retry_after=0.0
+)
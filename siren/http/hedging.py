@@ -0,0 +1,264 @@
+"""Hedged requests for idempotent read endpoints.
+
+When a read request has not answered within a hedge delay, :class:`Hedger`
+sends a second identical request and returns whichever response arrives
+first. The delay is either fixed or a percentile of the latency observed per
+endpoint template, so only the slow tail is duplicated. The extra load is
+capped: every primary request earns ``max_extra_load`` of a hedge credit and a
+hedge spends a whole one.
+
+The loser is cancelled. Async attempts are cancelled outright; a sync attempt
+that has already reached the network cannot be interrupted, so its response
+is closed as soon as it arrives to return the connection to the pool.
+
+Only endpoints the SDK marks as safe to repeat (message status and replies,
+template and channel-template listings) are ever hedged.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, TypeVar
+
+__all__ = ["Hedger", "HedgeStats"]
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Counters describing how much hedging has happened so far."""
+
+    requests: int
+    hedges: int
+    hedge_wins: int
+
+
+class Hedger:
+    """Thread-safe hedging controller shared by sync and async clients."""
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        *,
+        percentile: float | None = None,
+        min_samples: int = 20,
+        window_size: int = 200,
+        max_extra_load: float = 0.05,
+        max_workers: int = 32,
+    ) -> None:
+        """Create a hedger.
+
+        Args:
+            delay: Seconds to wait for the first attempt before hedging. With
+                ``percentile`` set this is only used until ``min_samples``
+                latencies are known; ``None`` means "don't hedge yet".
+            percentile: Hedge after this percentile (0-100) of the latency
+                observed for the endpoint, e.g. ``95``.
+            min_samples: Latencies needed before ``percentile`` is trusted.
+            window_size: Number of recent latencies kept per endpoint.
+            max_extra_load: Upper bound on hedges as a fraction of requests,
+                e.g. ``0.05`` allows at most one hedge per 20 requests.
+            max_workers: Threads used to run sync attempts concurrently. A
+                primary waiting for a free thread is not hedged before it
+                has run for the hedge delay.
+        """
+        if delay is None and percentile is None:
+            raise ValueError("Either delay or percentile must be set")
+        if delay is not None and delay < 0:
+            raise ValueError("delay must be non-negative")
+        if percentile is not None and not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 < max_extra_load <= 1:
+            raise ValueError("max_extra_load must be in (0, 1]")
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.max_extra_load = max_extra_load
+        self.max_workers = max_workers
+        self._budget_cap = max(1.0, max_extra_load * window_size)
+        self._budget = 0.0
+        self._latencies: dict[str, deque] = {}
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def hedge_delay(self, endpoint: str) -> float | None:
+        """Return the current hedge delay for *endpoint*, or ``None`` to not hedge."""
+        if self.percentile is None:
+            return self.delay
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return self.delay
+            ordered = sorted(samples)
+        index = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+    def stats(self) -> HedgeStats:
+        """Return request, hedge and hedge-win counters."""
+        with self._lock:
+            return HedgeStats(self._requests, self._hedges, self._hedge_wins)
+
+    def call(self, endpoint: str, send: Callable[[], T]) -> T:
+        """Run *send*, hedging it with a second call if it is slow.
+
+        Exceptions are only raised once every launched attempt has failed.
+        """
+        delay = self._start(endpoint)
+        if delay is None:
+            return self._timed(endpoint, send)
+
+        executor = self._get_executor()
+        started = threading.Event()
+
+        def run_primary() -> T:
+            started.set()
+            return self._timed(endpoint, send)
+
+        primary = executor.submit(run_primary)
+        primary.add_done_callback(lambda _: started.set())
+        # Start the hedge clock only once the primary runs: time spent queued
+        # behind a saturated pool would otherwise trigger hedges under load.
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_budget():
+            return primary.result()
+        hedge = executor.submit(self._timed, endpoint, send)
+        return self._first_success(primary, hedge)
+
+    async def call_async(self, endpoint: str, send: Callable[[], Awaitable[T]]) -> T:
+        """Await *send*, hedging it with a second call if it is slow.
+
+        The losing attempt is cancelled. Exceptions are only raised once every
+        launched attempt has failed.
+        """
+        import asyncio  # deferred so the sync client does not load asyncio
+
+        delay = self._start(endpoint)
+        if delay is None:
+            return await self._timed_async(endpoint, send)
+
+        primary = asyncio.ensure_future(self._timed_async(endpoint, send))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._take_budget():
+                return await primary
+            hedge = asyncio.ensure_future(self._timed_async(endpoint, send))
+            tasks.add(hedge)
+            pending = set(tasks)
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        errors.append(error)
+                        continue
+                    if task is hedge:
+                        self._count_win()
+                    return task.result()
+            raise errors[0]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def close(self) -> None:
+        """Shut down the worker threads used for sync hedging."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _start(self, endpoint: str) -> float | None:
+        with self._lock:
+            self._requests += 1
+            self._budget = min(self._budget + self.max_extra_load, self._budget_cap)
+        return self.hedge_delay(endpoint)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedges += 1
+            return True
+
+    def _count_win(self) -> None:
+        with self._lock:
+            self._hedge_wins += 1
+
+    def _record(self, endpoint: str, latency: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None:
+                samples = self._latencies[endpoint] = deque(maxlen=self.window_size)
+            samples.append(latency)
+
+    def _timed(self, endpoint: str, send: Callable[[], T]) -> T:
+        start = time.monotonic()
+        result = send()
+        self._record(endpoint, time.monotonic() - start)
+        return result
+
+    async def _timed_async(self, endpoint: str, send: Callable[[], Awaitable[T]]) -> T:
+        start = time.monotonic()
+        result = await send()
+        self._record(endpoint, time.monotonic() - start)
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="siren-hedge"
+                )
+            return self._executor
+
+    def _first_success(self, primary: Future, hedge: Future) -> Any:
+        pending = {primary, hedge}
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+                    continue
+                if future is hedge:
+                    self._count_win()
+                for loser in (primary, hedge):
+                    if loser is not future:
+                        loser.cancel()
+                        loser.add_done_callback(_close_result)
+                return future.result()
+        raise errors[0]
+
+
+def _close_result(future: Future) -> None:
+    """Release the connection held by a losing attempt's response."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    close = getattr(future.result(), "close", None)
+    if close is not None:
+        close()
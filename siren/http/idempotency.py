@@ -0,0 +1,127 @@
+"""Idempotency keys and a local window that suppresses duplicate submissions.
+
+A call that carries an idempotency key (``idempotency_key=`` on message sends
+and workflow triggers, or ``RequestOptions(idempotency_key=...)``) sends it as
+the ``Idempotency-Key`` header, which also lets the retry policy repeat the
+POST. With an :class:`IdempotencyWindow` on the client, a key that already
+succeeded within the window returns the recorded result without contacting
+the API, and a key whose first call is still in flight is rejected with
+:class:`~siren.exceptions.SirenDuplicateRequestError`. Failed calls release
+their key so they can be retried.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+from ..exceptions import SirenDuplicateRequestError
+from .options import RequestOptions
+
+__all__ = ["IdempotencyWindow", "with_idempotency_key"]
+
+Scope = Tuple[str, str, str]
+"""``(method, path, idempotency_key)`` of a call."""
+
+
+def with_idempotency_key(
+    options: RequestOptions | None, key: str | None, auto: bool
+) -> RequestOptions | None:
+    """Return *options* carrying the idempotency key a call should send.
+
+    *key* wins over ``options.idempotency_key``; without either, a random key
+    is generated when *auto* is set.
+    """
+    if key is None and options is not None:
+        key = options.idempotency_key
+    if key is None and auto:
+        key = uuid.uuid4().hex
+    if key is None or (options is not None and options.idempotency_key == key):
+        return options
+    return (options or RequestOptions()).merge(RequestOptions(idempotency_key=key))
+
+
+class IdempotencyWindow:
+    """Thread-safe, bounded record of recently used idempotency keys.
+
+    One window may be shared by sync and async clients. Keys are scoped by
+    HTTP method and path, so reusing a key on another endpoint is not
+    treated as a duplicate.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        *,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create the window.
+
+        Args:
+            maxsize: Maximum number of completed keys remembered; the oldest
+                is forgotten beyond that. Keys in flight are not counted.
+            ttl: Seconds a completed key suppresses duplicates.
+            clock: Monotonic time source, for tests.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # scope -> (result, expiry) for calls that succeeded
+        self._done: OrderedDict[Scope, tuple[Any, float]] = OrderedDict()
+        self._in_flight: set[Scope] = set()
+        self.suppressed = 0
+
+    def claim(self, scope: Scope) -> tuple[bool, Any]:
+        """Reserve *scope* for a new call.
+
+        Returns:
+            ``(True, result)`` if a call with this scope already succeeded
+            within the window, else ``(False, None)`` after marking it in
+            flight.
+
+        Raises:
+            SirenDuplicateRequestError: If a call with this scope is in flight.
+        """
+        with self._lock:
+            if scope in self._in_flight:
+                raise SirenDuplicateRequestError(scope[2])
+            entry = self._done.get(scope)
+            if entry is not None:
+                if entry[1] > self._clock():
+                    self.suppressed += 1
+                    return True, entry[0]
+                del self._done[scope]
+            self._in_flight.add(scope)
+            return False, None
+
+    def complete(self, scope: Scope, result: Any) -> None:
+        """Record the result of the call that claimed *scope*."""
+        with self._lock:
+            self._in_flight.discard(scope)
+            self._done[scope] = (result, self._clock() + self.ttl)
+            self._done.move_to_end(scope)
+            while len(self._done) > self.maxsize:
+                self._done.popitem(last=False)
+
+    def release(self, scope: Scope) -> None:
+        """Forget a claim whose call failed, so the key can be used again."""
+        with self._lock:
+            self._in_flight.discard(scope)
+
+    def clear(self) -> None:
+        """Forget every completed key (calls in flight keep their claim)."""
+        with self._lock:
+            self._done.clear()
+
+    def __len__(self) -> int:
+        """Number of completed keys remembered, including expired ones."""
+        return len(self._done)
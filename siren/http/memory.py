@@ -0,0 +1,246 @@
+"""In-memory transports that answer with canned Siren API envelopes.
+
+``InMemoryTransport`` and ``AsyncInMemoryTransport`` never touch the network:
+each request is routed to a handler that returns a status code and a JSON body
+shaped like the real API's. Compressed request bodies (``Content-Encoding``
+gzip or zstd) are decoded before the handler sees them. Plugged into a client through ``transport=``,
+they isolate the SDK's own cost – request validation, serialization and
+response parsing – for profiling and benchmarks, and make handy test doubles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import gzip
+import json
+import threading
+import time
+import uuid
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+import httpx  # type: ignore
+
+__all__ = ["AsyncInMemoryTransport", "Handler", "InMemoryTransport", "canned_response"]
+
+Handler = Callable[[str, str, "bytes | None"], "tuple[int, bytes]"]
+"""``handler(method, path, body) -> (status_code, json_body_bytes)``."""
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _decode(content: bytes | None, headers: dict[str, str] | None) -> bytes | None:
+    """Undo the ``Content-Encoding`` a client applied to a request body."""
+    encoding = (headers or {}).get("Content-Encoding")
+    if content is None or encoding is None:
+        return content
+    if encoding == "gzip":
+        return gzip.decompress(content)
+    if encoding == "zstd":
+        import zstandard  # type: ignore
+
+        return zstandard.ZstdDecompressor().decompress(content)
+    raise ValueError(f"Unsupported Content-Encoding: {encoding!r}")
+
+
+def _envelope(data: Any) -> bytes:
+    return json.dumps({"data": data, "error": None}).encode()
+
+
+def _template(i: int) -> dict[str, Any]:
+    version = {"id": f"ver_{i}", "version": 1, "status": "PUBLISHED_LATEST"}
+    return {
+        "id": f"tpl_{i}",
+        "name": f"template_{i}",
+        "variables": [{"name": "user_name", "defaultValue": "there"}],
+        "tags": ["onboarding", "email"],
+        "draftVersion": version,
+        "publishedVersion": version,
+        "templateVersions": [version],
+    }
+
+
+def _channel_template(i: int) -> dict[str, Any]:
+    return {
+        "id": f"ct_{i}",
+        "channel": "EMAIL",
+        "configuration": {"subject": "Hello {{user_name}}", "body": "<p>Hi</p>"},
+        "templateVersionId": "ver_1",
+    }
+
+
+def _reply(i: int) -> dict[str, Any]:
+    return {"text": f"reply {i}", "user": "U01UBCD06BB", "ts": f"1700000000.{i:06d}"}
+
+
+_ITEM_BUILDERS = {
+    "reply": _reply,
+    "channel_template": _channel_template,
+    "template": _template,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _list_body(kind: str, list_size: int) -> bytes:
+    # List payloads never change, so encode them once; this keeps the
+    # transport's own cost out of overhead measurements.
+    return _envelope([_ITEM_BUILDERS[kind](i) for i in range(list_size)])
+
+
+def canned_response(  # noqa: C901
+    method: str, path: str, body: bytes | None, list_size: int = 10
+) -> tuple[int, bytes]:
+    """Return ``(status, json_bytes)`` mimicking the Siren API for *path*.
+
+    List endpoints (templates, channel templates, replies) return
+    ``list_size`` items. Unknown paths get a 404 error envelope.
+    """
+    if "/send-messages" in path or "/send-awesome-messages" in path:
+        return 200, _envelope({"notificationId": uuid.uuid4().hex})
+    if path.endswith("/workflows/trigger/bulk"):
+        notify = json.loads(body or b"{}").get("notify") or []
+        return 200, _envelope(
+            {
+                "requestId": uuid.uuid4().hex,
+                "workflowExecutionIds": [uuid.uuid4().hex for _ in notify],
+            }
+        )
+    if path.endswith("/workflows/trigger"):
+        return 200, _envelope(
+            {"requestId": uuid.uuid4().hex, "workflowExecutionId": uuid.uuid4().hex}
+        )
+    if "/message-status/" in path:
+        return 200, _envelope({"status": "DELIVERED"})
+    if "/get-reply/" in path:
+        return 200, _list_body("reply", list_size)
+    if path.endswith("/channel-templates"):
+        return 200, _list_body("channel_template", list_size)
+    if path.endswith("/template") and method == "GET":
+        return 200, _list_body("template", list_size)
+    if method == "DELETE":
+        return 204, b""
+    if path.endswith("/template") and method == "POST":
+        return 200, _envelope(
+            {
+                "templateId": "tpl_new",
+                "templateName": "new",
+                "draftVersionId": "ver_new",
+                "channelTemplateList": [],
+            }
+        )
+    if "/template/" in path:
+        return 200, _envelope(_template(0))
+    if "/users" in path:
+        return 200, _envelope({"id": "usr_1", "uniqueId": "user_1"})
+    if "/webhooks" in path:
+        config = {"url": "https://example.com/hook", "verificationKey": "key"}
+        return 200, _envelope(
+            {"id": "wh_1", "webhookConfig": config, "inboundWebhookConfig": config}
+        )
+    if "/schedules" in path:
+        return 200, _envelope(
+            {
+                "id": "sch_1",
+                "name": "schedule",
+                "type": "ONCE",
+                "inputData": {},
+                "startDate": "2025-01-01",
+                "scheduleTime": "09:00:00",
+                "timezoneId": "UTC",
+            }
+        )
+    error = {"errorCode": "NOT_FOUND", "message": f"No route for {path}"}
+    return 404, json.dumps({"data": None, "error": error}).encode()
+
+
+class _InMemoryBase:
+    network_errors: tuple[type[Exception], ...] = (httpx.RequestError,)
+
+    def __init__(self, handler: Handler | None = None, *, latency: float = 0.0) -> None:
+        """Create the transport.
+
+        Args:
+            handler: Produces ``(status, body)`` for ``(method, path, body)``,
+                *body* already decompressed. Defaults to
+                :func:`canned_response`. It may raise an
+                ``httpx.RequestError`` to simulate a network failure.
+            latency: Seconds to wait before answering, to mimic the API.
+        """
+        self.handler = handler or canned_response
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _respond(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        content: bytes | None,
+    ) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+        body = _decode(content, headers)
+        status, body = self.handler(method, urlsplit(url).path, body)
+        return httpx.Response(status, content=body, headers=_JSON_HEADERS)
+
+
+class InMemoryTransport(_InMemoryBase):
+    """Blocking transport that answers from a handler instead of the network."""
+
+    def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """Return the handler's response for this request."""
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(method, url, headers, content)
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    def __enter__(self) -> InMemoryTransport:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Exit context manager."""
+        self.close()
+
+
+class AsyncInMemoryTransport(_InMemoryBase):
+    """Non-blocking transport that answers from a handler instead of the network."""
+
+    async def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """Return the handler's response for this request."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(method, url, headers, content)
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
+    async def __aenter__(self) -> AsyncInMemoryTransport:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        """Exit async context manager."""
+        await self.aclose()
@@ -0,0 +1,77 @@
+"""Per-call request options for Siren API requests.
+
+A :class:`RequestOptions` travels with a single call down to the transport, so
+concurrent calls on one shared client never see each other's settings. Fields
+left as ``None`` fall back to the client's configuration.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal, Mapping
+
+from .retry import RetryPolicy
+
+__all__ = ["RESPONSE_MODES", "RequestOptions", "ResponseMode"]
+
+ResponseMode = Literal["model", "raw", "lazy"]
+"""How read calls return ``data``: pydantic models, plain dicts or lazy views."""
+
+RESPONSE_MODES: tuple[ResponseMode, ...] = ("model", "raw", "lazy")
+
+
+@dataclass(frozen=True)
+class RequestOptions:
+    """Overrides applied to one API call.
+
+    Attributes:
+        timeout: Request timeout in seconds for this call.
+        retry_policy: Retry policy for this call, replacing the client's.
+            Pass ``RetryPolicy(max_attempts=1)`` to disable retries.
+        idempotency_key: Sent as the ``Idempotency-Key`` header; also allows
+            non-idempotent calls (POST, PATCH) to be retried.
+        extra_headers: Additional HTTP headers. They cannot replace the
+            ``Authorization`` header.
+        validate_request: Overrides the client's ``validate_requests`` for
+            this call. ``False`` sends payloads the SDK builds itself (message
+            sends, workflow triggers) without re-validating them.
+        response_mode: Overrides the client's ``response_mode`` for this
+            call. Only read calls (message status and replies, template and
+            channel-template listings) honour it.
+    """
+
+    timeout: float | None = None
+    retry_policy: RetryPolicy | None = None
+    idempotency_key: str | None = None
+    extra_headers: Mapping[str, str] = field(default_factory=dict)
+    validate_request: bool | None = None
+    response_mode: ResponseMode | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the timeout and response mode."""
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if self.response_mode is not None and self.response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {RESPONSE_MODES}")
+
+    def merge(self, overrides: RequestOptions | None) -> RequestOptions:
+        """Return these options with every field set in *overrides* replaced.
+
+        Extra headers are combined, with *overrides* winning on conflicts.
+        """
+        if overrides is None:
+            return self
+        return RequestOptions(
+            timeout=(
+                overrides.timeout if overrides.timeout is not None else self.timeout
+            ),
+            retry_policy=overrides.retry_policy or self.retry_policy,
+            idempotency_key=overrides.idempotency_key or self.idempotency_key,
+            extra_headers={**self.extra_headers, **overrides.extra_headers},
+            validate_request=(
+                overrides.validate_request
+                if overrides.validate_request is not None
+                else self.validate_request
+            ),
+            response_mode=overrides.response_mode or self.response_mode,
+        )
@@ -0,0 +1,126 @@
+"""Client-side rate limiting for Siren API requests.
+
+:class:`TokenBucket` paces requests with a reservation scheme: every caller
+takes a token immediately (the balance may go negative) and then sleeps for
+exactly the time it takes the bucket to refill to that point. Nobody spins or
+polls, concurrent callers are served in arrival order, and the same bucket can
+be used from threads and from asyncio tasks at once.
+
+:class:`RateLimiter` maps endpoint groups (e.g. ``"/send-messages"``) to their
+own buckets and falls back to an optional global bucket.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Mapping
+
+__all__ = ["RateLimiter", "TokenBucket"]
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests per second."""
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        """Create a bucket.
+
+        Args:
+            rate: Sustained number of requests per second.
+            burst: Maximum number of requests that may be sent back-to-back
+                after an idle period. Defaults to ``max(1, rate)``.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        if self.capacity < 1:
+            raise ValueError("burst must be at least 1")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the current thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            import asyncio  # deferred so the sync client does not load asyncio
+
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Routes requests to a per-endpoint-group or global :class:`TokenBucket`.
+
+    One limiter can be shared between a :class:`~siren.client.SirenClient` and
+    an :class:`~siren.async_client.AsyncSirenClient`; both draw from the same
+    buckets.
+
+    Example::
+
+        limiter = RateLimiter(
+            rate=50,
+            groups={"/send-messages": 20, "/workflows/trigger": 10},
+        )
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        *,
+        groups: Mapping[str, TokenBucket | float] | None = None,
+    ) -> None:
+        """Create a limiter.
+
+        Args:
+            rate: Global requests per second for endpoints not covered by a
+                group. ``None`` leaves them unlimited.
+            burst: Burst size of the global bucket.
+            groups: Endpoint fragments mapped to a bucket (or a plain rate).
+                A request uses the first group whose fragment occurs in its
+                endpoint path, in insertion order, instead of the global bucket.
+        """
+        self._global = TokenBucket(rate, burst) if rate is not None else None
+        self._groups = {
+            fragment: bucket if isinstance(bucket, TokenBucket) else TokenBucket(bucket)
+            for fragment, bucket in (groups or {}).items()
+        }
+
+    def bucket_for(self, endpoint: str) -> TokenBucket | None:
+        """Return the bucket governing *endpoint*, or ``None`` if unlimited."""
+        for fragment, bucket in self._groups.items():
+            if fragment in endpoint:
+                return bucket
+        return self._global
+
+    def acquire(self, endpoint: str) -> None:
+        """Block until a request to *endpoint* may be sent."""
+        bucket = self.bucket_for(endpoint)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait until a request to *endpoint* may be sent."""
+        bucket = self.bucket_for(endpoint)
+        if bucket is not None:
+            await bucket.acquire_async()
@@ -0,0 +1,147 @@
+"""Retry policy for Siren API requests.
+
+A :class:`RetryPolicy` decides *whether* a failed attempt may be repeated and
+*how long* to wait before the next one. The base clients own the retry loop;
+the policy itself is immutable and can be shared freely between sync and async
+clients.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+__all__ = ["IDEMPOTENCY_KEY_HEADER", "RetryPolicy"]
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Statuses whose ``Retry-After`` header tells us when the server expects us back.
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Configuration for retrying transient failures.
+
+    Attributes:
+        max_attempts: Total number of attempts, including the first one.
+        backoff_factor: Base delay in seconds; attempt ``n`` waits up to
+            ``backoff_factor * 2 ** (n - 1)`` seconds.
+        max_backoff: Upper bound for any single delay, including ``Retry-After``.
+        jitter: Randomise delays ("full jitter") to avoid synchronised retries.
+        retry_statuses: HTTP status codes that are retried.
+        retry_exceptions: Exception types that are retried. ``None`` means the
+            network errors declared by the client's transport.
+        respect_retry_after: Honour ``Retry-After`` on 429 and 503 responses.
+        idempotent_methods: Methods that are always safe to repeat. Other
+            methods (POST, PATCH) are only retried when the request carries an
+            ``Idempotency-Key`` header.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: tuple[type[BaseException], ...] | None = None
+    respect_retry_after: bool = True
+    idempotent_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+
+    def __post_init__(self) -> None:
+        """Validate numeric settings."""
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.backoff_factor < 0 or self.max_backoff < 0:
+            raise ValueError("backoff_factor and max_backoff must not be negative")
+
+    def delay_after_response(
+        self,
+        attempt: int,
+        method: str,
+        headers: Mapping[str, str],
+        status_code: int,
+        response_headers: Mapping[str, str] | None,
+    ) -> float | None:
+        """Return seconds to wait before retrying a response, or ``None`` to stop.
+
+        Args:
+            attempt: Number of the attempt that just finished (1-based).
+            method: HTTP method of the request.
+            headers: Headers sent with the request.
+            status_code: Status code of the response.
+            response_headers: Headers of the response (for ``Retry-After``).
+        """
+        if not self._may_retry(attempt, method, headers):
+            return None
+        if status_code not in self.retry_statuses:
+            return None
+        if self.respect_retry_after and status_code in _RETRY_AFTER_STATUSES:
+            retry_after = parse_retry_after(
+                response_headers.get("Retry-After") if response_headers else None
+            )
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return self._backoff(attempt)
+
+    def delay_after_exception(
+        self,
+        attempt: int,
+        method: str,
+        headers: Mapping[str, str],
+        exc: BaseException,
+        network_errors: tuple[type[BaseException], ...],
+    ) -> float | None:
+        """Return seconds to wait before retrying a failed send, or ``None`` to stop.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based).
+            method: HTTP method of the request.
+            headers: Headers sent with the request.
+            exc: Exception raised by the transport.
+            network_errors: Network exception types declared by the transport,
+                used when :attr:`retry_exceptions` is ``None``.
+        """
+        if not self._may_retry(attempt, method, headers):
+            return None
+        retryable = (
+            network_errors if self.retry_exceptions is None else self.retry_exceptions
+        )
+        if not isinstance(exc, retryable):
+            return None
+        return self._backoff(attempt)
+
+    def _may_retry(self, attempt: int, method: str, headers: Mapping[str, str]) -> bool:
+        if attempt >= self.max_attempts:
+            return False
+        return method.upper() in self.idempotent_methods or bool(
+            headers.get(IDEMPOTENCY_KEY_HEADER)
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -1,35 +1,190 @@
 """HTTP transport abstraction for Siren SDK.
 
-The SDK exposes two transports:
-1. ``SyncTransport`` – wraps the blocking ``requests`` API for backwards-compatibility.
-2. ``AsyncTransport`` – wraps an ``httpx.AsyncClient`` for non-blocking access.
+Clients talk to the network only through the :class:`Transport` (blocking) and
+:class:`AsyncTransportProtocol` (non-blocking) protocols, so any HTTP stack can
+be plugged in via the ``transport=`` argument of the clients. The SDK ships:
 
-Both classes expose the same ``request`` signature so domain clients can be
+1. ``SyncTransport`` – wraps a pooled ``requests.Session`` for blocking access.
+2. ``HttpxTransport`` – wraps an ``httpx.Client`` for blocking access that can
+   multiplex requests over HTTP/2.
+3. ``AsyncTransport`` – wraps an ``httpx.AsyncClient`` for non-blocking access.
+4. ``InMemoryTransport`` / ``AsyncInMemoryTransport`` (in
+   :mod:`siren.http.memory`) – answer with canned Siren envelopes without any
+   network, for tests and for measuring the SDK's own overhead.
+
+All classes expose the same ``request`` signature so domain clients can be
 written once and injected with the appropriate transport implementation.
+Request bodies are passed as pre-serialized ``content`` bytes so retries can
+resend them without re-encoding. Each
+transport lists the exceptions its HTTP library raises for network failures in
+``network_errors`` so clients can translate them without importing the library.
+
+The shipped network transports also offer ``warmup(url, connections)``, which
+opens keep-alive connections ahead of traffic so the first real requests skip
+DNS, TCP and TLS setup. It is optional: custom transports may leave it out.
+
+HTTP/2 support requires the optional ``h2`` package
+(``pip install trysiren[http2]``). ``httpx`` itself is imported only when an
+httpx-based transport is created, so the default ``requests`` stack does not
+pay for loading it.
 """
 
 from __future__ import annotations
 
-from typing import Any  # noqa: D401
+from typing import TYPE_CHECKING, Any, Mapping, Protocol, runtime_checkable  # noqa: D401
 
-import httpx  # type: ignore
 import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import httpx  # type: ignore
+
+__all__ = [
+    "AsyncTransport",
+    "AsyncTransportProtocol",
+    "HttpxTransport",
+    "Response",
+    "SyncTransport",
+    "Transport",
+]
+
+
+class Response(Protocol):
+    """The parts of an HTTP response the clients rely on.
+
+    Satisfied by both ``requests.Response`` and ``httpx.Response``.
+    """
+
+    status_code: int
+
+    @property
+    def headers(self) -> Mapping[str, str]:  # noqa: D102
+        ...
+
+    @property
+    def content(self) -> bytes:  # noqa: D102
+        ...
+
+    @property
+    def text(self) -> str:  # noqa: D102
+        ...
+
+    def json(self) -> Any:  # noqa: D102
+        ...
+
 
-__all__ = ["SyncTransport", "AsyncTransport"]
+@runtime_checkable
+class Transport(Protocol):
+    """Blocking transport accepted by :class:`siren.clients.base.BaseClient`."""
+
+    network_errors: tuple[type[Exception], ...]
+    """Exceptions the transport raises for network-level failures."""
+
+    def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        """Send one request and return the complete response."""
+        ...
+
+    def close(self) -> None:
+        """Release any pooled connections."""
+        ...
+
+
+@runtime_checkable
+class AsyncTransportProtocol(Protocol):
+    """Non-blocking transport accepted by the asynchronous clients."""
+
+    network_errors: tuple[type[Exception], ...]
+    """Exceptions the transport raises for network-level failures."""
+
+    async def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        """Send one request and return the complete response."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release any pooled connections."""
+        ...
+
+
+def _warm_limit(*limits: int | None) -> int | None:
+    # Connections beyond the pool's own caps would be dropped (or block), so
+    # warm-up never asks for more than the smallest configured limit.
+    bounded = [limit for limit in limits if limit is not None]
+    return min(bounded) if bounded else None
+
+
+def _httpx_limits(
+    max_connections: int | None,
+    max_keepalive_connections: int | None,
+    keepalive_expiry: float | None,
+) -> httpx.Limits:
+    import httpx  # type: ignore
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
 
 
 class SyncTransport:  # noqa: D101 – Simple wrapper, docstring at class level
-    def __init__(self, timeout: int = 10) -> None:
-        """Create a synchronous transport wrapper.
+    network_errors: tuple[type[Exception], ...] = (
+        requests.exceptions.RequestException,
+    )
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> None:
+        """Create a synchronous transport backed by a pooled ``requests.Session``.
+
+        A single transport is meant to be shared by every domain client of a
+        :class:`siren.client.SirenClient` so TCP/TLS connections are reused
+        across messaging, workflow, template, user and webhook calls.
 
         Args:
-            timeout: The request timeout in seconds.
+            timeout: The default request timeout in seconds.
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept alive per host.
+            pool_block: Block when the pool is exhausted instead of opening
+                throw-away connections beyond ``pool_maxsize``.
+            keep_alive: Keep connections open between requests. When ``False``
+                every request sends ``Connection: close``.
         """
         self._timeout = timeout
-        # For now keep compatibility: still use the global ``requests`` API rather
-        # than an ``httpx.Client`` so existing unit-tests remain untouched. This
-        # branch can later be switched to ``httpx.Client`` once the test mocks
-        # are migrated.
+        self._pool_maxsize = pool_maxsize
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
 
     def request(
         self,
@@ -37,24 +192,221 @@ class SyncTransport:  # noqa: D101 – Simple wrapper, docstring at class level
         method: str,
         url: str,
         headers: dict[str, str] | None = None,
-        json: Any | None = None,
+        content: bytes | None = None,
         params: dict[str, Any] | None = None,
+        timeout: float | None = None,
     ) -> requests.Response:
-        """Perform a blocking HTTP request using ``requests``."""
-        return requests.request(
+        """Perform a blocking HTTP request over the pooled session."""
+        return self._session.request(
             method=method,
             url=url,
             headers=headers,
-            json=json,
+            data=content,
             params=params,
-            timeout=self._timeout,
+            timeout=self._timeout if timeout is None else timeout,
         )
 
+    def warmup(self, url: str, connections: int) -> int:
+        """Open up to *connections* keep-alive connections to *url*'s host.
+
+        ``HEAD`` requests are streamed and held open together so the pool
+        has to dial a new connection for each (completing DNS, TCP and TLS
+        setup), then read to the end, which returns every connection to the
+        pool idle. Running it again refreshes connections the server may
+        otherwise time out.
+
+        Returns:
+            The number of connections now held in the pool, at most
+            ``pool_maxsize``.
+        """
+        count = min(connections, self._pool_maxsize)
+        responses = []
+        try:
+            for _ in range(count):
+                responses.append(
+                    self._session.request(
+                        "HEAD", url, stream=True, timeout=self._timeout
+                    )
+                )
+        finally:
+            for response in responses:
+                response.content  # noqa: B018 – consuming releases the connection
+                response.close()
+        return count
+
+    def close(self) -> None:  # noqa: D401 – simple verb
+        """Close the session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> SyncTransport:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Exit context manager, ensure transport is closed."""
+        self.close()
+
+
+class HttpxTransport:  # noqa: D101 – Simple wrapper, docstring at class level
+    network_errors: tuple[type[Exception], ...]
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        *,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+    ) -> None:
+        """Create a synchronous transport backed by a pooled ``httpx.Client``.
+
+        With ``http2=True`` concurrent requests from many threads are
+        multiplexed over a handful of connections instead of one socket per
+        in-flight request.
+
+        Args:
+            timeout: The default request timeout in seconds.
+            http2: Negotiate HTTP/2 with the server.
+            http1: Allow HTTP/1.1. Pass ``False`` together with ``http2=True``
+                to speak HTTP/2 without negotiation (e.g. plain-text local
+                stand-in servers).
+            max_connections: Upper bound on concurrently open connections.
+            max_keepalive_connections: Upper bound on idle connections kept
+                open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept before it is
+                closed.
+        """
+        import httpx  # type: ignore
+
+        self.network_errors = (httpx.RequestError,)
+        self._timeout = timeout
+        self._warm_limit = _warm_limit(max_connections, max_keepalive_connections)
+        self._client = httpx.Client(
+            timeout=timeout,
+            http1=http1,
+            http2=http2,
+            limits=_httpx_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+        )
+
+    def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """Perform a blocking HTTP request over the pooled ``httpx.Client``."""
+        return self._client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            content=content,
+            params=params,
+            timeout=self._timeout if timeout is None else timeout,
+        )
+
+    def warmup(self, url: str, connections: int) -> int:
+        """Open up to *connections* keep-alive connections to *url*'s host.
+
+        ``HEAD`` requests are streamed and held open together so the pool
+        has to dial a new connection for each, then released idle. Over
+        HTTP/2 the streams share one multiplexed connection.
+
+        Returns:
+            The number of warm-up requests sent, capped by the pool limits.
+        """
+        count = connections
+        if self._warm_limit is not None:
+            count = min(count, self._warm_limit)
+        responses = []
+        try:
+            for _ in range(count):
+                request = self._client.build_request("HEAD", url)
+                responses.append(self._client.send(request, stream=True))
+        finally:
+            for response in responses:
+                response.read()
+                response.close()
+        return count
+
+    def close(self) -> None:  # noqa: D401 – simple verb
+        """Close the client and release pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> HttpxTransport:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Exit context manager, ensure transport is closed."""
+        self.close()
+
 
 class AsyncTransport:  # noqa: D101 – Simple wrapper, docstring at class level
-    def __init__(self, timeout: int = 10) -> None:
-        """Instantiate the transport with an internal ``httpx.AsyncClient``."""
-        self._client = httpx.AsyncClient(timeout=timeout)
+    network_errors: tuple[type[Exception], ...]
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        *,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        http1: bool = True,
+    ) -> None:
+        """Instantiate the transport with an internal ``httpx.AsyncClient``.
+
+        A single transport is meant to be shared by every domain client of an
+        :class:`siren.async_client.AsyncSirenClient` so they draw from one
+        connection pool.
+
+        Args:
+            timeout: Default timeout in seconds for every phase of a request.
+            connect_timeout: Time allowed to establish a connection. Defaults
+                to ``timeout``.
+            read_timeout: Time allowed to wait for response data. Defaults to
+                ``timeout``.
+            pool_timeout: Time allowed to wait for a free pooled connection.
+                Defaults to ``timeout``.
+            max_connections: Upper bound on concurrently open connections.
+            max_keepalive_connections: Upper bound on idle connections kept
+                open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept before it is
+                closed.
+            http2: Negotiate HTTP/2 so concurrent requests are multiplexed
+                over a few connections.
+            http1: Allow HTTP/1.1. Pass ``False`` together with ``http2=True``
+                to speak HTTP/2 without negotiation.
+        """
+        import httpx  # type: ignore
+
+        self.network_errors = (httpx.RequestError,)
+        self._client_default_timeout = httpx.USE_CLIENT_DEFAULT
+        self._warm_limit = _warm_limit(max_connections, max_keepalive_connections)
+        self._client = httpx.AsyncClient(
+            http1=http1,
+            http2=http2,
+            timeout=httpx.Timeout(
+                timeout,
+                connect=timeout if connect_timeout is None else connect_timeout,
+                read=timeout if read_timeout is None else read_timeout,
+                pool=timeout if pool_timeout is None else pool_timeout,
+            ),
+            limits=_httpx_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+        )
 
     async def request(
         self,
@@ -62,19 +414,47 @@ class AsyncTransport:  # noqa: D101 – Simple wrapper, docstring at class level
         method: str,
         url: str,
         headers: dict[str, str] | None = None,
-        json: Any | None = None,
+        content: bytes | None = None,
         params: dict[str, Any] | None = None,
+        timeout: float | None = None,
     ) -> httpx.Response:
-        """Make an asynchronous HTTP request using ``httpx.AsyncClient``."""
+        """Make an asynchronous HTTP request using ``httpx.AsyncClient``.
+
+        ``timeout`` overrides every phase of the client's configured timeout
+        for this request only.
+        """
         response = await self._client.request(
             method=method,
             url=url,
             headers=headers,
-            json=json,
+            content=content,
             params=params,
+            timeout=self._client_default_timeout if timeout is None else timeout,
         )
         return response
 
+    async def warmup(self, url: str, connections: int) -> int:
+        """Open up to *connections* keep-alive connections to *url*'s host.
+
+        Non-blocking counterpart of :meth:`HttpxTransport.warmup`.
+
+        Returns:
+            The number of warm-up requests sent, capped by the pool limits.
+        """
+        count = connections
+        if self._warm_limit is not None:
+            count = min(count, self._warm_limit)
+        responses = []
+        try:
+            for _ in range(count):
+                request = self._client.build_request("HEAD", url)
+                responses.append(await self._client.send(request, stream=True))
+        finally:
+            for response in responses:
+                await response.aread()
+                await response.aclose()
+        return count
+
     async def aclose(self) -> None:  # noqa: D401 – simple verb
         """Close the underlying ``httpx`` client."""
         await self._client.aclose()
@@ -0,0 +1,128 @@
+"""Lazily validated views over raw API payloads.
+
+``response_mode="lazy"`` wraps each object of a response's ``data`` in a
+:class:`LazyModel`: attribute access looks like the pydantic model it stands
+in for, but each field is validated only the first time it is read. List-heavy
+reads (templates, replies) then pay only for the fields the caller touches.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+
+__all__ = ["LazyModel", "lazy_data"]
+
+M = TypeVar("M", bound=BaseModel)
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _fields(model: type[BaseModel]) -> dict[str, tuple[str, FieldInfo]]:
+    # Attribute name -> (key in the API payload, field info).
+    return {
+        name: (field.alias or name, field) for name, field in model.model_fields.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    field = model.model_fields[name]
+    annotation: Any = field.annotation
+    if field.metadata:
+        from typing_extensions import Annotated
+
+        annotation = Annotated[(annotation, *field.metadata)]
+    return TypeAdapter(annotation)
+
+
+class LazyModel(Generic[M]):
+    """Read-only proxy for *model* that validates fields on first access.
+
+    Model-level validators do not run; call :meth:`to_model` for the fully
+    validated instance.
+    """
+
+    __slots__ = ("_model", "_raw", "_values")
+
+    def __init__(self, model: type[M], raw: dict[str, Any]) -> None:
+        """Wrap the decoded JSON object *raw* as a lazy *model*."""
+        self._model = model
+        self._raw = raw
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Validate, cache and return field *name*."""
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        fields = _fields(self._model)
+        if name not in fields:
+            raise AttributeError(
+                f"{self._model.__name__!r} object has no attribute {name!r}"
+            )
+        key, field = fields[name]
+        value = self._raw.get(key, _MISSING)
+        if value is _MISSING and key != name:
+            value = self._raw.get(name, _MISSING)
+        if value is _MISSING:
+            if field.is_required():
+                self.to_model()  # raises the model's own ValidationError
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = _adapter(self._model, name).validate_python(value)
+        self._values[name] = value
+        return value
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The decoded JSON object, as returned by the API."""
+        return self._raw
+
+    def to_model(self) -> M:
+        """Validate every field and return the real pydantic model."""
+        return self._model.model_validate(self._raw)
+
+    def __repr__(self) -> str:
+        """Show the wrapped model name and payload."""
+        return f"LazyModel[{self._model.__name__}]({self._raw!r})"
+
+
+@functools.lru_cache(maxsize=None)
+def _data_shape(
+    response_model: type[BaseModel],
+) -> tuple[bool, type[BaseModel] | None]:
+    # BaseAPIResponse[T].data is Optional[T]; T is a model or List[model].
+    annotation: Any = response_model.model_fields["data"].annotation
+    args = [a for a in getattr(annotation, "__args__", ()) if a is not type(None)]
+    inner: Any = args[0] if len(args) == 1 else annotation
+    if getattr(inner, "__origin__", None) is list:
+        return True, _as_model(inner.__args__[0])
+    return False, _as_model(inner)
+
+
+def _as_model(annotation: Any) -> type[BaseModel] | None:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def lazy_data(
+    response_model: type[BaseModel], data: Any
+) -> LazyModel[Any] | list[LazyModel[Any]] | Any:
+    """Wrap the raw ``data`` of a *response_model* envelope in lazy models.
+
+    Values that are not model-shaped (e.g. plain lists of strings) are
+    returned unchanged.
+    """
+    is_list, model = _data_shape(response_model)
+    if model is None:
+        return data
+    if is_list:
+        return [LazyModel(model, item) for item in data]
+    return LazyModel(model, data)
@@ -15,3 +15,12 @@ from siren import SirenClient
 def client():
     """Provides a SirenClient instance for testing, using a dummy API key."""
     return SirenClient(api_key="test_api_key", env="dev")
+
+
+@pytest.fixture
+def fake_server():
+    """Provides a running local server that mimics the Siren API."""
+    from .fake_server import FakeSirenServer
+
+    with FakeSirenServer() as server:
+        yield server
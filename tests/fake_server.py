@@ -0,0 +1,109 @@
+"""Threaded local HTTP server that mimics the Siren API for integration tests."""
+
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+
+def _envelope(data: Any) -> bytes:
+    return json.dumps({"data": data, "error": None}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Keep test output quiet."""
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        server: FakeSirenServer = self.server  # type: ignore[assignment]
+        server.record(self.command, self.path, dict(self.headers), body)
+        status, payload = server.respond(self.command, self.path, body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle  # noqa: N815
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        """Answer warm-up pings with headers only."""
+        server: FakeSirenServer = self.server  # type: ignore[assignment]
+        server.record(self.command, self.path, dict(self.headers), b"")
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class FakeSirenServer(ThreadingHTTPServer):
+    """Answers Siren endpoints with canned envelopes and records every request.
+
+    Use as a context manager; ``base_url`` points at the running server and
+    ``connections`` counts the TCP connections accepted so far.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """Bind to a free localhost port."""
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.requests: List[Tuple[str, str, Dict[str, str], bytes]] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the running server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Count the accepted connection, then serve it on its own thread."""
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def record(self, method: str, path: str, headers: Dict[str, str], body: bytes):
+        """Store a received request."""
+        with self._lock:
+            self.requests.append((method, path, headers, body))
+
+    def respond(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        """Return ``(status, payload)`` for a request."""
+        if "/send-messages" in path or "/send-awesome-messages" in path:
+            return 200, _envelope({"notificationId": uuid.uuid4().hex})
+        if path.endswith("/workflows/trigger/bulk"):
+            notify = json.loads(body or b"{}").get("notify", [])
+            return 200, _envelope(
+                {
+                    "requestId": uuid.uuid4().hex,
+                    "workflowExecutionIds": [uuid.uuid4().hex for _ in notify],
+                }
+            )
+        if path.endswith("/workflows/trigger"):
+            return 200, _envelope(
+                {"requestId": uuid.uuid4().hex, "workflowExecutionId": uuid.uuid4().hex}
+            )
+        if "/message-status/" in path:
+            return 200, _envelope({"status": "DELIVERED"})
+        if "/get-reply/" in path:
+            return 200, _envelope([])
+        return 404, json.dumps(
+            {"data": None, "error": {"errorCode": "NOT_FOUND", "message": path}}
+        ).encode()
+
+    def __enter__(self) -> "FakeSirenServer":
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Stop the server and close its socket."""
+        self.shutdown()
+        self.server_close()
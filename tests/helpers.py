@@ -0,0 +1,26 @@
+"""Shared assertion helpers for the test suite."""
+
+import json
+from typing import Any
+
+
+class JsonBody:
+    """Matches a request body (``bytes``) that decodes to the expected JSON.
+
+    Lets ``assert_called_once_with`` compare serialized request bodies without
+    depending on key order or whitespace.
+    """
+
+    def __init__(self, expected: Any):
+        """Store the expected decoded JSON value."""
+        self.expected = expected
+
+    def __eq__(self, other: Any) -> bool:
+        """Decode *other* and compare it with the expected value."""
+        if not isinstance(other, (bytes, str)):
+            return False
+        return json.loads(other) == self.expected
+
+    def __repr__(self) -> str:
+        """Show the expected JSON in assertion messages."""
+        return f"JsonBody({self.expected!r})"
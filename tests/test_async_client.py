@@ -0,0 +1,63 @@
+"""Tests for the asynchronous Siren API client."""
+
+import pytest
+
+from siren.async_client import AsyncSirenClient
+
+API_KEY = "test_api_key"
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_single_transport():
+    """All domain clients use the one transport owned by AsyncSirenClient."""
+    client = AsyncSirenClient(api_key=API_KEY, env="dev")
+    transport = client._transport
+
+    for domain in (
+        client.webhook,
+        client.message,
+        client.template,
+        client.channel_template,
+        client.user,
+        client.workflow,
+    ):
+        assert domain._transport is transport
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_client_pool_and_timeout_configuration():
+    """Pool limits and per-phase timeouts reach the underlying httpx client."""
+    client = AsyncSirenClient(
+        api_key=API_KEY,
+        env="dev",
+        timeout=7,
+        connect_timeout=2,
+        pool_timeout=1,
+        max_connections=50,
+        max_keepalive_connections=10,
+        keepalive_expiry=30,
+    )
+    http_client = client._transport._client
+
+    assert http_client.timeout.connect == 2
+    assert http_client.timeout.read == 7
+    assert http_client.timeout.write == 7
+    assert http_client.timeout.pool == 1
+    pool = http_client._transport._pool
+    assert pool._max_connections == 50
+    assert pool._max_keepalive_connections == 10
+    assert pool._keepalive_expiry == 30
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_client_context_manager_closes_transport():
+    """Leaving the context manager closes the shared httpx client once."""
+    async with AsyncSirenClient(api_key=API_KEY, env="dev") as client:
+        http_client = client._transport._client
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
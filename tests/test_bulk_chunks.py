@@ -0,0 +1,158 @@
+"""Tests for chunked bulk workflow triggers."""
+
+import json
+import threading
+
+import pytest
+from pydantic_core import to_json
+
+from siren import (
+    AsyncSirenClient,
+    ChunkedBulkExecution,
+    IdempotencyWindow,
+    RequestOptions,
+    SirenClient,
+)
+from siren.clients.bulk_chunks import chunk_notify
+from siren.clients.workflows import WorkflowClient
+from siren.exceptions import SirenAPIError, SirenSDKError
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+
+API_KEY = "test_api_key"
+
+
+class BulkServer:
+    """Answers bulk triggers, failing those whose first element is in *fail*."""
+
+    def __init__(self, fail=(), short=()):
+        """Fail chunks starting at *fail*; drop an ID from those at *short*."""
+        self.fail = set(fail)
+        self.short = set(short)
+        self.bodies = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, body):
+        """Record the request and answer it."""
+        with self.lock:
+            self.bodies.append(body)
+        notify = json.loads(body)["notify"]
+        first = notify[0]["id"]
+        if first in self.fail:
+            error = {"errorCode": "SCRIPTED", "message": "scripted"}
+            return 413, json.dumps({"data": None, "error": error}).encode()
+        ids = [f"exec-{n['id']}" for n in notify]
+        if first in self.short:
+            ids.pop()
+        data = {"requestId": f"req-{first}", "workflowExecutionIds": ids}
+        return 200, json.dumps({"data": data, "error": None}).encode()
+
+
+def _notify(n, pad=0):
+    return [{"id": i, "pad": "x" * pad} for i in range(n)]
+
+
+def test_chunk_bounds_respect_items_and_bytes():
+    """Chunks hold at most max_items elements and max_bytes of body."""
+    notify = _notify(10, pad=50)
+    assert chunk_notify("wf", notify, max_items=4) == [(0, 4), (4, 8), (8, 10)]
+    assert chunk_notify("wf", [], max_items=4) == []
+
+    data = {"plan": "pro"}
+    bounds = chunk_notify("wf", notify, data, max_bytes=300)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 10
+    for start, stop in bounds:
+        body = to_json(
+            {"workflowName": "wf", "notify": notify[start:stop], "data": data}
+        )
+        assert len(body) <= 300
+    # A body of exactly max_bytes still fits in one chunk.
+    exact = len(to_json({"workflowName": "wf", "notify": notify[:3]}))
+    assert chunk_notify("wf", notify[:3], max_bytes=exact) == [(0, 3)]
+    # An element larger than max_bytes is sent on its own.
+    assert chunk_notify("wf", notify[:2], max_bytes=10) == [(0, 1), (1, 2)]
+
+    with pytest.raises(ValueError):
+        chunk_notify("wf", notify, max_items=0)
+
+
+def test_chunked_trigger_maps_ids_to_positions():
+    """Execution IDs line up with notify positions across parallel chunks."""
+    server = BulkServer()
+    client = SirenClient(
+        api_key=API_KEY, env="dev", transport=InMemoryTransport(server)
+    )
+
+    result = client.workflow.trigger_bulk_chunked(
+        "wf", _notify(25), {"k": 1}, max_items=10, concurrency=3
+    )
+
+    assert isinstance(result, ChunkedBulkExecution)
+    assert result.ok and not result.failed
+    assert result.workflow_execution_ids == [f"exec-{i}" for i in range(25)]
+    assert result.request_ids == ["req-0", "req-10", "req-20"]
+    assert len(server.bodies) == 3
+    assert all(json.loads(b)["data"] == {"k": 1} for b in server.bodies)
+
+
+def test_failed_chunks_are_reported_without_stopping_others():
+    """A failing chunk leaves None IDs and keeps its error; others succeed."""
+    server = BulkServer(fail={5}, short={10})
+    client = SirenClient(
+        api_key=API_KEY, env="dev", transport=InMemoryTransport(server)
+    )
+
+    result = client.workflow.trigger_bulk_chunked("wf", _notify(12), max_items=5)
+
+    assert not result.ok
+    assert [(c.start, c.stop) for c in result.failed] == [(5, 10), (10, 12)]
+    assert isinstance(result.failed[0].error, SirenAPIError)
+    assert isinstance(result.failed[1].error, SirenSDKError)
+    ids = result.workflow_execution_ids
+    assert ids[:5] == [f"exec-{i}" for i in range(5)]
+    assert ids[5:] == [None] * 7
+
+
+def test_each_chunk_gets_its_own_idempotency_key(fake_server):
+    """A caller's key is suffixed per chunk, so no chunk is deduplicated away."""
+    client = WorkflowClient(
+        api_key=API_KEY,
+        base_url=fake_server.base_url,
+        idempotency_window=IdempotencyWindow(),
+    )
+    options = RequestOptions(idempotency_key="abc")
+
+    result = client.trigger_bulk_chunked(
+        "wf", _notify(5), max_items=2, concurrency=2, request_options=options
+    )
+
+    assert result.ok
+    ids = result.workflow_execution_ids
+    assert len(set(ids)) == 5
+    keys = [headers["Idempotency-Key"] for _, _, headers, _ in fake_server.requests]
+    assert sorted(keys) == ["abc:0", "abc:2", "abc:4"]
+
+    again = client.trigger_bulk_chunked(
+        "wf", _notify(5), max_items=2, request_options=options
+    )
+    assert again.workflow_execution_ids == ids  # answered from the window
+    assert len(fake_server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_chunked_trigger():
+    """The async client sends chunks as tasks and aggregates the same way."""
+    server = BulkServer(fail={4})
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport(server)
+    ) as client:
+        result = await client.workflow.trigger_bulk_chunked(
+            "wf", _notify(10), max_items=4, concurrency=2
+        )
+
+    assert [(c.start, c.stop, c.ok) for c in result.chunks] == [
+        (0, 4, True),
+        (4, 8, False),
+        (8, 10, True),
+    ]
+    assert result.workflow_execution_ids[8:] == ["exec-8", "exec-9"]
+    assert result.request_ids == ["req-0", "req-8"]
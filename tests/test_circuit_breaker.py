@@ -0,0 +1,196 @@
+"""Tests for the per-endpoint circuit breaker."""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import httpx  # type: ignore
+import pytest
+import requests
+import respx  # type: ignore
+
+from siren.clients.messaging import MessageClient
+from siren.clients.messaging_async import AsyncMessageClient
+from siren.exceptions import SirenCircuitOpenError, SirenSDKError
+from siren.http.circuit_breaker import CircuitBreaker, CircuitState
+from siren.http.memory import AsyncInMemoryTransport
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+STATUS_ENDPOINT = "/api/v1/public/message-status/{message_id}"
+STATUS_OK = {"data": {"status": "DELIVERED"}, "error": None}
+
+
+def _response(status_code, payload=None):
+    response = Mock(status_code=status_code, headers={})
+    response.json.return_value = payload or {"data": None, "error": None}
+    response.content = json.dumps(response.json.return_value).encode()
+    return response
+
+
+class TestCircuitBreaker:
+    """State-machine tests for CircuitBreaker."""
+
+    def test_opens_once_failure_rate_reached(self):
+        """The circuit stays closed until minimum_calls outcomes are recorded."""
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4)
+        for _ in range(3):
+            breaker.record_failure("/a")
+        assert breaker.state("/a") is CircuitState.CLOSED
+        breaker.record_failure("/a")
+        assert breaker.state("/a") is CircuitState.OPEN
+        with pytest.raises(SirenCircuitOpenError) as exc_info:
+            breaker.before_request("/a")
+        assert exc_info.value.endpoint == "/a"
+        assert exc_info.value.retry_after > 0
+
+    def test_circuits_are_independent_per_endpoint(self):
+        """A failing endpoint does not block other endpoints."""
+        breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+        breaker.record_failure("/a")
+        breaker.before_request("/b")
+        assert breaker.state("/b") is CircuitState.CLOSED
+
+    def test_sliding_window_forgets_old_failures(self):
+        """Only the last window_size outcomes count towards the rate."""
+        breaker = CircuitBreaker(
+            failure_rate_threshold=0.5, minimum_calls=4, window_size=4
+        )
+        breaker.record_failure("/a")
+        for _ in range(6):
+            breaker.record_success("/a")
+        breaker.record_failure("/a")
+        snapshot = breaker.snapshot()["/a"]
+        assert snapshot.calls == 4
+        assert snapshot.failures == 1
+        assert snapshot.state is CircuitState.CLOSED
+
+    def test_half_open_probe_success_closes(self):
+        """After recovery_timeout a single probe is admitted; success closes."""
+        breaker = CircuitBreaker(minimum_calls=1, window_size=1, recovery_timeout=5)
+        with patch("siren.http.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure("/a")
+        with patch("siren.http.circuit_breaker.time.monotonic", return_value=106.0):
+            breaker.before_request("/a")
+            assert breaker.state("/a") is CircuitState.HALF_OPEN
+            with pytest.raises(SirenCircuitOpenError):
+                breaker.before_request("/a")
+            breaker.record_success("/a")
+        assert breaker.state("/a") is CircuitState.CLOSED
+        breaker.before_request("/a")
+
+    def test_half_open_probe_failure_reopens(self):
+        """A failed probe re-opens the circuit for another recovery_timeout."""
+        breaker = CircuitBreaker(minimum_calls=1, window_size=1, recovery_timeout=5)
+        with patch("siren.http.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure("/a")
+        with patch("siren.http.circuit_breaker.time.monotonic", return_value=106.0):
+            breaker.before_request("/a")
+            breaker.record_failure("/a")
+            assert breaker.snapshot()["/a"].retry_after == pytest.approx(5.0)
+        assert breaker.state("/a") is CircuitState.OPEN
+
+    def test_reset_closes_circuit(self):
+        """reset() forgets an endpoint's history."""
+        breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+        breaker.record_failure("/a")
+        breaker.reset("/a")
+        assert breaker.state("/a") is CircuitState.CLOSED
+        assert breaker.snapshot() == {}
+
+    def test_invalid_configuration(self):
+        """Nonsensical thresholds are rejected."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(minimum_calls=10, window_size=5)
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_client_fails_fast_on_open_circuit(mock_request):
+    """5xx responses trip the breaker; later calls fail without a request."""
+    mock_request.return_value = _response(503)
+    breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL, circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(SirenSDKError):
+            client.get_status("msg_1")
+    with pytest.raises(SirenCircuitOpenError):
+        client.get_status("msg_2")
+
+    assert mock_request.call_count == 2
+    assert breaker.state(STATUS_ENDPOINT) is CircuitState.OPEN
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_client_counts_network_errors_and_ignores_4xx(mock_request):
+    """Network errors are failures; client errors such as 404 are not."""
+    mock_request.side_effect = [
+        requests.exceptions.ConnectionError("boom"),
+        _response(404),
+    ]
+    breaker = CircuitBreaker(minimum_calls=2, window_size=2, failure_rate_threshold=1)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL, circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(SirenSDKError):
+            client.get_status("msg_1")
+
+    snapshot = breaker.snapshot()[STATUS_ENDPOINT]
+    assert snapshot.failures == 1
+    assert snapshot.state is CircuitState.CLOSED
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_client_shares_breaker():
+    """An async client refuses calls on a circuit opened by a sync client."""
+    route = respx.get(f"{BASE_URL}/api/v1/public/message-status/msg_1").mock(
+        return_value=httpx.Response(200, json=STATUS_OK)
+    )
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+    breaker.record_failure(STATUS_ENDPOINT)
+    client = AsyncMessageClient(
+        api_key=API_KEY, base_url=BASE_URL, circuit_breaker=breaker
+    )
+
+    with pytest.raises(SirenCircuitOpenError):
+        await client.get_status("msg_1")
+
+    assert not route.called
+    await client.aclose()
+
+
+class _HangingTransport(AsyncInMemoryTransport):
+    """Async transport whose requests never complete."""
+
+    async def request(self, **kwargs):
+        """Wait forever (until cancelled)."""
+        self.calls += 1
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_probe_frees_its_slot():
+    """A probe cancelled mid-flight does not keep the circuit rejecting calls."""
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1, recovery_timeout=0)
+    breaker.record_failure(STATUS_ENDPOINT)
+    transport = _HangingTransport()
+    client = AsyncMessageClient(
+        api_key=API_KEY, base_url=BASE_URL, circuit_breaker=breaker, transport=transport
+    )
+
+    probe = asyncio.ensure_future(client.get_status("msg_1"))
+    while not transport.calls:
+        await asyncio.sleep(0)
+    assert breaker.state(STATUS_ENDPOINT) is CircuitState.HALF_OPEN
+    with pytest.raises(SirenCircuitOpenError):
+        breaker.before_request(STATUS_ENDPOINT)  # the only slot is taken
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    breaker.before_request(STATUS_ENDPOINT)  # slot released
+    breaker.record_success(STATUS_ENDPOINT)
+    assert breaker.state(STATUS_ENDPOINT) is CircuitState.CLOSED
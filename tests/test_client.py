@@ -2,6 +2,7 @@
 
 import os
 import sys
+from unittest.mock import patch
 
 # Ensure the 'siren' package in the parent directory can be imported:
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -152,3 +153,35 @@ def test_siren_client_invalid_environment():
         assert False, "Should have raised ValueError for invalid environment"
     except ValueError as e:
         assert "Invalid environment 'invalid'" in str(e)
+
+
+def test_siren_client_shares_single_transport(client):
+    """Test that all domain clients share the client's pooled transport."""
+    transport = client._transport
+    assert client.template._transport is transport
+    assert client.template._channel_template_client._transport is transport
+    assert client.channel_template._transport is transport
+    assert client.workflow._transport is transport
+    assert client.message._transport is transport
+    assert client.user._transport is transport
+    assert client.webhook._transport is transport
+
+
+def test_siren_client_pool_configuration():
+    """Test that pool settings are applied to the shared session adapters."""
+    client = SirenClient(
+        api_key="test_key", env="dev", pool_maxsize=25, keep_alive=False
+    )
+    session = client._transport._session
+    adapter = session.get_adapter("https://api.dev.trysiren.io")
+    assert adapter._pool_maxsize == 25
+    assert session.headers["Connection"] == "close"
+    client.close()
+
+
+def test_siren_client_context_manager_closes_transport():
+    """Test that leaving the context manager closes the pooled session."""
+    with patch("siren.http.transport.requests.Session.close") as mock_close:
+        with SirenClient(api_key="test_key", env="dev") as client:
+            assert isinstance(client, SirenClient)
+        mock_close.assert_called_once()
@@ -0,0 +1,128 @@
+"""Tests for opt-in request body compression."""
+
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import httpx  # type: ignore
+import pytest
+import respx  # type: ignore
+
+from siren import AsyncSirenClient, RequestCompression, SirenClient
+from siren.clients.workflows import WorkflowClient
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+BULK_OK = {
+    "data": {"requestId": "req_1", "workflowExecutionIds": ["exec_1"]},
+    "error": None,
+}
+NOTIFY = [{"email": f"user{i}@example.com"} for i in range(200)]
+
+
+def _response(payload):
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = payload
+    response.content = json.dumps(response.json.return_value).encode()
+    return response
+
+
+class TestRequestCompression:
+    """Unit tests for the compression settings."""
+
+    def test_small_bodies_are_sent_as_is(self):
+        """Bodies under the threshold are returned unchanged."""
+        body = b'{"a":1}'
+        assert RequestCompression(threshold=100).compress(body) == (body, None)
+
+    def test_gzip_round_trip(self):
+        """Large bodies are gzip-encoded and shrink."""
+        body = json.dumps(NOTIFY).encode()
+        payload, encoding = RequestCompression(threshold=0).compress(body)
+        assert encoding == "gzip"
+        assert len(payload) < len(body)
+        assert gzip.decompress(payload) == body
+
+    def test_zstd_round_trip(self):
+        """Zstd is used when requested and the package is installed."""
+        zstandard = pytest.importorskip("zstandard")
+        body = json.dumps(NOTIFY).encode()
+        payload, encoding = RequestCompression("zstd", threshold=0).compress(body)
+        assert encoding == "zstd"
+        assert zstandard.ZstdDecompressor().decompress(payload) == body
+
+    def test_rejects_unknown_algorithm(self):
+        """Only gzip and zstd are supported."""
+        with pytest.raises(ValueError):
+            RequestCompression("brotli")  # type: ignore[arg-type]
+
+    def test_rejects_negative_threshold(self):
+        """A negative threshold is a configuration error."""
+        with pytest.raises(ValueError):
+            RequestCompression(threshold=-1)
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_large_body_is_compressed(mock_request):
+    """trigger_bulk sends a gzip body with Content-Encoding set."""
+    mock_request.return_value = _response(BULK_OK)
+    client = SirenClient(
+        api_key=API_KEY, env="dev", compression=RequestCompression(threshold=1024)
+    )
+
+    client.workflow.trigger_bulk("wf", notify=NOTIFY)
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert json.loads(gzip.decompress(kwargs["data"]))["notify"] == NOTIFY
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_small_body_is_not_compressed(mock_request):
+    """Bodies under the threshold keep their plain JSON encoding."""
+    mock_request.return_value = _response(BULK_OK)
+    client = WorkflowClient(
+        api_key=API_KEY,
+        base_url=BASE_URL,
+        compression=RequestCompression(threshold=1024),
+    )
+
+    client.trigger_bulk("wf", notify=[{"email": "a@example.com"}])
+
+    kwargs = mock_request.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert json.loads(kwargs["data"])["workflowName"] == "wf"
+
+
+def test_compressed_body_reaches_server(fake_server):
+    """A real HTTP round trip carries the compressed bytes unchanged."""
+    client = WorkflowClient(
+        api_key=API_KEY,
+        base_url=fake_server.base_url,
+        compression=RequestCompression(threshold=0),
+    )
+
+    client.trigger("wf", data={"plan": "pro"})
+
+    _, _, headers, body = fake_server.requests[-1]
+    assert headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body))["data"] == {"plan": "pro"}
+    client.close()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_large_body_is_compressed():
+    """The async client compresses the same way."""
+    route = respx.post(f"{BASE_URL}/api/v2/workflows/trigger/bulk").mock(
+        return_value=httpx.Response(200, json=BULK_OK)
+    )
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", compression=RequestCompression(threshold=1024)
+    ) as client:
+        await client.workflow.trigger_bulk("wf", notify=NOTIFY)
+
+    request = route.calls.last.request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.content))["notify"] == NOTIFY
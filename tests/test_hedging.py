@@ -0,0 +1,188 @@
+"""Tests for hedged read requests."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from siren.clients.messaging import MessageClient
+from siren.http.hedging import Hedger
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+STATUS_ENDPOINT = "/api/v1/public/message-status/{message_id}"
+
+
+def _status_response(status):
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {"data": {"status": status}, "error": None}
+    response.content = json.dumps(response.json.return_value).encode()
+    return response
+
+
+def _slow_then_fast(slow_seconds=0.5):
+    """Session.request side effect: the first call stalls, later ones answer."""
+    calls = []
+    lock = threading.Lock()
+
+    def side_effect(**kwargs):
+        with lock:
+            calls.append(kwargs)
+            first = len(calls) == 1
+        if first:
+            time.sleep(slow_seconds)
+            return _status_response("SLOW")
+        return _status_response("FAST")
+
+    return side_effect
+
+
+class TestHedger:
+    """Unit tests for delay selection and the load cap."""
+
+    def test_requires_delay_or_percentile(self):
+        """A hedger without any delay source is rejected."""
+        with pytest.raises(ValueError):
+            Hedger()
+
+    def test_percentile_delay_after_min_samples(self):
+        """The hedge delay follows the observed latency distribution."""
+        hedger = Hedger(delay=1.0, percentile=90, min_samples=10)
+        assert hedger.hedge_delay("/a") == 1.0
+        for latency in range(1, 11):
+            hedger._record("/a", latency / 100)
+        assert hedger.hedge_delay("/a") == pytest.approx(0.09)
+        assert hedger.hedge_delay("/b") == 1.0
+
+    def test_percentile_without_fallback_waits_for_samples(self):
+        """With no fixed delay nothing is hedged until latencies are known."""
+        hedger = Hedger(percentile=95)
+        assert hedger.call("/a", lambda: "ok") == "ok"
+        assert hedger.stats().hedges == 0
+
+    def test_extra_load_is_capped(self):
+        """With max_extra_load=0.5 at most every other request is hedged."""
+        hedger = Hedger(delay=0, max_extra_load=0.5)
+
+        def send():
+            time.sleep(0.01)
+            return "ok"
+
+        for _ in range(6):
+            hedger.call("/a", send)
+
+        assert hedger.stats().requests == 6
+        assert hedger.stats().hedges == 3
+        hedger.close()
+
+    def test_error_waits_for_other_attempt(self):
+        """A failed attempt does not win while the other may still succeed."""
+        hedger = Hedger(delay=0.01, max_extra_load=1)
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise RuntimeError("primary failed")
+            time.sleep(0.1)
+            return "hedge"
+
+        assert hedger.call("/a", send) == "hedge"
+        hedger.close()
+
+    def test_queued_primaries_are_not_hedged(self):
+        """Waiting for a busy worker does not count against the hedge delay."""
+        hedger = Hedger(delay=0.1, max_extra_load=1, max_workers=1)
+
+        def send():
+            time.sleep(0.02)
+            return "ok"
+
+        threads = [
+            threading.Thread(target=hedger.call, args=("/a", send)) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hedger.stats().requests == 8
+        assert hedger.stats().hedges == 0
+        hedger.close()
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_sync_client_hedges_slow_status_call(mock_request):
+    """The hedge answers first and the slow primary's response is closed."""
+    mock_request.side_effect = _slow_then_fast()
+    hedger = Hedger(delay=0.02, max_extra_load=1)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL, hedger=hedger)
+
+    start = time.monotonic()
+    assert client.get_status("msg_1") == "FAST"
+
+    assert time.monotonic() - start < 0.4
+    assert mock_request.call_count == 2
+    assert hedger.stats().hedge_wins == 1
+    hedger.close()
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_sync_client_does_not_hedge_sends(mock_request):
+    """Non-idempotent calls bypass the hedger entirely."""
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {
+        "data": {"notificationId": "n_1"},
+        "error": None,
+    }
+    response.content = json.dumps(response.json.return_value).encode()
+    mock_request.return_value = response
+    hedger = Hedger(delay=0, max_extra_load=1)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL, hedger=hedger)
+
+    client.send(
+        recipient_value="u@example.com", channel="EMAIL", body="hi", subject="s"
+    )
+
+    assert mock_request.call_count == 1
+    assert hedger.stats().requests == 0
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_cancels_loser():
+    """The async hedger returns the faster attempt and cancels the other."""
+    hedger = Hedger(delay=0.02, max_extra_load=1)
+    cancelled = asyncio.Event()
+    calls = 0
+
+    async def send():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+        return "fast"
+
+    assert await hedger.call_async(STATUS_ENDPOINT, send) == "fast"
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert hedger.stats().hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_async_fast_primary_is_not_hedged():
+    """A primary answering within the delay is returned without a hedge."""
+    hedger = Hedger(delay=0.5, max_extra_load=1)
+
+    async def send():
+        return "ok"
+
+    assert await hedger.call_async(STATUS_ENDPOINT, send) == "ok"
+    assert hedger.stats().hedges == 0
@@ -0,0 +1,195 @@
+"""Tests for idempotency keys and the local duplicate-suppression window."""
+
+import json
+import threading
+
+import pytest
+
+from siren import (
+    AsyncSirenClient,
+    IdempotencyWindow,
+    RequestOptions,
+    RetryPolicy,
+    SirenClient,
+)
+from siren.exceptions import SirenAPIError, SirenDuplicateRequestError
+from siren.http.idempotency import with_idempotency_key
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport, canned_response
+
+API_KEY = "test_api_key"
+
+
+class HeaderRecorder(InMemoryTransport):
+    """In-memory transport that keeps the headers of every request."""
+
+    def __init__(self, handler=None, **kwargs):
+        """Answer with *handler* and record headers."""
+        super().__init__(handler, **kwargs)
+        self.headers = []
+
+    def request(self, *, headers=None, **kwargs):
+        """Record *headers* and answer."""
+        self.headers.append(dict(headers or {}))
+        return super().request(headers=headers, **kwargs)
+
+
+def _failing_first(statuses):
+    """Handler answering the first requests with *statuses*, then normally."""
+    statuses = list(statuses)
+
+    def handler(method, path, body):
+        if statuses:
+            error = {"errorCode": "SCRIPTED", "message": "scripted"}
+            return statuses.pop(0), json.dumps({"data": None, "error": error}).encode()
+        return canned_response(method, path, body)
+
+    return handler
+
+
+def test_key_resolution():
+    """An explicit key wins; auto keys are only generated when none is given."""
+    options = RequestOptions(idempotency_key="from-options", timeout=3)
+    assert with_idempotency_key(options, "explicit", False).idempotency_key == (
+        "explicit"
+    )
+    assert with_idempotency_key(options, None, True) is options
+    assert with_idempotency_key(None, None, False) is None
+    generated = with_idempotency_key(None, None, True).idempotency_key
+    assert generated
+    assert generated != with_idempotency_key(None, None, True).idempotency_key
+
+
+def test_key_is_sent_as_header_and_enables_post_retries():
+    """With a key, a 503 on send is retried; the retry reuses the key."""
+    transport = HeaderRecorder(_failing_first([503]))
+    client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=transport,
+        retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+    )
+
+    client.message.send("U1", "SLACK", body="hi", idempotency_key="order-42")
+
+    assert [h["Idempotency-Key"] for h in transport.headers] == ["order-42"] * 2
+
+
+def test_auto_keys_on_send_and_trigger():
+    """auto_idempotency_keys gives each call its own key."""
+    transport = HeaderRecorder()
+    client = SirenClient(
+        api_key=API_KEY, env="dev", transport=transport, auto_idempotency_keys=True
+    )
+
+    client.message.send("U1", "SLACK", body="hi")
+    client.message.send_awesome_template("U1", "SLACK", "awesome/welcome")
+    client.workflow.trigger("onboarding")
+    client.message.get_status("msg_1")
+
+    keys = [h.get("Idempotency-Key") for h in transport.headers]
+    assert len(set(keys[:3])) == 3 and None not in keys[:3]
+    assert keys[3] is None
+
+
+def test_window_suppresses_repeated_keys():
+    """A repeated key returns the first result without another request."""
+    transport = HeaderRecorder()
+    window = IdempotencyWindow()
+    client = SirenClient(
+        api_key=API_KEY, env="dev", transport=transport, idempotency_window=window
+    )
+
+    first = client.message.send("U1", "SLACK", body="hi", idempotency_key="k1")
+    again = client.message.send("U1", "SLACK", body="hi", idempotency_key="k1")
+    other = client.message.send("U1", "SLACK", body="hi", idempotency_key="k2")
+    trigger = client.workflow.trigger("wf", idempotency_key="k1")  # other endpoint
+
+    assert again == first
+    assert other and trigger
+    assert transport.calls == 3
+    assert window.suppressed == 1
+
+
+def test_failed_calls_release_their_key():
+    """A key whose call failed can be used again."""
+    window = IdempotencyWindow()
+    client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(_failing_first([400])),
+        idempotency_window=window,
+    )
+
+    with pytest.raises(SirenAPIError):
+        client.workflow.trigger("wf", idempotency_key="k")
+    assert client.workflow.trigger("wf", idempotency_key="k").request_id
+
+
+def test_in_flight_duplicate_is_rejected():
+    """A second call with a key still in flight raises."""
+    started, release = threading.Event(), threading.Event()
+
+    def slow(method, path, body):
+        started.set()
+        release.wait(5)
+        return canned_response(method, path, body)
+
+    client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(slow),
+        idempotency_window=IdempotencyWindow(),
+    )
+    worker = threading.Thread(
+        target=client.workflow.trigger, args=("wf",), kwargs={"idempotency_key": "k"}
+    )
+    worker.start()
+    started.wait(5)
+    try:
+        with pytest.raises(SirenDuplicateRequestError) as exc_info:
+            client.workflow.trigger("wf", idempotency_key="k")
+        assert exc_info.value.idempotency_key == "k"
+    finally:
+        release.set()
+        worker.join()
+
+
+def test_window_ttl_and_size():
+    """Completed keys expire after the TTL and the oldest is evicted."""
+    now = [0.0]
+    window = IdempotencyWindow(maxsize=2, ttl=10, clock=lambda: now[0])
+    for key in ("a", "b", "c"):
+        window.claim(("POST", "/p", key))
+        window.complete(("POST", "/p", key), key)
+
+    assert len(window) == 2
+    assert window.claim(("POST", "/p", "c")) == (True, "c")
+    assert window.claim(("POST", "/p", "a")) == (False, None)  # evicted
+    now[0] = 10.0
+    assert window.claim(("POST", "/p", "c")) == (False, None)  # expired
+
+    with pytest.raises(ValueError):
+        IdempotencyWindow(ttl=0)
+
+
+@pytest.mark.asyncio
+async def test_async_window_shared_with_sync_client():
+    """One window deduplicates across sync and async clients."""
+    window = IdempotencyWindow()
+    sync_client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(),
+        idempotency_window=window,
+    )
+    first = sync_client.workflow.trigger("wf", idempotency_key="shared")
+
+    transport = AsyncInMemoryTransport()
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=transport, idempotency_window=window
+    ) as client:
+        again = await client.workflow.trigger("wf", idempotency_key="shared")
+        await client.message.send("welcome", "SLACK", "U1", idempotency_key="m")
+
+    assert again is first
+    assert transport.calls == 1
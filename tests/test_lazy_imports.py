@@ -0,0 +1,80 @@
+"""Tests for lazy module loading and lazy domain-client construction."""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import siren
+from siren import SirenClient
+from siren.http.memory import InMemoryTransport
+
+API_KEY = "test_api_key"
+
+
+def _modules_loaded_after(code: str) -> set:
+    script = f"import sys\n{code}\nprint(' '.join(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return set(output.split())
+
+
+def test_import_siren_loads_no_client_stack():
+    """``import siren`` alone loads neither client nor any HTTP library."""
+    loaded = _modules_loaded_after("import siren")
+
+    assert not {"siren.client", "siren.async_client", "requests", "httpx"} & loaded
+
+
+def test_sync_client_skips_async_stack_and_domain_modules():
+    """Creating a sync client loads neither httpx nor any domain client."""
+    loaded = _modules_loaded_after(
+        "from siren import SirenClient\nSirenClient(api_key='k', env='dev')"
+    )
+
+    assert "requests" in loaded
+    assert not {"httpx", "asyncio", "siren.async_client"} & loaded
+    assert not {m for m in loaded if m.startswith("siren.clients.messaging")}
+
+
+def test_public_names_resolve_lazily():
+    """Every name in ``__all__`` resolves, and unknown names still fail."""
+    for name in siren.__all__:
+        assert getattr(siren, name) is not None
+    assert set(siren.__all__) <= set(dir(siren))
+    with pytest.raises(AttributeError):
+        siren.NotAThing  # noqa: B018
+
+
+def test_domain_clients_created_on_first_access():
+    """Domain clients are built on demand, once, and share the transport."""
+    transport = InMemoryTransport()
+    client = SirenClient(api_key=API_KEY, env="dev", transport=transport)
+
+    assert "_message_client" not in vars(client)
+    message = client.message
+    assert client.message is message
+    assert message._transport is transport
+    assert "_template_client" not in vars(client)
+    assert client.template._channel_templates is None
+
+
+def test_concurrent_first_access_builds_one_client():
+    """Threads racing on the first access all get the same domain client."""
+    client = SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport())
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def access():
+        barrier.wait()
+        seen.append(client.workflow)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(workflow) for workflow in seen}) == 1
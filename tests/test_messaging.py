@@ -1,5 +1,6 @@
 """Unit tests for the messaging client using BaseClient."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -19,7 +20,7 @@ class TestMessageClient:
         """Set up test fixtures."""
         self.client = MessageClient(api_key=API_KEY, base_url=BASE_URL)
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_message_success(self, mock_request):
         """Test successful message sending with new BaseClient."""
         # Mock successful API response
@@ -29,6 +30,7 @@ class TestMessageClient:
             "data": {"notificationId": "test_msg_123"},
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method
@@ -51,12 +53,12 @@ class TestMessageClient:
         assert call_args[1]["url"] == f"{BASE_URL}/api/v1/public/send-messages"
 
         # Check payload has camelCase fields
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert "templateVariables" in payload
         assert payload["templateVariables"]["name"] == "John"
         assert payload["template"]["name"] == "test_template"
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_message_status_success(self, mock_request):
         """Test successful message status retrieval."""
         # Mock successful API response
@@ -66,6 +68,7 @@ class TestMessageClient:
             "data": {"status": "DELIVERED"},
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method
@@ -74,7 +77,7 @@ class TestMessageClient:
         # Verify result
         assert result == "DELIVERED"
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_replies_success(self, mock_request):
         """Test successful replies retrieval."""
         # Mock successful API response
@@ -97,6 +100,7 @@ class TestMessageClient:
             ],
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method
@@ -109,7 +113,7 @@ class TestMessageClient:
         assert result[1].text == "Reply 2"
         assert result[1].user == "U456"
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_api_error_handling(self, mock_request):
         """Test that API errors are properly handled."""
         # Mock API error response
@@ -119,6 +123,7 @@ class TestMessageClient:
             "data": None,
             "error": {"errorCode": "NOT_FOUND", "message": "Template not found"},
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Should raise SirenAPIError
@@ -132,7 +137,7 @@ class TestMessageClient:
         assert exc_info.value.error_code == "NOT_FOUND"
         assert "Template not found" in exc_info.value.api_message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_message_without_template_variables(self, mock_request):
         """Test sending message without template variables."""
         # Mock successful API response
@@ -142,6 +147,7 @@ class TestMessageClient:
             "data": {"notificationId": "test_msg_456"},
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method without template_variables
@@ -155,16 +161,17 @@ class TestMessageClient:
         assert result == "test_msg_456"
 
         # Verify payload excludes templateVariables when None
-        payload = mock_request.call_args[1]["json"]
+        payload = json.loads(mock_request.call_args[1]["data"])
         assert "templateVariables" not in payload
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_replies_empty_list(self, mock_request):
         """Test get_replies when no replies exist."""
         # Mock successful API response with empty list
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": [], "error": None}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method
@@ -174,7 +181,7 @@ class TestMessageClient:
         assert result == []
         assert len(result) == 0
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_network_error_handling(self, mock_request):
         """Test handling of network errors."""
         # Mock network error
@@ -190,7 +197,7 @@ class TestMessageClient:
 
         assert "Connection timeout" in str(exc_info.value)
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_awesome_template_success(self, mock_request):
         """Test successful awesome template sending."""
         # Mock successful API response
@@ -200,6 +207,7 @@ class TestMessageClient:
             "data": {"notificationId": "awesome_msg_123"},
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method
@@ -230,7 +238,7 @@ class TestMessageClient:
         assert call_args[1]["url"] == f"{BASE_URL}/api/v1/public/send-awesome-messages"
 
         # Check payload structure
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert payload["channel"] == "SLACK"
         assert payload["templateIdentifier"] == "awesome-templates/customer-support/escalation_required/official/casual.yaml"
         assert payload["recipient"]["slack"] == "U123ABC"
@@ -239,7 +247,7 @@ class TestMessageClient:
         assert payload["providerIntegration"]["name"] == "slack-test-provider"
         assert payload["providerIntegration"]["code"] == "SLACK"
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_awesome_template_without_provider(self, mock_request):
         """Test awesome template sending without provider information."""
         # Mock successful API response
@@ -249,6 +257,7 @@ class TestMessageClient:
             "data": {"notificationId": "awesome_msg_456"},
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method without provider info
@@ -263,10 +272,10 @@ class TestMessageClient:
         assert result == "awesome_msg_456"
 
         # Verify payload doesn't include providerIntegration
-        payload = mock_request.call_args[1]["json"]
+        payload = json.loads(mock_request.call_args[1]["data"])
         assert "providerIntegration" not in payload
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_awesome_template_without_template_variables(self, mock_request):
         """Test awesome template sending without template variables."""
         # Mock successful API response
@@ -276,6 +285,7 @@ class TestMessageClient:
             "data": {"notificationId": "awesome_msg_789"},
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Call the method without template variables
@@ -291,10 +301,10 @@ class TestMessageClient:
         assert result == "awesome_msg_789"
 
         # Verify payload doesn't include templateVariables
-        payload = mock_request.call_args[1]["json"]
+        payload = json.loads(mock_request.call_args[1]["data"])
         assert "templateVariables" not in payload
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_awesome_template_api_error(self, mock_request):
         """Test awesome template API error handling."""
         # Mock API error response
@@ -307,6 +317,7 @@ class TestMessageClient:
                 "message": "Validation failed: Should provide either provider Id or provider name and code."
             },
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Should raise SirenAPIError
@@ -347,7 +358,7 @@ class TestMessageClient:
 
         assert "Both provider_name and provider_code must be provided together" in str(exc_info.value)
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_awesome_template_different_channels(self, mock_request):
         """Test awesome template with different channels."""
         # Mock successful API response
@@ -357,6 +368,7 @@ class TestMessageClient:
             "data": {"notificationId": "awesome_msg_channel_test"},
             "error": None,
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_request.return_value = mock_response
 
         # Test EMAIL channel
@@ -372,11 +384,11 @@ class TestMessageClient:
         assert result == "awesome_msg_channel_test"
 
         # Verify recipient structure for EMAIL
-        payload = mock_request.call_args[1]["json"]
+        payload = json.loads(mock_request.call_args[1]["data"])
         assert payload["recipient"]["email"] == "test@example.com"
         assert "slack" not in payload["recipient"]
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_send_awesome_template_network_error(self, mock_request):
         """Test awesome template network error handling."""
         # Mock network error
@@ -0,0 +1,305 @@
+"""Tests for the SQLite outbox and its dispatchers."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from siren import (
+    AsyncOutboxDispatcher,
+    AsyncSirenClient,
+    Outbox,
+    OutboxDispatcher,
+    PollBackoff,
+    SirenClient,
+)
+from siren.exceptions import SirenSDKError
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport, canned_response
+
+API_KEY = "test_api_key"
+FAST = PollBackoff(initial=0.001, multiplier=2, max_interval=0.004, jitter=0)
+
+
+class RecordingHandler:
+    """Answers like the API, after the scripted error statuses run out."""
+
+    def __init__(self, errors=()):
+        """Fail the first requests with the HTTP statuses in *errors*."""
+        self.errors = list(errors)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, body):
+        """Record the request and answer it."""
+        with self.lock:
+            self.requests.append((path, json.loads(body)))
+            status = self.errors.pop(0) if self.errors else None
+        if status is not None:
+            error = {"errorCode": "SCRIPTED", "message": "scripted"}
+            return status, json.dumps({"data": None, "error": error}).encode()
+        return canned_response(method, path, body)
+
+
+def _client(handler):
+    return SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport(handler))
+
+
+def test_enqueue_is_durable_across_reopen(tmp_path):
+    """Flushed entries survive closing the outbox and are pending on reopen."""
+    path = tmp_path / "outbox.db"
+    with Outbox(path) as outbox:
+        send_id = outbox.enqueue_send("U1", "SLACK", template_name="welcome")
+        outbox.enqueue_trigger("onboarding", data={"plan": "pro"})
+
+    with Outbox(path) as outbox:
+        assert outbox.stats().pending == 2
+        entry = outbox.get(send_id)
+        assert entry["kind"] == "send"
+        assert entry["payload"] == {
+            "recipient_value": "U1",
+            "channel": "SLACK",
+            "template_name": "welcome",
+        }
+
+
+def test_dispatcher_drains_and_records_results(tmp_path):
+    """Sends and triggers are dispatched once and their results stored."""
+    handler = RecordingHandler()
+    outbox = Outbox(tmp_path / "outbox.db")
+    ids = [outbox.enqueue_send(f"U{i}", "SLACK", body="hi") for i in range(20)]
+    trigger_id = outbox.enqueue_trigger("onboarding", notify={"email": "a@b.c"})
+
+    with OutboxDispatcher(_client(handler), outbox, concurrency=4):
+        pass
+
+    stats = outbox.stats()
+    assert (stats.pending, stats.done, stats.failed) == (0, 21, 0)
+    assert len(handler.requests) == 21
+    assert isinstance(outbox.get(ids[0])["result"], str)
+    assert outbox.get(trigger_id)["result"]["requestId"]
+    outbox.close()
+
+
+def test_transient_errors_retry_and_permanent_errors_fail():
+    """A 503 is retried with backoff; a 400 marks the row failed."""
+    outbox = Outbox(":memory:")
+    flaky = outbox.enqueue_trigger("wf")
+    dispatcher = OutboxDispatcher(
+        _client(RecordingHandler(errors=[503])),
+        outbox,
+        poll_interval=0.001,
+        backoff=FAST,
+    )
+    with dispatcher:
+        outbox.flush()
+        for _ in range(1000):
+            if outbox.stats().done:
+                break
+            time.sleep(0.001)
+    assert outbox.get(flaky)["state"] == "done"
+    assert outbox.get(flaky)["attempts"] == 2
+
+    broken = outbox.enqueue_trigger("wf")
+    with OutboxDispatcher(_client(RecordingHandler(errors=[400])), outbox):
+        pass
+    row = outbox.get(broken)
+    assert (row["state"], row["attempts"]) == ("failed", 1)
+    assert "scripted" in row["error"]
+
+
+def test_gateway_error_pages_are_retried():
+    """A 502 page without a Siren error body is transient, not a failure."""
+    answers = [(502, b"<html>Bad gateway</html>")]
+
+    def gateway(method, path, body):
+        return answers.pop() if answers else canned_response(method, path, body)
+
+    outbox = Outbox(":memory:")
+    entry = outbox.enqueue_trigger("wf")
+    with OutboxDispatcher(_client(gateway), outbox, poll_interval=0.001, backoff=FAST):
+        outbox.flush()
+        for _ in range(1000):
+            if outbox.stats().done:
+                break
+            time.sleep(0.001)
+    assert (outbox.get(entry)["state"], outbox.get(entry)["attempts"]) == ("done", 2)
+    outbox.close()
+
+
+def test_dispatcher_survives_database_errors(caplog, monkeypatch):
+    """A locked database is logged and retried instead of ending the thread."""
+    outbox = Outbox(":memory:")
+    ids = [outbox.enqueue_trigger("wf") for _ in range(3)]
+    due, settle = outbox.due, outbox.settle
+    failures = {"due": 2, "settle": 1}
+
+    def flaky(name, real):
+        def call(*args, **kwargs):
+            if failures[name]:
+                failures[name] -= 1
+                raise sqlite3.OperationalError("database is locked")
+            return real(*args, **kwargs)
+
+        return call
+
+    monkeypatch.setattr(outbox, "due", flaky("due", due))
+    monkeypatch.setattr(outbox, "settle", flaky("settle", settle))
+    dispatcher = OutboxDispatcher(
+        _client(RecordingHandler()), outbox, poll_interval=0.001, backoff=FAST
+    )
+    with caplog.at_level(logging.ERROR, logger="siren.clients.outbox"):
+        with dispatcher:
+            outbox.flush()
+            for _ in range(1000):
+                if outbox.stats().done == 3:
+                    break
+                time.sleep(0.001)
+    assert [outbox.get(i)["state"] for i in ids] == ["done"] * 3
+    assert failures == {"due": 0, "settle": 0}
+    assert "database is locked" in caplog.text
+    outbox.close()
+
+
+def test_restart_resumes_pending_entries(tmp_path):
+    """A new dispatcher picks up what an earlier process left pending."""
+    path = tmp_path / "outbox.db"
+    with Outbox(path) as outbox:
+        for i in range(5):
+            outbox.enqueue_send(f"U{i}", "SLACK", body="hi")
+
+    handler = RecordingHandler()
+    with Outbox(path) as outbox:
+        with OutboxDispatcher(_client(handler), outbox):
+            pass
+        assert outbox.stats().done == 5
+        assert outbox.purge() == 5
+    assert len(handler.requests) == 5
+
+
+def test_dispatchers_sharing_a_file_send_each_entry_once(tmp_path):
+    """A leased row is claimed by one connection; the others skip it."""
+    path = tmp_path / "claims.db"
+    with Outbox(path) as outbox:
+        for i in range(40):
+            outbox.enqueue_send(f"U{i}", "SLACK", body="hi")
+    with Outbox(path) as first, Outbox(path) as second:
+        claimed = first.due(10, lease=0.05)
+        others = second.due(100)
+        assert (len(claimed), len(others)) == (10, 30)
+        assert not {e.id for e in claimed} & {e.id for e in others}
+        assert first.due(100) == [] and second.due(100) == []
+        time.sleep(0.06)  # an expired lease frees its rows for the others
+        assert {e.id for e in second.due(100)} == {e.id for e in claimed}
+
+    path = tmp_path / "outbox.db"
+    with Outbox(path) as outbox:
+        for i in range(40):
+            outbox.enqueue_send(f"U{i}", "SLACK", body="hi")
+    handler = RecordingHandler()
+    outboxes = [Outbox(path) for _ in range(3)]
+    dispatchers = [
+        OutboxDispatcher(_client(handler), outbox, concurrency=4).start()
+        for outbox in outboxes
+    ]
+    for dispatcher in dispatchers:
+        assert dispatcher.stop()
+    assert outboxes[0].stats().done == 40
+    bodies = {json.dumps(body, sort_keys=True) for _, body in handler.requests}
+    assert len(handler.requests) == len(bodies) == 40
+    for outbox in outboxes:
+        outbox.close()
+
+
+def test_stop_returns_false_when_flush_times_out(monkeypatch):
+    """A flush timeout still stops the dispatcher, and stop() reports it."""
+    outbox = Outbox(":memory:")
+    dispatcher = OutboxDispatcher(_client(RecordingHandler()), outbox)
+    dispatcher.start()
+
+    def slow_flush(timeout=None):
+        raise SirenSDKError(f"Outbox flush timed out after {timeout}s")
+
+    monkeypatch.setattr(outbox, "flush", slow_flush)
+    assert dispatcher.stop(timeout=1) is False
+    assert not dispatcher._thread.is_alive()
+    outbox.close()
+
+
+def test_invalid_use():
+    """Mismatched provider fields and closed outboxes are rejected."""
+    outbox = Outbox(":memory:")
+    with pytest.raises(ValueError):
+        outbox.enqueue_send("U1", "SLACK", body="hi", provider_name="slack")
+    with pytest.raises(ValueError):
+        OutboxDispatcher(_client(RecordingHandler()), outbox, concurrency=0)
+    outbox.close()
+    with pytest.raises(SirenSDKError):
+        outbox.enqueue_trigger("wf")
+
+
+@pytest.mark.asyncio
+async def test_async_dispatcher(tmp_path):
+    """The async dispatcher drains the outbox as tasks."""
+    handler = RecordingHandler()
+    outbox = Outbox(tmp_path / "outbox.db")
+    for i in range(10):
+        outbox.enqueue_send(f"U{i}", "SLACK", template_name="welcome")
+    outbox.enqueue_trigger("onboarding")
+    outbox.enqueue_send("U1", "SLACK", body="no templates on the async client")
+
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport(handler)
+    ) as client:
+        async with AsyncOutboxDispatcher(client, outbox, concurrency=3):
+            pass
+
+    stats = outbox.stats()
+    assert (stats.pending, stats.done, stats.failed) == (0, 11, 1)
+    outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_async_stop_returns_false_when_flush_times_out(monkeypatch):
+    """The async dispatcher also stops, and reports the flush timeout."""
+    outbox = Outbox(":memory:")
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport()
+    ) as client:
+        dispatcher = AsyncOutboxDispatcher(client, outbox)
+        dispatcher.start()
+
+        def slow_flush(timeout=None):
+            raise SirenSDKError(f"Outbox flush timed out after {timeout}s")
+
+        monkeypatch.setattr(outbox, "flush", slow_flush)
+        assert await dispatcher.stop(timeout=1) is False
+        assert dispatcher._task.done()
+    outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_async_dispatcher_survives_database_errors(monkeypatch):
+    """The async dispatcher task also backs off and retries database errors."""
+    outbox = Outbox(":memory:")
+    entry = outbox.enqueue_trigger("wf")
+    outbox.flush()
+    due, failures = outbox.due, [2]
+
+    def locked(*args, **kwargs):
+        if failures[0]:
+            failures[0] -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return due(*args, **kwargs)
+
+    monkeypatch.setattr(outbox, "due", locked)
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport()
+    ) as client:
+        async with AsyncOutboxDispatcher(client, outbox, backoff=FAST):
+            pass
+    assert failures == [0]
+    assert outbox.get(entry)["state"] == "done"
+    outbox.close()
@@ -0,0 +1,128 @@
+"""Tests for the client-side rate limiter."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import httpx  # type: ignore
+import pytest
+import respx  # type: ignore
+
+from siren.clients.messaging import MessageClient
+from siren.clients.messaging_async import AsyncMessageClient
+from siren.http.rate_limit import RateLimiter, TokenBucket
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+STATUS_OK = {"data": {"status": "DELIVERED"}, "error": None}
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket reservations."""
+
+    def test_burst_is_free_then_paced(self):
+        """The first `burst` tokens need no wait; later ones are spaced by 1/rate."""
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_acquire_sleeps_instead_of_spinning(self):
+        """acquire() sleeps exactly once for the reserved delay."""
+        bucket = TokenBucket(rate=5, burst=1)
+        bucket.acquire()
+        with patch("siren.http.rate_limit.time.sleep") as mock_sleep:
+            bucket.acquire()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.2, abs=0.02)
+
+    def test_thread_safe_pacing(self):
+        """Concurrent threads never exceed the configured rate."""
+        bucket = TokenBucket(rate=100, burst=1)
+        stamps = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(5):
+                bucket.acquire()
+                with lock:
+                    stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(stamps) == 20
+        # 20 requests at 100/s with a burst of 1 take at least ~0.19s.
+        assert max(stamps) - start >= 0.17
+
+    def test_invalid_rate(self):
+        """Rates must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter:
+    """Tests for endpoint-group routing."""
+
+    def test_groups_take_precedence_over_global(self):
+        """Endpoints matching a group use that group's bucket."""
+        send_bucket = TokenBucket(rate=1)
+        limiter = RateLimiter(rate=50, groups={"/send-messages": send_bucket})
+
+        assert limiter.bucket_for("/api/v1/public/send-messages") is send_bucket
+        assert limiter.bucket_for("/api/v1/public/users") is limiter._global
+
+    def test_plain_rates_become_buckets(self):
+        """Groups may be given as plain per-second rates."""
+        limiter = RateLimiter(groups={"/users": 5})
+        bucket = limiter.bucket_for("/api/v1/public/users/u1")
+        assert isinstance(bucket, TokenBucket)
+        assert bucket.rate == 5
+
+    def test_unlimited_without_global_rate(self):
+        """Endpoints outside any group are unlimited without a global rate."""
+        limiter = RateLimiter(groups={"/users": 5})
+        assert limiter.bucket_for("/api/v2/workflows/trigger") is None
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_sync_client_acquires_before_each_request(mock_request):
+    """MessageClient asks the limiter for a token keyed by endpoint template."""
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = STATUS_OK
+    response.content = json.dumps(response.json.return_value).encode()
+    mock_request.return_value = response
+    limiter = Mock(spec=RateLimiter)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL, rate_limiter=limiter)
+
+    client.get_status("msg_1")
+
+    limiter.acquire.assert_called_once_with(
+        "/api/v1/public/message-status/{message_id}"
+    )
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_client_paces_requests():
+    """The async client awaits the shared bucket before each request."""
+    respx.get(f"{BASE_URL}/api/v1/public/message-status/msg_1").mock(
+        return_value=httpx.Response(200, json=STATUS_OK)
+    )
+    limiter = RateLimiter(rate=20, burst=1)
+    client = AsyncMessageClient(
+        api_key=API_KEY, base_url=BASE_URL, rate_limiter=limiter
+    )
+
+    start = time.monotonic()
+    for _ in range(3):
+        await client.get_status("msg_1")
+
+    assert time.monotonic() - start >= 0.09
+    await client.aclose()
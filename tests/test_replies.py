@@ -0,0 +1,189 @@
+"""Tests for incremental reply fetching and the reply stream."""
+
+import json
+
+import pytest
+
+from siren import AsyncSirenClient, RequestOptions, SirenClient
+from siren.exceptions import SirenAPIError, SirenSDKError
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+from siren.models.messaging import ReplyData
+
+API_KEY = "test_api_key"
+
+
+def _reply(ts, text=None):
+    return {"text": text or f"reply {ts}", "user": "U1", "ts": ts, "threadTs": "1.0"}
+
+
+class Thread:
+    """Serves a reply thread that tests grow between requests."""
+
+    def __init__(self, *timestamps, errors=()):
+        """Start with replies at *timestamps*; answer the first polls with *errors*."""
+        self.replies = [_reply(ts) for ts in timestamps]
+        self.errors = list(errors)
+        self.calls = 0
+        self.on_call = None
+
+    def __call__(self, method, path, body):
+        """Return the whole thread, like the API does."""
+        self.calls += 1
+        if self.on_call is not None:
+            self.on_call(self)
+        if self.errors:
+            status = self.errors.pop(0)
+            error = {"errorCode": "SCRIPTED", "message": "scripted"}
+            return status, json.dumps({"data": None, "error": error}).encode()
+        return 200, json.dumps({"data": self.replies, "error": None}).encode()
+
+
+def _client(thread, **kwargs):
+    return SirenClient(
+        api_key=API_KEY, env="dev", transport=InMemoryTransport(thread), **kwargs
+    )
+
+
+def test_incremental_returns_only_new_replies():
+    """Each incremental call returns what arrived since the previous one."""
+    thread = Thread("1700000000.000100", "1700000000.000200")
+    client = _client(thread)
+
+    first = client.message.get_replies("m", incremental=True)
+    assert [r.ts for r in first] == ["1700000000.000100", "1700000000.000200"]
+    assert client.message.get_replies("m", incremental=True) == []
+
+    thread.replies.append(_reply("1700000000.000300"))
+    new = client.message.get_replies("m", incremental=True)
+    assert [r.ts for r in new] == ["1700000000.000300"]
+    assert isinstance(new[0], ReplyData)
+
+    client.message.reply_cursors.reset("m")
+    assert len(client.message.get_replies("m", incremental=True)) == 3
+
+
+def test_since_filters_numerically_without_moving_cursor():
+    """``since`` compares timestamps as numbers and leaves the cursor alone."""
+    client = _client(Thread("9.5", "10.25", "100.0"))
+
+    replies = client.message.get_replies("m", since="10.0")
+
+    assert [r.ts for r in replies] == ["10.25", "100.0"]
+    assert client.message.reply_cursors.get("m") is None
+    assert len(client.message.get_replies("m")) == 3
+
+
+def test_new_replies_come_oldest_first_whatever_the_api_order():
+    """Replies served newest first are returned and streamed in ``ts`` order."""
+    thread = Thread("30.0", "10.0", "20.0")
+    client = _client(thread)
+
+    first = client.message.get_replies("m", incremental=True)
+    assert [r.ts for r in first] == ["10.0", "20.0", "30.0"]
+    assert client.message.reply_cursors.get("m") == "30.0"
+
+    thread.replies[:0] = [_reply("50.0"), _reply("40.0")]
+    assert [r.ts for r in client.message.get_replies("m", since="20.0")] == [
+        "30.0",
+        "40.0",
+        "50.0",
+    ]
+    stream = client.message.iter_replies("m", since="25.0", timeout=0)
+    assert [r.ts for r in stream] == ["30.0", "40.0", "50.0"]
+
+
+def test_incremental_honours_response_mode():
+    """Raw mode returns the new replies as dicts."""
+    client = _client(Thread("1.0", "2.0"))
+
+    replies = client.message.get_replies(
+        "m",
+        since="1.0",
+        request_options=RequestOptions(response_mode="raw"),
+    )
+
+    assert replies == [_reply("2.0")]
+
+
+def test_iter_replies_yields_each_reply_once():
+    """New replies are yielded as they arrive; transient errors are skipped."""
+    thread = Thread("1.0", errors=[503])
+
+    def grow(thread):
+        if thread.calls in (3, 5):
+            thread.replies.append(_reply(f"{thread.calls}.0"))
+
+    thread.on_call = grow
+    client = _client(thread)
+
+    stream = client.message.iter_replies(
+        "m", poll_interval=0.001, max_interval=0.002, timeout=0.2
+    )
+    assert [r.ts for r in stream] == ["1.0", "3.0", "5.0"]
+    assert thread.calls > 5
+
+
+def test_iter_replies_raises_non_transient_errors():
+    """A 404 ends the stream with the API error."""
+    client = _client(Thread(errors=[404]))
+
+    with pytest.raises(SirenAPIError):
+        list(client.message.iter_replies("m", poll_interval=0.001, timeout=1))
+
+
+def test_iter_replies_retries_proxy_pages_and_raises_bad_data():
+    """A gateway's HTML 503 is skipped; a reply that never validates is raised."""
+    thread = Thread("1.0")
+    answers = [(503, b"<html>Bad gateway</html>")]
+
+    def gateway(method, path, body):
+        return answers.pop() if answers else thread(method, path, body)
+
+    client = _client(gateway)
+    stream = client.message.iter_replies("m", poll_interval=0.001, timeout=0.05)
+    assert [r.ts for r in stream] == ["1.0"]
+
+    calls = []
+
+    def malformed(method, path, body):
+        calls.append(path)
+        if len(calls) > 1:  # would only be reached by retrying
+            return 404, b'{"data": null, "error": {"errorCode": "GONE"}}'
+        return 200, json.dumps({"data": [{"ts": "1.0", "text": ["x"]}]}).encode()
+
+    with pytest.raises(SirenSDKError) as exc_info:
+        list(_client(malformed).message.iter_replies("m", poll_interval=0.001))
+    assert not isinstance(exc_info.value, SirenAPIError)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_incremental_and_stream():
+    """The async client supports incremental reads and the reply stream."""
+    thread = Thread("1.0", "2.0")
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport(thread)
+    ) as client:
+        assert len(await client.message.get_replies("m", incremental=True)) == 2
+        assert await client.message.get_replies("m", incremental=True) == []
+
+        stream = client.message.iter_replies(
+            "m", since="1.0", poll_interval=0.001, timeout=0.05
+        )
+        assert [r.ts async for r in stream] == ["2.0"]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_retries_proxy_pages():
+    """The async stream classifies a gateway's HTML 503 as transient too."""
+    thread = Thread("1.0")
+    answers = [(503, b"<html>Bad gateway</html>")]
+
+    def gateway(method, path, body):
+        return answers.pop() if answers else thread(method, path, body)
+
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport(gateway)
+    ) as client:
+        stream = client.message.iter_replies("m", poll_interval=0.001, timeout=0.05)
+        assert [r.ts async for r in stream] == ["1.0"]
@@ -0,0 +1,167 @@
+"""Tests for per-call RequestOptions."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import httpx  # type: ignore
+import pytest
+import respx  # type: ignore
+
+from siren.clients.messaging import MessageClient
+from siren.clients.messaging_async import AsyncMessageClient
+from siren.clients.workflows import WorkflowClient
+from siren.http.options import RequestOptions
+from siren.http.retry import RetryPolicy
+from siren.http.transport import SyncTransport
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+STATUS_OK = {"data": {"status": "DELIVERED"}, "error": None}
+TRIGGER_OK = {
+    "data": {"requestId": "req_1", "workflowExecutionId": "exec_1"},
+    "error": None,
+}
+
+
+def _response(payload):
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = payload
+    response.content = json.dumps(response.json.return_value).encode()
+    return response
+
+
+class TestRequestOptions:
+    """Unit tests for option merging."""
+
+    def test_merge_prefers_overrides(self):
+        """Fields set on the override win; headers are combined."""
+        policy = RetryPolicy(max_attempts=2)
+        base = RequestOptions(timeout=10, extra_headers={"A": "1", "B": "1"})
+        merged = base.merge(
+            RequestOptions(retry_policy=policy, extra_headers={"B": "2"})
+        )
+        assert merged.timeout == 10
+        assert merged.retry_policy is policy
+        assert merged.extra_headers == {"A": "1", "B": "2"}
+
+    def test_merge_with_none_returns_self(self):
+        """Merging nothing is a no-op."""
+        base = RequestOptions(timeout=5)
+        assert base.merge(None) is base
+
+    def test_rejects_non_positive_timeout(self):
+        """A zero timeout is a configuration error."""
+        with pytest.raises(ValueError):
+            RequestOptions(timeout=0)
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_options_reach_the_transport(mock_request):
+    """Timeout, idempotency key and extra headers are applied to one call only."""
+    mock_request.return_value = _response(STATUS_OK)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL)
+    options = RequestOptions(
+        timeout=2.5,
+        idempotency_key="key-1",
+        extra_headers={"X-Trace": "t1", "Authorization": "ignored"},
+    )
+
+    client.get_status("msg_1", request_options=options)
+    client.get_status("msg_1")
+
+    first, second = mock_request.call_args_list
+    assert first.kwargs["timeout"] == 2.5
+    assert first.kwargs["headers"] == {
+        "X-Trace": "t1",
+        "Authorization": f"Bearer {API_KEY}",
+        "Idempotency-Key": "key-1",
+    }
+    assert second.kwargs["timeout"] == 10
+    assert second.kwargs["headers"] == {"Authorization": f"Bearer {API_KEY}"}
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_workflow_trigger_timeouts_do_not_touch_client(mock_request):
+    """Trigger defaults to 10s and can be overridden without mutating the client."""
+    mock_request.return_value = _response(TRIGGER_OK)
+    client = WorkflowClient(api_key=API_KEY, base_url=BASE_URL, timeout=5)
+
+    client.trigger("wf")
+    client.trigger("wf", request_options=RequestOptions(timeout=3))
+
+    assert [c.kwargs["timeout"] for c in mock_request.call_args_list] == [10, 3]
+    assert client.timeout == 5
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_options_reach_the_transport():
+    """The async client forwards per-call timeout and headers to httpx."""
+    route = respx.get(f"{BASE_URL}/api/v1/public/message-status/msg_1").mock(
+        return_value=httpx.Response(200, json=STATUS_OK)
+    )
+    client = AsyncMessageClient(api_key=API_KEY, base_url=BASE_URL)
+
+    with patch.object(
+        client._transport._client, "request", wraps=client._transport._client.request
+    ) as spy:
+        await client.get_status(
+            "msg_1",
+            request_options=RequestOptions(timeout=1.5, extra_headers={"X-T": "1"}),
+        )
+
+    assert spy.call_args.kwargs["timeout"] == 1.5
+    assert route.calls.last.request.headers["X-T"] == "1"
+    await client.aclose()
+
+
+def test_shared_client_under_thread_pool(fake_server):
+    """Many threads share one client and each call keeps its own options."""
+    transport = SyncTransport(pool_maxsize=32)
+    workflows = WorkflowClient(
+        api_key=API_KEY, base_url=fake_server.base_url, transport=transport
+    )
+    messages = MessageClient(
+        api_key=API_KEY, base_url=fake_server.base_url, transport=transport
+    )
+    seen = {}
+    send = transport.request
+
+    def spy(**kwargs):
+        seen[kwargs["headers"]["X-Call"]] = kwargs["timeout"]
+        return send(**kwargs)
+
+    transport.request = spy  # type: ignore[method-assign]
+
+    def call(i):
+        headers = {"X-Call": str(i)}
+        if i % 3 == 0:
+            workflows.trigger(
+                "wf", request_options=RequestOptions(extra_headers=headers)
+            )
+            return 10
+        if i % 3 == 1:
+            workflows.trigger_bulk(
+                "wf",
+                notify=[{"n": i}],
+                request_options=RequestOptions(extra_headers=headers),
+            )
+            return 20
+        timeout = 1 + i / 1000
+        messages.get_status(
+            f"msg_{i}",
+            request_options=RequestOptions(timeout=timeout, extra_headers=headers),
+        )
+        return timeout
+
+    calls = 600
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        expected = dict(zip(map(str, range(calls)), pool.map(call, range(calls))))
+
+    transport.close()
+    assert seen == expected
+    assert workflows.timeout == 10
+    assert {headers["X-Call"] for _, _, headers, _ in fake_server.requests} == set(
+        expected
+    )
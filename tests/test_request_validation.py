@@ -0,0 +1,131 @@
+"""Tests for skipping validation of SDK-built request payloads."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from siren import AsyncSirenClient, RequestOptions, SirenClient
+from siren.exceptions import SirenSDKError
+from siren.http.memory import (
+    AsyncInMemoryTransport,
+    InMemoryTransport,
+    canned_response,
+)
+from siren.models.messaging import ProviderCode
+
+API_KEY = "test_api_key"
+
+CALLS = {
+    "send_body": lambda m, w: m.send(
+        recipient_value="alice@example.com",
+        channel="EMAIL",
+        body="Hi",
+        subject="Welcome",
+        provider_name="ses",
+        provider_code=ProviderCode.EMAIL_SES,
+    ),
+    "send_template": lambda m, w: m.send(
+        recipient_value="U01UBCD06BB",
+        channel="SLACK",
+        template_name="welcome",
+        template_variables={"user_name": "Alice", "plan": None},
+    ),
+    "send_awesome_template": lambda m, w: m.send_awesome_template(
+        recipient_value="U01UBCD06BB",
+        channel="SLACK",
+        template_identifier="awesome-templates/welcome.yaml",
+    ),
+    "trigger": lambda m, w: w.trigger("onboarding", data={"plan": "pro"}),
+    "trigger_bulk": lambda m, w: w.trigger_bulk(
+        "onboarding", notify=[{"email": "a@example.com"}, {"email": None}]
+    ),
+}
+
+
+def _recording_transport(transport_cls):
+    bodies = []
+
+    def handler(method, path, body):
+        bodies.append(json.loads(body))
+        return canned_response(method, path, body)
+
+    return transport_cls(handler), bodies
+
+
+@pytest.mark.parametrize("name", sorted(CALLS))
+def test_unvalidated_payload_matches_validated(name):
+    """Skipping validation sends exactly the JSON the validated path sends."""
+    results = []
+    for validate in (True, False):
+        transport, bodies = _recording_transport(InMemoryTransport)
+        client = SirenClient(
+            api_key=API_KEY,
+            env="dev",
+            transport=transport,
+            validate_requests=validate,
+        )
+        CALLS[name](client.message, client.workflow)
+        results.append(bodies[0])
+    assert results[0] == results[1]
+
+
+def test_skips_model_validation():
+    """With validation off, the request model is never validated."""
+    client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(),
+        validate_requests=False,
+    )
+    with patch("siren.models.messaging.SendMessageRequest.model_validate") as validate:
+        client.message.send(recipient_value="a@example.com", channel="EMAIL", body="x")
+    validate.assert_not_called()
+
+
+def test_per_call_override():
+    """RequestOptions.validate_request wins over the client setting."""
+    client = SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport())
+
+    def send(**kwargs):
+        client.message.send(recipient_value="a@example.com", channel="EMAIL", **kwargs)
+
+    with pytest.raises(SirenSDKError, match="Invalid parameters"):
+        send()
+    # Without validation the SDK's own checks are skipped; the API decides.
+    send(request_options=RequestOptions(validate_request=False))
+
+
+def test_caller_supplied_payloads_are_always_validated():
+    """Payloads from caller dicts keep being validated and mapped to aliases."""
+    transport, bodies = _recording_transport(InMemoryTransport)
+    client = SirenClient(
+        api_key=API_KEY, env="dev", transport=transport, validate_requests=False
+    )
+
+    client.webhook.configure_notifications(url="https://example.com/hook")
+
+    assert bodies[0] == {"webhookConfig": {"url": "https://example.com/hook"}}
+
+
+@pytest.mark.asyncio
+async def test_async_unvalidated_payload_matches_validated():
+    """The async client builds the same wire payload either way."""
+    results = []
+    for validate in (True, False):
+        transport, bodies = _recording_transport(AsyncInMemoryTransport)
+        client = AsyncSirenClient(
+            api_key=API_KEY,
+            env="dev",
+            transport=transport,
+            validate_requests=validate,
+        )
+        await client.message.send(
+            template_name="welcome",
+            channel="EMAIL",
+            recipient_value="a@example.com",
+            template_variables={"n": 1},
+        )
+        await client.workflow.trigger_bulk("wf", notify=[{"n": 1}])
+        results.append(bodies)
+    assert results[0] == results[1]
@@ -0,0 +1,158 @@
+"""Tests for the raw and lazy response modes of read calls."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from siren import AsyncSirenClient, LazyModel, RequestOptions, SirenClient
+from siren.exceptions import SirenAPIError
+from siren.http.memory import (
+    AsyncInMemoryTransport,
+    InMemoryTransport,
+    canned_response,
+)
+from siren.models.templates import Template, TemplateVersion
+
+API_KEY = "test_api_key"
+
+
+def _client(response_mode="model", handler=None):
+    return SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(handler),
+        response_mode=response_mode,
+    )
+
+
+def test_model_mode_is_the_default():
+    """Without a mode, read calls keep returning pydantic models."""
+    templates = _client().template.get()
+    assert all(isinstance(t, Template) for t in templates)
+
+
+def test_raw_mode_returns_decoded_json():
+    """Raw mode hands back the envelope's data exactly as the API sent it."""
+    client = _client("raw")
+
+    templates = client.template.get()
+    replies = client.message.get_replies("msg_1")
+
+    _, body = canned_response("GET", "/api/v1/public/template", None)
+    assert templates == json.loads(body)["data"]
+    assert templates[0]["draftVersion"]["id"] == "ver_0"
+    assert replies[0] == {
+        "text": "reply 0",
+        "user": "U01UBCD06BB",
+        "ts": "1700000000.000000",
+    }
+    assert client.message.get_status("msg_1") == "DELIVERED"
+    assert isinstance(client.channel_template.get("ver_1")[0], dict)
+
+
+def test_raw_mode_skips_model_validation():
+    """No pydantic model is built for the response in raw mode."""
+    client = _client("raw")
+    with patch(
+        "siren.models.templates.TemplateListResponse.model_validate_json"
+    ) as validate:
+        client.template.get()
+    validate.assert_not_called()
+
+
+def test_lazy_mode_validates_fields_on_access():
+    """Lazy views behave like the model and validate each field once."""
+    client = _client("lazy")
+
+    templates = client.template.get()
+    template = templates[0]
+
+    assert isinstance(template, LazyModel)
+    assert template.id == "tpl_0"
+    assert isinstance(template.draft_version, TemplateVersion)
+    assert template.draft_version is template.draft_version
+    assert template.template_versions[0].status == "PUBLISHED_LATEST"
+    assert template.to_model() == Template.model_validate(template.raw)
+    assert client.message.get_status("msg_1") == "DELIVERED"
+    assert client.message.get_replies("msg_1")[0].thread_ts is None
+
+
+def test_lazy_mode_reports_bad_fields_on_access():
+    """An invalid field only raises when it is read."""
+
+    def handler(method, path, body):
+        reply = {"text": "hi", "user": "U1", "ts": 5}
+        return 200, json.dumps({"data": [reply], "error": None}).encode()
+
+    reply = _client("lazy", handler).message.get_replies("msg_1")[0]
+
+    assert reply.text == "hi"
+    with pytest.raises(ValidationError):
+        reply.ts
+    with pytest.raises(AttributeError):
+        reply.missing
+    with pytest.raises(ValidationError):
+        reply.to_model()
+
+
+def test_per_call_override():
+    """RequestOptions.response_mode wins over the client setting."""
+    client = _client("raw")
+
+    templates = client.template.get(
+        request_options=RequestOptions(response_mode="model")
+    )
+
+    assert isinstance(templates[0], Template)
+
+
+def test_write_calls_ignore_response_mode():
+    """Only read calls change shape; writes still return their usual values."""
+    client = _client("raw")
+
+    created = client.template.create(name="new")
+
+    assert created.template_id == "tpl_new"
+
+
+def test_error_envelope_still_raises():
+    """API errors surface as SirenAPIError in every mode."""
+
+    def handler(method, path, body):
+        error = {"errorCode": "NOT_FOUND", "message": "Message not found"}
+        return 404, json.dumps({"data": None, "error": error}).encode()
+
+    for mode in ("raw", "lazy"):
+        with pytest.raises(SirenAPIError) as exc_info:
+            _client(mode, handler).message.get_status("missing")
+        assert exc_info.value.error_code == "NOT_FOUND"
+
+
+def test_invalid_mode_is_rejected():
+    """Unknown modes fail fast, on the client and per call."""
+    with pytest.raises(ValueError, match="response_mode"):
+        _client("dict")
+    with pytest.raises(ValueError, match="response_mode"):
+        RequestOptions(response_mode="dict")  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_async_response_modes():
+    """The async client supports the same modes and overrides."""
+    async with AsyncSirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=AsyncInMemoryTransport(),
+        response_mode="lazy",
+    ) as client:
+        templates = await client.template.get()
+        assert templates[0].name == "template_0"
+        replies = await client.message.get_replies(
+            "msg_1", request_options=RequestOptions(response_mode="raw")
+        )
+        assert replies[0]["text"] == "reply 0"
+        assert await client.message.get_status("msg_1") == "DELIVERED"
+        channel_templates = await client.channel_template.get("ver_1")
+        assert channel_templates[0].channel == "EMAIL"
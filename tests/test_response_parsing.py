@@ -0,0 +1,91 @@
+"""Tests that response bodies are decoded once and validated from bytes."""
+
+import json
+from unittest.mock import Mock, patch
+
+import httpx  # type: ignore
+import pytest
+import respx  # type: ignore
+
+from siren.clients.messaging import MessageClient
+from siren.clients.messaging_async import AsyncMessageClient
+from siren.exceptions import SirenAPIError, SirenSDKError
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+STATUS_URL = f"{BASE_URL}/api/v1/public/message-status/msg_1"
+NOT_FOUND = {
+    "data": None,
+    "error": {"errorCode": "NOT_FOUND", "message": "Message not found"},
+}
+# With a field the SDK's models do not know about.
+NOT_FOUND_EXTRA = {**NOT_FOUND, "traceId": "abc123"}
+
+
+def _response(status_code, body):
+    response = Mock(status_code=status_code, headers={}, text=body.decode())
+    response.content = body
+    response.json.side_effect = lambda: json.loads(body)
+    return response
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_success_is_validated_from_bytes(mock_request):
+    """A successful body is never turned into an intermediate dict."""
+    response = _response(200, b'{"data": {"status": "DELIVERED"}, "error": null}')
+    mock_request.return_value = response
+
+    assert MessageClient(API_KEY, BASE_URL).get_status("msg_1") == "DELIVERED"
+    response.json.assert_not_called()
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_success_status_without_data_keeps_the_body(mock_request):
+    """A 200 carrying an error reports the body as sent, unknown fields included."""
+    response = _response(200, json.dumps(NOT_FOUND_EXTRA).encode())
+    mock_request.return_value = response
+
+    with pytest.raises(SirenAPIError) as exc_info:
+        MessageClient(API_KEY, BASE_URL).get_status("msg_1")
+
+    assert exc_info.value.error_code == "NOT_FOUND"
+    assert exc_info.value.raw_response == NOT_FOUND_EXTRA
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_error_status_is_decoded_once(mock_request):
+    """Error responses are decoded to a dict once and validated from it."""
+    response = _response(404, json.dumps(NOT_FOUND).encode())
+    mock_request.return_value = response
+
+    with pytest.raises(SirenAPIError) as exc_info:
+        MessageClient(API_KEY, BASE_URL).get_status("msg_1")
+
+    assert response.json.call_count == 1
+    assert exc_info.value.raw_response == NOT_FOUND
+
+
+@patch("siren.http.transport.requests.Session.request")
+def test_invalid_json_on_success(mock_request):
+    """A non-JSON success body raises a descriptive SirenSDKError."""
+    mock_request.return_value = _response(200, b"<html>gateway</html>")
+
+    with pytest.raises(SirenSDKError, match="not valid JSON") as exc_info:
+        MessageClient(API_KEY, BASE_URL).get_status("msg_1")
+
+    assert exc_info.value.status_code == 200
+    assert "<html>gateway</html>" in exc_info.value.message
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_success_status_without_data_keeps_the_body():
+    """The async client reports a 200-with-error with the body as sent."""
+    respx.get(STATUS_URL).mock(return_value=httpx.Response(200, json=NOT_FOUND_EXTRA))
+    client = AsyncMessageClient(API_KEY, BASE_URL)
+
+    with pytest.raises(SirenAPIError) as exc_info:
+        await client.get_status("msg_1")
+
+    assert exc_info.value.raw_response == NOT_FOUND_EXTRA
+    await client.aclose()
@@ -0,0 +1,291 @@
+"""Tests for the retry policy and the retry loop in the base clients."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import httpx  # type: ignore
+import pytest
+import requests
+import respx  # type: ignore
+
+from siren.clients.messaging import MessageClient
+from siren.clients.messaging_async import AsyncMessageClient
+from siren.exceptions import SirenSDKError
+from siren.http.options import RequestOptions
+from siren.http.retry import RetryPolicy, parse_retry_after
+from siren.models.messaging import SendMessageRequest, SendMessageResponse
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+STATUS_URL = f"{BASE_URL}/api/v1/public/message-status/msg_1"
+SEND_URL = f"{BASE_URL}/api/v1/public/send-messages"
+NETWORK_ERRORS = (requests.exceptions.RequestException,)
+
+
+def mock_response(status_code: int, json_data: dict = None, headers: dict = None):
+    """Helper function to create a mock HTTP response."""
+    mock_resp = Mock()
+    mock_resp.status_code = status_code
+    mock_resp.json.return_value = json_data if json_data is not None else {}
+    mock_resp.content = json.dumps(mock_resp.json.return_value).encode()
+    mock_resp.headers = headers or {}
+    return mock_resp
+
+
+STATUS_OK = {"data": {"status": "DELIVERED"}, "error": None}
+SEND_OK = {"data": {"notificationId": "msg_1"}, "error": None}
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy decisions."""
+
+    def test_backoff_grows_exponentially_and_is_capped(self):
+        """Delays double per attempt and never exceed max_backoff."""
+        policy = RetryPolicy(
+            max_attempts=10, backoff_factor=1, max_backoff=5, jitter=False
+        )
+        delays = [
+            policy.delay_after_response(attempt, "GET", {}, 503, {})
+            for attempt in range(1, 6)
+        ]
+        assert delays == [1, 2, 4, 5, 5]
+
+    def test_jitter_stays_within_bounds(self):
+        """Full jitter picks a delay between zero and the exponential bound."""
+        policy = RetryPolicy(max_attempts=5, backoff_factor=1)
+        for _ in range(50):
+            assert 0 <= policy.delay_after_response(3, "GET", {}, 500, {}) <= 4
+
+    def test_stops_after_max_attempts(self):
+        """No delay is returned once the attempt budget is used up."""
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.delay_after_response(1, "GET", {}, 503, {}) is not None
+        assert policy.delay_after_response(2, "GET", {}, 503, {}) is None
+
+    def test_non_retryable_status(self):
+        """Client errors other than 429 are not retried."""
+        assert RetryPolicy().delay_after_response(1, "GET", {}, 404, {}) is None
+
+    def test_post_requires_idempotency_key(self):
+        """POST is only retried when an Idempotency-Key header is present."""
+        policy = RetryPolicy()
+        assert policy.delay_after_response(1, "POST", {}, 503, {}) is None
+        assert (
+            policy.delay_after_response(1, "POST", {"Idempotency-Key": "abc"}, 503, {})
+            is not None
+        )
+
+    def test_retry_after_seconds_is_honoured(self):
+        """Retry-After on 429 overrides the computed backoff."""
+        policy = RetryPolicy(jitter=False)
+        delay = policy.delay_after_response(1, "GET", {}, 429, {"Retry-After": "7"})
+        assert delay == 7
+
+    def test_retry_after_is_capped_by_max_backoff(self):
+        """A huge Retry-After never exceeds max_backoff."""
+        policy = RetryPolicy(max_backoff=3)
+        delay = policy.delay_after_response(1, "GET", {}, 503, {"Retry-After": "3600"})
+        assert delay == 3
+
+    def test_parse_retry_after_http_date(self):
+        """HTTP-date Retry-After values are converted to seconds from now."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_parse_retry_after_invalid(self):
+        """Garbage Retry-After values are ignored."""
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_exception_retry_uses_transport_network_errors(self):
+        """By default only the transport's network errors are retried."""
+        policy = RetryPolicy()
+        network_error = requests.exceptions.ConnectionError("down")
+        assert (
+            policy.delay_after_exception(1, "GET", {}, network_error, NETWORK_ERRORS)
+            is not None
+        )
+        assert (
+            policy.delay_after_exception(
+                1, "GET", {}, ValueError("bug"), NETWORK_ERRORS
+            )
+            is None
+        )
+
+    def test_custom_retry_exceptions(self):
+        """retry_exceptions narrows which errors are retried."""
+        policy = RetryPolicy(retry_exceptions=(requests.exceptions.Timeout,))
+        connection_error = requests.exceptions.ConnectionError("down")
+        timeout_error = requests.exceptions.ReadTimeout("slow")
+        assert (
+            policy.delay_after_exception(1, "GET", {}, connection_error, NETWORK_ERRORS)
+            is None
+        )
+        assert (
+            policy.delay_after_exception(1, "GET", {}, timeout_error, NETWORK_ERRORS)
+            is not None
+        )
+
+    def test_invalid_max_attempts(self):
+        """max_attempts must allow at least one attempt."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+@patch("siren.clients.base.time.sleep")
+@patch("siren.http.transport.requests.Session.request")
+class TestSyncRetries:
+    """Tests for the retry loop in BaseClient."""
+
+    def _client(self, **policy_kwargs) -> MessageClient:
+        return MessageClient(
+            api_key=API_KEY,
+            base_url=BASE_URL,
+            retry_policy=RetryPolicy(jitter=False, **policy_kwargs),
+        )
+
+    def test_retries_5xx_then_succeeds(self, mock_request, mock_sleep):
+        """A GET that hits 503 is retried and the later success is returned."""
+        mock_request.side_effect = [
+            mock_response(503, {"error": {"errorCode": "E", "message": "down"}}),
+            mock_response(200, STATUS_OK),
+        ]
+
+        assert self._client().get_status("msg_1") == "DELIVERED"
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_retries_network_errors(self, mock_request, mock_sleep):
+        """Connection errors are retried until the attempt budget is exhausted."""
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+
+        with pytest.raises(SirenSDKError) as exc_info:
+            self._client(max_attempts=3).get_status("msg_1")
+
+        assert "Network or connection error" in exc_info.value.message
+        assert mock_request.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_post_without_idempotency_key_is_not_retried(
+        self, mock_request, mock_sleep
+    ):
+        """Sends are not repeated on 503 because they are not idempotent."""
+        mock_request.return_value = mock_response(503, {"data": None})
+
+        with pytest.raises(SirenSDKError):
+            self._client().send(recipient_value="U1", channel="SLACK", body="hello")
+
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_post_with_idempotency_key_reuses_serialized_body(
+        self, mock_request, mock_sleep
+    ):
+        """Idempotent POST retries resend the exact same body bytes."""
+        mock_request.side_effect = [
+            mock_response(429, {"data": None}, headers={"Retry-After": "2"}),
+            mock_response(200, SEND_OK),
+        ]
+        client = self._client()
+
+        with patch.object(
+            client, "_serialize_request", wraps=client._serialize_request
+        ) as serialize:
+            result = client._make_request(
+                method="POST",
+                endpoint="/api/v1/public/send-messages",
+                request_model=SendMessageRequest,
+                response_model=SendMessageResponse,
+                data={"channel": "SLACK", "body": "hi", "recipient": {"slack": "U1"}},
+                options=RequestOptions(idempotency_key="key-1"),
+            )
+
+        assert result.message_id == "msg_1"
+        serialize.assert_called_once()
+        first, second = mock_request.call_args_list
+        assert first.kwargs["data"] is second.kwargs["data"]
+        assert first.kwargs["headers"]["Idempotency-Key"] == "key-1"
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_per_call_policy_overrides_client_policy(self, mock_request, mock_sleep):
+        """A retry policy in RequestOptions wins over the client default."""
+        mock_request.return_value = mock_response(503, {"data": None})
+        client = self._client(max_attempts=5)
+        options = RequestOptions(retry_policy=RetryPolicy(max_attempts=2, jitter=False))
+
+        with pytest.raises(SirenSDKError):
+            client.get_status("msg_1", request_options=options)
+
+        assert mock_request.call_count == 2
+
+    def test_no_policy_means_single_attempt(self, mock_request, mock_sleep):
+        """Clients without a retry policy keep the single-attempt behaviour."""
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+        client = MessageClient(api_key=API_KEY, base_url=BASE_URL)
+
+        with pytest.raises(SirenSDKError):
+            client.get_status("msg_1")
+
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_retries_then_succeeds():
+    """The async client retries a 502 and returns the later success."""
+    route = respx.get(STATUS_URL).mock(
+        side_effect=[
+            httpx.Response(502, json={"data": None}),
+            httpx.Response(200, json=STATUS_OK),
+        ]
+    )
+    client = AsyncMessageClient(
+        api_key=API_KEY,
+        base_url=BASE_URL,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+
+    assert await client.get_status("msg_1") == "DELIVERED"
+    assert route.call_count == 2
+    await client.aclose()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_network_errors_exhaust_attempts():
+    """Async network errors are retried and finally raised as SirenSDKError."""
+    route = respx.get(STATUS_URL).mock(side_effect=httpx.ConnectError("down"))
+    client = AsyncMessageClient(
+        api_key=API_KEY,
+        base_url=BASE_URL,
+        retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0),
+    )
+
+    with pytest.raises(SirenSDKError):
+        await client.get_status("msg_1")
+
+    assert route.call_count == 3
+    await client.aclose()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_post_is_not_retried_without_key():
+    """Async sends are not retried without an idempotency key."""
+    route = respx.post(SEND_URL).mock(
+        return_value=httpx.Response(503, json={"data": None})
+    )
+    client = AsyncMessageClient(
+        api_key=API_KEY,
+        base_url=BASE_URL,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+
+    with pytest.raises(SirenSDKError):
+        await client.send(template_name="t", channel="EMAIL", recipient_value="a@b.com")
+
+    assert route.call_count == 1
+    await client.aclose()
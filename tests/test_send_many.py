@@ -0,0 +1,165 @@
+"""Tests for batch message sending with bounded concurrency."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from siren import AsyncSirenClient, SirenClient
+from siren.exceptions import SirenAPIError
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+
+API_KEY = "test_api_key"
+
+
+class RecordingHandler:
+    """Answers sends with the recipient as ID, failing for ``bad@`` addresses."""
+
+    def __init__(self, delay=0.0):
+        """Answer after *delay* seconds."""
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.sent = []
+
+    def __call__(self, method, path, body):
+        """Record the send and answer with an envelope."""
+        email = json.loads(body)["recipient"]["email"]
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            self.sent.append(email)
+            if email.startswith("bad"):
+                error = {"errorCode": "BAD_REQUEST", "message": f"Rejected {email}"}
+                return 400, json.dumps({"data": None, "error": error}).encode()
+            data = {"notificationId": f"id-{email}"}
+            return 200, json.dumps({"data": data, "error": None}).encode()
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def _items(emails):
+    return (
+        {"recipient_value": email, "channel": "EMAIL", "template_name": "welcome"}
+        for email in emails
+    )
+
+
+def _client(handler):
+    return SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport(handler))
+
+
+def test_results_in_input_order_with_errors():
+    """Results line up with the input; failures are returned, not raised."""
+    handler = RecordingHandler()
+    emails = [f"user{i}@example.com" for i in range(20)]
+    emails[7] = "bad@example.com"
+
+    results = _client(handler).message.send_many(_items(emails), concurrency=4)
+
+    assert len(results) == 20
+    assert results[0] == "id-user0@example.com"
+    assert results[19] == "id-user19@example.com"
+    assert isinstance(results[7], SirenAPIError)
+    assert results[7].error_code == "BAD_REQUEST"
+
+
+def test_concurrency_is_bounded():
+    """No more than ``concurrency`` sends are ever in flight."""
+    handler = RecordingHandler(delay=0.01)
+
+    _client(handler).message.send_many(
+        _items(f"u{i}@example.com" for i in range(30)), concurrency=5
+    )
+
+    assert len(handler.sent) == 30
+    assert 1 < handler.peak <= 5
+
+
+def test_iter_send_many_streams_completions():
+    """The streaming variant yields every index once, as sends finish."""
+    handler = RecordingHandler()
+    emails = [f"user{i}@example.com" for i in range(10)]
+
+    seen = dict(_client(handler).message.iter_send_many(_items(emails), concurrency=3))
+
+    assert seen == {i: f"id-{email}" for i, email in enumerate(emails)}
+
+
+def test_fail_fast_raises_and_skips_unstarted_sends():
+    """With fail_fast the first error is raised and queued work is dropped."""
+    handler = RecordingHandler(delay=0.01)
+    emails = ["bad@example.com"] + [f"u{i}@example.com" for i in range(50)]
+
+    with pytest.raises(SirenAPIError):
+        _client(handler).message.send_many(
+            _items(emails), concurrency=2, fail_fast=True
+        )
+
+    time.sleep(0.05)
+    assert len(handler.sent) < 10
+
+
+def test_invalid_concurrency():
+    """Concurrency below one is rejected."""
+    with pytest.raises(ValueError, match="concurrency"):
+        _client(RecordingHandler()).message.send_many([], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_async_send_many():
+    """The async client keeps order, bounds concurrency and reports errors."""
+    handler = RecordingHandler()
+    emails = [f"user{i}@example.com" for i in range(12)]
+    emails[3] = "bad@example.com"
+    async with AsyncSirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=AsyncInMemoryTransport(handler, latency=0.005),
+    ) as client:
+        results = await client.message.send_many(_items(emails), concurrency=4)
+        streamed = [i async for i, _ in client.message.iter_send_many(_items(emails))]
+
+    assert results[0] == "id-user0@example.com"
+    assert isinstance(results[3], SirenAPIError)
+    assert sorted(streamed) == list(range(12))
+
+
+@pytest.mark.asyncio
+async def test_async_fail_fast_cancels_in_flight_sends():
+    """fail_fast cancels the sends still running when the first one fails."""
+    started = []
+
+    def handler(method, path, body):
+        email = json.loads(body)["recipient"]["email"]
+        started.append(email)
+        if email.startswith("bad"):
+            error = {"errorCode": "BAD_REQUEST", "message": "no"}
+            return 400, json.dumps({"data": None, "error": error}).encode()
+        data = {"notificationId": email}
+        return 200, json.dumps({"data": data, "error": None}).encode()
+
+    transport = AsyncInMemoryTransport(handler)
+    slow_request = transport.request
+
+    async def request(**kwargs):
+        if b"bad@" not in kwargs["content"]:
+            await asyncio.sleep(1)
+        return await slow_request(**kwargs)
+
+    transport.request = request
+    client = AsyncSirenClient(api_key=API_KEY, env="dev", transport=transport)
+    emails = [f"u{i}@example.com" for i in range(3)] + ["bad@example.com"]
+
+    start = time.perf_counter()
+    with pytest.raises(SirenAPIError):
+        await client.message.send_many(_items(emails), concurrency=4, fail_fast=True)
+
+    assert time.perf_counter() - start < 0.5
+    assert started == ["bad@example.com"]
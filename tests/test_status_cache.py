@@ -0,0 +1,145 @@
+"""Tests for the LRU + TTL message status cache."""
+
+import json
+
+import pytest
+
+from siren import AsyncSirenClient, PollBackoff, SirenClient, StatusCache
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+
+API_KEY = "test_api_key"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class StatusHandler:
+    """Answers status requests with ``statuses[message_id]`` and counts them."""
+
+    def __init__(self, statuses):
+        """Serve *statuses*, which tests may change between calls."""
+        self.statuses = statuses
+        self.calls = 0
+
+    def __call__(self, method, path, body):
+        """Return the current status of the message in *path*."""
+        self.calls += 1
+        status = self.statuses[path.rsplit("/", 1)[-1]]
+        return 200, json.dumps({"data": {"status": status}, "error": None}).encode()
+
+
+def test_non_terminal_statuses_expire_after_ttl():
+    """Non-terminal statuses are served until the TTL passes."""
+    clock = FakeClock()
+    cache = StatusCache(ttl=5, clock=clock)
+    cache.put("a", "SENT")
+
+    clock.now = 4.9
+    assert cache.get("a") == "SENT"
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats().size == 0
+
+
+def test_terminal_statuses_never_expire():
+    """Terminal statuses stay until evicted."""
+    clock = FakeClock()
+    cache = StatusCache(ttl=1, clock=clock, terminal={"DELIVERED"})
+    cache.put("a", "DELIVERED")
+
+    clock.now = 1e9
+    assert cache.get("a") == "DELIVERED"
+
+
+def test_lru_eviction_and_counters():
+    """The least recently used entry is evicted; counters track activity."""
+    cache = StatusCache(maxsize=2)
+    cache.put("a", "DELIVERED")
+    cache.put("b", "DELIVERED")
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", "DELIVERED")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "DELIVERED"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 1, 1, 2)
+
+
+def test_invalid_settings():
+    """Nonsensical sizes and TTLs are rejected."""
+    with pytest.raises(ValueError):
+        StatusCache(maxsize=0)
+    with pytest.raises(ValueError):
+        StatusCache(ttl=-1)
+
+
+def test_get_status_uses_cache():
+    """Repeated get_status calls hit the cache instead of the API."""
+    handler = StatusHandler({"a": "DELIVERED", "b": "SENT"})
+    cache = StatusCache(ttl=60)
+    client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(handler),
+        status_cache=cache,
+    )
+
+    assert [client.message.get_status("a") for _ in range(3)] == ["DELIVERED"] * 3
+    client.message.get_status("b")
+    client.message.get_status("b")
+
+    assert handler.calls == 2
+    assert cache.stats().hits == 3
+
+
+def test_wait_for_statuses_bypasses_but_refreshes_cache():
+    """Polling always asks the API and leaves the fresh status in the cache."""
+    handler = StatusHandler({"a": "DELIVERED"})
+    cache = StatusCache()
+    cache.put("a", "SENT")
+    client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(handler),
+        status_cache=cache,
+    )
+
+    list(client.message.wait_for_statuses(["a"], backoff=PollBackoff(initial=0.001)))
+
+    assert handler.calls == 1
+    assert cache.get("a") == "DELIVERED"
+
+
+@pytest.mark.asyncio
+async def test_cache_shared_between_sync_and_async_clients():
+    """A status fetched by the sync client is served to the async one."""
+    cache = StatusCache()
+    sync_handler = StatusHandler({"a": "DELIVERED"})
+    async_handler = StatusHandler({"a": "DELIVERED"})
+    sync_client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=InMemoryTransport(sync_handler),
+        status_cache=cache,
+    )
+    sync_client.message.get_status("a")
+
+    async with AsyncSirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=AsyncInMemoryTransport(async_handler),
+        status_cache=cache,
+    ) as client:
+        assert await client.message.get_status("a") == "DELIVERED"
+
+    assert async_handler.calls == 0
+    assert cache.stats().hits == 1
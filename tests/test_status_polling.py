@@ -0,0 +1,189 @@
+"""Tests for waiting on many message statuses."""
+
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+
+from siren import AsyncSirenClient, PollBackoff, SirenClient, StatusTransition
+from siren.clients.status_polling import PollSchedule, is_transient
+from siren.exceptions import (
+    SirenAPIError,
+    SirenCircuitOpenError,
+    SirenSDKError,
+    SirenTimeoutError,
+)
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+
+API_KEY = "test_api_key"
+FAST = PollBackoff(initial=0.001, multiplier=2, max_interval=0.004, jitter=0)
+
+
+class ScriptedStatuses:
+    """Answers status polls from a per-message script; the last entry repeats."""
+
+    def __init__(self, scripts):
+        """Use ``{message_id: [status or (http_status, error_code), ...]}``."""
+        self.scripts = {k: list(v) for k, v in scripts.items()}
+        self.polls = {k: 0 for k in scripts}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def __call__(self, method, path, body):
+        """Return the next scripted answer for the message in *path*."""
+        message_id = path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            script = self.scripts[message_id]
+            step = script[min(self.polls[message_id], len(script) - 1)]
+            self.polls[message_id] += 1
+        time.sleep(0.001)
+        with self.lock:
+            self.in_flight -= 1
+        if isinstance(step, tuple):
+            error = {"errorCode": step[1], "message": "scripted"}
+            return step[0], json.dumps({"data": None, "error": error}).encode()
+        return 200, json.dumps({"data": {"status": step}, "error": None}).encode()
+
+
+def _wait(handler, ids, **kwargs):
+    client = SirenClient(
+        api_key=API_KEY, env="dev", transport=InMemoryTransport(handler)
+    )
+    kwargs.setdefault("backoff", FAST)
+    return list(client.message.wait_for_statuses(ids, **kwargs))
+
+
+def test_yields_transitions_until_terminal():
+    """Every first status and change is reported; terminal IDs stop polling."""
+    handler = ScriptedStatuses(
+        {
+            "a": ["QUEUED", "QUEUED", "SENT", "DELIVERED"],
+            "b": ["FAILED"],
+        }
+    )
+
+    transitions = _wait(handler, ["a", "b", "a"], timeout=5)
+
+    by_id = {}
+    for t in transitions:
+        by_id.setdefault(t.message_id, []).append((t.previous, t.status, t.terminal))
+    assert by_id["a"] == [
+        (None, "QUEUED", False),
+        ("QUEUED", "SENT", False),
+        ("SENT", "DELIVERED", True),
+    ]
+    assert by_id["b"] == [(None, "FAILED", True)]
+    assert handler.polls == {"a": 4, "b": 1}
+    assert all(isinstance(t, StatusTransition) for t in transitions)
+
+
+def test_custom_terminal_set_and_concurrency_limit():
+    """Custom terminal statuses end polling; requests in flight stay bounded."""
+    ids = [f"m{i}" for i in range(20)]
+    handler = ScriptedStatuses({i: ["SENT", "READ"] for i in ids})
+
+    transitions = _wait(handler, ids, terminal={"READ"}, concurrency=3, timeout=5)
+
+    assert sum(t.terminal for t in transitions) == 20
+    assert handler.peak <= 3
+
+
+def test_transient_errors_are_retried_others_raised():
+    """5xx answers delay the ID; a 404 stops the wait."""
+    handler = ScriptedStatuses({"a": [(503, "UNAVAILABLE"), "DELIVERED"]})
+    assert [t.status for t in _wait(handler, ["a"], timeout=5)] == ["DELIVERED"]
+
+    handler = ScriptedStatuses({"a": [(404, "NOT_FOUND")]})
+    with pytest.raises(SirenAPIError):
+        _wait(handler, ["a"], timeout=5)
+
+
+def test_errors_are_classified_by_status_then_cause():
+    """Proxy 5xx pages and network errors are retried; broken data is raised."""
+    answers = [(503, b"<html>Bad gateway</html>")]
+
+    def gateway(method, path, body):
+        if answers:
+            return answers.pop()
+        return 200, json.dumps({"data": {"status": "DELIVERED"}}).encode()
+
+    assert [t.status for t in _wait(gateway, ["a"], timeout=5)] == ["DELIVERED"]
+
+    def malformed(method, path, body):
+        return 200, json.dumps({"data": {"status": ["DELIVERED"]}}).encode()
+
+    start = time.monotonic()
+    with pytest.raises(SirenSDKError) as exc_info:
+        _wait(malformed, ["a"], timeout=None)
+    assert exc_info.value.status_code is None
+    assert time.monotonic() - start < 1
+
+    assert is_transient(SirenSDKError("bad gateway", status_code=502))
+    assert not is_transient(SirenSDKError("bad request", status_code=400))
+    assert is_transient(SirenCircuitOpenError("/status", 1.0))
+    assert is_transient(
+        SirenSDKError("down", original_exception=httpx.ConnectError("down"))
+    )
+    assert is_transient(
+        SirenSDKError("slow", original_exception=requests.exceptions.ReadTimeout())
+    )
+    assert not is_transient(SirenSDKError("Invalid parameters: x"))
+    assert not is_transient(ValueError("x"))
+
+
+def test_timeout_reports_pending_ids():
+    """IDs that never become terminal are listed on the timeout error."""
+    handler = ScriptedStatuses({"a": ["SENT"], "b": ["DELIVERED"]})
+
+    with pytest.raises(SirenTimeoutError) as exc_info:
+        _wait(handler, ["a", "b"], timeout=0.05)
+
+    assert exc_info.value.pending == ["a"]
+    assert isinstance(exc_info.value, TimeoutError)
+
+
+def test_backoff_grows_while_unchanged_and_resets_on_change():
+    """The per-ID interval doubles up to the cap and resets after a change."""
+    schedule = PollSchedule(["a"], {"DELIVERED"}, FAST, now=0.0)
+    assert schedule.pop_due(0.0, 10) == ["a"]
+
+    schedule.settle("a", "SENT", 0.0)
+    schedule.settle("a", "SENT", 1.0)
+    schedule.settle("a", "SENT", 2.0)
+    assert schedule._interval["a"] == 0.004  # 0.001 -> 0.002 -> 0.004 (capped)
+    schedule.settle("a", "OPENED", 3.0)
+    assert schedule._interval["a"] == 0.001
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_statuses():
+    """The async client yields the same transitions."""
+    handler = ScriptedStatuses({"a": ["SENT", "DELIVERED"], "b": ["FAILED"]})
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport(handler)
+    ) as client:
+        transitions = [
+            (t.message_id, t.status)
+            async for t in client.message.wait_for_statuses(
+                ["a", "b"], backoff=FAST, concurrency=2, timeout=5
+            )
+        ]
+        assert sorted(transitions) == [
+            ("a", "DELIVERED"),
+            ("a", "SENT"),
+            ("b", "FAILED"),
+        ]
+
+        handler = ScriptedStatuses({"c": ["SENT"]})
+        client.message._transport.handler = handler
+        with pytest.raises(SirenTimeoutError):
+            async for _ in client.message.wait_for_statuses(
+                ["c"], backoff=FAST, timeout=0.05
+            ):
+                pass
@@ -0,0 +1,116 @@
+"""Tests for the future-returning ``client.submit`` namespace."""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from siren import SirenClient
+from siren.exceptions import SirenAPIError, SirenSDKError
+from siren.http.memory import InMemoryTransport, canned_response
+
+API_KEY = "test_api_key"
+
+
+def _client(handler=None, **kwargs):
+    return SirenClient(
+        api_key=API_KEY, env="dev", transport=InMemoryTransport(handler), **kwargs
+    )
+
+
+def test_domain_calls_return_futures():
+    """Every domain method is available and resolves to the blocking result."""
+    with _client() as client:
+        send = client.submit.message.send("U1", "SLACK", body="hi")
+        trigger = client.submit.workflow.trigger("onboarding", data={"a": 1})
+        user = client.submit.user.add(unique_id="u1")
+
+        assert isinstance(send, Future)
+        assert isinstance(send.result(timeout=5), str)
+        assert trigger.result(timeout=5).workflow_execution_id
+        assert user.result(timeout=5).unique_id
+        assert client.submit.message.send.__name__ == "send"
+        with pytest.raises(AttributeError):
+            client.submit.message._make_request  # noqa: B018
+        with pytest.raises(AttributeError):
+            client.submit.message.reply_cursors  # noqa: B018
+
+
+def test_calls_share_the_client_and_run_concurrently():
+    """Submitted calls reuse the domain clients and run on the managed pool."""
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def slow(method, path, body):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return canned_response(method, path, body)
+
+    client = _client(slow, pool_maxsize=4)
+    futures = [client.submit.workflow.trigger("wf") for _ in range(12)]
+    assert all(f.result(timeout=5).request_id for f in futures)
+    assert 1 < peak[0] <= 4
+    assert client._workflow_client is client.workflow
+    client.close()
+
+
+def test_errors_are_set_on_the_future():
+    """API errors surface from ``Future.result()``."""
+
+    def failing(method, path, body):
+        return 400, b'{"data": null, "error": {"errorCode": "BAD", "message": "no"}}'
+
+    with _client(failing) as client:
+        future = client.submit.workflow.trigger("wf")
+        with pytest.raises(SirenAPIError):
+            future.result(timeout=5)
+
+
+def test_close_drains_and_bounds_shutdown():
+    """close() waits for submitted calls up to shutdown_timeout, then cancels."""
+    release = threading.Event()
+
+    def blocked(method, path, body):
+        release.wait(5)
+        return canned_response(method, path, body)
+
+    with _client(blocked, pool_maxsize=1) as client:
+        first = client.submit.workflow.trigger("wf")
+        release.set()
+    assert first.result(timeout=0).request_id  # drained before close returned
+
+    release.clear()
+    client = _client(blocked, pool_maxsize=1, shutdown_timeout=0.05)
+    running = client.submit.workflow.trigger("wf")
+    queued = client.submit.workflow.trigger("wf")
+    start = time.monotonic()
+    client.close()
+    assert time.monotonic() - start < 1
+    assert queued.cancelled()
+    release.set()
+    assert running.result(timeout=5).request_id
+
+    with pytest.raises(SirenSDKError):
+        client.submit.workflow.trigger("wf")
+    with pytest.raises(ValueError):
+        _client(shutdown_timeout=-1)
+
+
+def test_caller_executor_is_used_and_left_running():
+    """A caller-owned executor runs the calls and survives close()."""
+    with ThreadPoolExecutor(2, thread_name_prefix="app") as executor:
+        names = []
+
+        def handler(method, path, body):
+            names.append(threading.current_thread().name)
+            return canned_response(method, path, body)
+
+        with _client(handler, executor=executor) as client:
+            client.submit.workflow.trigger("wf").result(timeout=5)
+
+        assert names[0].startswith("app")
+        assert executor.submit(lambda: 1).result() == 1
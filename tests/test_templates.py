@@ -1,5 +1,6 @@
 """Unit tests for the templates client using BaseClient."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -7,6 +8,7 @@ import pytest
 from siren.clients.templates import TemplateClient
 from siren.exceptions import SirenAPIError, SirenSDKError
 from siren.models.templates import CreatedTemplate, Template
+from tests.helpers import JsonBody
 
 API_KEY = "test_api_key"
 BASE_URL = "https://api.dev.trysiren.io"
@@ -17,6 +19,7 @@ def mock_response(status_code: int, json_data: dict = None):
     mock_resp = Mock()
     mock_resp.status_code = status_code
     mock_resp.json.return_value = json_data if json_data is not None else {}
+    mock_resp.content = json.dumps(mock_resp.json.return_value).encode()
     return mock_resp
 
 
@@ -27,7 +30,7 @@ class TestTemplateClient:
         """Set up test fixtures."""
         self.client = TemplateClient(api_key=API_KEY, base_url=BASE_URL)
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_templates_success(self, mock_request):
         """Test successful retrieval of templates."""
         # Mock API response based on user-provided response
@@ -121,12 +124,12 @@ class TestTemplateClient:
             method="GET",
             url=f"{BASE_URL}/api/v1/public/template",
             headers={"Authorization": f"Bearer {API_KEY}"},
-            json=None,
+            data=None,
             params={"page": 0, "size": 2},
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_templates_with_all_params(self, mock_request):
         """Test get_templates with all optional parameters."""
         mock_api_response = {
@@ -156,7 +159,7 @@ class TestTemplateClient:
             method="GET",
             url=f"{BASE_URL}/api/v1/public/template",
             headers={"Authorization": f"Bearer {API_KEY}"},
-            json=None,
+            data=None,
             params={
                 "tagNames": "test,example",
                 "search": "template",
@@ -167,7 +170,7 @@ class TestTemplateClient:
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_templates_api_error(self, mock_request):
         """Test API error during template retrieval."""
         mock_api_error = {
@@ -181,7 +184,7 @@ class TestTemplateClient:
         assert exc_info.value.error_code == "UNAUTHORIZED"
         assert "Invalid API key" in exc_info.value.api_message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_templates_network_error(self, mock_request):
         """Test network error during template retrieval."""
         from requests.exceptions import ConnectionError
@@ -193,7 +196,7 @@ class TestTemplateClient:
 
         assert "Connection failed" in exc_info.value.message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_create_template_success(self, mock_request):
         """Test successful template creation."""
         mock_api_response = {
@@ -245,26 +248,28 @@ class TestTemplateClient:
                 "Authorization": f"Bearer {API_KEY}",
                 "Content-Type": "application/json",
             },
-            json={
-                "name": "Test_Create_Template",
-                "description": "A test template",
-                "tagNames": ["test", "creation"],
-                "variables": [{"name": "user_name", "defaultValue": "Guest"}],
-                "configurations": {
-                    "EMAIL": {
-                        "subject": "Welcome {{user_name}}!",
-                        "channel": "EMAIL",
-                        "body": "<p>Hello {{user_name}}, welcome!</p>",
-                        "isRawHTML": True,
-                        "isPlainText": False,
-                    }
-                },
-            },
+            data=JsonBody(
+                {
+                    "name": "Test_Create_Template",
+                    "description": "A test template",
+                    "tagNames": ["test", "creation"],
+                    "variables": [{"name": "user_name", "defaultValue": "Guest"}],
+                    "configurations": {
+                        "EMAIL": {
+                            "subject": "Welcome {{user_name}}!",
+                            "channel": "EMAIL",
+                            "body": "<p>Hello {{user_name}}, welcome!</p>",
+                            "isRawHTML": True,
+                            "isPlainText": False,
+                        }
+                    },
+                }
+            ),
             params=None,
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_create_template_api_error(self, mock_request):
         """Test API error during template creation."""
         mock_api_error = {
@@ -278,7 +283,7 @@ class TestTemplateClient:
         assert exc_info.value.error_code == "BAD_REQUEST"
         assert "Bad request" in exc_info.value.api_message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_delete_template_success(self, mock_request):
         """Test successful template deletion (204 No Content)."""
         # Mock 204 response with empty body
@@ -294,12 +299,12 @@ class TestTemplateClient:
             method="DELETE",
             url=f"{BASE_URL}/api/v1/public/template/{template_id}",
             headers={"Authorization": f"Bearer {API_KEY}"},
-            json=None,
+            data=None,
             params=None,
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_delete_template_not_found(self, mock_request):
         """Test template deletion with 404 error."""
         mock_api_error = {
@@ -315,7 +320,7 @@ class TestTemplateClient:
         assert exc_info.value.error_code == "NOT_FOUND"
         assert "Template not found" in exc_info.value.api_message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_update_template_success(self, mock_request):
         """Test successful template update."""
         mock_api_response = {
@@ -358,17 +363,21 @@ class TestTemplateClient:
                 "Authorization": f"Bearer {API_KEY}",
                 "Content-Type": "application/json",
             },
-            json={
-                "name": "Updated_Test_Template",
-                "description": "An updated test template",
-                "tagNames": ["updated", "test"],
-                "variables": [{"name": "user_name", "defaultValue": "Updated Guest"}],
-            },
+            data=JsonBody(
+                {
+                    "name": "Updated_Test_Template",
+                    "description": "An updated test template",
+                    "tagNames": ["updated", "test"],
+                    "variables": [
+                        {"name": "user_name", "defaultValue": "Updated Guest"}
+                    ],
+                }
+            ),
             params=None,
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_publish_template_success(self, mock_request):
         """Test successful template publishing."""
         template_id = "tpl_pub_success"
@@ -409,12 +418,12 @@ class TestTemplateClient:
             method="PATCH",
             url=f"{BASE_URL}/api/v1/public/template/{template_id}/publish",
             headers={"Authorization": f"Bearer {API_KEY}"},
-            json=None,
+            data=None,
             params=None,
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_publish_template_not_found(self, mock_request):
         """Test template publishing with 404 error."""
         template_id = "tpl_not_found"
@@ -429,7 +438,7 @@ class TestTemplateClient:
         assert exc_info.value.error_code == "NOT_FOUND"
         assert "Template not found" in exc_info.value.api_message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_publish_template_bad_request(self, mock_request):
         """Test template publishing with 400 error."""
         template_id = "tpl_bad_request"
@@ -447,7 +456,7 @@ class TestTemplateClient:
         assert exc_info.value.error_code == "BAD_REQUEST"
         assert "Template has no versions to publish" in exc_info.value.api_message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_create_channel_templates_success(self, mock_request):
         """Test successful creation of channel templates."""
         mock_input_data = {
@@ -508,12 +517,12 @@ class TestTemplateClient:
                 "Authorization": f"Bearer {API_KEY}",
                 "Content-Type": "application/json",
             },
-            json=mock_input_data,
+            data=JsonBody(mock_input_data),
             params=None,
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_create_channel_templates_api_error(self, mock_request):
         """Test API error during channel templates creation."""
         mock_api_error = {
@@ -532,7 +541,7 @@ class TestTemplateClient:
         assert exc_info.value.error_code == "BAD_REQUEST"
         assert "Invalid channel configuration" in exc_info.value.api_message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_channel_templates_success(self, mock_request):
         """Test successful retrieval of channel templates."""
         mock_response_data = {
@@ -572,12 +581,12 @@ class TestTemplateClient:
             method="GET",
             url=f"{BASE_URL}/api/v1/public/template/versions/version123/channel-templates",
             headers={"Authorization": f"Bearer {API_KEY}"},
-            json=None,
+            data=None,
             params={},
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_get_channel_templates_with_params(self, mock_request):
         """Test get channel templates with query parameters."""
         mock_response_data = {
@@ -607,7 +616,7 @@ class TestTemplateClient:
             method="GET",
             url=f"{BASE_URL}/api/v1/public/template/versions/version123/channel-templates",
             headers={"Authorization": f"Bearer {API_KEY}"},
-            json=None,
+            data=None,
             params={"channel": "EMAIL", "page": 0, "size": 5},
             timeout=10,
         )
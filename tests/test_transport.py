@@ -0,0 +1,207 @@
+"""Tests for the HTTP transport layer."""
+
+import importlib.util
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx  # type: ignore
+import pytest
+import respx  # type: ignore
+
+from siren import RequestCompression
+from siren.async_client import AsyncSirenClient
+from siren.client import SirenClient
+from siren.clients.messaging import MessageClient
+from siren.exceptions import SirenAPIError, SirenSDKError
+from siren.http.memory import (
+    AsyncInMemoryTransport,
+    InMemoryTransport,
+    canned_response,
+)
+from siren.http.transport import (
+    AsyncTransport,
+    AsyncTransportProtocol,
+    HttpxTransport,
+    SyncTransport,
+    Transport,
+)
+
+API_KEY = "test_api_key"
+BASE_URL = "https://api.dev.trysiren.io"
+
+requires_h2 = pytest.mark.skipif(
+    importlib.util.find_spec("h2") is None, reason="h2 package not installed"
+)
+
+
+def test_sync_client_defaults_to_requests_transport():
+    """Without http2 the shared transport is the pooled requests session."""
+    client = SirenClient(api_key=API_KEY, env="dev")
+    assert isinstance(client._transport, SyncTransport)
+    client.close()
+
+
+@requires_h2
+def test_sync_client_http2_uses_httpx_transport():
+    """http2=True swaps in an HTTP/2-capable httpx transport for every domain."""
+    client = SirenClient(api_key=API_KEY, env="dev", http2=True)
+    transport = client._transport
+
+    assert isinstance(transport, HttpxTransport)
+    assert client.message._transport is transport
+    assert client.template._channel_template_client._transport is transport
+    client.close()
+    assert transport._client.is_closed
+
+
+@requires_h2
+def test_sync_client_http2_maps_pool_options():
+    """Pool options keep their meaning on httpx; pool_connections is refused."""
+    client = SirenClient(
+        api_key=API_KEY, env="dev", http2=True, pool_maxsize=7, pool_block=True
+    )
+    pool = client._transport._client._transport._pool  # pyright: ignore[reportAttributeAccessIssue]
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 7
+    client.close()
+
+    client = SirenClient(api_key=API_KEY, env="dev", http2=True, keep_alive=False)
+    pool = client._transport._client._transport._pool  # pyright: ignore[reportAttributeAccessIssue]
+    assert pool._max_keepalive_connections == 0
+    client.close()
+
+    with pytest.raises(ValueError):
+        SirenClient(api_key=API_KEY, env="dev", http2=True, pool_connections=4)
+
+
+@requires_h2
+@respx.mock
+def test_httpx_transport_round_trip():
+    """Requests made over HttpxTransport are parsed like any other response."""
+    route = respx.get(f"{BASE_URL}/api/v1/public/message-status/msg_1").mock(
+        return_value=httpx.Response(200, json={"data": {"status": "DELIVERED"}})
+    )
+    transport = HttpxTransport(http2=True)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL, transport=transport)
+
+    assert client.get_status("msg_1") == "DELIVERED"
+    assert route.calls.last.request.headers["Authorization"] == f"Bearer {API_KEY}"
+    transport.close()
+
+
+@requires_h2
+@respx.mock
+def test_httpx_transport_network_error_becomes_sdk_error():
+    """Network failures from httpx surface as SirenSDKError on the sync client."""
+    respx.get(f"{BASE_URL}/api/v1/public/message-status/msg_1").mock(
+        side_effect=httpx.ConnectError("boom")
+    )
+    transport = HttpxTransport(http2=True)
+    client = MessageClient(api_key=API_KEY, base_url=BASE_URL, transport=transport)
+
+    with pytest.raises(SirenSDKError) as exc_info:
+        client.get_status("msg_1")
+
+    assert "Network or connection error" in exc_info.value.message
+    assert isinstance(exc_info.value.original_exception, httpx.ConnectError)
+    transport.close()
+
+
+@requires_h2
+@pytest.mark.asyncio
+async def test_async_client_http2_option():
+    """http2=True enables HTTP/2 on the shared httpx.AsyncClient pool."""
+    async with AsyncSirenClient(api_key=API_KEY, env="dev", http2=True) as client:
+        pool = client._transport._client._transport._pool  # pyright: ignore[reportAttributeAccessIssue]
+        assert pool._http2 is True
+
+
+def test_bundled_transports_satisfy_protocols():
+    """Every shipped transport implements the matching protocol."""
+    for transport in (
+        SyncTransport(),
+        HttpxTransport(http2=False),
+        InMemoryTransport(),
+    ):
+        assert isinstance(transport, Transport)
+        transport.close()
+    assert isinstance(AsyncTransport(), AsyncTransportProtocol)
+    assert isinstance(AsyncInMemoryTransport(), AsyncTransportProtocol)
+
+
+def test_sync_client_accepts_custom_transport():
+    """A transport passed to SirenClient is shared and left open on close."""
+    transport = InMemoryTransport()
+    client = SirenClient(api_key=API_KEY, env="dev", transport=transport)
+
+    assert client.message.send(
+        recipient_value="U01UBCD06BB", channel="SLACK", body="hi"
+    )
+    assert client.message.get_status("msg_1") == "DELIVERED"
+    assert len(client.template.get()) == 10
+    bulk = client.workflow.trigger_bulk("wf", notify=[{"a": 1}, {"a": 2}])
+    assert len(bulk.workflow_execution_ids) == 2
+    assert client.template.delete("tpl_1") is True
+    assert transport.calls == 5
+    assert client.template._channel_template_client._transport is transport
+
+    client.close()
+    transport.close()
+
+
+def test_in_memory_handler_can_simulate_failures():
+    """Handlers drive error envelopes and network errors through the client."""
+
+    def handler(method, path, body):
+        if "message-status" in path:
+            raise httpx.ConnectError("offline")
+        return 503, b'{"data": null, "error": {"errorCode": "DOWN", "message": "x"}}'
+
+    client = SirenClient(
+        api_key=API_KEY, env="dev", transport=InMemoryTransport(handler)
+    )
+
+    with pytest.raises(SirenSDKError, match="Network or connection error"):
+        client.message.get_status("msg_1")
+    with pytest.raises(SirenAPIError) as exc_info:
+        client.message.get_replies("msg_1")
+    assert exc_info.value.status_code == 503
+
+
+def test_in_memory_transport_decodes_bodies_and_counts_every_call():
+    """Handlers see decompressed bodies; concurrent calls are all counted."""
+    bodies = []
+
+    def handler(method, path, body):
+        bodies.append(json.loads(body))
+        return canned_response(method, path, body)
+
+    transport = InMemoryTransport(handler)
+    client = SirenClient(
+        api_key=API_KEY,
+        env="dev",
+        transport=transport,
+        compression=RequestCompression(threshold=0),
+    )
+    client.workflow.trigger("wf", data={"plan": "pro"})
+    assert bodies == [{"workflowName": "wf", "data": {"plan": "pro"}}]
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: client.workflow.trigger("wf"), range(200)))
+    assert transport.calls == 201
+
+
+@pytest.mark.asyncio
+async def test_async_client_accepts_custom_transport():
+    """AsyncSirenClient routes every domain through the given transport."""
+    transport = AsyncInMemoryTransport()
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=transport
+    ) as client:
+        assert client.workflow._transport is transport
+        replies = await client.message.get_replies("msg_1")
+        execution = await client.workflow.trigger("wf")
+
+    assert len(replies) == 10
+    assert execution.workflow_execution_id
+    assert transport.calls == 2
@@ -0,0 +1,184 @@
+"""Tests for coalescing workflow triggers into bulk requests."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from siren import AsyncSirenClient, RequestOptions, SirenClient
+from siren.clients.trigger_batcher import batch_key
+from siren.exceptions import SirenAPIError, SirenSDKError
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+
+API_KEY = "test_api_key"
+
+
+class BulkRecorder:
+    """Answers bulk triggers with IDs derived from each ``notify`` element."""
+
+    def __init__(self, status=200, short=False):
+        """Answer with *status*; with *short*, return one ID too few."""
+        self.status = status
+        self.short = short
+        self.bodies = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, body):
+        """Record the bulk request and answer it."""
+        assert path.endswith("/workflows/trigger/bulk")
+        payload = json.loads(body)
+        with self.lock:
+            self.bodies.append(payload)
+        if self.status != 200:
+            error = {"errorCode": "SCRIPTED", "message": "scripted"}
+            return self.status, json.dumps({"data": None, "error": error}).encode()
+        ids = [f"exec-{n['id']}" for n in payload["notify"]]
+        if self.short:
+            ids = ids[:-1]
+        data = {"requestId": "req", "workflowExecutionIds": ids}
+        return 200, json.dumps({"data": data, "error": None}).encode()
+
+
+def _client(handler):
+    return SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport(handler))
+
+
+def test_triggers_coalesce_by_workflow_and_data():
+    """Equal workflow and data share a request; each caller gets its own ID."""
+    handler = BulkRecorder()
+    client = _client(handler)
+
+    with client.workflow.batcher(max_batch=100, max_delay_ms=1000) as batcher:
+        a = [batcher.submit("wf", {"x": 1, "y": 2}, {"id": i}) for i in range(3)]
+        b = batcher.submit("wf", {"y": 2, "x": 1}, {"id": 3})  # same data
+        c = batcher.submit("wf", {"x": 2}, {"id": 4})
+        d = batcher.submit("other", None, {"id": 5})
+
+    assert [f.result() for f in a + [b, c, d]] == [f"exec-{i}" for i in range(6)]
+    sizes = sorted(len(body["notify"]) for body in handler.bodies)
+    assert sizes == [1, 1, 4]
+
+
+def test_full_batch_is_sent_without_waiting():
+    """Reaching max_batch sends at once; the rest waits for the delay."""
+    handler = BulkRecorder()
+    batcher = _client(handler).workflow.batcher(max_batch=2, max_delay_ms=60_000)
+    try:
+        first = [batcher.submit("wf", notify={"id": i}) for i in range(2)]
+        assert [f.result(timeout=5) for f in first] == ["exec-0", "exec-1"]
+        late = batcher.submit("wf", notify={"id": 2})
+        assert not late.done()
+    finally:
+        batcher.close()
+    assert late.result() == "exec-2"
+
+
+def test_delay_flushes_partial_batches():
+    """A partial batch is sent once its oldest trigger waited max_delay_ms."""
+    handler = BulkRecorder()
+    with _client(handler).workflow.batcher(max_batch=100, max_delay_ms=5) as batcher:
+        assert batcher.trigger("wf", notify={"id": 7}) == "exec-7"
+
+
+def test_concurrent_callers():
+    """Many threads share a batcher and each gets its own execution ID."""
+    handler = BulkRecorder()
+    with _client(handler).workflow.batcher(max_batch=16, max_delay_ms=2) as batcher:
+        with ThreadPoolExecutor(8) as pool:
+            results = list(
+                pool.map(lambda i: batcher.trigger("wf", notify={"id": i}), range(200))
+            )
+
+    assert results == [f"exec-{i}" for i in range(200)]
+    assert len(handler.bodies) < 200
+
+
+def test_errors_reach_every_caller_in_the_batch():
+    """A failed bulk call, or a short ID list, fails all futures of the batch."""
+    with _client(BulkRecorder(status=400)).workflow.batcher() as batcher:
+        futures = [batcher.submit("wf", notify={"id": i}) for i in range(3)]
+    for future in futures:
+        assert isinstance(future.exception(), SirenAPIError)
+
+    with _client(BulkRecorder(short=True)).workflow.batcher() as batcher:
+        future = batcher.submit("wf", notify={"id": 0})
+    assert isinstance(future.exception(), SirenSDKError)
+
+    with pytest.raises(SirenSDKError):
+        batcher.submit("wf")
+    with pytest.raises(ValueError):
+        _client(BulkRecorder()).workflow.batcher(max_batch=0)
+
+
+def test_shared_idempotency_keys_are_rejected():
+    """One key on every batch would drop all batches after the first."""
+    client = _client(BulkRecorder())
+    options = RequestOptions(idempotency_key="abc")
+    with pytest.raises(ValueError):
+        client.workflow.batcher(request_options=options)
+    with pytest.raises(ValueError):
+        AsyncSirenClient(api_key=API_KEY, env="dev").workflow.batcher(
+            request_options=options
+        )
+    timeout = RequestOptions(timeout=5)
+    client.workflow.batcher(request_options=timeout).close()
+
+
+def test_data_json_cannot_encode_still_batches():
+    """Datetimes coalesce by value; uncanonical data only with itself."""
+    when = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert batch_key("wf", {"at": when}) == batch_key("wf", {"at": when})
+    mixed = {1: "a", "b": 2}
+    assert batch_key("wf", mixed) == batch_key("wf", mixed)
+    assert batch_key("wf", mixed) != batch_key("wf", dict(mixed))
+
+    handler = BulkRecorder()
+    with _client(handler).workflow.batcher(max_delay_ms=1000) as batcher:
+        futures = [batcher.submit("wf", {"at": when}, {"id": i}) for i in range(2)]
+    assert [f.result() for f in futures] == ["exec-0", "exec-1"]
+    assert [len(b["notify"]) for b in handler.bodies] == [2]
+
+
+def test_cancellation_races_with_the_answer():
+    """Cancelled triggers are skipped; sent ones can no longer be cancelled."""
+    release = threading.Event()
+    handler = BulkRecorder()
+
+    def slow(method, path, body):
+        release.wait(5)
+        return handler(method, path, body)
+
+    batcher = _client(slow).workflow.batcher(max_batch=3, max_delay_ms=60_000)
+    try:
+        dropped = batcher.submit("wf", notify={"id": 0})
+        assert dropped.cancel()
+        kept = [batcher.submit("wf", notify={"id": i}) for i in (1, 2)]
+        assert kept[0].running() and not kept[0].cancel()
+        release.set()
+        assert [f.result(timeout=5) for f in kept] == ["exec-1", "exec-2"]
+        assert dropped.cancelled()
+    finally:
+        release.set()
+        batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_async_batcher():
+    """The async batcher coalesces triggers submitted on the event loop."""
+    import asyncio
+
+    handler = BulkRecorder()
+    async with AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport(handler)
+    ) as client:
+        async with client.workflow.batcher(max_batch=3, max_delay_ms=5) as batcher:
+            results = await asyncio.gather(
+                *(batcher.trigger("wf", {"k": 1}, {"id": i}) for i in range(7))
+            )
+            late = batcher.submit("wf", notify={"id": 99})
+
+        assert results == [f"exec-{i}" for i in range(7)]
+        assert await late == "exec-99"
+        assert sorted(len(b["notify"]) for b in handler.bodies) == [1, 1, 3, 3]
@@ -1,6 +1,7 @@
 # tests/test_users.py
 """Unit tests for the user management features of the Siren SDK."""
 
+import json
 from typing import Optional
 from unittest.mock import MagicMock, patch
 
@@ -11,6 +12,7 @@ from siren.client import SirenClient
 from siren.clients.users import UserClient
 from siren.exceptions import SirenAPIError, SirenSDKError
 from siren.models.user import User
+from tests.helpers import JsonBody
 
 # Test constants
 MOCK_API_KEY = "test_api_key"
@@ -40,6 +42,7 @@ def mock_response(
     mock_resp = MagicMock()
     mock_resp.status_code = status_code
     mock_resp.json.return_value = json_data if json_data is not None else {}
+    mock_resp.content = json.dumps(mock_resp.json.return_value).encode()
     mock_resp.text = text_data
     if raise_for_status_exception:
         mock_resp.raise_for_status.side_effect = raise_for_status_exception
@@ -49,7 +52,7 @@ def mock_response(
 class TestUserClient:
     """Tests for the UserClient class."""
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_add_user_success(self, mock_request, user_client: UserClient):
         """Test successful user creation/update returns a User model instance."""
         # Mock API response with all possible user fields
@@ -102,7 +105,7 @@ class TestUserClient:
             method="POST",
             url=f"{MOCK_BASE_URL}/api/v1/public/users",
             headers=expected_headers,
-            json=expected_json_payload,
+            data=JsonBody(expected_json_payload),
             params=None,
             timeout=10,
         )
@@ -124,7 +127,7 @@ class TestUserClient:
         assert response.phone is None
         assert response.avatar_url is None
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_add_user_api_error_returns_json(
         self, mock_request, user_client: UserClient
     ):
@@ -160,7 +163,7 @@ class TestUserClient:
             == mock_api_error_payload["error"]["details"]
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_add_user_http_error_no_json(self, mock_request, user_client: UserClient):
         """Test API error (500) without JSON body raises SirenSDKError."""
         # Mock non-JSON error response
@@ -182,7 +185,7 @@ class TestUserClient:
         assert "API response was not valid JSON" in excinfo.value.message
         assert error_text in excinfo.value.message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_add_user_request_exception(self, mock_request, user_client: UserClient):
         """Test handling of requests.exceptions.RequestException (e.g., network error) raises SirenSDKError."""
         # Mock network error
@@ -200,7 +203,7 @@ class TestUserClient:
         )
         assert "Network or connection error" in excinfo.value.message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_update_user_success(self, mock_request, user_client: UserClient):
         """Test successful user update returns a User model instance."""
         # Mock API response
@@ -256,7 +259,7 @@ class TestUserClient:
             method="PUT",
             url=f"{MOCK_BASE_URL}/api/v1/public/users/{MOCK_USER_ID}",
             headers=expected_headers,
-            json=expected_json_payload,
+            data=JsonBody(expected_json_payload),
             params=None,
             timeout=10,
         )
@@ -273,7 +276,7 @@ class TestUserClient:
         assert response.whatsapp == "+919632323154"
         assert response.updated_at == "2023-01-02T12:00:00Z"
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_update_user_api_error_returns_json(
         self, mock_request, user_client: UserClient
     ):
@@ -298,7 +301,7 @@ class TestUserClient:
         assert excinfo.value.api_message == mock_api_error_payload["error"]["message"]
         assert excinfo.value.error_code == mock_api_error_payload["error"]["errorCode"]
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_update_user_validation_error(self, mock_request, user_client: UserClient):
         """Test invalid parameters raise SirenSDKError."""
         with pytest.raises(SirenSDKError) as excinfo:
@@ -307,7 +310,7 @@ class TestUserClient:
         assert "Invalid parameters" in excinfo.value.message
         mock_request.assert_not_called()
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_update_user_request_exception(self, mock_request, user_client: UserClient):
         """Test handling of requests.exceptions.RequestException raises SirenSDKError."""
         # Mock network error
@@ -322,7 +325,7 @@ class TestUserClient:
         assert excinfo.value.original_exception == original_exception
         assert "Network or connection error" in excinfo.value.message
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_delete_user_success(self, mock_request, user_client: UserClient):
         """Test successful user deletion returns True."""
         # Mock API response for 204 No Content
@@ -338,7 +341,7 @@ class TestUserClient:
             method="DELETE",
             url=f"{MOCK_BASE_URL}/api/v1/public/users/{MOCK_USER_ID}",
             headers=expected_headers,
-            json=None,
+            data=None,
             params=None,
             timeout=10,
         )
@@ -346,7 +349,7 @@ class TestUserClient:
         # Verify response
         assert response is True
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_delete_user_not_found(self, mock_request, user_client: UserClient):
         """Test API error (404) raises SirenAPIError."""
         # Mock API error response
@@ -369,7 +372,7 @@ class TestUserClient:
         assert excinfo.value.api_message == mock_api_error_payload["error"]["message"]
         assert excinfo.value.error_code == mock_api_error_payload["error"]["errorCode"]
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_delete_user_request_exception(self, mock_request, user_client: UserClient):
         """Test handling of requests.exceptions.RequestException raises SirenSDKError."""
         # Mock network error
@@ -388,7 +391,7 @@ class TestUserClient:
 class TestSirenClientUsers:
     """Tests for user management methods exposed on SirenClient."""
 
-    @patch("siren.client.UserClient.add")
+    @patch("siren.clients.users.UserClient.add")
     def test_client_add_user_delegates_to_client(
         self, mock_client_add_user, siren_client: SirenClient
     ):
@@ -440,7 +443,7 @@ class TestSirenClientUsers:
         assert call_args["attributes"] == payload["attributes"]
         assert response == mock_user_instance
 
-    @patch("siren.client.UserClient.update")
+    @patch("siren.clients.users.UserClient.update")
     def test_client_update_user_delegates_to_client(
         self, mock_client_update_user, siren_client: SirenClient
     ):
@@ -502,7 +505,7 @@ class TestSirenClientUsers:
         assert call_kwargs["attributes"] == payload["attributes"]
         assert response == mock_user_instance
 
-    @patch("siren.client.UserClient.delete")
+    @patch("siren.clients.users.UserClient.delete")
     def test_client_delete_user_delegates_to_client(
         self, mock_client_delete_user, siren_client: SirenClient
     ):
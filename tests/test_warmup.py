@@ -0,0 +1,160 @@
+"""Tests for connection warm-up and background keep-alive pings."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from siren import AsyncSirenClient, SirenClient
+from siren.exceptions import SirenSDKError
+from siren.http.memory import AsyncInMemoryTransport, InMemoryTransport
+from siren.http.transport import AsyncTransport, HttpxTransport, SyncTransport
+
+API_KEY = "test_api_key"
+
+
+def _point_at(client, base_url):
+    """Aim *client* (and the domain clients it builds later) at *base_url*."""
+    client.base_url = base_url
+    client._client_kwargs["base_url"] = base_url
+    return client
+
+
+def _sync_client(server, transport):
+    client = SirenClient(api_key=API_KEY, env="dev", transport=transport)
+    return _point_at(client, server.base_url)
+
+
+def _head_count(server):
+    return sum(1 for method, *_ in server.requests if method == "HEAD")
+
+
+@pytest.mark.parametrize(
+    "make_transport",
+    [lambda: SyncTransport(pool_maxsize=8), lambda: HttpxTransport(http2=False)],
+    ids=["requests", "httpx"],
+)
+def test_warmup_opens_connections_that_later_calls_reuse(fake_server, make_transport):
+    """N warm connections are opened once and then serve concurrent calls."""
+    transport = make_transport()
+    client = _sync_client(fake_server, transport)
+
+    assert client.warmup(connections=4) == 4
+    assert fake_server.connections == 4
+    assert _head_count(fake_server) == 4
+
+    barrier = threading.Barrier(4)
+    results = []
+
+    def call():
+        barrier.wait()
+        try:
+            results.append(client.message.get_status("msg_1"))
+        except Exception as e:  # collected and asserted below
+            results.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["DELIVERED"] * 4
+    gets = [r for r in fake_server.requests if r[0] == "GET"]
+    assert len(gets) == 4
+    assert fake_server.connections == 4
+    transport.close()
+
+
+def test_warmup_is_capped_by_pool_size(fake_server):
+    """Connections the pool could not keep are never opened."""
+    transport = SyncTransport(pool_maxsize=2)
+    client = _sync_client(fake_server, transport)
+
+    assert client.warmup(connections=5) == 2
+    assert fake_server.connections == 2
+    transport.close()
+
+
+def test_keepalive_pings_until_close(fake_server):
+    """The background thread re-pings the warm connections and stops on close."""
+    transport = SyncTransport(pool_maxsize=2)
+    client = _sync_client(fake_server, transport)
+
+    client.warmup(connections=2, keepalive_interval=0.05)
+    deadline = time.monotonic() + 2
+    while _head_count(fake_server) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client._keepalive is not None
+    thread, _ = client._keepalive
+
+    client.close()
+    transport.close()
+
+    assert _head_count(fake_server) >= 6
+    assert fake_server.connections == 2
+    assert not thread.is_alive()
+    assert client._keepalive is None
+
+
+def test_warmup_without_transport_support_is_a_no_op():
+    """Transports without ``warmup`` are accepted and nothing is opened."""
+    client = SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport())
+    assert client.warmup(connections=3, keepalive_interval=1) == 0
+    assert client._keepalive is None
+
+
+def test_warmup_network_error_raises_sdk_error():
+    """An unreachable API surfaces as ``SirenSDKError``."""
+    transport = SyncTransport(timeout=1)
+    client = SirenClient(api_key=API_KEY, env="dev", transport=transport)
+    _point_at(client, "http://127.0.0.1:9")
+
+    with pytest.raises(SirenSDKError):
+        client.warmup(connections=1)
+    transport.close()
+
+
+def test_warmup_rejects_invalid_arguments():
+    """Connection counts and intervals must be positive."""
+    client = SirenClient(api_key=API_KEY, env="dev", transport=InMemoryTransport())
+    with pytest.raises(ValueError):
+        client.warmup(connections=0)
+    with pytest.raises(ValueError):
+        client.warmup(connections=1, keepalive_interval=0)
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_and_keepalive(fake_server):
+    """The async client warms N connections and pings them from a task."""
+    transport = AsyncTransport(max_keepalive_connections=10)
+    client = _point_at(
+        AsyncSirenClient(api_key=API_KEY, env="dev", transport=transport),
+        fake_server.base_url,
+    )
+
+    assert await client.warmup(3, keepalive_interval=0.05) == 3
+    assert fake_server.connections == 3
+    task = client._keepalive_task
+    deadline = time.monotonic() + 2
+    while _head_count(fake_server) < 9 and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+    await client.aclose()  # stops the pings; the transport is ours
+    assert await client.message.get_status("msg_1") == "DELIVERED"
+    await transport.aclose()
+
+    assert _head_count(fake_server) >= 9
+    assert [r[0] for r in fake_server.requests].count("GET") == 1
+    assert fake_server.connections == 3
+    assert task is not None and task.done()
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_without_transport_support_is_a_no_op():
+    """Async transports without ``warmup`` are accepted."""
+    client = AsyncSirenClient(
+        api_key=API_KEY, env="dev", transport=AsyncInMemoryTransport()
+    )
+    assert await client.warmup(2) == 0
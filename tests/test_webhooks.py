@@ -1,5 +1,6 @@
 """Unit tests for the webhook client using BaseClient."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +9,7 @@ from siren.client import SirenClient
 from siren.clients.webhooks import WebhookClient
 from siren.exceptions import SirenAPIError, SirenSDKError
 from siren.models.webhooks import WebhookConfig
+from tests.helpers import JsonBody
 
 API_KEY = "test_api_key"
 BASE_URL = "https://api.dev.trysiren.io"
@@ -19,6 +21,7 @@ def mock_response(status_code: int, json_data: dict = None):
     mock_resp = Mock()
     mock_resp.status_code = status_code
     mock_resp.json.return_value = json_data if json_data is not None else {}
+    mock_resp.content = json.dumps(mock_resp.json.return_value).encode()
     return mock_resp
 
 
@@ -29,7 +32,7 @@ class TestWebhookClient:
         """Set up test fixtures."""
         self.client = WebhookClient(api_key=API_KEY, base_url=BASE_URL)
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_configure_notifications_webhook_success(self, mock_request):
         """Test successful configuration of notifications webhook."""
         # Mock successful API response
@@ -63,12 +66,12 @@ class TestWebhookClient:
                 "Authorization": f"Bearer {API_KEY}",
                 "Content-Type": "application/json",
             },
-            json={"webhookConfig": {"url": WEBHOOK_URL}},
+            data=JsonBody({"webhookConfig": {"url": WEBHOOK_URL}}),
             params=None,
             timeout=10,
         )
 
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_configure_inbound_message_webhook_success(self, mock_request):
         """Test successful configuration of inbound message webhook."""
         # Mock successful API response
@@ -102,7 +105,7 @@ class TestWebhookClient:
                 "Authorization": f"Bearer {API_KEY}",
                 "Content-Type": "application/json",
             },
-            json={"inboundWebhookConfig": {"url": WEBHOOK_URL}},
+            data=JsonBody({"inboundWebhookConfig": {"url": WEBHOOK_URL}}),
             params=None,
             timeout=10,
         )
@@ -114,7 +117,7 @@ class TestWebhookClient:
             ("configure_inbound", "inboundWebhookConfig"),
         ],
     )
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_webhook_api_error(self, mock_request, method_name: str, config_key: str):
         """Test API error during webhook configuration."""
         # Mock API error response
@@ -144,7 +147,7 @@ class TestWebhookClient:
                 "Authorization": f"Bearer {API_KEY}",
                 "Content-Type": "application/json",
             },
-            json=expected_json,
+            data=JsonBody(expected_json),
             params=None,
             timeout=10,
         )
@@ -153,7 +156,7 @@ class TestWebhookClient:
         "method_name",
         ["configure_notifications", "configure_inbound"],
     )
-    @patch("siren.clients.base.requests.request")
+    @patch("siren.http.transport.requests.Session.request")
     def test_webhook_network_error(self, mock_request, method_name: str):
         """Test network error during webhook configuration."""
         from requests.exceptions import ConnectionError
@@ -173,7 +176,7 @@ def test_siren_client_configure_notifications_webhook():
     """Test SirenClient.webhook.configure_notifications calls WebhookClient correctly."""
     client = SirenClient(api_key=API_KEY, env="dev")
 
-    with patch.object(client._webhook_client, "configure_notifications") as mock_method:
+    with patch.object(client.webhook, "configure_notifications") as mock_method:
         # Create WebhookConfig using model_validate to handle aliases properly
         mock_config = WebhookConfig.model_validate(
             {"url": WEBHOOK_URL, "headers": [], "verificationKey": "test_key_123"}
@@ -190,7 +193,7 @@ def test_siren_client_configure_inbound_message_webhook():
     """Test SirenClient.webhook.configure_inbound calls WebhookClient correctly."""
     client = SirenClient(api_key=API_KEY, env="dev")
 
-    with patch.object(client._webhook_client, "configure_inbound") as mock_method:
+    with patch.object(client.webhook, "configure_inbound") as mock_method:
         # Create WebhookConfig using model_validate to handle aliases properly
         mock_config = WebhookConfig.model_validate(
             {"url": WEBHOOK_URL, "headers": [], "verificationKey": "test_key_456"}
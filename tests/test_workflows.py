@@ -1,6 +1,9 @@
 # tests/test_workflows.py
 """Test cases for workflows client."""
 
+from datetime import datetime, timezone
+from uuid import UUID
+
 import pytest
 import requests
 from requests_mock import Mocker as RequestsMocker
@@ -92,6 +95,40 @@ def test_trigger_workflow_success_minimal_params(
     }  # data and notify are optional
 
 
+def test_trigger_workflow_serializes_rich_json_types(
+    client: SirenClient, requests_mock: RequestsMocker
+):
+    """Datetimes, UUIDs and non-ASCII text in free-form data are JSON-encoded."""
+    requests_mock.post(
+        f"{MOCK_V2_BASE}/workflows/trigger",
+        json={"data": {"requestId": "r", "workflowExecutionId": "e"}, "error": None},
+    )
+    request_data = {
+        "sent_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "order_id": UUID("12345678-1234-5678-1234-567812345678"),
+        "greeting": "¡Hola, José!",
+    }
+
+    client.workflow.trigger(workflow_name=WORKFLOW_NAME, data=request_data)
+
+    request = requests_mock.request_history[0]
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.json()["data"] == {
+        "sent_at": "2025-01-02T03:04:05Z",
+        "order_id": "12345678-1234-5678-1234-567812345678",
+        "greeting": "¡Hola, José!",
+    }
+
+
+def test_trigger_workflow_unserializable_data(
+    client: SirenClient, requests_mock: RequestsMocker
+):
+    """Data that cannot be encoded as JSON fails before any request is sent."""
+    with pytest.raises(SirenSDKError, match="Invalid parameters"):
+        client.workflow.trigger(workflow_name=WORKFLOW_NAME, data={"x": object()})
+    assert requests_mock.call_count == 0
+
+
 def test_trigger_workflow_http_400_error(
     client: SirenClient, requests_mock: RequestsMocker
 ):